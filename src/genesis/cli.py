@@ -13,13 +13,14 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 
 from genesis.models.mission import DomainType, MissionClass
 from genesis.models.trust import ActorKind
 from genesis.persistence.event_log import EventLog
-from genesis.persistence.state_store import StateStore
+from genesis.persistence.state_store import open_state_store
 from genesis.policy.resolver import PolicyResolver
 from genesis.service import GenesisService
 
@@ -32,8 +33,14 @@ def _make_service(config_dir: Path, data_dir: Path = DEFAULT_DATA) -> GenesisSer
     """Create a GenesisService with durable persistence."""
     data_dir.mkdir(parents=True, exist_ok=True)
     resolver = PolicyResolver.from_config_dir(config_dir)
-    event_log = EventLog(storage_path=data_dir / "events.jsonl")
-    state_store = StateStore(storage_path=data_dir / "state.json")
+    event_log = EventLog(
+        storage_path=data_dir / "events.jsonl",
+        verify_workers=os.cpu_count() or 1,
+        checkpoint=True,
+    )
+    state_store = open_state_store(
+        data_dir, resolver.persistence_backend(), resolver.persistence_layout(),
+    )
     service = GenesisService(
         resolver,
         event_log=event_log,
@@ -45,14 +52,14 @@ def _make_service(config_dir: Path, data_dir: Path = DEFAULT_DATA) -> GenesisSer
 
 
 def cmd_status(args: argparse.Namespace) -> int:
-    service = _make_service(args.config)
+    service = _make_service(args.config, args.data)
     status = service.status()
     print(json.dumps(status, indent=2))
     return 0
 
 
 def cmd_register_actor(args: argparse.Namespace) -> int:
-    service = _make_service(args.config)
+    service = _make_service(args.config, args.data)
     result = service.register_actor(
         actor_id=args.id,
         actor_kind=ActorKind(args.kind),
@@ -71,7 +78,7 @@ def cmd_register_actor(args: argparse.Namespace) -> int:
 
 
 def cmd_create_mission(args: argparse.Namespace) -> int:
-    service = _make_service(args.config)
+    service = _make_service(args.config, args.data)
     result = service.create_mission(
         mission_id=args.id,
         title=args.title,
@@ -90,7 +97,7 @@ def cmd_check_first_light(args: argparse.Namespace) -> int:
     """Evaluate First Light conditions from current financials."""
     from decimal import Decimal
 
-    service = _make_service(args.config)
+    service = _make_service(args.config, args.data)
     result = service.periodic_first_light_check(
         monthly_revenue=Decimal(args.revenue),
         monthly_costs=Decimal(args.costs),
@@ -109,7 +116,7 @@ def cmd_process_payment(args: argparse.Namespace) -> int:
     from genesis.compensation.ledger import OperationalLedger
     from genesis.models.compensation import ReserveFundState
 
-    service = _make_service(args.config)
+    service = _make_service(args.config, args.data)
     # In production these come from the ledger and reserve subsystems;
     # the CLI provides a manual override for testing and operations.
     ledger = OperationalLedger()
@@ -153,6 +160,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_CONFIG,
         help="Path to config directory (default: config/)",
     )
+    parser.add_argument(
+        "--data",
+        type=Path,
+        default=DEFAULT_DATA,
+        help="Path to data directory for the event log and state (default: data/)",
+    )
     sub = parser.add_subparsers(dest="command")
 
     # status
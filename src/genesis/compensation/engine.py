@@ -28,13 +28,14 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional
+from typing import Optional, Sequence
 
 from genesis.compensation.equilibrium import compute_equilibrium_differential
-from genesis.compensation.ledger import OperationalLedger
+from genesis.compensation.ledger import LedgerWindow, OperationalLedger
 from genesis.models.compensation import (
     CommissionBreakdown,
     CostCategory,
+    PayoutTerms,
     ReserveFundState,
     WindowStats,
 )
@@ -89,6 +90,65 @@ class CommissionEngine:
             now = datetime.now(timezone.utc)
 
         params = self._resolver.commission_params()
+        return self._breakdown(
+            PayoutTerms(
+                mission_reward=mission_reward,
+                worker_actor_kind=worker_actor_kind,
+                machine_tier=machine_tier,
+                mission_domain=mission_domain,
+                tier3_recognized=tier3_recognized,
+            ),
+            params, self._window(params, ledger, now),
+            ledger.total_completed_missions(), reserve, now,
+        )
+
+    def compute_commissions(
+        self,
+        payouts: Sequence[PayoutTerms],
+        ledger: OperationalLedger,
+        reserve: ReserveFundState,
+        now: Optional[datetime] = None,
+    ) -> list[CommissionBreakdown]:
+        """Compute breakdowns for a batch of payouts against one window.
+
+        Policy and the rolling window are resolved once for the batch.
+        Each breakdown equals compute_commission() for the same terms,
+        ledger, reserve and time.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        params = self._resolver.commission_params()
+        window = self._window(params, ledger, now)
+        total_completed = ledger.total_completed_missions()
+        return [
+            self._breakdown(terms, params, window, total_completed, reserve, now)
+            for terms in payouts
+        ]
+
+    def _window(
+        self,
+        params: dict,
+        ledger: OperationalLedger,
+        now: datetime,
+    ) -> LedgerWindow:
+        return ledger.window(
+            int(params["commission_window_days"]),
+            int(params["commission_window_min_missions"]),
+            now,
+        )
+
+    def _breakdown(
+        self,
+        terms: PayoutTerms,
+        params: dict,
+        window: LedgerWindow,
+        total_completed: int,
+        reserve: ReserveFundState,
+        now: datetime,
+    ) -> CommissionBreakdown:
+        """The commission formula for one payout, given its window."""
+        mission_reward = terms.mission_reward
         floor = params["commission_floor"]
         ceiling = params["commission_ceiling"]
         safety_margin = params["commission_safety_margin"]
@@ -97,22 +157,16 @@ class CommissionEngine:
         min_missions = int(params["commission_window_min_missions"])
         bootstrap_min_rate = params["commission_bootstrap_min_rate"]
         reserve_maintenance = params["commission_reserve_maintenance_rate"]
-
-        # Get rolling window data
-        window_missions = ledger.missions_in_window(window_days, min_missions, now)
-        window_costs = ledger.costs_in_window(window_days, min_missions, now)
-        total_completed = ledger.total_completed_missions()
         is_bootstrap = total_completed < min_missions
 
         # Compute window span in days
-        if window_missions:
-            earliest = min(m.completed_utc for m in window_missions)
-            window_days_actual = max(1, (now - earliest).days)
+        if window.earliest_utc is not None:
+            window_days_actual = max(1, (now - window.earliest_utc).days)
         else:
             window_days_actual = 0
 
         window_stats = WindowStats(
-            missions_in_window=len(window_missions),
+            missions_in_window=window.mission_count,
             total_completed_missions=total_completed,
             window_days_actual=window_days_actual,
             window_days_configured=window_days,
@@ -121,12 +175,8 @@ class CommissionEngine:
         )
 
         # Rolling totals
-        rolling_mission_value = sum(
-            (m.reward_amount for m in window_missions), Decimal("0")
-        )
-        rolling_ops_costs = sum(
-            (c.amount for c in window_costs), Decimal("0")
-        )
+        rolling_mission_value = window.mission_value
+        rolling_ops_costs = window.ops_costs
 
         # Reserve contribution
         reserve_contribution = self._reserve_contribution(
@@ -232,7 +282,7 @@ class CommissionEngine:
         # Invariant preserved: commission + creator + worker + gcf == mission_reward
         # (the differential is a reallocation from worker to gcf)
 
-        worker_is_machine = (worker_actor_kind == ActorKind.MACHINE)
+        worker_is_machine = (terms.worker_actor_kind == ActorKind.MACHINE)
 
         equilibrium_discount_rate_param = params.get(
             "equilibrium_discount_rate", None,
@@ -241,9 +291,9 @@ class CommissionEngine:
             worker_payout=worker_payout,
             gcf_contribution=gcf_contribution,
             worker_is_machine=worker_is_machine,
-            machine_tier=machine_tier,
-            domain=mission_domain,
-            tier3_recognized=tier3_recognized,
+            machine_tier=terms.machine_tier,
+            domain=terms.mission_domain,
+            tier3_recognized=terms.tier3_recognized,
             discount_rate=equilibrium_discount_rate_param,
         )
 
@@ -253,7 +303,9 @@ class CommissionEngine:
         gcf_contribution = eq_result.adjusted_gcf_contribution
 
         # Build cost breakdown by category
-        cost_breakdown = self._build_cost_breakdown(window_costs, reserve_contribution)
+        cost_breakdown = self._build_cost_breakdown(
+            window.costs_by_category, reserve_contribution,
+        )
         if creator_amount > Decimal("0"):
             cost_breakdown["creator_allocation"] = creator_amount
         if employer_creator_fee > Decimal("0"):
@@ -315,14 +367,14 @@ class CommissionEngine:
 
     def _build_cost_breakdown(
         self,
-        window_costs: list,
+        costs_by_category: dict,
         reserve_contribution: Decimal,
     ) -> dict:
         """Build the published cost breakdown by category."""
-        breakdown: dict = {}
-        for cost in window_costs:
-            cat = cost.category.value
-            breakdown[cat] = breakdown.get(cat, Decimal("0")) + cost.amount
+        breakdown: dict = {
+            category.value: amount
+            for category, amount in costs_by_category.items()
+        }
 
         # Add reserve contribution
         if reserve_contribution > Decimal("0"):
@@ -32,7 +32,9 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+
+from genesis.models.sorted_keys import SortedKeyDict
 
 
 class DisbursementCategory(str, enum.Enum):
@@ -128,7 +130,8 @@ class DisbursementEngine:
 
     def __init__(self, config: dict[str, Any]) -> None:
         self._config = config
-        self._proposals: dict[str, DisbursementProposal] = {}
+        # Sorted by ID so that compliance re-screening can resume mid-way.
+        self._proposals: SortedKeyDict = SortedKeyDict()
         self._votes: dict[str, list[DisbursementVote]] = {}  # proposal_id → votes
         self._voter_index: dict[str, set[str]] = {}  # proposal_id → voter_ids
 
@@ -266,6 +269,15 @@ class DisbursementEngine:
         """Retrieve a proposal by ID."""
         return self._proposals.get(proposal_id)
 
+    def proposal_ids_after(
+        self, proposal_id: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield proposal IDs greater than ``proposal_id`` (all if None), in order.
+
+        No proposal may be created while the iterator is in use.
+        """
+        return self._proposals.keys_after(proposal_id)
+
     def list_proposals(
         self,
         status: Optional[DisbursementStatus] = None,
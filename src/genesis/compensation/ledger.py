@@ -12,14 +12,83 @@ Adaptive dual-threshold window:
 - Minimum sample: at least WINDOW_MIN_MISSIONS missions
 - If fewer than MIN_MISSIONS in the time window, extend back to capture them
 - This is inherently adaptive: stretches at low volume, bounds at high volume
+
+Missions and costs are kept in time order next to running totals, so the
+window bounds are found by bisection and window totals are differences
+of two prefix sums. A commission computation costs O(log n) in the
+ledger's history, not a filter-and-sort over all of it. Entries almost
+always arrive in time order and append in O(1); an out-of-order entry
+re-totals only the rows after it.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from genesis.models.compensation import (
+    CompletedMission,
+    CostCategory,
+    OperationalCostEntry,
+)
+
+_ZERO = Decimal("0")
+
+
+@dataclass(frozen=True)
+class LedgerWindow:
+    """Aggregates over one adaptive rolling window.
+
+    Every total equals the left-to-right sum of the window's entries,
+    starting from Decimal("0"), in value and in exponent.
+    """
+    mission_count: int
+    earliest_utc: Optional[datetime]
+    mission_value: Decimal
+    ops_costs: Decimal
+    costs_by_category: Dict[CostCategory, Decimal]
+
+
+class _RunningTotals:
+    """Prefix sums over a Decimal column, with exact range sums.
 
-from genesis.models.compensation import CompletedMission, OperationalCostEntry
+    A difference of two prefix sums has the right value but not always
+    the exponent a direct sum would have (earlier rows can add trailing
+    digits). Prefix counts per exponent recover the direct sum's
+    exponent, so range_sum() matches sum(rows[lo:hi], Decimal("0"))
+    exactly while totals stay within the Decimal context precision.
+    """
+
+    def __init__(self) -> None:
+        self._sums: List[Decimal] = [_ZERO]
+        self._exponent_counts: Dict[int, List[int]] = {}
+
+    def append(self, amount: Decimal) -> None:
+        self._sums.append(self._sums[-1] + amount)
+        exponent = amount.as_tuple().exponent
+        if exponent not in self._exponent_counts:
+            self._exponent_counts[exponent] = [0] * (len(self._sums) - 1)
+        for e, counts in self._exponent_counts.items():
+            counts.append(counts[-1] + (e == exponent))
+
+    def truncate(self, length: int) -> None:
+        """Drop every row from index ``length`` on."""
+        del self._sums[length + 1:]
+        for counts in self._exponent_counts.values():
+            del counts[length + 1:]
+
+    def range_sum(self, lo: int, hi: int) -> Decimal:
+        """Return sum(rows[lo:hi], Decimal("0"))."""
+        exponent = min(
+            [e for e, counts in self._exponent_counts.items()
+             if counts[hi] > counts[lo]] + [0]
+        )
+        return (self._sums[hi] - self._sums[lo]).quantize(
+            Decimal(1).scaleb(exponent)
+        )
 
 
 class OperationalLedger:
@@ -31,53 +100,102 @@ class OperationalLedger:
         ledger.record_operational_cost(cost_entry)
 
         # For commission computation:
-        window_missions = ledger.missions_in_window(90, 50, now)
+        window = ledger.window(90, 50, now)
     """
 
     def __init__(self) -> None:
         self._missions: List[CompletedMission] = []
         self._costs: List[OperationalCostEntry] = []
+        # Missions ascending by completion time; equal times are kept in
+        # reverse arrival order, so the newest-first view of any suffix
+        # lists ties in arrival order (as a stable descending sort does).
+        self._mission_rows: List[CompletedMission] = []
+        self._mission_times: List[datetime] = []
+        self._mission_value = _RunningTotals()
+        # Costs per category, ascending by timestamp, with arrival index.
+        self._cost_rows: Dict[CostCategory, List[tuple[int, OperationalCostEntry]]] = {}
+        self._cost_times: Dict[CostCategory, List[datetime]] = {}
+        self._cost_totals: Dict[CostCategory, _RunningTotals] = {}
 
     def record_completed_mission(self, mission: CompletedMission) -> None:
         """Record a completed mission for rolling window computation."""
         self._missions.append(mission)
+        pos = bisect_left(self._mission_times, mission.completed_utc)
+        self._mission_rows.insert(pos, mission)
+        self._mission_times.insert(pos, mission.completed_utc)
+        self._mission_value.truncate(pos)
+        for row in self._mission_rows[pos:]:
+            self._mission_value.append(row.reward_amount)
 
     def record_operational_cost(self, entry: OperationalCostEntry) -> None:
         """Record an operational cost entry."""
+        seq = len(self._costs)
         self._costs.append(entry)
+        rows = self._cost_rows.setdefault(entry.category, [])
+        times = self._cost_times.setdefault(entry.category, [])
+        totals = self._cost_totals.setdefault(entry.category, _RunningTotals())
+        pos = bisect_right(times, entry.timestamp_utc)
+        rows.insert(pos, (seq, entry))
+        times.insert(pos, entry.timestamp_utc)
+        totals.truncate(pos)
+        for _, row in rows[pos:]:
+            totals.append(row.amount)
 
     def total_completed_missions(self) -> int:
         """Return the total number of completed missions (all time)."""
         return len(self._missions)
 
+    def window(
+        self,
+        window_days: int,
+        min_missions: int,
+        now: datetime,
+    ) -> LedgerWindow:
+        """Return the aggregates of the adaptive rolling window.
+
+        Same window as missions_in_window() and costs_in_window(),
+        without materialising either list.
+        """
+        lo, hi = self._mission_bounds(window_days, min_missions, now)
+        if lo == hi:
+            return LedgerWindow(0, None, _ZERO, _ZERO, {})
+
+        earliest = self._mission_times[lo]
+        costs_by_category: Dict[CostCategory, Decimal] = {}
+        ops_costs = _ZERO
+        for category in CostCategory:
+            times = self._cost_times.get(category)
+            if not times:
+                continue
+            c_lo = bisect_left(times, earliest)
+            c_hi = bisect_right(times, now)
+            if c_lo < c_hi:
+                amount = self._cost_totals[category].range_sum(c_lo, c_hi)
+                costs_by_category[category] = amount
+                ops_costs = ops_costs + amount
+        return LedgerWindow(
+            mission_count=hi - lo,
+            earliest_utc=earliest,
+            mission_value=self._mission_value.range_sum(lo, hi),
+            ops_costs=ops_costs,
+            costs_by_category=costs_by_category,
+        )
+
     def missions_in_window(
         self,
         window_days: int,
         min_missions: int,
         now: datetime,
     ) -> List[CompletedMission]:
-        """Return missions in the adaptive rolling window.
+        """Return missions in the adaptive rolling window, newest first.
 
         1. Start with missions completed in the last window_days days.
         2. If fewer than min_missions, extend back to capture min_missions.
         3. If fewer than min_missions exist total, return all of them.
+        Future-dated missions are never included.
         """
-        cutoff = now - timedelta(days=window_days)
-
-        # Filter out future-dated entries, then sort descending
-        valid_missions = [m for m in self._missions if m.completed_utc <= now]
-        sorted_missions = sorted(
-            valid_missions, key=lambda m: m.completed_utc, reverse=True
-        )
-
-        # Get missions within the time window
-        in_window = [m for m in sorted_missions if m.completed_utc >= cutoff]
-
-        if len(in_window) >= min_missions:
-            return in_window
-
-        # Not enough in time window — extend back to capture min_missions
-        return sorted_missions[:min_missions]
+        lo, hi = self._mission_bounds(window_days, min_missions, now)
+        return self._mission_rows[lo:hi][::-1]
 
     def costs_in_window(
         self,
@@ -89,13 +207,35 @@ class OperationalLedger:
 
         The cost window matches the mission window: if the mission window
         extended back beyond window_days to capture min_missions, the
-        cost window extends correspondingly.
+        cost window extends correspondingly. Costs are returned in the
+        order they were recorded.
         """
-        window_missions = self.missions_in_window(window_days, min_missions, now)
-
-        if not window_missions:
+        lo, hi = self._mission_bounds(window_days, min_missions, now)
+        if lo == hi:
             return []
 
         # Use the earliest mission in the window as the cost cutoff
-        earliest_mission = min(m.completed_utc for m in window_missions)
-        return [c for c in self._costs if earliest_mission <= c.timestamp_utc <= now]
+        earliest = self._mission_times[lo]
+        selected: List[tuple[int, OperationalCostEntry]] = []
+        for category, times in self._cost_times.items():
+            rows = self._cost_rows[category]
+            selected.extend(
+                rows[bisect_left(times, earliest):bisect_right(times, now)]
+            )
+        selected.sort(key=lambda row: row[0])
+        return [entry for _, entry in selected]
+
+    def _mission_bounds(
+        self,
+        window_days: int,
+        min_missions: int,
+        now: datetime,
+    ) -> tuple[int, int]:
+        """Return [lo, hi) of the window in the time-ordered mission rows."""
+        hi = bisect_right(self._mission_times, now)
+        cutoff = now - timedelta(days=window_days)
+        lo = min(bisect_left(self._mission_times, cutoff), hi)
+        if hi - lo >= min_missions:
+            return lo, hi
+        # Not enough in time window — extend back to capture min_missions
+        return max(0, hi - min_missions), hi
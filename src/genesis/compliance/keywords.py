@@ -0,0 +1,172 @@
+"""Keyword automaton — every prohibited-keyword hit in one pass over the text.
+
+ComplianceScreener used to test each keyword with a separate substring
+search, once for the reject tier and again for the flag tier. The
+automaton compiles all keywords of all tiers into one prefix trie and
+scans the text once, reporting every (tier, category) whose keyword
+occurs anywhere in it. That is the same answer as the per-keyword
+``keyword in text`` loops, overlapping occurrences included.
+
+The trie is rendered as a regular expression so that the scan runs
+inside the C regex engine rather than a per-character Python loop:
+
+- Siblings in the trie start with distinct characters, so the text fixes
+  a single path through the trie from any start position, and the greedy
+  pattern finds the longest keyword on that path.
+- Every keyword matching at that position is a prefix of the longest one,
+  so each keyword carries the precomputed labels of all its prefixes
+  (its "closure").
+- Resuming the search one character after each match start, rather than
+  after its end, reports keywords that overlap earlier matches.
+
+Scan cost is linear in the text plus the number of match positions. It
+does not grow with the number of keywords, so amendments that extend the
+keyword lists do not slow screening down.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from typing import Iterable, Mapping
+
+# Joins documents for a bulk scan. Normalised text never contains it,
+# so no match can span two documents.
+_DOC_SEPARATOR = "\x00"
+
+
+class KeywordAutomaton:
+    """Compiled multi-keyword matcher over tiered category keyword lists.
+
+    Usage:
+        automaton = KeywordAutomaton({
+            "reject": {"financial_fraud": ["ponzi scheme"]},
+            "flag": {"financial_fraud": ["fraud", "scam"]},
+        })
+        automaton.scan("run a ponzi scheme")
+        # {"reject": {"financial_fraud"}, "flag": set()}
+    """
+
+    def __init__(self, tiers: Mapping[str, Mapping[str, Iterable[str]]]) -> None:
+        self._tiers = tuple(tiers)
+        labels: dict[str, set[tuple[str, str]]] = {}
+        # An empty keyword is a substring of every text.
+        always: set[tuple[str, str]] = set()
+        for tier, categories in tiers.items():
+            for category, keywords in categories.items():
+                for keyword in keywords:
+                    if keyword:
+                        labels.setdefault(keyword, set()).add((tier, category))
+                    else:
+                        always.add((tier, category))
+        self._always: frozenset[tuple[str, str]] = frozenset(always)
+
+        trie: dict[str, dict] = {}
+        for keyword in labels:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[""] = keyword
+
+        self._closure: dict[str, frozenset[tuple[str, str]]] = {}
+        self._collect_closures(trie, frozenset(), labels)
+        self._pattern = re.compile(_render(trie)) if labels else None
+
+    @property
+    def tiers(self) -> tuple[str, ...]:
+        return self._tiers
+
+    @property
+    def keyword_count(self) -> int:
+        return len(self._closure)
+
+    def scan(self, text: str) -> dict[str, set[str]]:
+        """Return {tier: categories with a keyword occurring in text}."""
+        result: dict[str, set[str]] = {tier: set() for tier in self._tiers}
+        for tier, category in self._hits(text):
+            result[tier].add(category)
+        return result
+
+    def scan_many(self, texts: list[str]) -> list[dict[str, set[str]]]:
+        """Scan many texts in one pass. Results are in input order.
+
+        Texts must not contain the NUL character (normalised text never
+        does); they are joined with it for a single scan.
+        """
+        results: list[dict[str, set[str]]] = [
+            {tier: set() for tier in self._tiers} for _ in texts
+        ]
+        if not texts:
+            return results
+        if any(_DOC_SEPARATOR in text for text in texts):
+            raise ValueError("Texts for a bulk scan must not contain NUL")
+
+        starts: list[int] = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        corpus = _DOC_SEPARATOR.join(texts)
+
+        for result in results:
+            for tier, category in self._always:
+                result[tier].add(category)
+        for position, hits in self._matches(corpus):
+            result = results[bisect_right(starts, position) - 1]
+            for tier, category in hits:
+                result[tier].add(category)
+        return results
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _hits(self, text: str) -> set[tuple[str, str]]:
+        hits = set(self._always)
+        for _, closure in self._matches(text):
+            hits |= closure
+        return hits
+
+    def _matches(self, text: str):
+        """Yield (start, labels) for every position where a keyword starts."""
+        if self._pattern is None:
+            return
+        search = self._pattern.search
+        closure = self._closure
+        pos = 0
+        while True:
+            m = search(text, pos)
+            if m is None:
+                return
+            yield m.start(), closure[m.group()]
+            pos = m.start() + 1
+
+    def _collect_closures(
+        self,
+        node: dict[str, dict],
+        inherited: frozenset[tuple[str, str]],
+        labels: Mapping[str, set[tuple[str, str]]],
+    ) -> None:
+        keyword = node.get("")
+        if keyword is not None:
+            inherited = inherited | labels[keyword]
+            self._closure[keyword] = inherited
+        for ch, child in node.items():
+            if ch:
+                self._collect_closures(child, inherited, labels)
+
+
+def _render(node: dict[str, dict]) -> str:
+    """Render a trie node as a greedy regex over its continuations."""
+    branches = [
+        re.escape(ch) + _render(child)
+        for ch, child in sorted(node.items())
+        if ch
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if "" in node:
+        # A keyword ends here: prefer a longer keyword, fall back to this one.
+        return f"(?:{body})?"
+    return body
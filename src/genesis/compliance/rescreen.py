@@ -0,0 +1,154 @@
+"""Bulk compliance re-screening — stream existing work through the screener.
+
+Screening normally happens once, when a listing, mission or GCF proposal
+is created. When the prohibited keyword lists change, existing work has
+to be screened again. ComplianceRescreener does that in fixed-size
+chunks, optionally spread across a process pool. It yields each
+chunk's results in input order so that the caller can record them and
+advance a checkpoint after every chunk.
+
+Subjects are screened in a fixed total order (kind, then ID), and a
+checkpoint is the cursor of the last subject whose results were
+recorded. A job interrupted at any point resumes from its last
+checkpoint without skipping or repeating work.
+
+Screening is pure: workers receive the keyword lists explicitly (a copy
+of ComplianceScreener.keyword_lists()), so a pool always screens with
+exactly the lists of the screener it was given. In-process runs reuse
+the screener's compiled automaton instead of compiling one per chunk.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, Mapping, Optional
+
+from genesis.compliance.keywords import KeywordAutomaton
+from genesis.compliance.screener import (
+    ComplianceResult,
+    ComplianceScreener,
+    normalise_text,
+    verdict_for,
+)
+
+# Re-screening order of subject kinds.
+SUBJECT_KINDS: tuple[str, ...] = ("listing", "mission", "disbursement")
+
+
+@dataclass(frozen=True)
+class ScreeningSubject:
+    """One piece of existing work, reduced to the text fields screened."""
+    kind: str
+    subject_id: str
+    title: str
+    description: str
+    tags: Optional[tuple[str, ...]] = None
+
+    @property
+    def cursor(self) -> str:
+        return f"{self.kind}/{self.subject_id}"
+
+    @property
+    def order_key(self) -> tuple[int, str]:
+        return (SUBJECT_KINDS.index(self.kind), self.subject_id)
+
+
+def cursor_order_key(cursor: str) -> tuple[int, str]:
+    """Order key of a checkpoint cursor ("<kind>/<subject_id>").
+
+    Raises ValueError for a malformed cursor or unknown kind.
+    """
+    kind, sep, subject_id = cursor.partition("/")
+    if not sep or kind not in SUBJECT_KINDS:
+        raise ValueError(f"Invalid re-screening cursor: {cursor!r}")
+    return (SUBJECT_KINDS.index(kind), subject_id)
+
+
+def screen_chunk(
+    reject_keywords: Mapping[str, list[str]],
+    flag_keywords: Mapping[str, list[str]],
+    subjects: list[ScreeningSubject],
+    now: datetime,
+) -> list[ComplianceResult]:
+    """Screen one chunk. Module-level so that it can run in a worker process."""
+    automaton = KeywordAutomaton({"reject": reject_keywords, "flag": flag_keywords})
+    texts = [
+        normalise_text(s.title, s.description, list(s.tags or ()))
+        for s in subjects
+    ]
+    return [verdict_for(hits, now) for hits in automaton.scan_many(texts)]
+
+
+class ComplianceRescreener:
+    """Screens a stream of subjects in chunks, optionally in parallel.
+
+    Usage:
+        rescreener = ComplianceRescreener(screener, chunk_size=500, workers=4)
+        for subjects, results in rescreener.run(stream, now):
+            ...  # record results, then checkpoint subjects[-1].cursor
+    """
+
+    def __init__(
+        self,
+        screener: ComplianceScreener,
+        chunk_size: int = 500,
+        workers: int = 0,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if workers < 0:
+            raise ValueError("workers must be non-negative")
+        keywords = screener.keyword_lists()
+        self._screener = screener
+        self._reject = keywords["reject"]
+        self._flag = keywords["flag"]
+        self._chunk_size = chunk_size
+        self._workers = workers
+
+    def run(
+        self,
+        subjects: Iterable[ScreeningSubject],
+        now: datetime,
+    ) -> Iterator[tuple[list[ScreeningSubject], list[ComplianceResult]]]:
+        """Yield (chunk, results) pairs in input order.
+
+        With workers <= 1 chunks are screened in this process, with the
+        screener's own compiled automaton. Otherwise they are screened
+        across a process pool, at most ``workers`` chunks ahead of the
+        consumer.
+        """
+        chunks = self._chunks(subjects)
+        if self._workers <= 1:
+            for chunk in chunks:
+                yield chunk, self._screener.screen_many(
+                    ((s.title, s.description, list(s.tags or ())) for s in chunk),
+                    now,
+                )
+            return
+
+        with ProcessPoolExecutor(max_workers=self._workers) as pool:
+            pending: list = []
+            for chunk in chunks:
+                pending.append((chunk, pool.submit(
+                    screen_chunk, self._reject, self._flag, chunk, now,
+                )))
+                if len(pending) > self._workers:
+                    done_chunk, future = pending.pop(0)
+                    yield done_chunk, future.result()
+            for done_chunk, future in pending:
+                yield done_chunk, future.result()
+
+    def _chunks(
+        self,
+        subjects: Iterable[ScreeningSubject],
+    ) -> Iterator[list[ScreeningSubject]]:
+        chunk: list[ScreeningSubject] = []
+        for subject in subjects:
+            chunk.append(subject)
+            if len(chunk) == self._chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
@@ -23,7 +23,9 @@ import re
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import FrozenSet, Optional
+from typing import FrozenSet, Iterable, Optional
+
+from genesis.compliance.keywords import KeywordAutomaton
 
 
 class ComplianceVerdict(str, enum.Enum):
@@ -151,6 +153,21 @@ class ComplianceScreener:
 
     def __init__(self) -> None:
         self._complaints: dict[str, ComplianceComplaint] = {}
+        self._automaton = self._compile_keywords()
+
+    def _compile_keywords(self) -> KeywordAutomaton:
+        return KeywordAutomaton(self.keyword_lists())
+
+    def keyword_lists(self) -> dict[str, dict[str, list[str]]]:
+        """Return a copy of the keyword lists: {"reject"|"flag": {category: [kw]}}."""
+        return {
+            "reject": {c: list(kws) for c, kws in self._REJECT_KEYWORDS.items()},
+            "flag": {c: list(kws) for c, kws in self._FLAG_KEYWORDS.items()},
+        }
+
+    def reload_keywords(self) -> None:
+        """Recompile the keyword automaton after the keyword lists change."""
+        self._automaton = self._compile_keywords()
 
     def screen_mission(
         self,
@@ -167,51 +184,27 @@ class ComplianceScreener:
         if now is None:
             now = datetime.now(timezone.utc)
 
-        combined = f"{title} {description} {' '.join(tags or [])}".lower()
-        combined = re.sub(r"[^a-z0-9\s]", " ", combined)
-
-        # Phase 1: Check for REJECTED matches (high confidence)
-        rejected_categories: list[str] = []
-        for category, keywords in self._REJECT_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in combined:
-                    rejected_categories.append(category)
-                    break
-
-        if rejected_categories:
-            return ComplianceResult(
-                verdict=ComplianceVerdict.REJECTED,
-                categories_matched=sorted(set(rejected_categories)),
-                reason=f"Prohibited content detected: {', '.join(sorted(set(rejected_categories)))}",
-                confidence=1.0,
-                screened_utc=now,
-            )
+        hits = self._automaton.scan(normalise_text(title, description, tags))
+        return verdict_for(hits, now)
 
-        # Phase 2: Check for FLAGGED matches (lower confidence)
-        flagged_categories: list[str] = []
-        for category, keywords in self._FLAG_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in combined:
-                    flagged_categories.append(category)
-                    break
-
-        if flagged_categories:
-            return ComplianceResult(
-                verdict=ComplianceVerdict.FLAGGED,
-                categories_matched=sorted(set(flagged_categories)),
-                reason=f"Potential compliance concern: {', '.join(sorted(set(flagged_categories)))}",
-                confidence=0.6,
-                screened_utc=now,
-            )
+    def screen_many(
+        self,
+        proposals: Iterable[tuple[str, str, Optional[list[str]]]],
+        now: Optional[datetime] = None,
+    ) -> list[ComplianceResult]:
+        """Screen many (title, description, tags) proposals in one pass.
 
-        # Phase 3: Clear
-        return ComplianceResult(
-            verdict=ComplianceVerdict.CLEAR,
-            categories_matched=[],
-            reason="No compliance concerns detected",
-            confidence=1.0,
-            screened_utc=now,
-        )
+        Each result is identical to screen_mission() on the same input.
+        Intended for bulk re-screening, e.g. after a keyword amendment.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        texts = [
+            normalise_text(title, description, tags)
+            for title, description, tags in proposals
+        ]
+        return [verdict_for(hits, now) for hits in self._automaton.scan_many(texts)]
 
     def screen_gcf_proposal(
         self,
@@ -229,14 +222,10 @@ class ComplianceScreener:
         Design test #56: Can a disbursement proposal bypass compliance screening?
         If yes, reject design.
         """
-        combined_text = " ".join([
-            title,
-            description,
-            recipient_description,
-            " ".join(deliverables),
-        ])
         return self.screen_mission(
-            title=combined_text,
+            title=gcf_proposal_text(
+                title, description, recipient_description, deliverables,
+            ),
             description="",
             tags=None,
             now=now,
@@ -301,3 +290,58 @@ class ComplianceScreener:
             now = datetime.now(timezone.utc)
         elapsed = (now - complaint.filed_utc).days
         return elapsed <= statute_of_limitations_days
+
+
+def normalise_text(title: str, description: str, tags: Optional[list[str]]) -> str:
+    """Lower-case and strip punctuation from the fields that are screened."""
+    combined = f"{title} {description} {' '.join(tags or [])}".lower()
+    return re.sub(r"[^a-z0-9\s]", " ", combined)
+
+
+def gcf_proposal_text(
+    title: str,
+    description: str,
+    recipient_description: str,
+    deliverables: list[str],
+) -> str:
+    """All GCF proposal text fields, combined as screen_gcf_proposal() screens them."""
+    return " ".join([
+        title,
+        description,
+        recipient_description,
+        " ".join(deliverables),
+    ])
+
+
+def verdict_for(hits: dict[str, set[str]], now: datetime) -> ComplianceResult:
+    """Turn automaton hits ({"reject": ..., "flag": ...}) into a result."""
+    # Phase 1: REJECTED matches (high confidence)
+    rejected_categories = sorted(hits["reject"])
+    if rejected_categories:
+        return ComplianceResult(
+            verdict=ComplianceVerdict.REJECTED,
+            categories_matched=rejected_categories,
+            reason=f"Prohibited content detected: {', '.join(rejected_categories)}",
+            confidence=1.0,
+            screened_utc=now,
+        )
+
+    # Phase 2: FLAGGED matches (lower confidence)
+    flagged_categories = sorted(hits["flag"])
+    if flagged_categories:
+        return ComplianceResult(
+            verdict=ComplianceVerdict.FLAGGED,
+            categories_matched=flagged_categories,
+            reason=f"Potential compliance concern: {', '.join(flagged_categories)}",
+            confidence=0.6,
+            screened_utc=now,
+        )
+
+    # Phase 3: Clear
+    return ComplianceResult(
+        verdict=ComplianceVerdict.CLEAR,
+        categories_matched=[],
+        reason="No compliance concerns detected",
+        confidence=1.0,
+        screened_utc=now,
+    )
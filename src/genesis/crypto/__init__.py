@@ -1,7 +1,31 @@
 """Cryptographic primitives — Merkle trees, commitment building, hashing, epoch service."""
 
-from genesis.crypto.merkle import MerkleTree
+from genesis.crypto.merkle import (
+    MerkleAccumulator,
+    MerkleMultiProof,
+    MerkleProof,
+    MerkleTree,
+    verify_inclusion,
+    verify_multi_proof,
+)
 from genesis.crypto.commitment_builder import CommitmentBuilder
 from genesis.crypto.epoch_service import EpochService
+from genesis.crypto.anchor import ChainClient, MockChain, Web3Chain
+from genesis.crypto.anchor_queue import AnchorBatch, AnchorQueue, AnchorStatus
 
-__all__ = ["MerkleTree", "CommitmentBuilder", "EpochService"]
+__all__ = [
+    "AnchorBatch",
+    "AnchorQueue",
+    "AnchorStatus",
+    "ChainClient",
+    "MockChain",
+    "Web3Chain",
+    "MerkleAccumulator",
+    "MerkleMultiProof",
+    "MerkleProof",
+    "MerkleTree",
+    "CommitmentBuilder",
+    "EpochService",
+    "verify_inclusion",
+    "verify_multi_proof",
+]
@@ -13,16 +13,26 @@ Genesis uses blockchain anchoring to prove:
 1. The constitution existed in a specific form at a specific time.
 2. Epoch commitment payloads were produced and recorded.
 3. Governance decisions were logged before outcomes were known.
+
+Chain clients:
+    anchor_to_chain() blocks until the transaction is mined. Callers that
+    must not block hand digests to an AnchorQueue instead, which submits
+    them from a background worker through a ChainClient: Web3Chain for a
+    real network, or MockChain, an in-process chain for tests and offline
+    development.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Protocol, runtime_checkable
 
 
 @dataclass(frozen=True)
@@ -124,3 +134,119 @@ def anchor_to_chain(
         timestamp_utc=now,
         explorer_url=explorer_url,
     )
+
+
+@runtime_checkable
+class ChainClient(Protocol):
+    """Anything that can embed a digest on a chain and report where it landed."""
+
+    def submit(self, digest: str) -> AnchorRecord:
+        """Anchor a raw SHA-256 hex digest. Raises on failure."""
+        ...
+
+
+class Web3Chain:
+    """ChainClient over an Ethereum RPC endpoint (wraps anchor_to_chain).
+
+    Usage:
+        chain = Web3Chain(rpc_url, private_key)
+        anchor = chain.submit(digest)
+    """
+
+    def __init__(
+        self,
+        rpc_url: str,
+        private_key: str,
+        chain_id: int = 11155111,  # Sepolia
+    ) -> None:
+        self._rpc_url = rpc_url
+        self._private_key = private_key
+        self.chain_id = chain_id
+
+    @classmethod
+    def from_env(cls) -> Optional[Web3Chain]:
+        """Build from SEPOLIA_RPC_URL and PRIVATE_KEY, or None if unset.
+
+        Same variables as tools/anchor_constitution.py (SEPOLIA_PRIVATE_KEY
+        is accepted for the key).
+        """
+        rpc_url = os.environ.get("SEPOLIA_RPC_URL")
+        private_key = os.environ.get("PRIVATE_KEY") or os.environ.get("SEPOLIA_PRIVATE_KEY")
+        if not rpc_url or not private_key:
+            return None
+        return cls(rpc_url, private_key)
+
+    def submit(self, digest: str) -> AnchorRecord:
+        return anchor_to_chain(
+            digest=digest,
+            rpc_url=self._rpc_url,
+            private_key=self._private_key,
+            chain_id=self.chain_id,
+        )
+
+
+class MockChain:
+    """In-process ChainClient for tests and offline development.
+
+    Each submission mines one block immediately (after ``latency``
+    seconds) and returns a deterministic transaction hash. Failures can
+    be injected to exercise retry paths. Mock anchors carry a mock://
+    explorer URL and a local chain id, so they never earn the /audit
+    on-chain badge.
+
+    Usage:
+        chain = MockChain(latency=0.5)
+        chain.fail_next(2)          # the next two submissions raise
+        anchor = chain.submit(digest)
+        chain.lookup(anchor.tx_hash)  # -> digest
+    """
+
+    def __init__(self, chain_id: int = 31337, latency: float = 0.0) -> None:
+        if latency < 0:
+            raise ValueError("latency must be >= 0")
+        self.chain_id = chain_id
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._block_number = 0
+        self._failures = 0
+        self._transactions: dict[str, str] = {}  # tx_hash -> digest
+
+    def fail_next(self, count: int = 1) -> None:
+        """Make the next ``count`` submissions raise ConnectionError."""
+        with self._lock:
+            self._failures += count
+
+    def submit(self, digest: str) -> AnchorRecord:
+        bytes.fromhex(digest)  # same validation as a real transaction payload
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            if self._failures:
+                self._failures -= 1
+                raise ConnectionError("mock chain: injected submission failure")
+            self._block_number += 1
+            block = self._block_number
+            tx_hash = hashlib.sha256(
+                f"{self.chain_id}:{block}:{digest}".encode("utf-8"),
+            ).hexdigest()
+            self._transactions[tx_hash] = digest
+        return AnchorRecord(
+            document_path="",
+            sha256_hash=digest,
+            tx_hash=tx_hash,
+            block_number=block,
+            chain_id=self.chain_id,
+            timestamp_utc=datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            explorer_url=f"mock://{self.chain_id}/tx/{tx_hash}",
+        )
+
+    def lookup(self, tx_hash: str) -> Optional[str]:
+        """The digest embedded by ``tx_hash``, or None if it was never mined."""
+        with self._lock:
+            return self._transactions.get(tx_hash)
+
+    @property
+    def transactions(self) -> dict[str, str]:
+        """All mined transactions: {tx_hash: digest}."""
+        with self._lock:
+            return dict(self._transactions)
@@ -0,0 +1,569 @@
+"""Anchoring queue — durable, asynchronous L1 anchoring of epoch commitments.
+
+Anchoring a commitment means waiting for a transaction to be mined, which
+can take minutes. Closing an epoch must not wait for that, so commitments
+are enqueued here and a background worker anchors them:
+
+1. enqueue() journals the commitment hash and returns at once.
+2. The worker takes the due entries (up to batch_size), builds a Merkle
+   tree over their commitment hashes and anchors the root in ONE
+   transaction. A single entry anchors its own hash unchanged, exactly
+   as EpochService.anchor_commitment() would.
+3. A failed submission is retried with exponential backoff; the whole
+   batch shares the attempt count.
+4. The resulting AnchorBatch records the transaction and can produce an
+   inclusion proof linking each epoch commitment to the anchored root.
+
+Durability:
+    Every state change is an fsynced line in an append-only JSONL
+    journal, replayed on construction, so a restart loses no enqueued
+    commitment and no anchor result. A torn final line (crash mid-write)
+    is ignored. Delivery is at-least-once: a crash between a successful
+    submission and its journal line leaves the entries pending, and they
+    are anchored again after restart. compact() rewrites the journal
+    down to the live state.
+"""
+
+from __future__ import annotations
+
+import enum
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional
+
+from genesis.crypto.anchor import AnchorRecord, ChainClient
+from genesis.crypto.merkle import MerkleProof, MerkleTree
+from genesis.persistence.state_store import _atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+
+class AnchorStatus(str, enum.Enum):
+    """Lifecycle of a queued commitment."""
+    PENDING = "pending"
+    ANCHORED = "anchored"
+    FAILED = "failed"  # gave up after max_attempts; see requeue_failed()
+
+
+@dataclass
+class AnchorEntry:
+    """One epoch commitment waiting for, or holding, an anchor."""
+    entry_id: str
+    epoch_id: str
+    commitment_hash: str
+    enqueued_utc: datetime
+    status: AnchorStatus = AnchorStatus.PENDING
+    attempts: int = 0
+    next_attempt_utc: Optional[datetime] = None
+    last_error: str = ""
+    batch_id: str = ""
+
+
+@dataclass(frozen=True)
+class AnchorBatch:
+    """One anchored transaction covering one or more epoch commitments."""
+    batch_id: str
+    anchor: AnchorRecord
+    entry_ids: tuple[str, ...]
+    epoch_ids: tuple[str, ...]
+    commitment_hashes: tuple[str, ...]
+    merkle_root: str
+    collected: bool = False
+
+    def proof_for(self, commitment_hash: str) -> Optional[MerkleProof]:
+        """Inclusion proof of a commitment in the anchored root, or None."""
+        tree = MerkleTree()
+        for leaf in self.commitment_hashes:
+            tree.add_leaf(leaf)
+        tree.compute_root()
+        return tree.inclusion_proof(commitment_hash)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _merkle_root(leaves: list[str]) -> str:
+    tree = MerkleTree()
+    for leaf in leaves:
+        tree.add_leaf(leaf)
+    return tree.compute_root()
+
+
+class AnchorQueue:
+    """Durable queue that anchors epoch commitments from a background worker.
+
+    Usage:
+        queue = AnchorQueue(Path("anchors.jsonl"), MockChain(), batch_size=8)
+        queue.start()                     # background worker
+        entry_id = queue.enqueue(record.epoch_id, commitment_hash)
+        ...
+        for batch in queue.uncollected_batches():
+            ...                           # record batch.anchor
+        queue.mark_collected([b.batch_id for b in batches])
+        queue.compact()                   # drop what has been collected
+        queue.stop()
+
+    GenesisService.collect_anchor_results() does the collect-and-compact
+    step; pass it as start(on_anchored=...) to run it as anchors land.
+
+    Without a worker, process_once() runs one submission round inline.
+    linger_seconds holds back a partial batch until its oldest entry has
+    waited that long, so several epochs share one transaction.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path],
+        chain: ChainClient,
+        batch_size: int = 16,
+        linger_seconds: float = 0.0,
+        base_delay_seconds: float = 30.0,
+        max_delay_seconds: float = 3600.0,
+        max_attempts: Optional[int] = None,
+        fsync: bool = True,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if linger_seconds < 0 or base_delay_seconds < 0 or max_delay_seconds < 0:
+            raise ValueError("delays must be >= 0")
+        if max_attempts is not None and max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self._path = path
+        self._chain = chain
+        self._batch_size = batch_size
+        self._linger = timedelta(seconds=linger_seconds)
+        self._base_delay = base_delay_seconds
+        self._max_delay = max_delay_seconds
+        self._max_attempts = max_attempts
+        self._fsync = fsync
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._file: Optional[BinaryIO] = None
+        self._entries: dict[str, AnchorEntry] = {}  # in enqueue order
+        self._by_hash: dict[str, str] = {}  # commitment_hash -> entry_id
+        self._batches: dict[str, AnchorBatch] = {}  # in anchor order
+        self._in_flight: set[str] = set()
+        self._entry_seq = 0
+        self._batch_seq = 0
+        self._last_enqueued: Optional[datetime] = None
+
+        self._worker: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+
+        if path is not None and path.exists():
+            self._replay(path)
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def enqueue(self, epoch_id: str, commitment_hash: str) -> str:
+        """Queue a commitment for anchoring. Returns its entry_id.
+
+        Returns at once; the commitment is durable when this returns.
+        Enqueuing a commitment hash that is already queued or anchored
+        returns the existing entry. Raises OSError if the journal write
+        fails, in which case nothing was queued.
+        """
+        with self._lock:
+            existing = self._by_hash.get(commitment_hash)
+            if existing is not None:
+                return existing
+            op = {
+                "op": "enqueue",
+                "entry_id": f"ANCHOR-{self._entry_seq + 1:06d}",
+                "epoch_id": epoch_id,
+                "commitment_hash": commitment_hash,
+                "enqueued_utc": self._clock().isoformat(),
+            }
+            self._commit(op)
+        self._wake.set()
+        return op["entry_id"]
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def process_once(self) -> Optional[AnchorBatch]:
+        """Submit one batch of due entries. Returns the batch if it anchored.
+
+        The chain call runs outside the queue lock, so enqueue() never
+        waits for the chain. Returns None when nothing is due or the
+        submission failed (the failure is journaled with its backoff).
+        """
+        with self._lock:
+            now = self._clock()
+            due = [
+                e for e in self._entries.values()
+                if e.status is AnchorStatus.PENDING
+                and e.entry_id not in self._in_flight
+                and e.next_attempt_utc <= now
+            ]
+            if not due:
+                return None
+            if len(due) < self._batch_size and now - due[0].enqueued_utc < self._linger:
+                return None
+            due = due[:self._batch_size]
+            self._in_flight.update(e.entry_id for e in due)
+            leaves = [e.commitment_hash for e in due]
+
+        try:
+            root = _merkle_root(leaves)
+            try:
+                anchor = self._chain.submit(root.removeprefix("sha256:"))
+            except Exception as e:
+                self._record_failure(due, f"{type(e).__name__}: {e}")
+                return None
+            with self._lock:
+                op = {
+                    "op": "anchored",
+                    "batch_id": f"BATCH-{self._batch_seq + 1:06d}",
+                    "entry_ids": [e.entry_id for e in due],
+                    "merkle_root": root,
+                    "anchor": asdict(anchor),
+                }
+                self._commit(op)
+                return self._batches[op["batch_id"]]
+        finally:
+            with self._lock:
+                self._in_flight.difference_update(e.entry_id for e in due)
+
+    def run_until_idle(self) -> list[AnchorBatch]:
+        """Call process_once() until nothing more anchors. Returns the batches."""
+        batches: list[AnchorBatch] = []
+        while (batch := self.process_once()) is not None:
+            batches.append(batch)
+        return batches
+
+    def start(
+        self,
+        poll_interval: float = 1.0,
+        on_anchored: Optional[Callable[[list[AnchorBatch]], None]] = None,
+    ) -> None:
+        """Start the background worker thread (idempotent).
+
+        on_anchored, if given, is called on the worker thread after every
+        round that anchored at least one batch, with those batches, so
+        the consumer can collect the results (and compact the journal)
+        as they arrive.
+        """
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stopping.clear()
+        self._worker = threading.Thread(
+            target=self._run, args=(poll_interval, on_anchored),
+            name="anchor-queue-worker", daemon=True,
+        )
+        self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker. An in-flight submission is allowed to finish."""
+        self._stopping.set()
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def hours_since_last_enqueue(self) -> float:
+        """Hours since the newest commitment was queued (inf if none ever was).
+
+        Drives the tier cadence in GenesisService.close_epoch(); survives
+        restarts and compact().
+        """
+        with self._lock:
+            if self._last_enqueued is None:
+                return float("inf")
+            return (self._clock() - self._last_enqueued).total_seconds() / 3600
+
+    def get_entry(self, entry_id: str) -> Optional[AnchorEntry]:
+        with self._lock:
+            return self._entries.get(entry_id)
+
+    def pending(self) -> list[AnchorEntry]:
+        """Entries not yet anchored, in enqueue order."""
+        return self._entries_in(AnchorStatus.PENDING)
+
+    def failed(self) -> list[AnchorEntry]:
+        """Entries that exhausted max_attempts, in enqueue order."""
+        return self._entries_in(AnchorStatus.FAILED)
+
+    def batches(self) -> list[AnchorBatch]:
+        """Every anchored batch, in anchor order."""
+        with self._lock:
+            return list(self._batches.values())
+
+    def uncollected_batches(self) -> list[AnchorBatch]:
+        """Anchored batches whose results have not been mark_collected()."""
+        with self._lock:
+            return [b for b in self._batches.values() if not b.collected]
+
+    def batch_for(self, commitment_hash: str) -> Optional[AnchorBatch]:
+        """The batch that anchored a commitment, or None if not anchored yet."""
+        with self._lock:
+            entry_id = self._by_hash.get(commitment_hash)
+            if entry_id is None:
+                return None
+            return self._batches.get(self._entries[entry_id].batch_id)
+
+    def mark_collected(self, batch_ids: list[str]) -> None:
+        """Record that these batches' anchors have been consumed."""
+        with self._lock:
+            unknown = [b for b in batch_ids if b not in self._batches]
+            if unknown:
+                raise KeyError(f"Unknown anchor batch(es): {unknown}")
+            self._commit({"op": "collected", "batch_ids": list(batch_ids)})
+
+    def requeue_failed(self) -> int:
+        """Return failed entries to the queue with a fresh attempt budget."""
+        with self._lock:
+            ids = [
+                e.entry_id for e in self._entries.values()
+                if e.status is AnchorStatus.FAILED
+            ]
+            if ids:
+                self._commit({
+                    "op": "requeue",
+                    "entry_ids": ids,
+                    "next_attempt_utc": self._clock().isoformat(),
+                })
+        if ids:
+            self._wake.set()
+        return len(ids)
+
+    def compact(self) -> None:
+        """Rewrite the journal to the minimal ops reproducing current state.
+
+        Collected batches and their entries are dropped: their anchors
+        live on in the consumer's records. A queue without a journal
+        just drops them from memory.
+        """
+        with self._lock:
+            live = {
+                e.entry_id for e in self._entries.values()
+                if not (e.batch_id and self._batches[e.batch_id].collected)
+            }
+            if self._path is not None:
+                self._rewrite_journal(live)
+            self._entries = {k: v for k, v in self._entries.items() if k in live}
+            self._by_hash = {e.commitment_hash: e.entry_id for e in self._entries.values()}
+            self._batches = {k: v for k, v in self._batches.items() if not v.collected}
+
+    def _rewrite_journal(self, live: set[str]) -> None:
+        """Atomically replace the journal with ops for the live entries."""
+        assert self._path is not None
+        lines: list[str] = []
+        for e in self._entries.values():
+            if e.entry_id not in live:
+                continue
+            lines.append(json.dumps({
+                "op": "enqueue",
+                "entry_id": e.entry_id,
+                "epoch_id": e.epoch_id,
+                "commitment_hash": e.commitment_hash,
+                "enqueued_utc": e.enqueued_utc.isoformat(),
+            }, sort_keys=True))
+            if e.attempts and not e.batch_id:
+                lines.append(json.dumps(self._failure_op(
+                    [e.entry_id], e.attempts, e.last_error,
+                    e.next_attempt_utc, e.status,
+                ), sort_keys=True))
+        for b in self._batches.values():
+            if not b.collected:
+                lines.append(json.dumps({
+                    "op": "anchored",
+                    "batch_id": b.batch_id,
+                    "entry_ids": list(b.entry_ids),
+                    "merkle_root": b.merkle_root,
+                    "anchor": asdict(b.anchor),
+                }, sort_keys=True))
+        # Keep the sequences so ids are never reused after a restart,
+        # and the last enqueue time so the anchoring cadence survives.
+        sequence: dict[str, Any] = {
+            "op": "sequence",
+            "entry_seq": self._entry_seq,
+            "batch_seq": self._batch_seq,
+        }
+        if self._last_enqueued is not None:
+            sequence["last_enqueued_utc"] = self._last_enqueued.isoformat()
+        lines.append(json.dumps(sequence, sort_keys=True))
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        _atomic_write_text(self._path, "".join(f"{line}\n" for line in lines))
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _run(
+        self,
+        poll_interval: float,
+        on_anchored: Optional[Callable[[list[AnchorBatch]], None]],
+    ) -> None:
+        while not self._stopping.is_set():
+            self._wake.clear()
+            try:
+                batches = self.run_until_idle()
+                if batches and on_anchored is not None:
+                    on_anchored(batches)
+            except Exception:
+                # Journal unavailable or an unexpected bug: entries stay
+                # pending and are retried next poll. The worker must not die.
+                logger.exception("Anchor queue worker round failed")
+            self._wake.wait(poll_interval)
+
+    def _note_enqueued(self, enqueued: datetime) -> None:
+        if self._last_enqueued is None or enqueued > self._last_enqueued:
+            self._last_enqueued = enqueued
+
+    def _entries_in(self, status: AnchorStatus) -> list[AnchorEntry]:
+        with self._lock:
+            return [e for e in self._entries.values() if e.status is status]
+
+    def _record_failure(self, entries: list[AnchorEntry], error: str) -> None:
+        with self._lock:
+            attempts = max(e.attempts for e in entries) + 1
+            if self._max_attempts is not None and attempts >= self._max_attempts:
+                status = AnchorStatus.FAILED
+                next_attempt = None
+            else:
+                status = AnchorStatus.PENDING
+                delay = min(self._max_delay, self._base_delay * 2 ** (attempts - 1))
+                next_attempt = self._clock() + timedelta(seconds=delay)
+            self._commit(self._failure_op(
+                [e.entry_id for e in entries], attempts, error, next_attempt, status,
+            ))
+
+    @staticmethod
+    def _failure_op(
+        entry_ids: list[str],
+        attempts: int,
+        error: str,
+        next_attempt: Optional[datetime],
+        status: AnchorStatus,
+    ) -> dict[str, Any]:
+        return {
+            "op": "attempt_failed",
+            "entry_ids": entry_ids,
+            "attempts": attempts,
+            "error": error,
+            "next_attempt_utc": next_attempt.isoformat() if next_attempt else None,
+            "status": status.value,
+        }
+
+    def _commit(self, op: dict[str, Any]) -> None:
+        """Journal an op, then apply it. Called with _lock held.
+
+        Nothing is applied unless the journal write succeeded.
+        """
+        if self._path is not None:
+            line = (json.dumps(op, sort_keys=True) + "\n").encode("utf-8")
+            if self._file is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self._path.open("ab")
+            offset = self._file.tell()
+            try:
+                self._file.write(line)
+                self._file.flush()
+                if self._fsync:
+                    os.fsync(self._file.fileno())
+            except OSError:
+                self._file.close()
+                self._file = None
+                try:
+                    with self._path.open("r+b") as f:
+                        f.truncate(offset)
+                except OSError:
+                    pass  # The torn tail is ignored on the next replay
+                raise
+        self._apply(op)
+
+    def _apply(self, op: dict[str, Any]) -> None:
+        kind = op["op"]
+        if kind == "enqueue":
+            enqueued = datetime.fromisoformat(op["enqueued_utc"])
+            entry = AnchorEntry(
+                entry_id=op["entry_id"],
+                epoch_id=op["epoch_id"],
+                commitment_hash=op["commitment_hash"],
+                enqueued_utc=enqueued,
+                next_attempt_utc=enqueued,
+            )
+            self._entries[entry.entry_id] = entry
+            self._by_hash[entry.commitment_hash] = entry.entry_id
+            self._entry_seq += 1
+            self._note_enqueued(enqueued)
+        elif kind == "attempt_failed":
+            next_attempt = op["next_attempt_utc"]
+            for entry_id in op["entry_ids"]:
+                entry = self._entries[entry_id]
+                entry.attempts = op["attempts"]
+                entry.last_error = op["error"]
+                entry.status = AnchorStatus(op["status"])
+                entry.next_attempt_utc = (
+                    datetime.fromisoformat(next_attempt) if next_attempt else None
+                )
+        elif kind == "anchored":
+            entries = [self._entries[entry_id] for entry_id in op["entry_ids"]]
+            batch = AnchorBatch(
+                batch_id=op["batch_id"],
+                anchor=AnchorRecord(**op["anchor"]),
+                entry_ids=tuple(op["entry_ids"]),
+                epoch_ids=tuple(e.epoch_id for e in entries),
+                commitment_hashes=tuple(e.commitment_hash for e in entries),
+                merkle_root=op["merkle_root"],
+            )
+            for entry in entries:
+                entry.status = AnchorStatus.ANCHORED
+                entry.attempts += 1
+                entry.batch_id = batch.batch_id
+                entry.next_attempt_utc = None
+            self._batches[batch.batch_id] = batch
+            self._batch_seq += 1
+        elif kind == "collected":
+            for batch_id in op["batch_ids"]:
+                self._batches[batch_id] = replace(self._batches[batch_id], collected=True)
+        elif kind == "requeue":
+            next_attempt = datetime.fromisoformat(op["next_attempt_utc"])
+            for entry_id in op["entry_ids"]:
+                entry = self._entries[entry_id]
+                entry.status = AnchorStatus.PENDING
+                entry.attempts = 0
+                entry.next_attempt_utc = next_attempt
+        elif kind == "sequence":
+            self._entry_seq = max(self._entry_seq, op["entry_seq"])
+            self._batch_seq = max(self._batch_seq, op["batch_seq"])
+            if op.get("last_enqueued_utc"):
+                self._note_enqueued(datetime.fromisoformat(op["last_enqueued_utc"]))
+        else:
+            raise ValueError(f"Unknown anchor journal op: {kind!r}")
+
+    def _replay(self, path: Path) -> None:
+        """Rebuild state from the journal. A torn final line is ignored."""
+        data = path.read_bytes()
+        lines = data.split(b"\n")
+        for line_num, raw in enumerate(lines, 1):
+            if not raw.strip():
+                continue
+            try:
+                op = json.loads(raw)
+            except json.JSONDecodeError:
+                if line_num == len(lines):  # no trailing newline: torn write
+                    with path.open("r+b") as f:
+                        f.truncate(len(data) - len(raw))
+                    return
+                raise ValueError(f"Corrupt anchor journal line {line_num} in {path}")
+            self._apply(op)
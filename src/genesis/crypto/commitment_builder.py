@@ -17,7 +17,7 @@ import hashlib
 import json
 from datetime import datetime, timezone
 
-from genesis.crypto.merkle import MerkleTree
+from genesis.crypto.merkle import MerkleAccumulator
 from genesis.models.commitment import CommitmentRecord
 
 
@@ -49,10 +49,33 @@ class CommitmentBuilder:
         self._version = version
         self._epoch_id = epoch_id
         self._previous_hash = previous_hash
-        self._mission_tree = MerkleTree()
-        self._trust_tree = MerkleTree()
-        self._governance_tree = MerkleTree()
-        self._review_tree = MerkleTree()
+        self._mission_tree = MerkleAccumulator()
+        self._trust_tree = MerkleAccumulator()
+        self._governance_tree = MerkleAccumulator()
+        self._review_tree = MerkleAccumulator()
+
+    @classmethod
+    def from_accumulators(
+        cls,
+        version: str,
+        epoch_id: str,
+        previous_hash: str,
+        mission: MerkleAccumulator,
+        trust: MerkleAccumulator,
+        governance: MerkleAccumulator,
+        review: MerkleAccumulator,
+    ) -> CommitmentBuilder:
+        """Build over accumulators already filled during the epoch.
+
+        The accumulators are adopted, not copied, so build() only has to
+        finish their running roots.
+        """
+        builder = cls(version=version, epoch_id=epoch_id, previous_hash=previous_hash)
+        builder._mission_tree = mission
+        builder._trust_tree = trust
+        builder._governance_tree = governance
+        builder._review_tree = review
+        return builder
 
     def add_mission_event(self, event_hash: str) -> None:
         """Add a mission event leaf hash."""
@@ -84,10 +107,10 @@ class CommitmentBuilder:
         if timestamp_utc is None:
             timestamp_utc = datetime.now(timezone.utc)
 
-        mission_root = self._mission_tree.compute_root()
-        trust_root = self._trust_tree.compute_root()
-        governance_root = self._governance_tree.compute_root()
-        review_root = self._review_tree.compute_root()
+        mission_root = self._mission_tree.root()
+        trust_root = self._trust_tree.root()
+        governance_root = self._governance_tree.root()
+        review_root = self._review_tree.root()
 
         # Ensure sha256: prefix
         mission_root = _ensure_prefix(mission_root)
@@ -21,13 +21,19 @@ import hashlib
 import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from genesis.crypto.anchor import AnchorRecord, anchor_to_chain
-from genesis.crypto.commitment_builder import CommitmentBuilder
+from genesis.crypto.anchor_queue import AnchorQueue
+from genesis.crypto.commitment_builder import CommitmentBuilder, _ensure_prefix
+from genesis.crypto.merkle import MerkleAccumulator
 from genesis.models.commitment import CommitmentRecord, CommitmentTier
 from genesis.policy.resolver import PolicyResolver
 
+if TYPE_CHECKING:
+    # Imported for annotations only: persistence imports crypto.
+    from genesis.persistence.commitment_store import CommitmentStore
+
 
 # Sentinel for the genesis block (no previous commitment exists).
 GENESIS_PREVIOUS_HASH = "sha256:" + "0" * 64
@@ -35,16 +41,20 @@ GENESIS_PREVIOUS_HASH = "sha256:" + "0" * 64
 
 @dataclass
 class EpochState:
-    """Mutable state of the current epoch."""
+    """Mutable state of the current epoch.
+
+    Each domain keeps a running Merkle accumulator over its hashes, so
+    roots are live and closing the epoch does not rebuild the trees.
+    """
 
     epoch_id: str
     started_utc: datetime
-    mission_event_hashes: list[str] = field(default_factory=list)
-    trust_delta_hashes: list[str] = field(default_factory=list)
-    governance_ballot_hashes: list[str] = field(default_factory=list)
-    review_decision_hashes: list[str] = field(default_factory=list)
     constitutional_events_pending: bool = False
     closed: bool = False
+    mission_event_tree: MerkleAccumulator = field(default_factory=MerkleAccumulator)
+    trust_delta_tree: MerkleAccumulator = field(default_factory=MerkleAccumulator)
+    governance_ballot_tree: MerkleAccumulator = field(default_factory=MerkleAccumulator)
+    review_decision_tree: MerkleAccumulator = field(default_factory=MerkleAccumulator)
 
 
 class EpochService:
@@ -66,6 +76,9 @@ class EpochService:
         # Determine if anchoring is due:
         if service.should_anchor(current_tier, hours_since_last_anchor):
             anchor_record = service.anchor_commitment(record, rpc_url, key)
+
+        # Or, without blocking on the chain:
+        entry_id = service.queue_anchor(record, anchor_queue)
     """
 
     COMMITMENT_VERSION = "0.3"
@@ -74,12 +87,22 @@ class EpochService:
         self,
         resolver: PolicyResolver,
         previous_hash: str = GENESIS_PREVIOUS_HASH,
+        commitment_store: Optional[CommitmentStore] = None,
     ) -> None:
         self._resolver = resolver
         self._previous_hash = previous_hash
         self._current_epoch: Optional[EpochState] = None
         self._committed_records: list[CommitmentRecord] = []
         self._anchor_records: list[AnchorRecord] = []
+        # Durable history (optional): resume the hash chain from the
+        # latest stored commitment.
+        self._store = commitment_store
+        self._unsaved_anchors: list[AnchorRecord] = []
+        if commitment_store is not None:
+            self._committed_records = commitment_store.records()
+            self._anchor_records = commitment_store.anchor_records()
+            if commitment_store.head is not None:
+                self._previous_hash = commitment_store.head
 
     # ------------------------------------------------------------------
     # Epoch lifecycle
@@ -114,38 +137,46 @@ class EpochService:
     ) -> CommitmentRecord:
         """Close the current epoch and build the commitment record.
 
-        Computes Merkle roots over all collected events and returns
+        Finishes the running Merkle roots over all collected events and returns
         an immutable CommitmentRecord. Links to the previous commitment
-        via hash chain.
+        via hash chain. With a commitment store, the record and its trees
+        are persisted first; OSError or ValueError from the store leaves
+        the epoch open.
         """
         epoch = self._require_open_epoch()
 
         if chamber_nonce is None:
             chamber_nonce = "sha256:" + "0" * 64
 
-        builder = CommitmentBuilder(
+        builder = CommitmentBuilder.from_accumulators(
             version=self.COMMITMENT_VERSION,
             epoch_id=epoch.epoch_id,
             previous_hash=self._previous_hash,
+            mission=epoch.mission_event_tree,
+            trust=epoch.trust_delta_tree,
+            governance=epoch.governance_ballot_tree,
+            review=epoch.review_decision_tree,
         )
 
-        for h in epoch.mission_event_hashes:
-            builder.add_mission_event(h)
-        for h in epoch.trust_delta_hashes:
-            builder.add_trust_delta(h)
-        for h in epoch.governance_ballot_hashes:
-            builder.add_governance_ballot(h)
-        for h in epoch.review_decision_hashes:
-            builder.add_review_decision(h)
-
         record = builder.build(
             beacon_round=beacon_round,
             chamber_nonce=chamber_nonce,
             timestamp_utc=timestamp_utc,
         )
 
+        commitment_hash = self._commitment_hash(record)
+        if self._store is not None:
+            # Durable before visible: if this raises, the epoch stays open.
+            self._flush_anchors()
+            self._store.append(record, commitment_hash, {
+                "mission": epoch.mission_event_tree.to_tree(),
+                "trust": epoch.trust_delta_tree.to_tree(),
+                "governance": epoch.governance_ballot_tree.to_tree(),
+                "review": epoch.review_decision_tree.to_tree(),
+            })
+
         # Update hash chain
-        self._previous_hash = self._commitment_hash(record)
+        self._previous_hash = commitment_hash
         epoch.closed = True
         self._committed_records.append(record)
 
@@ -158,12 +189,12 @@ class EpochService:
     def record_mission_event(self, event_hash: str) -> None:
         """Record a mission event hash in the current epoch."""
         epoch = self._require_open_epoch()
-        epoch.mission_event_hashes.append(event_hash)
+        epoch.mission_event_tree.add_leaf(event_hash)
 
     def record_trust_delta(self, delta_hash: str) -> None:
         """Record a trust delta hash in the current epoch."""
         epoch = self._require_open_epoch()
-        epoch.trust_delta_hashes.append(delta_hash)
+        epoch.trust_delta_tree.add_leaf(delta_hash)
 
     def record_governance_ballot(self, ballot_hash: str, is_constitutional: bool = False) -> None:
         """Record a governance ballot hash in the current epoch.
@@ -173,14 +204,14 @@ class EpochService:
         anchoring regardless of commitment tier cadence.
         """
         epoch = self._require_open_epoch()
-        epoch.governance_ballot_hashes.append(ballot_hash)
+        epoch.governance_ballot_tree.add_leaf(ballot_hash)
         if is_constitutional:
             epoch.constitutional_events_pending = True
 
     def record_review_decision(self, decision_hash: str) -> None:
         """Record a review decision hash in the current epoch."""
         epoch = self._require_open_epoch()
-        epoch.review_decision_hashes.append(decision_hash)
+        epoch.review_decision_tree.add_leaf(decision_hash)
 
     # ------------------------------------------------------------------
     # Commitment tier and anchoring logic
@@ -243,9 +274,33 @@ class EpochService:
             private_key=private_key,
             chain_id=chain_id,
         )
-        self._anchor_records.append(anchor)
+        self.record_anchor(anchor)
         return anchor
 
+    def queue_anchor(self, record: CommitmentRecord, queue: AnchorQueue) -> str:
+        """Hand a commitment record to an AnchorQueue instead of blocking.
+
+        Returns the queue entry_id. The anchor arrives later as part of an
+        AnchorBatch; pass batch.anchor to record_anchor() once collected.
+        """
+        return queue.enqueue(record.epoch_id, self._commitment_hash(record))
+
+    def record_anchor(self, anchor: AnchorRecord) -> None:
+        """Record an anchor produced outside this service (e.g. by a queue).
+
+        With a commitment store the anchor is also persisted. The chain
+        transaction already happened, so a failed write is not raised:
+        the anchor is kept and written with the next store write (see
+        unsaved_anchor_count).
+        """
+        self._anchor_records.append(anchor)
+        if self._store is not None:
+            self._unsaved_anchors.append(anchor)
+            try:
+                self._flush_anchors()
+            except OSError:
+                pass
+
     # ------------------------------------------------------------------
     # Query methods
     # ------------------------------------------------------------------
@@ -270,16 +325,40 @@ class EpochService:
         """All anchor records produced by this service instance."""
         return list(self._anchor_records)
 
+    @property
+    def commitment_store(self) -> Optional[CommitmentStore]:
+        """The durable commitment store, or None if history is in memory only."""
+        return self._store
+
+    @property
+    def unsaved_anchor_count(self) -> int:
+        """Anchors recorded but not yet written to the commitment store."""
+        return len(self._unsaved_anchors)
+
     def epoch_event_counts(self) -> dict[str, int]:
         """Return event counts for the current epoch."""
         if self._current_epoch is None:
             return {"mission": 0, "trust": 0, "governance": 0, "review": 0}
         epoch = self._current_epoch
         return {
-            "mission": len(epoch.mission_event_hashes),
-            "trust": len(epoch.trust_delta_hashes),
-            "governance": len(epoch.governance_ballot_hashes),
-            "review": len(epoch.review_decision_hashes),
+            "mission": epoch.mission_event_tree.leaf_count,
+            "trust": epoch.trust_delta_tree.leaf_count,
+            "governance": epoch.governance_ballot_tree.leaf_count,
+            "review": epoch.review_decision_tree.leaf_count,
+        }
+
+    def current_roots(self) -> dict[str, str]:
+        """Live Merkle roots of the open epoch, keyed like epoch_event_counts.
+
+        These are the roots close_epoch() would commit if called now.
+        Raises RuntimeError if no epoch is open.
+        """
+        epoch = self._require_open_epoch()
+        return {
+            "mission": _ensure_prefix(epoch.mission_event_tree.root()),
+            "trust": _ensure_prefix(epoch.trust_delta_tree.root()),
+            "governance": _ensure_prefix(epoch.governance_ballot_tree.root()),
+            "review": _ensure_prefix(epoch.review_decision_tree.root()),
         }
 
     # ------------------------------------------------------------------
@@ -292,6 +371,12 @@ class EpochService:
             raise RuntimeError("No open epoch — call open_epoch() first.")
         return self._current_epoch
 
+    def _flush_anchors(self) -> None:
+        """Write anchors whose earlier store write failed. Raises OSError."""
+        while self._unsaved_anchors:
+            self._store.append_anchor(self._unsaved_anchors[0])
+            self._unsaved_anchors.pop(0)
+
     @staticmethod
     def _commitment_hash(record: CommitmentRecord) -> str:
         """Compute the canonical hash of a commitment record.
@@ -9,8 +9,12 @@ production, but this module works with pre-hashed leaf values.
 
 from __future__ import annotations
 
+import bisect
 import hashlib
+import json
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -21,6 +25,26 @@ class MerkleProof:
     root: str
 
 
+@dataclass(frozen=True)
+class MerkleMultiProof:
+    """A compact inclusion proof for several leaves of one tree.
+
+    Carries only the sibling hashes that cannot be derived from the
+    proven leaves or from each other, ordered by level then position.
+    Siblings shared between the leaves' paths appear once, so proving k
+    leaves costs far fewer than k * log2(n) hashes.
+    """
+    leaf_count: int
+    leaf_indices: tuple[int, ...]  # ascending positions in the sorted leaves
+    leaf_hashes: tuple[str, ...]  # leaf at each index
+    hashes: tuple[str, ...]
+    root: str
+
+
+TREE_FORMAT = "genesis-merkle-tree"
+TREE_FORMAT_VERSION = 1
+
+
 class MerkleTree:
     """A deterministic Merkle tree using SHA-256.
 
@@ -30,11 +54,18 @@ class MerkleTree:
         tree.add_leaf("sha256:def456...")
         root = tree.compute_root()
         proof = tree.inclusion_proof("sha256:abc123...")
+
+        # Proofs for many leaves at once, and a persisted proof tree:
+        proofs = tree.batch_inclusion_proofs(leaves)
+        multi = tree.multi_proof(leaves)
+        tree.save(Path("epoch-7.mission.tree.json"))
+        tree = MerkleTree.load(Path("epoch-7.mission.tree.json"))
     """
 
     def __init__(self) -> None:
         self._leaves: list[str] = []
         self._tree: list[list[str]] = []
+        self._leaf_index: dict[str, int] = {}
         self._computed = False
 
     def add_leaf(self, leaf_hash: str) -> None:
@@ -71,8 +102,43 @@ class MerkleTree:
             self._tree.append(next_level)
             current_level = next_level
 
+        self._finish()
+        return self._root()
+
+    @classmethod
+    def _from_levels(cls, levels: list[list[str]]) -> MerkleTree:
+        """A computed tree over already-built levels (level 0 sorted)."""
+        tree = cls()
+        tree._leaves = list(levels[0])
+        tree._tree = [list(level) for level in levels]
+        tree._finish()
+        return tree
+
+    def _finish(self) -> None:
+        # Leaf -> position map; duplicates map to their first position.
+        index: dict[str, int] = {}
+        for i, leaf in enumerate(self._tree[0]):
+            index.setdefault(leaf, i)
+        self._leaf_index = index
         self._computed = True
-        return f"sha256:{current_level[0]}" if not current_level[0].startswith("sha256:") else current_level[0]
+
+    def _root(self) -> str:
+        root = self._tree[-1][0]
+        return root if root.startswith("sha256:") else f"sha256:{root}"
+
+    def _require_computed(self) -> None:
+        if not self._computed:
+            raise RuntimeError("Must call compute_root before generating proofs")
+
+    def levels(self) -> list[list[str]]:
+        """Copy of the computed levels: sorted leaves first, root level last."""
+        self._require_computed()
+        return [list(level) for level in self._tree]
+
+    def leaf_index(self, leaf_hash: str) -> Optional[int]:
+        """Position of a leaf in the sorted leaves, or None if absent."""
+        self._require_computed()
+        return self._leaf_index.get(leaf_hash)
 
     def inclusion_proof(self, leaf_hash: str) -> MerkleProof | None:
         """Generate an inclusion proof for a leaf.
@@ -80,33 +146,281 @@ class MerkleTree:
         Returns None if the leaf is not in the tree.
         Must call compute_root first.
         """
-        if not self._computed:
-            raise RuntimeError("Must call compute_root before generating proofs")
-
-        sorted_leaves = self._tree[0]
-        if leaf_hash not in sorted_leaves:
+        self._require_computed()
+        idx = self._leaf_index.get(leaf_hash)
+        if idx is None:
             return None
+        return MerkleProof(
+            leaf_hash=leaf_hash, path=self._path(idx, {}), root=self._root(),
+        )
+
+    def batch_inclusion_proofs(
+        self,
+        leaf_hashes: list[str],
+    ) -> list[MerkleProof | None]:
+        """Inclusion proofs for many leaves, in input order.
 
-        idx = sorted_leaves.index(leaf_hash)
-        path: list[tuple[str, str]] = []
+        Paths above a shared ancestor are computed once and reused, so
+        proving every leaf of a tree costs O(n) path steps rather than
+        O(n log n). Entries are None for leaves not in the tree.
+        """
+        self._require_computed()
+        root = self._root()
+        memo: dict[tuple[int, int], list[tuple[str, str]]] = {}
+        proofs: list[MerkleProof | None] = []
+        for leaf_hash in leaf_hashes:
+            idx = self._leaf_index.get(leaf_hash)
+            if idx is None:
+                proofs.append(None)
+                continue
+            proofs.append(MerkleProof(
+                leaf_hash=leaf_hash, path=self._path(idx, memo), root=root,
+            ))
+        return proofs
 
+    def _path(
+        self,
+        idx: int,
+        memo: dict[tuple[int, int], list[tuple[str, str]]],
+    ) -> list[tuple[str, str]]:
+        """Sibling path of leaf idx, memoised per (level, node)."""
+        steps: list[tuple[int, int, tuple[str, str]]] = []
+        suffix: list[tuple[str, str]] = []
         current_idx = idx
-        for level in self._tree[:-1]:
+        for depth, level in enumerate(self._tree[:-1]):
+            cached = memo.get((depth, current_idx))
+            if cached is not None:
+                suffix = cached
+                break
             if current_idx % 2 == 0:
                 sibling_idx = current_idx + 1
                 if sibling_idx < len(level):
-                    path.append((level[sibling_idx], "R"))
+                    step = (level[sibling_idx], "R")
                 else:
-                    path.append((level[current_idx], "R"))  # Duplicate
+                    step = (level[current_idx], "R")  # Duplicate
             else:
-                path.append((level[current_idx - 1], "L"))
+                step = (level[current_idx - 1], "L")
+            steps.append((depth, current_idx, step))
             current_idx //= 2
+        for depth, node_idx, step in reversed(steps):
+            suffix = [step] + suffix
+            memo[(depth, node_idx)] = suffix
+        return list(suffix)
 
-        root = self._tree[-1][0]
-        if not root.startswith("sha256:"):
-            root = f"sha256:{root}"
+    def multi_proof(self, leaf_hashes: list[str]) -> MerkleMultiProof | None:
+        """Compact proof that all the given leaves are in the tree.
+
+        Returns None if any leaf is absent. Verify with
+        verify_multi_proof().
+        """
+        self._require_computed()
+        indices: set[int] = set()
+        for leaf_hash in leaf_hashes:
+            idx = self._leaf_index.get(leaf_hash)
+            if idx is None:
+                return None
+            indices.add(idx)
+        leaf_indices = tuple(sorted(indices))
+        hashes: list[str] = []
+        known = list(leaf_indices)
+        for level in self._tree[:-1]:
+            known_set = set(known)
+            for i in known:
+                sibling = i ^ 1
+                if sibling < len(level) and sibling not in known_set:
+                    hashes.append(level[sibling])
+            known = sorted({i // 2 for i in known})
+        return MerkleMultiProof(
+            leaf_count=len(self._tree[0]),
+            leaf_indices=leaf_indices,
+            leaf_hashes=tuple(self._tree[0][i] for i in leaf_indices),
+            hashes=tuple(hashes),
+            root=self._root(),
+        )
+
+    # ------------------------------------------------------------------
+    # Persisted proof tree
+    # ------------------------------------------------------------------
+
+    def to_json(self) -> str:
+        """Serialise the computed tree (all levels) for later proofs."""
+        self._require_computed()
+        return json.dumps(
+            {
+                "format": TREE_FORMAT,
+                "version": TREE_FORMAT_VERSION,
+                "root": self._root(),
+                "levels": self._tree,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> MerkleTree:
+        """Load a tree written by to_json(), checking it is consistent.
 
-        return MerkleProof(leaf_hash=leaf_hash, path=path, root=root)
+        Every level is re-hashed from the one below, so a tampered file
+        raises ValueError instead of yielding false proofs.
+        """
+        data = json.loads(text)
+        if data.get("format") != TREE_FORMAT or data.get("version") != TREE_FORMAT_VERSION:
+            raise ValueError("Not a supported Merkle tree file")
+        levels: list[list[str]] = data["levels"]
+        if not levels or not levels[0] or levels[0] != sorted(levels[0]):
+            raise ValueError("Merkle tree file has missing or unsorted leaves")
+        for below, above in zip(levels, levels[1:]):
+            expected = [
+                _hash_pair(below[i], below[i + 1] if i + 1 < len(below) else below[i])
+                for i in range(0, len(below), 2)
+            ]
+            if above != expected:
+                raise ValueError("Merkle tree file levels are inconsistent")
+        if len(levels[-1]) != 1:
+            raise ValueError("Merkle tree file is incomplete")
+        tree = cls._from_levels(levels)
+        if tree._root() != data["root"]:
+            raise ValueError("Merkle tree file root does not match its levels")
+        return tree
+
+    def save(self, path: Path) -> None:
+        """Write the tree to path atomically (temp file + rename)."""
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.to_json(), encoding="utf-8")
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> MerkleTree:
+        return cls.from_json(path.read_text(encoding="utf-8"))
+
+
+def verify_inclusion(proof: MerkleProof) -> bool:
+    """Check that a single-leaf proof hashes up to its root."""
+    current = proof.leaf_hash
+    for sibling, position in proof.path:
+        current = _hash_pair(sibling, current) if position == "L" else _hash_pair(current, sibling)
+    return _ensure_prefix(current) == proof.root
+
+
+def verify_multi_proof(proof: MerkleMultiProof) -> bool:
+    """Check that a multi-proof hashes up to its root."""
+    if not proof.leaf_indices or len(proof.leaf_indices) != len(proof.leaf_hashes):
+        return False
+    if any(i < 0 or i >= proof.leaf_count for i in proof.leaf_indices):
+        return False
+    nodes = dict(zip(proof.leaf_indices, proof.leaf_hashes))
+    supplied = iter(proof.hashes)
+    width = proof.leaf_count
+    try:
+        while width > 1:
+            parents: dict[int, str] = {}
+            for i in sorted(nodes):
+                sibling = i ^ 1
+                if sibling >= width:
+                    sibling_hash = nodes[i]  # Duplicate the odd last node
+                elif sibling in nodes:
+                    sibling_hash = nodes[sibling]
+                else:
+                    sibling_hash = next(supplied)
+                left, right = (nodes[i], sibling_hash) if i % 2 == 0 else (sibling_hash, nodes[i])
+                parents[i // 2] = _hash_pair(left, right)
+            nodes = parents
+            width = (width + 1) // 2
+    except StopIteration:
+        return False
+    if next(supplied, None) is not None:
+        return False
+    return _ensure_prefix(nodes[0]) == proof.root
+
+
+class MerkleAccumulator:
+    """Incrementally maintained Merkle tree with canonical-sorted semantics.
+
+    Produces exactly the root MerkleTree.compute_root() gives for the same
+    leaves, but keeps the sorted leaves and every tree level between
+    calls. add_leaf() is an O(1) append to a pending run; root() sorts
+    the pending run once, merges it into the sorted leaves and re-hashes
+    only the nodes right of the lowest merged position, reusing the
+    rest. Roots can therefore be read at any time, and adding n leaves
+    then reading the root costs one sort and one tree build.
+
+    Usage:
+        acc = MerkleAccumulator()
+        acc.add_leaf("sha256:abc123...")
+        live_root = acc.root()          # cheap, may be called repeatedly
+        acc.add_leaf("sha256:def456...")
+        final_root = acc.root()
+    """
+
+    def __init__(self) -> None:
+        self._levels: list[list[str]] = [[]]
+        self._pending: list[str] = []
+        self._dirty_from: Optional[int] = None
+
+    def add_leaf(self, leaf_hash: str) -> None:
+        """Add a leaf hash; it takes its canonical position on the next read."""
+        self._pending.append(leaf_hash)
+
+    @property
+    def leaf_count(self) -> int:
+        return len(self._levels[0]) + len(self._pending)
+
+    def leaves(self) -> list[str]:
+        """Leaves in canonical (sorted) order."""
+        self._merge_pending()
+        return list(self._levels[0])
+
+    def root(self) -> str:
+        """Current Merkle root, identical to MerkleTree.compute_root()."""
+        self._merge_pending()
+        leaves = self._levels[0]
+        if not leaves:
+            return _sha256_hex(b"")
+        if self._dirty_from is not None:
+            self._repair(self._dirty_from)
+            self._dirty_from = None
+        top = self._levels[-1][0]
+        return top if top.startswith("sha256:") else f"sha256:{top}"
+
+    def to_tree(self) -> MerkleTree:
+        """Snapshot as a computed MerkleTree, for proofs and persistence.
+
+        An empty accumulator yields an empty, uncomputed tree.
+        """
+        if not self.leaf_count:
+            return MerkleTree()
+        self.root()
+        return MerkleTree._from_levels(self._levels)
+
+    def _merge_pending(self) -> None:
+        """Merge the pending run into the sorted leaves and mark the tree."""
+        pending = self._pending
+        if not pending:
+            return
+        pending.sort()
+        leaves = self._levels[0]
+        start = bisect.bisect_right(leaves, pending[0])
+        # Two sorted runs: the sort is a single linear merge.
+        leaves.extend(pending)
+        leaves.sort()
+        pending.clear()
+        if self._dirty_from is None or start < self._dirty_from:
+            self._dirty_from = start
+
+    def _repair(self, start: int) -> None:
+        """Recompute every node whose subtree includes a leaf at >= start."""
+        depth = 0
+        while len(self._levels[depth]) > 1:
+            current = self._levels[depth]
+            if depth + 1 == len(self._levels):
+                self._levels.append([])
+            parents = self._levels[depth + 1]
+            start //= 2
+            del parents[start:]
+            for i in range(start * 2, len(current), 2):
+                right = current[i + 1] if i + 1 < len(current) else current[i]
+                parents.append(_hash_pair(current[i], right))
+            depth += 1
+        del self._levels[depth + 1:]
 
 
 def _sha256_hex(data: bytes) -> str:
@@ -114,6 +428,10 @@ def _sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def _ensure_prefix(hash_val: str) -> str:
+    return hash_val if hash_val.startswith("sha256:") else f"sha256:{hash_val}"
+
+
 def _hash_pair(left: str, right: str) -> str:
     """Hash two nodes together. Strips sha256: prefix if present."""
     left_clean = left.removeprefix("sha256:")
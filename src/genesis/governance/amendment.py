@@ -39,6 +39,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
+from genesis.governance.panels import PanelBuilder
 from genesis.models.governance import Chamber, ChamberKind
 
 
@@ -397,8 +398,10 @@ class AmendmentEngine:
                 f"need {size}, have {len(candidates)}"
             )
 
+        builder = PanelBuilder(candidates)
+
         # Check geographic diversity is achievable
-        unique_regions = {c["region"] for c in candidates}
+        unique_regions = builder.distinct("region")
         if len(unique_regions) < r_min:
             raise ValueError(
                 f"Not enough regional diversity: need {r_min} regions, "
@@ -406,85 +409,33 @@ class AmendmentEngine:
             )
 
         # Check organisational diversity is achievable (design test #90)
-        unique_orgs = {c["organization"] for c in candidates}
+        unique_orgs = builder.distinct("organization")
         if len(unique_orgs) < org_diversity_min:
             raise ValueError(
                 f"Not enough organisational diversity: need {org_diversity_min} "
                 f"organisations, have {len(unique_orgs)}"
             )
 
-        # Greedy diversity-first selection (same pattern as AdjudicationEngine)
-        selected: list[dict[str, Any]] = []
-        remaining = list(candidates)
-
-        # First pass: ensure minimum region diversity
-        selected_regions: set[str] = set()
-        for region in unique_regions:
-            if len(selected_regions) >= r_min:
-                break
-            for c in remaining:
-                if c["region"] == region and c not in selected:
-                    selected.append(c)
-                    remaining.remove(c)
-                    selected_regions.add(region)
-                    break
-
-        # Second pass: ensure minimum org diversity
-        selected_orgs: set[str] = {s["organization"] for s in selected}
-        for org in unique_orgs:
-            if len(selected_orgs) >= org_diversity_min:
-                break
-            if org in selected_orgs:
-                continue
-            for c in remaining:
-                if c["organization"] == org and c not in selected:
-                    if len(selected) < size:
-                        selected.append(c)
-                        remaining.remove(c)
-                        selected_orgs.add(org)
-                        break
-
-        # Fill remaining slots respecting c_max concentration (geographic)
-        # AND org c_max (no single org exceeds c_max of the chamber)
+        # Greedy diversity-first selection: minimum regions, then
+        # minimum orgs, then fill respecting c_max concentration
+        # (geographic AND org), relaxing the org cap if impossible.
+        builder.seed("region", r_min)
+        builder.seed("organization", org_diversity_min, limit=size)
         max_per_region = max(1, int(size * c_max))
         max_per_org = max(1, int(size * c_max))
-        while len(selected) < size and remaining:
-            region_counts: dict[str, int] = {}
-            org_counts: dict[str, int] = {}
-            for s in selected:
-                region_counts[s["region"]] = region_counts.get(s["region"], 0) + 1
-                org_counts[s["organization"]] = org_counts.get(s["organization"], 0) + 1
-
-            added = False
-            for c in remaining:
-                region_ok = region_counts.get(c["region"], 0) < max_per_region
-                org_ok = org_counts.get(c["organization"], 0) < max_per_org
-                if region_ok and org_ok:
-                    selected.append(c)
-                    remaining.remove(c)
-                    added = True
-                    break
-
-            if not added:
-                # Relax org constraint if impossible with both
-                for c in remaining:
-                    if region_counts.get(c["region"], 0) < max_per_region:
-                        selected.append(c)
-                        remaining.remove(c)
-                        added = True
-                        break
-
-            if not added:
-                raise ValueError(
-                    f"Cannot fill {chamber_kind.value} chamber to size {size} "
-                    f"while respecting c_max={c_max}"
-                )
+        if not builder.fill(
+            size,
+            {"region": max_per_region, "organization": max_per_org},
+            {"region": max_per_region},
+        ):
+            raise ValueError(
+                f"Cannot fill {chamber_kind.value} chamber to size {size} "
+                f"while respecting c_max={c_max}"
+            )
+        selected = builder.selected
 
         # Record org distribution for this chamber
-        org_dist: dict[str, int] = {}
-        for s in selected:
-            org_dist[s["organization"]] = org_dist.get(s["organization"], 0) + 1
-        proposal.chamber_org_counts[chamber_kind.value] = org_dist
+        proposal.chamber_org_counts[chamber_kind.value] = builder.counts("organization")
 
         panel_ids = [s["actor_id"] for s in selected]
         proposal.chamber_panels[chamber_kind.value] = panel_ids
@@ -860,8 +811,10 @@ class AmendmentEngine:
                 f"need {size}, have {len(candidates)}"
             )
 
+        builder = PanelBuilder(candidates, keys=("region",))
+
         # Check diversity
-        unique_regions = {c["region"] for c in candidates}
+        unique_regions = builder.distinct("region")
         if len(unique_regions) < r_min:
             raise ValueError(
                 f"Not enough regional diversity for confirmation: "
@@ -869,39 +822,14 @@ class AmendmentEngine:
             )
 
         # Greedy diversity-first selection
-        selected: list[dict[str, Any]] = []
-        remaining = list(candidates)
-
-        selected_regions: set[str] = set()
-        for region in unique_regions:
-            if len(selected_regions) >= r_min:
-                break
-            for c in remaining:
-                if c["region"] == region and c not in selected:
-                    selected.append(c)
-                    remaining.remove(c)
-                    selected_regions.add(region)
-                    break
-
+        builder.seed("region", r_min)
         max_per_region = max(1, int(size * c_max))
-        while len(selected) < size and remaining:
-            region_counts: dict[str, int] = {}
-            for s in selected:
-                region_counts[s["region"]] = region_counts.get(s["region"], 0) + 1
-
-            added = False
-            for c in remaining:
-                if region_counts.get(c["region"], 0) < max_per_region:
-                    selected.append(c)
-                    remaining.remove(c)
-                    added = True
-                    break
-
-            if not added:
-                raise ValueError(
-                    f"Cannot fill confirmation panel to size {size} "
-                    f"while respecting c_max={c_max}"
-                )
+        if not builder.fill(size, {"region": max_per_region}):
+            raise ValueError(
+                f"Cannot fill confirmation panel to size {size} "
+                f"while respecting c_max={c_max}"
+            )
+        selected = builder.selected
 
         panel_ids = [s["actor_id"] for s in selected]
         proposal.confirmation_panel = panel_ids
@@ -283,18 +283,33 @@ class AssemblyEngine:
         if now is None:
             now = datetime.now(timezone.utc)
 
-        archived_ids: list[str] = []
-        for topic in self._topics.values():
-            if topic.status != AssemblyTopicStatus.ACTIVE:
-                continue
-            expiry = topic.last_activity_utc + timedelta(
-                days=topic.inactivity_expiry_days
-            )
-            if now >= expiry:
-                topic.status = AssemblyTopicStatus.ARCHIVED
-                archived_ids.append(topic.topic_id)
+        return [
+            topic_id for topic_id in list(self._topics)
+            if self.archive_if_inactive(topic_id, now)
+        ]
+
+    def inactivity_deadline(self, topic_id: str) -> Optional[datetime]:
+        """Return when an active topic becomes due for archival.
 
-        return archived_ids
+        Returns None for unknown or already archived topics.
+        """
+        topic = self._topics.get(topic_id)
+        if topic is None or topic.status != AssemblyTopicStatus.ACTIVE:
+            return None
+        return topic.last_activity_utc + timedelta(
+            days=topic.inactivity_expiry_days
+        )
+
+    def archive_if_inactive(self, topic_id: str, now: datetime) -> bool:
+        """Archive one topic if its inactivity period has elapsed.
+
+        Returns True if the topic was archived by this call.
+        """
+        expiry = self.inactivity_deadline(topic_id)
+        if expiry is None or now < expiry:
+            return False
+        self._topics[topic_id].status = AssemblyTopicStatus.ARCHIVED
+        return True
 
     def get_topic(self, topic_id: str) -> Optional[AssemblyTopic]:
         """Retrieve a topic by ID.
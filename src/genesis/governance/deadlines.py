@@ -0,0 +1,130 @@
+"""Deadline scheduler — one min-heap for every time-based governance sweep.
+
+Periodic sweeps (identity lapse, leave expiry, suspension expiry,
+visibility lapse, G0 ratification, Assembly archival, clearance expiry,
+machine auto-decommission) each scan their whole domain on every tick,
+although almost nothing is due on any given tick. The scheduler holds one
+entry per pending deadline, ordered by due time, so that a tick only
+touches entries that are actually due.
+
+Entries are keyed by (kind, key) where key is the ID of the object the
+deadline belongs to (actor, leave, workflow, item, topic, clearance).
+Re-scheduling a key replaces its previous deadline; superseded heap
+entries are discarded lazily when they surface, and the heap is compacted
+when they outnumber live entries.
+
+The scheduler is derived state. It holds no facts of its own and is
+never persisted: the service rebuilds it from the canonical records on
+load, and consumers re-check each popped entry against those records
+before acting on it.
+"""
+
+from __future__ import annotations
+
+import enum
+import heapq
+from datetime import datetime
+from typing import Optional
+
+
+class DeadlineKind(str, enum.Enum):
+    """Kinds of scheduled deadline, in the order they run when due together."""
+    IDENTITY_EXPIRY = "identity_expiry"
+    MACHINE_DECOMMISSION = "machine_decommission"
+    LEAVE_EXPIRY = "leave_expiry"
+    SUSPENSION_EXPIRY = "suspension_expiry"
+    VISIBILITY_EXPIRY = "visibility_expiry"
+    RATIFICATION_DEADLINE = "ratification_deadline"
+    TOPIC_INACTIVITY = "topic_inactivity"
+    CLEARANCE_EXPIRY = "clearance_expiry"
+
+
+_KIND_RANK: dict[DeadlineKind, int] = {k: i for i, k in enumerate(DeadlineKind)}
+
+# Compact once superseded heap entries exceed live ones by this margin.
+_COMPACT_SLACK = 64
+
+
+class DeadlineScheduler:
+    """Min-heap of (due_utc, kind, key) with keyed replacement.
+
+    Ties on due time are broken by kind (declaration order) and then by
+    key, so pop order is a pure function of the scheduled set.
+
+    Usage:
+        scheduler = DeadlineScheduler()
+        scheduler.schedule(DeadlineKind.LEAVE_EXPIRY, leave_id, expires_utc)
+        for kind, key, due in scheduler.pop_due(now):
+            ...  # re-check the record, then act
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[datetime, int, str, DeadlineKind]] = []
+        self._due: dict[tuple[DeadlineKind, str], datetime] = {}
+
+    def schedule(self, kind: DeadlineKind, key: str, due_utc: datetime) -> None:
+        """Set the deadline for (kind, key), replacing any previous one."""
+        if self._due.get((kind, key)) == due_utc:
+            return
+        self._due[(kind, key)] = due_utc
+        heapq.heappush(self._heap, (due_utc, _KIND_RANK[kind], key, kind))
+        self._maybe_compact()
+
+    def cancel(self, kind: DeadlineKind, key: str) -> None:
+        """Drop the deadline for (kind, key) if one is scheduled."""
+        if self._due.pop((kind, key), None) is not None:
+            self._maybe_compact()
+
+    def due_utc(self, kind: DeadlineKind, key: str) -> Optional[datetime]:
+        """Return the scheduled deadline for (kind, key), or None."""
+        return self._due.get((kind, key))
+
+    def next_due(self) -> Optional[datetime]:
+        """Return the earliest scheduled deadline, or None if empty."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[tuple[DeadlineKind, str, datetime]]:
+        """Remove and return every entry due at or before ``now``.
+
+        Entries are returned in (due_utc, kind, key) order.
+        """
+        popped: list[tuple[DeadlineKind, str, datetime]] = []
+        while True:
+            self._discard_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return popped
+            due, _, key, kind = heapq.heappop(self._heap)
+            del self._due[(kind, key)]
+            popped.append((kind, key, due))
+
+    def entries(self) -> dict[tuple[DeadlineKind, str], datetime]:
+        """Return a copy of every live {(kind, key): due_utc} entry."""
+        return dict(self._due)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._due.clear()
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _is_live(self, entry: tuple[datetime, int, str, DeadlineKind]) -> bool:
+        due, _, key, kind = entry
+        return self._due.get((kind, key)) == due
+
+    def _discard_stale(self) -> None:
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > 2 * len(self._due) + _COMPACT_SLACK:
+            self._heap = [
+                (due, _KIND_RANK[kind], key, kind)
+                for (kind, key), due in self._due.items()
+            ]
+            heapq.heapify(self._heap)
@@ -120,6 +120,12 @@ class DomainExpertEngine:
     through expert voting to approval, renewal, and revocation.
     Never directly modifies actor records — that is the service layer's
     responsibility.
+
+    Clearances are also indexed per machine, with each machine's active
+    clearances kept in a separate map that is refreshed whenever one of
+    that machine's clearances changes status. Per-machine lookups cost
+    O(that machine's clearances), not O(all clearances), and
+    machine_revision() tells callers when a machine's active set changed.
     """
 
     def __init__(self, config: dict[str, Any]) -> None:
@@ -136,6 +142,12 @@ class DomainExpertEngine:
         """
         self._config = config
         self._clearances: dict[str, DomainClearance] = {}
+        # machine_id → {clearance_id → clearance}, in creation order
+        self._by_machine: dict[str, dict[str, DomainClearance]] = {}
+        # machine_id → {clearance_id → ACTIVE clearance}, in creation order
+        self._active_by_machine: dict[str, dict[str, DomainClearance]] = {}
+        # machine_id → revision, bumped whenever its active set changes
+        self._revisions: dict[str, int] = {}
         self._clearance_min_quorum = config.get(
             "clearance_min_quorum", CLEARANCE_MIN_QUORUM
         )
@@ -199,7 +211,7 @@ class DomainExpertEngine:
                 revoked_by=cd.get("revoked_by"),
                 renewal_count=cd.get("renewal_count", 0),
             )
-            engine._clearances[clearance.clearance_id] = clearance
+            engine._add(clearance)
         return engine
 
     def nominate_for_clearance(
@@ -232,9 +244,8 @@ class DomainExpertEngine:
             now = datetime.now(timezone.utc)
 
         # Check for existing active or pending clearance
-        for c in self._clearances.values():
-            if (c.machine_id == machine_id
-                    and c.org_id == org_id
+        for c in self._by_machine.get(machine_id, {}).values():
+            if (c.org_id == org_id
                     and c.domain == domain
                     and c.level == level
                     and c.status in (
@@ -258,7 +269,7 @@ class DomainExpertEngine:
             nominated_by=nominator_id,
             nominated_utc=now,
         )
-        self._clearances[clearance_id] = clearance
+        self._add(clearance)
         return clearance
 
     def vote_on_clearance(
@@ -337,6 +348,7 @@ class DomainExpertEngine:
             clearance.status = DomainClearanceStatus.REVOKED
             clearance.revoked_utc = now
             clearance.revoked_by = voter_id
+            self._refresh(clearance.machine_id)
 
         return clearance
 
@@ -396,6 +408,7 @@ class DomainExpertEngine:
             clearance.expires_utc = now + timedelta(
                 days=self._clearance_expiry_days
             )
+            self._refresh(clearance.machine_id)
 
         return clearance
 
@@ -435,6 +448,7 @@ class DomainExpertEngine:
         clearance.status = DomainClearanceStatus.REVOKED
         clearance.revoked_utc = now
         clearance.revoked_by = revoker_id
+        self._refresh(clearance.machine_id)
         return clearance
 
     def check_expirations(
@@ -453,15 +467,32 @@ class DomainExpertEngine:
             now = datetime.now(timezone.utc)
 
         expired: list[DomainClearance] = []
-        for c in self._clearances.values():
-            if (c.status == DomainClearanceStatus.ACTIVE
-                    and c.expires_utc is not None
-                    and now >= c.expires_utc):
-                c.status = DomainClearanceStatus.EXPIRED
+        for clearance_id in list(self._clearances):
+            c = self.expire_if_due(clearance_id, now)
+            if c is not None:
                 expired.append(c)
 
         return expired
 
+    def expire_if_due(
+        self,
+        clearance_id: str,
+        now: datetime,
+    ) -> Optional[DomainClearance]:
+        """Expire one clearance if it is active and past its expiry date.
+
+        Returns the clearance if it was expired by this call, else None.
+        """
+        c = self._clearances.get(clearance_id)
+        if (c is not None
+                and c.status == DomainClearanceStatus.ACTIVE
+                and c.expires_utc is not None
+                and now >= c.expires_utc):
+            c.status = DomainClearanceStatus.EXPIRED
+            self._refresh(c.machine_id)
+            return c
+        return None
+
     def renew_clearance(
         self,
         clearance_id: str,
@@ -498,9 +529,8 @@ class DomainExpertEngine:
             )
 
         # Guard against duplicate pending renewals for the same tuple
-        for existing in self._clearances.values():
-            if (existing.machine_id == old.machine_id
-                    and existing.org_id == old.org_id
+        for existing in self._by_machine.get(old.machine_id, {}).values():
+            if (existing.org_id == old.org_id
                     and existing.domain == old.domain
                     and existing.level == old.level
                     and existing.status == DomainClearanceStatus.PENDING
@@ -528,7 +558,7 @@ class DomainExpertEngine:
         if old.status == DomainClearanceStatus.ACTIVE:
             old.status = DomainClearanceStatus.EXPIRED
 
-        self._clearances[new_id] = new_clearance
+        self._add(new_clearance)
         return new_clearance
 
     def get_clearance(self, clearance_id: str) -> Optional[DomainClearance]:
@@ -543,12 +573,14 @@ class DomainExpertEngine:
         level: Optional[ClearanceLevel] = None,
     ) -> list[DomainClearance]:
         """List active clearances with optional filters."""
+        if machine_id is not None:
+            candidates = self._active_by_machine.get(machine_id, {}).values()
+        else:
+            candidates = self._clearances.values()
         result = []
-        for c in self._clearances.values():
+        for c in candidates:
             if c.status != DomainClearanceStatus.ACTIVE:
                 continue
-            if machine_id is not None and c.machine_id != machine_id:
-                continue
             if org_id is not None and c.org_id != org_id:
                 continue
             if domain is not None and c.domain != domain:
@@ -567,14 +599,37 @@ class DomainExpertEngine:
         level: ClearanceLevel = ClearanceLevel.SUPERVISED,
     ) -> bool:
         """Check if a machine has active clearance for a domain at a level."""
-        for c in self._clearances.values():
-            if (c.machine_id == machine_id
-                    and c.domain == domain
-                    and c.level == level
-                    and c.status == DomainClearanceStatus.ACTIVE):
+        for c in self._active_by_machine.get(machine_id, {}).values():
+            if c.domain == domain and c.level == level:
                 return True
         return False
 
+    def machine_revision(self, machine_id: str) -> int:
+        """Return a counter that changes whenever the machine's active
+        clearances change. Callers can cache anything derived from them
+        against it."""
+        return self._revisions.get(machine_id, 0)
+
+    def _add(self, clearance: DomainClearance) -> None:
+        self._clearances[clearance.clearance_id] = clearance
+        self._by_machine.setdefault(
+            clearance.machine_id, {},
+        )[clearance.clearance_id] = clearance
+        self._refresh(clearance.machine_id)
+
+    def _refresh(self, machine_id: str) -> None:
+        """Re-derive one machine's active clearances after a status change."""
+        active = {
+            cid: c for cid, c in self._by_machine.get(machine_id, {}).items()
+            if c.status == DomainClearanceStatus.ACTIVE
+        }
+        if active.keys() != self._active_by_machine.get(machine_id, {}).keys():
+            self._revisions[machine_id] = self._revisions.get(machine_id, 0) + 1
+        if active:
+            self._active_by_machine[machine_id] = active
+        else:
+            self._active_by_machine.pop(machine_id, None)
+
     def to_records(self) -> list[dict[str, Any]]:
         """Serialise all clearances for persistence."""
         records: list[dict[str, Any]] = []
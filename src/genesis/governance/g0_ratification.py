@@ -39,9 +39,11 @@ from __future__ import annotations
 import enum
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
+from genesis.governance.panels import PanelBuilder
+
 
 class G0RatificationStatus(str, enum.Enum):
     """Lifecycle of a G0 provisional decision under review.
@@ -116,6 +118,9 @@ REVERSAL_HANDLERS: dict[str, str] = {
     "constitutional_court_decided": "undo_court_ruling",
 }
 
+# Statuses that auto-lapse when the ratification deadline passes.
+_UNDECIDED = (G0RatificationStatus.PENDING, G0RatificationStatus.PANEL_VOTING)
+
 
 class G0RatificationEngine:
     """Manages the retroactive ratification of G0 provisional decisions.
@@ -289,50 +294,26 @@ class G0RatificationEngine:
                 f"have {len(eligible_voters)}"
             )
 
+        builder = PanelBuilder(eligible_voters, keys=("region",))
+
         # Check diversity is achievable
-        unique_regions = {v["region"] for v in eligible_voters}
+        unique_regions = builder.distinct("region")
         if len(unique_regions) < r_min:
             raise ValueError(
                 f"Not enough regional diversity: need {r_min} regions, "
                 f"have {len(unique_regions)}"
             )
 
-        # Greedy diversity-first selection
-        selected: list[dict[str, Any]] = []
-        remaining = list(eligible_voters)
-
-        # First pass: ensure minimum region diversity
-        selected_regions: set[str] = set()
-        for region in unique_regions:
-            if len(selected_regions) >= r_min:
-                break
-            for c in remaining:
-                if c["region"] == region and c not in selected:
-                    selected.append(c)
-                    remaining.remove(c)
-                    selected_regions.add(region)
-                    break
-
-        # Fill remaining slots respecting c_max concentration
+        # Greedy diversity-first selection: minimum regions, then fill
+        # remaining slots respecting c_max concentration
+        builder.seed("region", r_min)
         max_per_region = max(1, int(chamber_size * c_max))
-        while len(selected) < chamber_size and remaining:
-            region_counts: dict[str, int] = {}
-            for s in selected:
-                region_counts[s["region"]] = region_counts.get(s["region"], 0) + 1
-
-            added = False
-            for c in remaining:
-                if region_counts.get(c["region"], 0) < max_per_region:
-                    selected.append(c)
-                    remaining.remove(c)
-                    added = True
-                    break
-
-            if not added:
-                raise ValueError(
-                    f"Cannot fill panel to size {chamber_size} "
-                    f"while respecting c_max={c_max}"
-                )
+        if not builder.fill(chamber_size, {"region": max_per_region}):
+            raise ValueError(
+                f"Cannot fill panel to size {chamber_size} "
+                f"while respecting c_max={c_max}"
+            )
+        selected = builder.selected
 
         panel_ids = [s["actor_id"] for s in selected]
         item.panel_ids = panel_ids
@@ -483,17 +464,39 @@ class G0RatificationEngine:
         if now < deadline:
             return []
 
-        lapsed_ids: list[str] = []
-        for item in self._items.values():
-            if item.status in (
-                G0RatificationStatus.PENDING,
-                G0RatificationStatus.PANEL_VOTING,
-            ):
-                item.status = G0RatificationStatus.LAPSED
-                item.decided_utc = now
-                lapsed_ids.append(item.item_id)
+        return [
+            item_id for item_id in list(self._items)
+            if self.lapse_if_undecided(item_id, now)
+        ]
 
-        return lapsed_ids
+    def item_deadline(self, item_id: str) -> Optional[datetime]:
+        """Return the ratification deadline of an undecided item.
+
+        The window runs from submission, which happens at the G0→G1
+        transition, so this equals the phase controller's deadline.
+        Returns None for unknown or decided items.
+        """
+        item = self._items.get(item_id)
+        if (
+            item is None
+            or item.created_utc is None
+            or item.status not in _UNDECIDED
+        ):
+            return None
+        return item.created_utc + timedelta(days=self._ratification_window_days)
+
+    def lapse_if_undecided(self, item_id: str, now: datetime) -> bool:
+        """Auto-lapse one item still awaiting a decision.
+
+        Returns True if the item was lapsed by this call. The caller is
+        responsible for checking that the deadline has passed.
+        """
+        item = self._items.get(item_id)
+        if item is None or item.status not in _UNDECIDED:
+            return False
+        item.status = G0RatificationStatus.LAPSED
+        item.decided_utc = now
+        return True
 
     # ------------------------------------------------------------------
     # Reversal
@@ -175,12 +175,18 @@ class MachineAgencyEngine:
     - Allow self-petition (machine cannot initiate its own Tier 3)
     - Bypass the amendment process for first-of-class eligibility
     - Grant procedural Tier 3 without a constitutionally approved class
+
+    Grants are also indexed per machine, so per-machine lookups cost
+    O(that machine's grants). machine_revision() changes whenever one of
+    a machine's grants is created or changes status.
     """
 
     def __init__(self, config: dict[str, Any]) -> None:
         self._config = config
         self._tier3_grants: dict[str, Tier3Grant] = {}  # grant_id → Tier3Grant
         self._tier3_class_grants: dict[str, Tier3ClassGrant] = {}  # class_id → Tier3ClassGrant
+        self._grants_by_machine: dict[str, dict[str, Tier3Grant]] = {}  # machine_id → {grant_id → grant}
+        self._revisions: dict[str, int] = {}  # machine_id → revision
         self._min_years = config.get("tier3_min_years_at_tier2", TIER3_MIN_YEARS_AT_TIER2)
         self._min_domain_trust = config.get("tier3_min_domain_trust", TIER3_MIN_DOMAIN_TRUST)
 
@@ -216,11 +222,8 @@ class MachineAgencyEngine:
                 domain_tiers[domain] = MachineTier.TIER_1
 
         # Check Tier 3 grants (override Tier 1/2)
-        for grant in self._tier3_grants.values():
-            if (
-                grant.machine_id == machine_id
-                and grant.status == Tier3PetitionStatus.GRANTED
-            ):
+        for grant in self._grants_by_machine.get(machine_id, {}).values():
+            if grant.status == Tier3PetitionStatus.GRANTED:
                 domain_tiers[grant.domain] = MachineTier.TIER_3
 
         return domain_tiers
@@ -332,10 +335,9 @@ class MachineAgencyEngine:
             now = datetime.now(timezone.utc)
 
         # Check for existing active/pending petition
-        for grant in self._tier3_grants.values():
+        for grant in self._grants_by_machine.get(machine_id, {}).values():
             if (
-                grant.machine_id == machine_id
-                and grant.domain == domain
+                grant.domain == domain
                 and grant.status in (
                     Tier3PetitionStatus.PENDING_AMENDMENT,
                     Tier3PetitionStatus.GRANTED,
@@ -356,7 +358,7 @@ class MachineAgencyEngine:
             status=Tier3PetitionStatus.PENDING_AMENDMENT,
             created_utc=now,
         )
-        self._tier3_grants[grant_id] = grant
+        self._add_grant(grant)
         return grant
 
     def on_amendment_confirmed(
@@ -386,6 +388,7 @@ class MachineAgencyEngine:
             ):
                 grant.status = Tier3PetitionStatus.GRANTED
                 grant.granted_utc = now
+                self._touch(grant.machine_id)
                 return grant
         return None
 
@@ -412,6 +415,7 @@ class MachineAgencyEngine:
                 and grant.status == Tier3PetitionStatus.PENDING_AMENDMENT
             ):
                 grant.status = Tier3PetitionStatus.REJECTED
+                self._touch(grant.machine_id)
                 return grant
         return None
 
@@ -440,15 +444,15 @@ class MachineAgencyEngine:
         if now is None:
             now = datetime.now(timezone.utc)
 
-        for grant in self._tier3_grants.values():
+        for grant in self._grants_by_machine.get(machine_id, {}).values():
             if (
-                grant.machine_id == machine_id
-                and grant.domain == domain
+                grant.domain == domain
                 and grant.status == Tier3PetitionStatus.GRANTED
             ):
                 grant.status = Tier3PetitionStatus.REVOKED
                 grant.revoked_utc = now
                 grant.revocation_reason = reason
+                self._touch(machine_id)
                 return grant
         return None
 
@@ -476,15 +480,15 @@ class MachineAgencyEngine:
         if now is None:
             now = datetime.now(timezone.utc)
 
-        for grant in self._tier3_grants.values():
+        for grant in self._grants_by_machine.get(machine_id, {}).values():
             if (
-                grant.machine_id == machine_id
-                and grant.domain == domain
+                grant.domain == domain
                 and grant.status == Tier3PetitionStatus.GRANTED
             ):
                 grant.status = Tier3PetitionStatus.SUSPENDED
                 grant.revoked_utc = now
                 grant.revocation_reason = f"Emergency suspension: {reason}"
+                self._touch(machine_id)
                 return grant
         return None
 
@@ -520,10 +524,9 @@ class MachineAgencyEngine:
         domain: str,
     ) -> Optional[Tier3Grant]:
         """Get the current Tier 3 grant for a machine+domain, if any."""
-        for grant in self._tier3_grants.values():
+        for grant in self._grants_by_machine.get(machine_id, {}).values():
             if (
-                grant.machine_id == machine_id
-                and grant.domain == domain
+                grant.domain == domain
                 and grant.status in (
                     Tier3PetitionStatus.PENDING_AMENDMENT,
                     Tier3PetitionStatus.GRANTED,
@@ -538,13 +541,29 @@ class MachineAgencyEngine:
         status: Optional[Tier3PetitionStatus] = None,
     ) -> list[Tier3Grant]:
         """Get all Tier 3 grants, optionally filtered."""
-        result = list(self._tier3_grants.values())
         if machine_id is not None:
-            result = [g for g in result if g.machine_id == machine_id]
+            result = list(self._grants_by_machine.get(machine_id, {}).values())
+        else:
+            result = list(self._tier3_grants.values())
         if status is not None:
             result = [g for g in result if g.status == status]
         return result
 
+    def machine_revision(self, machine_id: str) -> int:
+        """Return a counter that changes whenever one of the machine's
+        grants is created or changes status."""
+        return self._revisions.get(machine_id, 0)
+
+    def _add_grant(self, grant: Tier3Grant) -> None:
+        self._tier3_grants[grant.grant_id] = grant
+        self._grants_by_machine.setdefault(
+            grant.machine_id, {},
+        )[grant.grant_id] = grant
+        self._touch(grant.machine_id)
+
+    def _touch(self, machine_id: str) -> None:
+        self._revisions[machine_id] = self._revisions.get(machine_id, 0) + 1
+
     def provision_key_for(self, machine_id: str, domain: str) -> str:
         """Generate the amendment provision key for a Tier 3 petition.
 
@@ -738,10 +757,9 @@ class MachineAgencyEngine:
             )
 
         # Check for existing active/pending individual grant
-        for grant in self._tier3_grants.values():
+        for grant in self._grants_by_machine.get(machine_id, {}).values():
             if (
-                grant.machine_id == machine_id
-                and grant.domain == domain
+                grant.domain == domain
                 and grant.status in (
                     Tier3PetitionStatus.PENDING_AMENDMENT,
                     Tier3PetitionStatus.GRANTED,
@@ -765,7 +783,7 @@ class MachineAgencyEngine:
             class_grant_id=class_id,
             grant_pathway="procedural",
         )
-        self._tier3_grants[grant_id] = grant
+        self._add_grant(grant)
         return grant
 
     def revoke_class_eligibility(
@@ -898,7 +916,7 @@ class MachineAgencyEngine:
                 grant_pathway=r.get("grant_pathway", "amendment"),
                 created_utc=datetime.fromisoformat(r["created_utc"]),
             )
-            engine._tier3_grants[grant.grant_id] = grant
+            engine._add_grant(grant)
 
         for r in class_records:
             cg = Tier3ClassGrant(
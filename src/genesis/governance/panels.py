@@ -0,0 +1,141 @@
+"""Diversity-constrained panel selection — one greedy engine for every panel.
+
+Amendment chambers, confirmation panels, G0 ratification panels,
+adjudication panels and Constitutional Court panels are all formed by
+the same greedy, diversity-first procedure over a candidate pool:
+
+1. Seed: for each distinct region (or organisation), until enough are
+   represented, add the first candidate in pool order holding it.
+2. Fill: add the first remaining candidate in pool order whose region
+   (and organisation) is still below its concentration cap, relaxing
+   caps tier by tier when no candidate fits.
+
+PanelBuilder runs that procedure over pool indexes with live per-region
+and per-organisation counters. Because counts only grow, a candidate
+that does not fit a cap tier never fits it later, so each fill tier is
+one forward scan of the pool: forming a panel is linear in the pool,
+not quadratic. Selections are identical to the list-based loops they
+replace: distinct values are visited in the order of the same set built
+from the pool, and every pick is the first qualifying candidate in pool
+order.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional, Sequence
+
+# Candidate fields counted by default.
+DIVERSITY_KEYS: tuple[str, ...] = ("region", "organization")
+
+
+class PanelBuilder:
+    """Builds one panel from a candidate pool, in selection order.
+
+    Usage:
+        builder = PanelBuilder(candidates)
+        if len(builder.distinct("region")) < r_min:
+            raise ValueError(...)
+        builder.seed("region", r_min)
+        if not builder.fill(size, {"region": max_per_region}):
+            raise ValueError(...)
+        panel = builder.selected
+    """
+
+    def __init__(
+        self,
+        pool: Sequence[Mapping[str, Any]],
+        keys: Sequence[str] = DIVERSITY_KEYS,
+    ) -> None:
+        self._pool = pool
+        self._taken = bytearray(len(pool))
+        self._order: list[int] = []
+        self._counts: dict[str, dict[Any, int]] = {key: {} for key in keys}
+        self._distinct: dict[str, set] = {}
+        self._first: dict[str, dict[Any, int]] = {}
+
+    @property
+    def selected(self) -> list[Mapping[str, Any]]:
+        """Selected candidates, in selection order."""
+        pool = self._pool
+        return [pool[i] for i in self._order]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def distinct(self, key: str) -> set:
+        """Distinct values of ``key`` across the whole pool."""
+        values = self._distinct.get(key)
+        if values is None:
+            values = self._distinct[key] = {c[key] for c in self._pool}
+        return values
+
+    def counts(self, key: str) -> dict[Any, int]:
+        """Selected candidates per value of ``key``, in first-pick order."""
+        return dict(self._counts[key])
+
+    def seed(self, key: str, minimum: int, limit: Optional[int] = None) -> None:
+        """Add candidates until ``minimum`` distinct ``key`` values are on the panel.
+
+        Values are visited in distinct(key) order; values already on the
+        panel are skipped, and each new value contributes the first pool
+        candidate holding it. With ``limit``, no pick grows the panel
+        beyond that size.
+        """
+        present = self._counts[key]
+        first = self._first_index(key)
+        for value in self.distinct(key):
+            if len(present) >= minimum:
+                break
+            if value in present:
+                continue
+            if limit is not None and len(self._order) >= limit:
+                continue
+            self._take(first[value])
+
+    def fill(self, size: int, *caps: Mapping[str, int]) -> bool:
+        """Fill the panel to ``size`` from the pool, in pool order.
+
+        Each positional argument is a cap tier: {key: maximum per value}.
+        Candidates are taken from the first tier while any fits, then
+        from the next; with no tiers every remaining candidate fits.
+        Returns True if the panel reached ``size``.
+        """
+        pool = self._pool
+        taken = self._taken
+        counts = self._counts
+        for tier in caps or ({},):
+            limits = [(counts[key], key, cap) for key, cap in tier.items()]
+            pos = 0
+            while len(self._order) < size:
+                while pos < len(pool) and (
+                    taken[pos] or any(
+                        c.get(pool[pos][key], 0) >= cap for c, key, cap in limits
+                    )
+                ):
+                    pos += 1
+                if pos == len(pool):
+                    break
+                self._take(pos)
+            if len(self._order) >= size:
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _first_index(self, key: str) -> dict[Any, int]:
+        first = self._first.get(key)
+        if first is None:
+            first = self._first[key] = {}
+            for i, c in enumerate(self._pool):
+                first.setdefault(c[key], i)
+        return first
+
+    def _take(self, index: int) -> None:
+        self._taken[index] = 1
+        self._order.append(index)
+        candidate = self._pool[index]
+        for key, counts in self._counts.items():
+            value = candidate[key]
+            counts[value] = counts.get(value, 0) + 1
@@ -26,6 +26,8 @@ from __future__ import annotations
 
 import secrets
 import uuid
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -216,8 +218,17 @@ class QuorumVerifier:
         # Active requests: request_id -> QuorumVerificationRequest
         self._requests: dict[str, QuorumVerificationRequest] = {}
 
-        # Verifier history for cooldown/workload tracking
-        self._verifier_history: dict[str, list[datetime]] = {}
+        # Verifier history for cooldown/workload tracking: assignment times
+        # per verifier, ascending, pruned on every assignment to what the
+        # cooldown and workload limits can still see — entries inside the
+        # longest window, and no more than the largest limit of them.
+        self._verifier_history: dict[str, deque[datetime]] = {}
+        self._history_window = timedelta(hours=max(
+            self._verifier_cooldown_hours, self._timeout_hours, 30 * 24,
+        ))
+        self._history_cap = max(
+            1, self._max_panels_per_month, self._max_concurrent_panels,
+        )
 
     # ------------------------------------------------------------------
     # Public API — Facilitator assignment (single facilitator, not panel)
@@ -315,7 +326,7 @@ class QuorumVerifier:
 
         # Record facilitator assignment in history
         for vid in selected_ids:
-            self._verifier_history.setdefault(vid, []).append(now_utc)
+            self._record_assignment(vid, now_utc)
 
         return request
 
@@ -622,7 +633,7 @@ class QuorumVerifier:
         verifier_cooldown_hours.
         """
         now_utc = now or datetime.now(timezone.utc)
-        history = self._verifier_history.get(verifier_id, [])
+        history = self._verifier_history.get(verifier_id, ())
         cutoff = now_utc - timedelta(hours=self._verifier_cooldown_hours)
         return any(ts >= cutoff for ts in history)
 
@@ -636,7 +647,7 @@ class QuorumVerifier:
         Returns a list of violation descriptions (empty = OK).
         """
         now_utc = now or datetime.now(timezone.utc)
-        history = self._verifier_history.get(verifier_id, [])
+        history = self._verifier_history.get(verifier_id, ())
         violations: list[str] = []
 
         # Max panels per month (30 days)
@@ -838,6 +849,53 @@ class QuorumVerifier:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @property
+    def region_required(self) -> bool:
+        """Whether facilitators must share the participant's region."""
+        return self._require_region
+
+    # ------------------------------------------------------------------
+
+    def _record_assignment(self, verifier_id: str, when: datetime) -> None:
+        """Add an assignment to a verifier's history and prune it."""
+        history = self._verifier_history.get(verifier_id)
+        if history is None:
+            history = self._verifier_history[verifier_id] = deque()
+        if not history or when >= history[-1]:
+            history.append(when)
+        else:
+            history.insert(bisect_right(history, when), when)
+        horizon = history[-1] - self._history_window
+        while len(history) > self._history_cap or history[0] < horizon:
+            history.popleft()
+
+    def _is_available(self, verifier_id: str, now: datetime) -> bool:
+        """O(1) equivalent of passing check_verifier_cooldown() and
+        check_verifier_workload(), read off the newest history entries.
+
+        Histories that have aged out of every window are dropped here.
+        """
+        history = self._verifier_history.get(verifier_id)
+        if history and history[-1] < now - self._history_window:
+            del self._verifier_history[verifier_id]
+            history = None
+        history = history or deque()
+
+        def at_least(count: int, cutoff: datetime) -> bool:
+            # history is ascending: the count-th newest entry decides.
+            return count <= 0 or (
+                len(history) >= count and history[-count] >= cutoff
+            )
+
+        return not (
+            at_least(1, now - timedelta(hours=self._verifier_cooldown_hours))
+            or at_least(self._max_panels_per_month, now - timedelta(days=30))
+            or at_least(
+                self._max_concurrent_panels,
+                now - timedelta(hours=self._timeout_hours),
+            )
+        )
+
     def _filter_eligible(
         self,
         verifiers: list[tuple[str, float, str]],
@@ -854,9 +912,7 @@ class QuorumVerifier:
                 continue
             if self._require_region and verifier_region != region:
                 continue
-            if self.check_verifier_cooldown(verifier_id, now):
-                continue
-            if self.check_verifier_workload(verifier_id, now):
+            if not self._is_available(verifier_id, now):
                 continue
             eligible.append((verifier_id, trust, verifier_region))
         return eligible
@@ -915,14 +971,15 @@ def _secure_sample(
 def _generate_challenge_phrase(word_count: int = 6) -> str:
     """Generate a BIP39 challenge phrase for proof-of-interaction.
 
-    Uses the same Fisher-Yates shuffle pattern as _secure_sample to
-    select *word_count* unique words from the BIP39 English wordlist.
+    Selects *word_count* unique words from the BIP39 English wordlist
+    using cryptographic randomness. Indexes are drawn directly and
+    redrawn on repeats, so the 2048-word list is never copied.
     """
-    pool = list(EN_WORDS)
-    selected: list[str] = []
-    for _ in range(word_count):
-        idx = secrets.randbelow(len(pool))
-        selected.append(pool[idx])
-        pool[idx] = pool[-1]
-        pool.pop()
-    return " ".join(selected)
+    if word_count > len(EN_WORDS):
+        raise ValueError("Cannot sample more words than the wordlist holds")
+    indexes: list[int] = []
+    while len(indexes) < word_count:
+        idx = secrets.randbelow(len(EN_WORDS))
+        if idx not in indexes:
+            indexes.append(idx)
+    return " ".join(EN_WORDS[i] for i in indexes)
@@ -23,6 +23,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
+from genesis.governance.panels import PanelBuilder
+
 
 class AdjudicationType(str, enum.Enum):
     """Types of adjudication cases."""
@@ -253,9 +255,11 @@ class AdjudicationEngine:
                 f"Not enough eligible candidates: need {size}, have {len(eligible)}"
             )
 
+        builder = PanelBuilder(eligible)
+
         # Check diversity is achievable
-        unique_orgs = {c["organization"] for c in eligible}
-        unique_regions = {c["region"] for c in eligible}
+        unique_orgs = builder.distinct("organization")
+        unique_regions = builder.distinct("region")
         if len(unique_orgs) < self._min_orgs:
             raise ValueError(
                 f"Not enough organizational diversity: need {self._min_orgs} orgs, "
@@ -267,46 +271,16 @@ class AdjudicationEngine:
                 f"have {len(unique_regions)}"
             )
 
-        # Greedy diversity-first selection
-        selected: list[dict[str, Any]] = []
-        remaining = list(eligible)
-
-        # First pass: ensure minimum org diversity
-        selected_orgs: set[str] = set()
-        for org in unique_orgs:
-            if len(selected_orgs) >= self._min_orgs:
-                break
-            for c in remaining:
-                if c["organization"] == org and c not in selected:
-                    selected.append(c)
-                    remaining.remove(c)
-                    selected_orgs.add(org)
-                    break
-
-        # Second pass: ensure minimum region diversity
-        selected_regions = {c["region"] for c in selected}
-        for region in unique_regions:
-            if len(selected_regions) >= self._min_regions:
-                break
-            if region in selected_regions:
-                continue
-            for c in remaining:
-                if c["region"] == region and c not in selected:
-                    selected.append(c)
-                    remaining.remove(c)
-                    selected_regions.add(region)
-                    break
-
-        # Fill remaining slots
-        while len(selected) < size and remaining:
-            selected.append(remaining.pop(0))
-
-        if len(selected) < size:
+        # Greedy diversity-first selection: minimum orgs, then minimum
+        # regions, then fill remaining slots in pool order
+        builder.seed("organization", self._min_orgs)
+        builder.seed("region", self._min_regions)
+        if not builder.fill(size):
             raise ValueError(
-                f"Could not form panel of size {size}: only {len(selected)} after diversity"
+                f"Could not form panel of size {size}: only {len(builder)} after diversity"
             )
 
-        return selected[:size]
+        return builder.selected[:size]
 
     def submit_panel_vote(
         self,
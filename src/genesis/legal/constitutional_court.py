@@ -21,6 +21,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from genesis.governance.panels import PanelBuilder
+
 
 class CourtCaseStatus(str, enum.Enum):
     """Lifecycle status of a Constitutional Court case."""
@@ -137,9 +139,11 @@ class ConstitutionalCourt:
                 f"have {len(eligible)}"
             )
 
+        builder = PanelBuilder(eligible)
+
         # Check diversity
-        unique_orgs = {c["organization"] for c in eligible}
-        unique_regions = {c["region"] for c in eligible}
+        unique_orgs = builder.distinct("organization")
+        unique_regions = builder.distinct("region")
         if len(unique_orgs) < self._min_orgs:
             raise ValueError(
                 f"Not enough organizational diversity: need {self._min_orgs}, "
@@ -151,44 +155,15 @@ class ConstitutionalCourt:
                 f"have {len(unique_regions)}"
             )
 
-        # Diversity-first selection
-        selected: list[dict[str, Any]] = []
-        remaining = list(eligible)
-
-        # Ensure minimum org diversity
-        selected_orgs: set[str] = set()
-        for org in unique_orgs:
-            if len(selected_orgs) >= self._min_orgs:
-                break
-            for c in remaining:
-                if c["organization"] == org and c not in selected:
-                    selected.append(c)
-                    remaining.remove(c)
-                    selected_orgs.add(org)
-                    break
-
-        # Ensure minimum region diversity
-        selected_regions = {c["region"] for c in selected}
-        for region in unique_regions:
-            if len(selected_regions) >= self._min_regions:
-                break
-            if region in selected_regions:
-                continue
-            for c in remaining:
-                if c["region"] == region and c not in selected:
-                    selected.append(c)
-                    remaining.remove(c)
-                    selected_regions.add(region)
-                    break
-
-        # Fill remaining
-        while len(selected) < self._panel_size and remaining:
-            selected.append(remaining.pop(0))
-
-        if len(selected) < self._panel_size:
+        # Diversity-first selection: minimum orgs, then minimum regions,
+        # then fill remaining seats in pool order
+        builder.seed("organization", self._min_orgs)
+        builder.seed("region", self._min_regions)
+        if not builder.fill(self._panel_size):
             raise ValueError(
                 f"Could not form court panel of size {self._panel_size}"
             )
+        selected = builder.selected
 
         case.panel_ids = [p["actor_id"] for p in selected]
         case.panel_orgs = [p["organization"] for p in selected]
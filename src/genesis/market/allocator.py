@@ -112,21 +112,8 @@ class AllocationEngine:
         """Return (w_relevance, w_global_trust, w_domain_trust).
 
         Reads from market_policy config, falls back to skill_matching
-        config, then to hardcoded defaults.
+        config, then to hardcoded defaults (resolved once per policy
+        version in the compiled snapshot).
         """
-        # Try market-specific weights first
-        if self._resolver.has_market_config():
-            config = self._resolver.market_allocation_weights()
-            return (
-                config.get("relevance", 0.50),
-                config.get("global_trust", 0.20),
-                config.get("domain_trust", 0.30),
-            )
-        # Fall back to skill matching config
-        sm = self._resolver.skill_matching_config()
-        alloc = sm.get("worker_allocation_weights", {})
-        return (
-            alloc.get("relevance", 0.50),
-            alloc.get("global_trust", 0.20),
-            alloc.get("domain_trust", 0.30),
-        )
+        alloc = self._resolver.compiled().market_allocation
+        return (alloc.relevance, alloc.global_trust, alloc.domain_trust)
@@ -17,6 +17,8 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, Optional
 
+from genesis.models.trust import ActorKind
+
 
 class CostCategory(str, enum.Enum):
     """Classification of operational costs.
@@ -105,6 +107,20 @@ class WindowStats:
     is_bootstrap: bool
 
 
+@dataclass(frozen=True)
+class PayoutTerms:
+    """Per-payout inputs to the commission formula.
+
+    The window, reserve and policy are shared by every payout computed
+    at the same instant; these fields are what varies between them.
+    """
+    mission_reward: Decimal
+    worker_actor_kind: Optional[ActorKind] = None
+    machine_tier: int = 0
+    mission_domain: str = "general"
+    tier3_recognized: bool = False
+
+
 @dataclass(frozen=True)
 class CommissionBreakdown:
     """Full breakdown of a commission computation.
@@ -39,6 +39,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from genesis.models.tally import TalliedRecord
+
 
 class LeaveCategory(str, enum.Enum):
     """Categories of protected life events.
@@ -124,7 +126,7 @@ class LeaveAdjudication:
 
 
 @dataclass
-class LeaveRecord:
+class LeaveRecord(TalliedRecord):
     """A protected leave record for an actor.
 
     Trust freeze semantics:
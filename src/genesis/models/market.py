@@ -17,6 +17,7 @@ from decimal import Decimal
 from typing import Any, Optional
 
 from genesis.models.skill import SkillRequirement
+from genesis.models.tally import TalliedRecord
 
 
 class ListingState(str, enum.Enum):
@@ -53,7 +54,7 @@ class WorkVisibility(str, enum.Enum):
 
 
 @dataclass
-class MarketListing:
+class MarketListing(TalliedRecord):
     """A work listing posted by a mission creator.
 
     Describes the work to be done and the skill requirements.
@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from genesis.models.tally import TalliedRecord
+
 
 # ---------------------------------------------------------------------------
 # Enumerations
@@ -124,7 +126,7 @@ class Task:
 
 
 @dataclass
-class Mission:
+class Mission(TalliedRecord):
     """Top-level mission — the fundamental unit of accountable work.
 
     Every mission must have:
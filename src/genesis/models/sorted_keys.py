@@ -0,0 +1,94 @@
+"""Sorted-key dicts — ordered iteration over a keyed record collection.
+
+Bulk jobs that walk a collection in key order and checkpoint by key
+(compliance re-screening, for one) would otherwise sort every key on
+every call. A SortedKeyDict is the record dict itself, keeping a sorted
+list of its keys as records come and go, so a walk can start after any
+checkpoint key with a binary search.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Iterator, Mapping, Optional
+
+
+class SortedKeyDict(dict):
+    """A dict that keeps a sorted list of its keys.
+
+    Usage:
+        proposals = SortedKeyDict(records)
+        proposals[proposal.proposal_id] = proposal
+        for proposal_id in proposals.keys_after(checkpoint):
+            ...
+
+    Keys must be mutually orderable. Inserting or removing a key costs
+    O(log n) comparisons plus a list shift.
+    """
+
+    def __init__(self, records: Optional[Mapping[Any, Any]] = None) -> None:
+        super().__init__()
+        self._sorted_keys: list[Any] = []
+        if records:
+            self.update(records)
+
+    def keys_after(self, key: Optional[Any] = None) -> Iterator[Any]:
+        """Yield keys greater than ``key`` (all keys if None), in order.
+
+        The dict must not gain or lose keys while the iterator is in use.
+        """
+        keys = self._sorted_keys
+        start = 0 if key is None else bisect_right(keys, key)
+        for i in range(start, len(keys)):
+            yield keys[i]
+
+    # -- dict mutators, each keeping the key order in step --
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key not in self:
+            insort(self._sorted_keys, key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        dict.__delitem__(self, key)
+        self._forget(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            value = dict.pop(self, key)
+            self._forget(key)
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self) -> tuple[Any, Any]:
+        key, value = dict.popitem(self)
+        self._forget(key)
+        return key, value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._sorted_keys.clear()
+
+    def __ior__(self, other: Any) -> SortedKeyDict:
+        self.update(other)
+        return self
+
+    def __reduce__(self) -> tuple:
+        return (type(self), (dict(self),))
+
+    # -- internal helpers --
+
+    def _forget(self, key: Any) -> None:
+        keys = self._sorted_keys
+        del keys[bisect_left(keys, key)]
@@ -0,0 +1,119 @@
+"""State tallies — live per-state counts over a keyed record collection.
+
+Status summaries count records by state: missions by MissionState,
+listings by ListingState, leave records by LeaveState. Scanning the
+collection for every summary costs O(n). A StateTally is the record
+dict itself, counting its members by ``state`` as they come and go.
+
+Records join the count when stored and leave it when removed. Records
+that derive from TalliedRecord also report their own state changes, so
+every ``record.state = ...`` assignment, wherever it happens, moves the
+record between counts. A record reports to one tally only: storing it
+in a second tally raises ValueError, and copies start untallied.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Hashable, Iterable, Mapping, Optional
+
+from genesis.models.sorted_keys import SortedKeyDict
+
+
+class TalliedRecord:
+    """Mixin for dataclasses whose ``state`` is counted by a StateTally."""
+
+    def __setattr__(self, name: str, value: object) -> None:
+        tally = self.__dict__.get("_tally")
+        if tally is not None and name == "state":
+            tally._move(self.__dict__["state"], value)
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        state.pop("_tally", None)
+        return state
+
+
+class StateTally(SortedKeyDict):
+    """A dict of records that keeps a count of its records per state.
+
+    Usage:
+        missions = StateTally(state_store.load_missions())
+        missions[mission.mission_id] = mission
+        mission.state = MissionState.SUBMITTED  # counts follow
+        missions.count(MissionState.SUBMITTED)
+
+    It is also a SortedKeyDict, so records can be walked in key order.
+    Raises ValueError when storing a record another tally holds.
+    """
+
+    def __init__(self, records: Optional[Mapping[Any, Any]] = None) -> None:
+        self._counts: dict[Hashable, int] = {}
+        super().__init__(records)
+
+    def count(self, *states: Hashable) -> int:
+        """Return the number of records in any of ``states``."""
+        counts = self._counts
+        return sum(counts.get(s, 0) for s in states)
+
+    def counts(self) -> dict[Hashable, int]:
+        """Return {state: count} for every state held by some record."""
+        return {s: n for s, n in self._counts.items() if n}
+
+    # -- dict mutators, each keeping the counts in step --
+
+    def __setitem__(self, key: Any, record: Any) -> None:
+        owner = record.__dict__.get("_tally")
+        if owner is not None and owner is not self:
+            raise ValueError(f"Record {key!r} is held by another tally")
+        previous = dict.get(self, key)
+        if previous is not None:
+            self._detach(previous)
+        super().__setitem__(key, record)
+        self._attach(record)
+
+    def __delitem__(self, key: Any) -> None:
+        self._detach(self[key])
+        super().__delitem__(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            record = super().pop(key)
+            self._detach(record)
+            return record
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self) -> tuple[Any, Any]:
+        key, record = super().popitem()
+        self._detach(record)
+        return key, record
+
+    def clear(self) -> None:
+        for record in self.values():
+            self._detach(record)
+        super().clear()
+
+    # -- internal helpers --
+
+    def _attach(self, record: Any) -> None:
+        object.__setattr__(record, "_tally", self)
+        self._counts[record.state] = self._counts.get(record.state, 0) + 1
+
+    def _detach(self, record: Any) -> None:
+        self._counts[record.state] -= 1
+        if record.__dict__.get("_tally") is self:
+            object.__setattr__(record, "_tally", None)
+
+    def _move(self, old: Hashable, new: Hashable) -> None:
+        self._counts[old] -= 1
+        self._counts[new] = self._counts.get(new, 0) + 1
+
+
+def scan_counts(records: Iterable[Any]) -> dict[Hashable, int]:
+    """Count records by state with a full scan (the reference for checks)."""
+    counts: dict[Hashable, int] = {}
+    for record in records:
+        counts[record.state] = counts.get(record.state, 0) + 1
+    return counts
@@ -1,6 +1,28 @@
 """Persistence layer — event log and state storage."""
 
-from genesis.persistence.event_log import EventLog, EventRecord, EventKind
-from genesis.persistence.state_store import StateStore
+from genesis.persistence.commitment_store import CommitmentStore, EventInclusionProof
+from genesis.persistence.event_log import (
+    EventKind,
+    EventLog,
+    EventPage,
+    EventRecord,
+    GroupCommitStats,
+)
+from genesis.persistence.segmented_log import SegmentIndex, SegmentedEventLog
+from genesis.persistence.sqlite_store import SQLiteStateStore
+from genesis.persistence.state_store import StateStore, open_state_store
 
-__all__ = ["EventLog", "EventRecord", "EventKind", "StateStore"]
+__all__ = [
+    "CommitmentStore",
+    "EventInclusionProof",
+    "EventLog",
+    "EventRecord",
+    "EventKind",
+    "EventPage",
+    "GroupCommitStats",
+    "SQLiteStateStore",
+    "SegmentIndex",
+    "SegmentedEventLog",
+    "StateStore",
+    "open_state_store",
+]
@@ -0,0 +1,604 @@
+"""Commitment store — durable epoch commitments and their Merkle trees.
+
+EpochService builds four Merkle trees per epoch and commits only their
+roots. To prove later that an event belongs to an old epoch, the tree
+must still exist. CommitmentStore keeps every closed epoch on disk:
+
+    commitments/
+        commitments.jsonl        one line per epoch: CommitmentRecord + hash
+        anchors.jsonl            one line per AnchorRecord
+        epoch-000000.tree        the epoch's four domain trees (binary)
+        epoch-000001.tree        ...
+        index-000000-000007.idx  sorted event hash -> epoch runs
+        index-000008-000008.idx  ...
+
+A tree file holds every level of the mission, trust, governance and
+review trees as fixed-width 32-byte nodes after a small header of leaf
+counts, so any node is one seek away. An inclusion proof binary-searches
+the sorted leaves and reads one sibling per level: O(log n) reads, no
+tree rebuild, and the proof is identical to MerkleTree.inclusion_proof().
+
+Finding which epoch holds an event hash uses an on-disk index instead
+of a dict of every leaf: each closed epoch adds a sorted run of
+fixed-width (digest, epoch, domain) entries, and runs covering equal
+spans of epochs are merged, binary-counter style, so there are at most
+O(log epochs) runs. A lookup binary-searches each run with seeks, so
+opening the store reads no leaves. On open only each tree's top node is
+checked against the root in its CommitmentRecord, so a swapped or
+truncated tree file fails closed with ValueError; index runs missing for
+some epochs (a crash after the journal line) are rebuilt from the tree
+files. verify_epoch() re-hashes a whole epoch for audits.
+
+Writes are ordered tree file first (temp file + rename), then the
+commitments.jsonl line, both fsynced. A crash in between leaves an
+orphan tree file that is overwritten by the next append; a torn final
+journal line is discarded on open.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import re
+import struct
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+from genesis.crypto.anchor import AnchorRecord
+from genesis.crypto.merkle import MerkleProof, MerkleTree, _ensure_prefix, _hash_pair
+from genesis.models.commitment import CommitmentRecord
+from genesis.persistence.state_store import _fsync_dir
+
+# Domain order in tree files, keyed like EpochService.epoch_event_counts().
+DOMAINS: tuple[str, ...] = ("mission", "trust", "governance", "review")
+_ROOT_FIELDS = {
+    "mission": "mission_event_root",
+    "trust": "trust_delta_root",
+    "governance": "governance_ballot_root",
+    "review": "review_decision_root",
+}
+
+_TREE_MAGIC = b"GNTREE01"
+_HEADER = struct.Struct(">4Q")  # leaf count per domain
+_NODE = 32
+_LEAF_RE = re.compile(r"^sha256:[0-9a-f]{64}$")
+_INDEX_ENTRY = struct.Struct(">32sIB")  # leaf digest, epoch ordinal, domain
+_INDEX_RE = re.compile(r"^index-(\d{6})-(\d{6})\.idx$")
+_INDEX_CHUNK = 4096  # entries per read or write while streaming a run
+
+
+@dataclass(frozen=True)
+class EventInclusionProof:
+    """Proof that an event hash is a leaf of a committed epoch tree.
+
+    verify_inclusion(proof) checks the path; proof.root equals the
+    domain root in ``record``, and hashing ``record`` canonically gives
+    ``commitment_hash`` — the value anchored on chain.
+    """
+    epoch_id: str
+    domain: str
+    proof: MerkleProof
+    record: CommitmentRecord
+    commitment_hash: str
+
+
+def _level_sizes(leaf_count: int) -> list[int]:
+    if leaf_count == 0:
+        return []
+    sizes = [leaf_count]
+    while sizes[-1] > 1:
+        sizes.append((sizes[-1] + 1) // 2)
+    return sizes
+
+
+def _node_text(raw: bytes, level: int) -> str:
+    # Leaves keep their sha256: prefix, inner nodes are bare hex,
+    # exactly as MerkleTree stores them.
+    return f"sha256:{raw.hex()}" if level == 0 else raw.hex()
+
+
+class _TreeFile:
+    """Node offsets within one epoch's tree file."""
+
+    def __init__(self, path: Path, leaf_counts: tuple[int, ...]) -> None:
+        self.path = path
+        self.leaf_counts = leaf_counts
+        self.levels: list[list[tuple[int, int]]] = []  # (offset, size) per level
+        offset = len(_TREE_MAGIC) + _HEADER.size
+        for count in leaf_counts:
+            domain_levels = []
+            for size in _level_sizes(count):
+                domain_levels.append((offset, size))
+                offset += size * _NODE
+            self.levels.append(domain_levels)
+        self.size = offset
+
+    @classmethod
+    def open(cls, path: Path) -> _TreeFile:
+        with path.open("rb") as f:
+            head = f.read(len(_TREE_MAGIC) + _HEADER.size)
+        if len(head) != len(_TREE_MAGIC) + _HEADER.size or not head.startswith(_TREE_MAGIC):
+            raise ValueError(f"Not a commitment tree file: {path}")
+        tree = cls(path, _HEADER.unpack(head[len(_TREE_MAGIC):]))
+        if path.stat().st_size != tree.size:
+            raise ValueError(f"Commitment tree file has the wrong size: {path}")
+        return tree
+
+    def node(self, f: Any, domain: int, level: int, index: int) -> bytes:
+        offset, _ = self.levels[domain][level]
+        f.seek(offset + index * _NODE)
+        return f.read(_NODE)
+
+    def level(self, f: Any, domain: int, level: int) -> list[bytes]:
+        offset, size = self.levels[domain][level]
+        f.seek(offset)
+        raw = f.read(size * _NODE)
+        return [raw[i:i + _NODE] for i in range(0, len(raw), _NODE)]
+
+    def find_leaf(self, f: Any, domain: int, digest: bytes) -> Optional[int]:
+        """Index of the first leaf equal to ``digest``, or None.
+
+        First, as MerkleTree.leaf_index() resolves duplicates to their
+        first position.
+        """
+        count = self.leaf_counts[domain]
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.node(f, domain, 0, mid) < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == count or self.node(f, domain, 0, lo) != digest:
+            return None
+        return lo
+
+
+class _IndexRun:
+    """A sorted run of (digest, ordinal, domain) entries for epochs first..last.
+
+    Entries sort by digest, then ordinal, then domain, so the first entry
+    for a digest is the oldest epoch holding it.
+    """
+
+    def __init__(self, path: Path, first: int, last: int) -> None:
+        self.path = path
+        self.first = first
+        self.last = last
+        size = path.stat().st_size
+        if size % _INDEX_ENTRY.size:
+            raise ValueError(f"Commitment index run has the wrong size: {path}")
+        self.count = size // _INDEX_ENTRY.size
+
+    @property
+    def span(self) -> int:
+        return self.last - self.first + 1
+
+    @classmethod
+    def write(
+        cls,
+        path: Path,
+        first: int,
+        last: int,
+        entries: Iterable[tuple[bytes, int, int]],
+        fsync: bool,
+    ) -> _IndexRun:
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            chunk: list[bytes] = []
+            for entry in entries:
+                chunk.append(_INDEX_ENTRY.pack(*entry))
+                if len(chunk) == _INDEX_CHUNK:
+                    f.write(b"".join(chunk))
+                    chunk.clear()
+            f.write(b"".join(chunk))
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+        if fsync:
+            _fsync_dir(path.parent)
+        return cls(path, first, last)
+
+    def entries(self) -> Iterator[tuple[bytes, int, int]]:
+        with self.path.open("rb") as f:
+            while raw := f.read(_INDEX_CHUNK * _INDEX_ENTRY.size):
+                yield from _INDEX_ENTRY.iter_unpack(raw)
+
+    def find(self, digest: bytes) -> Optional[tuple[int, int]]:
+        """(ordinal, domain) of the first entry for ``digest``, or None."""
+        with self.path.open("rb") as f:
+            lo, hi = 0, self.count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                f.seek(mid * _INDEX_ENTRY.size)
+                if f.read(_NODE) < digest:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo == self.count:
+                return None
+            f.seek(lo * _INDEX_ENTRY.size)
+            found, ordinal, domain = _INDEX_ENTRY.unpack(f.read(_INDEX_ENTRY.size))
+        return (ordinal, domain) if found == digest else None
+
+
+class CommitmentStore:
+    """Append-only on-disk store of epoch commitments, trees and anchors.
+
+    Usage:
+        store = CommitmentStore(Path("data/commitments"))
+        epochs = EpochService(resolver, commitment_store=store)
+        ...                                   # close_epoch() appends
+        found = store.inclusion_proof(event_hash)
+        assert verify_inclusion(found.proof)
+    """
+
+    def __init__(self, directory: Path, fsync: bool = True) -> None:
+        self._dir = directory
+        self._fsync = fsync
+        self._records: list[CommitmentRecord] = []
+        self._hashes: list[str] = []
+        self._trees: list[_TreeFile] = []
+        self._by_epoch: dict[str, int] = {}
+        # Index runs in epoch order, covering ordinals 0.._runs[-1].last;
+        # epochs after that (an index write failed) are searched directly.
+        self._runs: list[_IndexRun] = []
+        self._unindexed: list[int] = []
+        self._anchors: list[AnchorRecord] = []
+
+        directory.mkdir(parents=True, exist_ok=True)
+        for data in self._read_journal(self._commitments_path):
+            self._load_epoch(data)
+        for data in self._read_journal(self._anchors_path):
+            self._anchors.append(AnchorRecord(**data))
+        self._open_index()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(
+        self,
+        record: CommitmentRecord,
+        commitment_hash: str,
+        trees: Mapping[str, MerkleTree],
+    ) -> None:
+        """Persist a closed epoch: its record, hash and four domain trees.
+
+        ``trees`` maps each name in DOMAINS to the epoch's tree (computed,
+        or empty). Raises ValueError for a duplicate epoch or a leaf that
+        is not a sha256 hex digest, and OSError if a write fails; in both
+        cases the store is unchanged.
+        """
+        if record.epoch_id in self._by_epoch:
+            raise ValueError(f"Epoch {record.epoch_id!r} is already stored")
+        domain_levels: list[list[list[str]]] = []
+        for domain in DOMAINS:
+            tree = trees[domain]
+            levels = tree.levels() if tree.leaf_count else []
+            if levels:
+                if not all(_LEAF_RE.match(leaf) for leaf in levels[0]):
+                    raise ValueError(f"{domain} tree has a non-sha256 leaf")
+                root = levels[-1][0]
+                if _ensure_prefix(root) != getattr(record, _ROOT_FIELDS[domain]):
+                    raise ValueError(f"{domain} tree does not match the record root")
+            domain_levels.append(levels)
+
+        ordinal = len(self._records)
+        path = self._tree_path(ordinal)
+        chunks = [_TREE_MAGIC, _HEADER.pack(*(len(l[0]) if l else 0 for l in domain_levels))]
+        for levels in domain_levels:
+            for depth, level in enumerate(levels):
+                chunks.append(b"".join(
+                    bytes.fromhex(node[7:] if depth == 0 else node) for node in level
+                ))
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(b"".join(chunks))
+            f.flush()
+            if self._fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+        if self._fsync:
+            _fsync_dir(self._dir)
+
+        data = {
+            "ordinal": ordinal,
+            "commitment_hash": commitment_hash,
+            "record": asdict(record),
+        }
+        self._append_line(self._commitments_path, data)
+        self._load_epoch(data)
+        # The epoch is stored once its journal line is; indexing it is
+        # catch-up work that the next append or open retries on failure.
+        self._unindexed.append(ordinal)
+        try:
+            self._index_pending()
+        except OSError:
+            pass
+
+    def append_anchor(self, anchor: AnchorRecord) -> None:
+        """Persist an anchor record. Raises OSError if the write fails."""
+        self._append_line(self._anchors_path, asdict(anchor))
+        self._anchors.append(anchor)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def head(self) -> Optional[str]:
+        """Commitment hash of the latest stored epoch, or None if empty."""
+        return self._hashes[-1] if self._hashes else None
+
+    def records(self) -> list[CommitmentRecord]:
+        """Every stored commitment record, oldest first."""
+        return list(self._records)
+
+    def anchor_records(self) -> list[AnchorRecord]:
+        """Every stored anchor record, oldest first."""
+        return list(self._anchors)
+
+    def commitment_hash(self, epoch_id: str) -> Optional[str]:
+        ordinal = self._by_epoch.get(epoch_id)
+        return None if ordinal is None else self._hashes[ordinal]
+
+    def get(self, epoch_id: str) -> Optional[CommitmentRecord]:
+        ordinal = self._by_epoch.get(epoch_id)
+        return None if ordinal is None else self._records[ordinal]
+
+    def locate(self, leaf_hash: str) -> Optional[tuple[str, str]]:
+        """(epoch_id, domain) holding ``leaf_hash``, or None if not stored."""
+        digest = self._digest(leaf_hash)
+        found = None if digest is None else self._find(digest)
+        if found is None:
+            return None
+        ordinal, domain = found
+        return self._records[ordinal].epoch_id, DOMAINS[domain]
+
+    def inclusion_proof(
+        self,
+        leaf_hash: str,
+        epoch_id: Optional[str] = None,
+    ) -> Optional[EventInclusionProof]:
+        """Prove ``leaf_hash`` is in a stored epoch, reading O(log n) nodes.
+
+        Without ``epoch_id`` the first epoch holding the leaf is used.
+        Returns None if the leaf is not in that epoch (or in any).
+        """
+        digest = self._digest(leaf_hash)
+        if digest is None:
+            return None
+        if epoch_id is None:
+            found = self._find(digest)
+            if found is None:
+                return None
+            ordinals = [found[0]]
+            domains = [found[1]]
+        else:
+            ordinal = self._by_epoch.get(epoch_id)
+            if ordinal is None:
+                return None
+            ordinals = [ordinal] * len(DOMAINS)
+            domains = list(range(len(DOMAINS)))
+
+        for ordinal, domain in zip(ordinals, domains):
+            tree = self._trees[ordinal]
+            count = tree.leaf_counts[domain]
+            if not count:
+                continue
+            with tree.path.open("rb") as f:
+                index = tree.find_leaf(f, domain, digest)
+                if index is None:
+                    continue
+                path: list[tuple[str, str]] = []
+                sizes = _level_sizes(count)
+                for level, size in enumerate(sizes[:-1]):
+                    if index % 2 == 0:
+                        sibling = index + 1 if index + 1 < size else index
+                        path.append((_node_text(tree.node(f, domain, level, sibling), level), "R"))
+                    else:
+                        path.append((_node_text(tree.node(f, domain, level, index - 1), level), "L"))
+                    index //= 2
+                root = tree.node(f, domain, len(sizes) - 1, 0)
+            return EventInclusionProof(
+                epoch_id=self._records[ordinal].epoch_id,
+                domain=DOMAINS[domain],
+                proof=MerkleProof(leaf_hash=leaf_hash, path=path, root=f"sha256:{root.hex()}"),
+                record=self._records[ordinal],
+                commitment_hash=self._hashes[ordinal],
+            )
+        return None
+
+    def verify_epoch(self, epoch_id: str) -> bool:
+        """Re-hash every level of an epoch's trees against its record roots."""
+        ordinal = self._by_epoch.get(epoch_id)
+        if ordinal is None:
+            raise KeyError(epoch_id)
+        tree = self._trees[ordinal]
+        record = self._records[ordinal]
+        with tree.path.open("rb") as f:
+            for domain, name in enumerate(DOMAINS):
+                if not tree.leaf_counts[domain]:
+                    continue
+                below = tree.level(f, domain, 0)
+                if below != sorted(below):
+                    return False
+                for depth in range(1, len(tree.levels[domain])):
+                    expected = [
+                        bytes.fromhex(_hash_pair(
+                            below[i].hex(),
+                            below[i + 1].hex() if i + 1 < len(below) else below[i].hex(),
+                        ))
+                        for i in range(0, len(below), 2)
+                    ]
+                    below = tree.level(f, domain, depth)
+                    if below != expected:
+                        return False
+                if f"sha256:{below[0].hex()}" != getattr(record, _ROOT_FIELDS[name]):
+                    return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    @property
+    def _commitments_path(self) -> Path:
+        return self._dir / "commitments.jsonl"
+
+    @property
+    def _anchors_path(self) -> Path:
+        return self._dir / "anchors.jsonl"
+
+    def _tree_path(self, ordinal: int) -> Path:
+        return self._dir / f"epoch-{ordinal:06d}.tree"
+
+    def _index_path(self, first: int, last: int) -> Path:
+        return self._dir / f"index-{first:06d}-{last:06d}.idx"
+
+    @staticmethod
+    def _digest(leaf_hash: str) -> Optional[bytes]:
+        if not _LEAF_RE.match(leaf_hash):
+            return None
+        return bytes.fromhex(leaf_hash[7:])
+
+    def _load_epoch(self, data: dict[str, Any]) -> None:
+        ordinal = data["ordinal"]
+        if ordinal != len(self._records):
+            raise ValueError(f"Commitment journal out of order at epoch {ordinal}")
+        record = CommitmentRecord(**data["record"])
+        tree = _TreeFile.open(self._tree_path(ordinal))
+        with tree.path.open("rb") as f:
+            for domain, name in enumerate(DOMAINS):
+                if not tree.leaf_counts[domain]:
+                    continue
+                top = tree.node(f, domain, len(tree.levels[domain]) - 1, 0)
+                if f"sha256:{top.hex()}" != getattr(record, _ROOT_FIELDS[name]):
+                    raise ValueError(
+                        f"Tree file for epoch {record.epoch_id!r} does not match "
+                        f"its {name} root"
+                    )
+        self._records.append(record)
+        self._hashes.append(data["commitment_hash"])
+        self._trees.append(tree)
+        self._by_epoch[record.epoch_id] = ordinal
+
+    def _find(self, digest: bytes) -> Optional[tuple[int, int]]:
+        """(ordinal, domain) of the oldest epoch holding ``digest``."""
+        for run in self._runs:
+            found = run.find(digest)
+            if found is not None:
+                return found
+        for ordinal in self._unindexed:
+            tree = self._trees[ordinal]
+            with tree.path.open("rb") as f:
+                for domain in range(len(DOMAINS)):
+                    if tree.leaf_counts[domain] and tree.find_leaf(f, domain, digest) is not None:
+                        return ordinal, domain
+        return None
+
+    def _open_index(self) -> None:
+        """Pick the runs covering the stored epochs; index the rest.
+
+        The longest run starting where the previous one ended wins, so a
+        crash between writing a merged run and deleting its inputs is
+        harmless. Runs not chosen (superseded, or for epochs past the
+        journal) are deleted.
+        """
+        found: dict[int, list[_IndexRun]] = {}
+        for path in self._dir.glob("index-*.idx"):
+            match = _INDEX_RE.match(path.name)
+            if match:
+                run = _IndexRun(path, int(match[1]), int(match[2]))
+                found.setdefault(run.first, []).append(run)
+        start = 0
+        while start in found:
+            candidates = [r for r in found[start] if r.last < len(self._records)]
+            if not candidates:
+                break
+            run = max(candidates, key=lambda r: r.last)
+            self._runs.append(run)
+            start = run.last + 1
+        chosen = {run.path for run in self._runs}
+        self._unindexed = list(range(start, len(self._records)))
+        try:
+            for runs in found.values():
+                for run in runs:
+                    if run.path not in chosen:
+                        run.path.unlink()
+            self._index_pending()
+        except OSError:
+            pass  # lookups search unindexed epochs directly meanwhile
+
+    def _index_pending(self) -> None:
+        """Write an index run for each unindexed epoch, merging as it goes."""
+        while self._unindexed:
+            ordinal = self._unindexed[0]
+            tree = self._trees[ordinal]
+            entries: list[tuple[bytes, int, int]] = []
+            with tree.path.open("rb") as f:
+                for domain in range(len(DOMAINS)):
+                    if tree.leaf_counts[domain]:
+                        entries.extend(
+                            (leaf, ordinal, domain) for leaf in tree.level(f, domain, 0)
+                        )
+            entries.sort()
+            self._runs.append(_IndexRun.write(
+                self._index_path(ordinal, ordinal), ordinal, ordinal, entries, self._fsync,
+            ))
+            self._unindexed.pop(0)
+            while len(self._runs) >= 2 and self._runs[-2].span <= self._runs[-1].span:
+                right = self._runs[-1]
+                left = self._runs[-2]
+                merged = _IndexRun.write(
+                    self._index_path(left.first, right.last), left.first, right.last,
+                    heapq.merge(left.entries(), right.entries()), self._fsync,
+                )
+                self._runs[-2:] = [merged]
+                left.path.unlink()
+                right.path.unlink()
+
+    def _append_line(self, path: Path, data: dict[str, Any]) -> None:
+        """Append one fsynced JSON line; on failure truncate it away and raise."""
+        line = (json.dumps(data, sort_keys=True) + "\n").encode("utf-8")
+        offset = path.stat().st_size if path.exists() else 0
+        try:
+            with path.open("ab") as f:
+                f.write(line)
+                f.flush()
+                if self._fsync:
+                    os.fsync(f.fileno())
+        except OSError:
+            try:
+                with path.open("r+b") as f:
+                    f.truncate(offset)
+            except OSError:
+                pass  # The torn tail is discarded on the next open
+            raise
+
+    @staticmethod
+    def _read_journal(path: Path) -> list[dict[str, Any]]:
+        if not path.exists():
+            return []
+        data = path.read_bytes()
+        lines = data.split(b"\n")
+        entries: list[dict[str, Any]] = []
+        for line_num, raw in enumerate(lines, 1):
+            if not raw.strip():
+                continue
+            try:
+                entries.append(json.loads(raw))
+            except json.JSONDecodeError:
+                if line_num == len(lines):  # no trailing newline: torn write
+                    with path.open("r+b") as f:
+                        f.truncate(len(data) - len(raw))
+                    break
+                raise ValueError(f"Corrupt line {line_num} in {path}")
+        return entries
@@ -12,13 +12,18 @@ If yes, reject design." — This module ensures the answer is always no.
 
 from __future__ import annotations
 
+import bisect
 import enum
 import hashlib
+import heapq
 import json
-from dataclasses import dataclass, field, asdict
+import os
+import threading
+import time
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterator, Optional
 
 
 class EventKind(str, enum.Enum):
@@ -224,47 +229,201 @@ class EventRecord:
         ts = timestamp_utc or datetime.now(timezone.utc)
         ts_str = ts.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        # Compute canonical hash (content only — does not include previous_hash
-        # to maintain backward compatibility with existing event hashes)
-        canonical = json.dumps(
-            {
-                "event_id": event_id,
-                "event_kind": event_kind.value,
-                "timestamp_utc": ts_str,
-                "actor_id": actor_id,
-                "payload": payload,
-            },
-            sort_keys=True,
-            ensure_ascii=False,
-        ).encode("utf-8")
-        digest = hashlib.sha256(canonical).hexdigest()
-
         return EventRecord(
             event_id=event_id,
             event_kind=event_kind,
             timestamp_utc=ts_str,
             actor_id=actor_id,
             payload=payload,
-            event_hash=f"sha256:{digest}",
+            event_hash=_content_hash(
+                event_id, event_kind.value, ts_str, actor_id, payload,
+            ),
             previous_hash=previous_hash,
         )
 
 
+def _content_hash(
+    event_id: str,
+    event_kind: str,
+    timestamp_utc: str,
+    actor_id: str,
+    payload: dict[str, Any],
+) -> str:
+    """SHA-256 of an event's canonical content.
+
+    Content only — previous_hash is excluded to maintain backward
+    compatibility with existing event hashes.
+    """
+    canonical = json.dumps(
+        {
+            "event_id": event_id,
+            "event_kind": event_kind,
+            "timestamp_utc": timestamp_utc,
+            "actor_id": actor_id,
+            "payload": payload,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    ).encode("utf-8")
+    return f"sha256:{hashlib.sha256(canonical).hexdigest()}"
+
+
+@dataclass(frozen=True)
+class GroupCommitStats:
+    """Snapshot of EventLog group-commit metrics.
+
+    A batch is one write + fsync covering every event that was pending
+    when the committing thread took the batch.
+    """
+    batches: int = 0
+    events: int = 0
+    max_batch_size: int = 0
+    last_batch_size: int = 0
+    total_commit_seconds: float = 0.0
+    max_commit_seconds: float = 0.0
+    last_commit_seconds: float = 0.0
+    failed_batches: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.events / self.batches if self.batches else 0.0
+
+    @property
+    def mean_commit_seconds(self) -> float:
+        return self.total_commit_seconds / self.batches if self.batches else 0.0
+
+
+@dataclass(frozen=True)
+class EventPage:
+    """One page of a cursor-paginated event query.
+
+    next_cursor is the log position of the next matching event, to be
+    passed back as cursor; None when the query is exhausted.
+    """
+
+    events: list[EventRecord]
+    next_cursor: Optional[int]
+
+
+@dataclass(frozen=True)
+class VerificationCheckpoint:
+    """Progress of integrity verification, persisted beside the log file.
+
+    The first offset bytes of the file (count events, ending at
+    chain_head) have been verified; prefix_sha256 is the SHA-256 of those
+    bytes. On restart a matching prefix is loaded without recomputing
+    content hashes and verification resumes at offset. A prefix that no
+    longer matches is verified from scratch.
+    """
+
+    offset: int
+    count: int
+    chain_head: str
+    prefix_sha256: str
+
+
+# Records per process-pool task when verifying in parallel, and records
+# verified between two checkpoint writes during a load.
+VERIFY_CHUNK_SIZE = 2000
+CHECKPOINT_INTERVAL = 100_000
+# Every OFFSET_STRIDE-th durable record's byte offset is kept, so a
+# file-backed verify_range() seeks near its start instead of reading
+# the file from byte 0.
+OFFSET_STRIDE = 1024
+
+
+def _time_bucket(timestamp_utc: str) -> str:
+    """Hour bucket of an ISO-8601 timestamp ("YYYY-MM-DDTHH")."""
+    return timestamp_utc[:13]
+
+
+def _encode_line(event: EventRecord) -> bytes:
+    """Serialise one event as a JSONL line."""
+    record = {
+        "event_id": event.event_id,
+        "event_kind": event.event_kind.value,
+        "timestamp_utc": event.timestamp_utc,
+        "actor_id": event.actor_id,
+        "payload": event.payload,
+        "event_hash": event.event_hash,
+        "previous_hash": event.previous_hash,
+    }
+    return (json.dumps(record, sort_keys=True, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 class EventLog:
     """Append-only event log with optional file persistence.
 
     Events can only be appended, never modified or deleted.
     The log can be persisted to a JSONL file (one JSON object per line)
     and loaded back for recovery.
+
+    Durability and group commit:
+        The JSONL file is kept open for the lifetime of the log. append()
+        and append_many() return only once their events are written and
+        (with fsync=True, the default) fsynced; on failure they raise
+        OSError, the file is truncated back to the last durable offset,
+        and every uncommitted event is removed from memory.
+
+        Concurrent appenders share commits: while one thread is writing
+        a batch, later appends queue up and are committed together by the
+        next batch. commit_window_seconds > 0 additionally makes the
+        committing thread wait that long to gather more appends before
+        writing. append_many() always commits its events as one batch.
+        Batch size and commit latency are exposed via commit_stats.
     """
 
-    def __init__(self, storage_path: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        storage_path: Optional[Path] = None,
+        fsync: bool = True,
+        commit_window_seconds: float = 0.0,
+        verify_workers: int = 1,
+        checkpoint: bool = False,
+    ) -> None:
+        if commit_window_seconds < 0:
+            raise ValueError("commit_window_seconds must be >= 0")
+        if verify_workers < 1:
+            raise ValueError("verify_workers must be >= 1")
         self._events: list[EventRecord] = []
         self._storage_path = storage_path
         self._event_ids: set[str] = set()
+        self._fsync = fsync
+        self._commit_window = commit_window_seconds
+        self._verify_workers = verify_workers
+        self._checkpointing = checkpoint
+        self._prefix_digest: Optional[Any] = None  # sha256 of durable bytes
+
+        # Group-commit state, guarded by _lock.
+        self._lock = threading.Lock()
+        self._committed = threading.Condition(self._lock)
+        self._file: Optional[BinaryIO] = None
+        self._durable_offset = 0
+        self._durable_count = 0
+        self._durable_lines = 0
+        # (byte offset, line number) of durable records 0, OFFSET_STRIDE, ...
+        self._stride_marks: list[tuple[int, int]] = []
+        self._pending: list[bytes] = []
+        self._open_batch = 0  # batch that new appends join
+        self._done_batch = -1  # highest batch id whose outcome is known
+        self._failed_batches: dict[int, OSError] = {}
+        self._committing = False
+        self._stats = GroupCommitStats()
+
+        # Secondary indexes: ascending positions into _events.
+        self._by_id: dict[str, int] = {}
+        self._by_kind: dict[EventKind, list[int]] = {}
+        self._by_actor: dict[str, list[int]] = {}
+        self._by_bucket: dict[str, list[int]] = {}
+        self._bucket_keys: list[str] = []  # sorted keys of _by_bucket
 
         if storage_path and storage_path.exists():
             self._load_from_file(storage_path)
+        self._durable_count = len(self._events)
+        if storage_path and storage_path.exists():
+            self._durable_offset = storage_path.stat().st_size
+        if checkpoint and storage_path and self._prefix_digest is None:
+            self._prefix_digest = hashlib.sha256()
 
     def append(self, event: EventRecord) -> None:
         """Append an event to the log with automatic chain linking.
@@ -275,24 +434,220 @@ class EventLog:
         this replacement is safe and does not invalidate the content hash.
 
         Raises ValueError if event_id is a duplicate (replay protection).
+        Raises OSError if the event could not be made durable; the event
+        is then not in the log.
         """
-        if event.event_id in self._event_ids:
-            raise ValueError(f"Duplicate event ID: {event.event_id}")
+        self.append_many([event])
 
-        # Automatic chain linking: set previous_hash to the chain head
-        expected_prev = (
-            self._events[-1].event_hash if self._events else GENESIS_HASH
-        )
-        # Replace previous_hash on the frozen dataclass (safe because
-        # previous_hash is not part of event_hash computation)
-        from dataclasses import replace
-        chained_event = replace(event, previous_hash=expected_prev)
+    def append_many(self, events: list[EventRecord]) -> None:
+        """Append several events as one durable batch (one write, one fsync).
+
+        All-or-nothing: either every event is durable when this returns,
+        or OSError is raised and none of them remain in the log.
+        Raises ValueError (appending nothing) on any duplicate event_id.
+        """
+        if not events:
+            return
+        with self._lock:
+            seen: set[str] = set()
+            for event in events:
+                if event.event_id in self._event_ids or event.event_id in seen:
+                    raise ValueError(f"Duplicate event ID: {event.event_id}")
+                seen.add(event.event_id)
+
+            for event in events:
+                # Automatic chain linking: set previous_hash to the chain head
+                expected_prev = self.chain_head
+                # Replace previous_hash on the frozen dataclass (safe because
+                # previous_hash is not part of event_hash computation)
+                chained_event = replace(event, previous_hash=expected_prev)
+                self._index_event(chained_event)
+                if self._storage_path:
+                    self._pending.append(_encode_line(chained_event))
+
+            if not self._storage_path:
+                self._durable_count = len(self._events)
+                return
+            self._await_batch(self._open_batch)
+
+    def _index_event(self, event: EventRecord) -> None:
+        """Add an event to _events and every secondary index."""
+        position = len(self._events)
+        self._events.append(event)
+        self._event_ids.add(event.event_id)
+        self._by_id[event.event_id] = position
+        self._by_kind.setdefault(event.event_kind, []).append(position)
+        self._by_actor.setdefault(event.actor_id, []).append(position)
+        bucket = _time_bucket(event.timestamp_utc)
+        positions = self._by_bucket.get(bucket)
+        if positions is None:
+            positions = self._by_bucket[bucket] = []
+            bisect.insort(self._bucket_keys, bucket)
+        positions.append(position)
+
+    def _mark_stride(self, position: int, offset: int, line_num: int) -> None:
+        """Remember where record ``position`` starts if it is on the stride."""
+        if position == len(self._stride_marks) * OFFSET_STRIDE:
+            self._stride_marks.append((offset, line_num))
+
+    def _unindex_from(self, position: int) -> None:
+        """Remove events at position and after from _events and the indexes."""
+        for event in reversed(self._events[position:]):
+            self._event_ids.discard(event.event_id)
+            del self._by_id[event.event_id]
+            for index, key in (
+                (self._by_kind, event.event_kind),
+                (self._by_actor, event.actor_id),
+                (self._by_bucket, _time_bucket(event.timestamp_utc)),
+            ):
+                positions = index[key]
+                positions.pop()
+                if not positions:
+                    del index[key]
+                    if index is self._by_bucket:
+                        self._bucket_keys.remove(key)
+        del self._events[position:]
+        del self._stride_marks[-(-position // OFFSET_STRIDE):]
+
+    def _reset_indexes(self) -> None:
+        self._events = []
+        self._stride_marks = []
+        self._durable_lines = 0
+        self._by_id = {}
+        self._by_kind = {}
+        self._by_actor = {}
+        self._by_bucket = {}
+        self._bucket_keys = []
+
+    def _await_batch(self, batch: int) -> None:
+        """Block until batch is committed; lead the commit if nobody is.
+
+        Must be called with _lock held.
+        """
+        while self._done_batch < batch:
+            if self._committing:
+                self._committed.wait()
+                continue
+            self._committing = True
+            try:
+                if self._commit_window:
+                    # Let other appenders join this batch.
+                    self._committed.wait(timeout=self._commit_window)
+                self._commit_open_batch()
+            finally:
+                self._committing = False
+                self._committed.notify_all()
+        error = self._failed_batches.get(batch)
+        if error is not None:
+            raise OSError(f"Event log commit failed: {error}") from error
+
+    def _commit_open_batch(self) -> None:
+        """Write and fsync the open batch. Called with _lock held; the lock
+        is released during I/O so further appends can queue up."""
+        batch = self._open_batch
+        lines = self._pending
+        target_count = len(self._events)
+        self._pending = []
+        self._open_batch += 1
 
-        self._events.append(chained_event)
-        self._event_ids.add(chained_event.event_id)
+        started = time.perf_counter()
+        self._lock.release()
+        error: Optional[OSError] = None
+        try:
+            self._write_lines(lines)
+        except OSError as e:
+            error = e
+        finally:
+            self._lock.acquire()
+        elapsed = time.perf_counter() - started
 
-        if self._storage_path:
-            self._append_to_file(chained_event)
+        if error is None:
+            for i, line in enumerate(lines):
+                self._durable_lines += 1
+                self._mark_stride(
+                    self._durable_count + i, self._durable_offset, self._durable_lines,
+                )
+                self._durable_offset += len(line)
+            if self._prefix_digest is not None:
+                for line in lines:
+                    self._prefix_digest.update(line)
+            self._durable_count = target_count
+            self._done_batch = batch
+            stats = self._stats
+            self._stats = replace(
+                stats,
+                batches=stats.batches + 1,
+                events=stats.events + len(lines),
+                max_batch_size=max(stats.max_batch_size, len(lines)),
+                last_batch_size=len(lines),
+                total_commit_seconds=stats.total_commit_seconds + elapsed,
+                max_commit_seconds=max(stats.max_commit_seconds, elapsed),
+                last_commit_seconds=elapsed,
+            )
+            return
+
+        # Fail closed: this batch and anything appended on top of it
+        # (chained to now-missing events) are rolled back.
+        failed = [batch]
+        if self._pending:
+            failed.append(self._open_batch)
+            self._pending = []
+            self._open_batch += 1
+        for failed_batch in failed:
+            self._failed_batches[failed_batch] = error
+        self._done_batch = self._open_batch - 1
+        self._unindex_from(self._durable_count)
+        self._truncate_to_durable()
+        self._stats = replace(self._stats, failed_batches=self._stats.failed_batches + 1)
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        if self._file is None:
+            self._storage_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self._storage_path.open("ab")
+        self._file.write(b"".join(lines))
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+
+    def _truncate_to_durable(self) -> None:
+        """Drop any partially written bytes past the last durable offset."""
+        try:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            with self._storage_path.open("r+b") as f:
+                f.truncate(self._durable_offset)
+        except OSError:
+            pass  # The torn tail is rejected on the next load
+
+    def close(self) -> None:
+        """Close the underlying file handle (reopened on the next append).
+
+        With checkpointing enabled, also records everything durable so far
+        as verified, so the next load need not re-hash it.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self._prefix_digest is not None:
+                try:
+                    self._write_checkpoint(VerificationCheckpoint(
+                        offset=self._durable_offset,
+                        count=self._durable_count,
+                        chain_head=(
+                            self._events[self._durable_count - 1].event_hash
+                            if self._durable_count else self._base_head()
+                        ),
+                        prefix_sha256=self._prefix_digest.hexdigest(),
+                    ))
+                except OSError:
+                    pass  # A stale checkpoint only costs re-verification
+
+    @property
+    def commit_stats(self) -> GroupCommitStats:
+        """Batch size and commit latency metrics for durable appends."""
+        return self._stats
 
     @property
     def chain_head(self) -> str:
@@ -302,11 +657,26 @@ class EventLog:
         """
         return self._events[-1].event_hash if self._events else GENESIS_HASH
 
+    def roll_segment(self) -> None:
+        """Seal the current storage segment and start a new one.
+
+        A single-file log has one segment, so this is a no-op here;
+        SegmentedEventLog overrides it.
+        """
+
+    def __iter__(self) -> Iterator[EventRecord]:
+        return iter(self.events())
+
+    def get_event(self, event_id: str) -> Optional[EventRecord]:
+        """Return the event with the given ID, or None."""
+        position = self._by_id.get(event_id)
+        return None if position is None else self._events[position]
+
     def events(self, kind: Optional[EventKind] = None) -> list[EventRecord]:
         """Return events, optionally filtered by kind."""
         if kind is None:
             return list(self._events)
-        return [e for e in self._events if e.event_kind == kind]
+        return [self._events[p] for p in self._by_kind.get(kind, ())]
 
     def recent_events(
         self,
@@ -322,17 +692,7 @@ class EventLog:
 
         if kind is None:
             return list(self._events[-limit:])
-
-        # For kind-filtered queries, walk backwards and stop once the
-        # requested window has been collected.
-        matched: list[EventRecord] = []
-        for event in reversed(self._events):
-            if event.event_kind == kind:
-                matched.append(event)
-                if len(matched) >= limit:
-                    break
-        matched.reverse()
-        return matched
+        return [self._events[p] for p in self._by_kind.get(kind, [])[-limit:]]
 
     def events_since(
         self,
@@ -340,11 +700,99 @@ class EventLog:
         kind: Optional[EventKind] = None,
     ) -> list[EventRecord]:
         """Return events after a timestamp, optionally filtered by kind."""
-        result = [e for e in self._events if e.timestamp_utc >= since_utc]
-        if kind is not None:
-            result = [e for e in result if e.event_kind == kind]
+        return [self._events[p] for p in self._positions_since(since_utc, kind)]
+
+    def events_for_actor(
+        self,
+        actor_id: str,
+        since: Optional[str] = None,
+        kind: Optional[EventKind] = None,
+    ) -> list[EventRecord]:
+        """Return an actor's events in log order, optionally filtered by
+        kind and by timestamp (since is inclusive)."""
+        result = []
+        for p in self._by_actor.get(actor_id, ()):
+            event = self._events[p]
+            if kind is not None and event.event_kind != kind:
+                continue
+            if since is not None and event.timestamp_utc < since:
+                continue
+            result.append(event)
         return result
 
+    def page(
+        self,
+        cursor: int = 0,
+        limit: int = 100,
+        kind: Optional[EventKind] = None,
+        actor_id: Optional[str] = None,
+    ) -> EventPage:
+        """Return up to limit matching events at log position >= cursor.
+
+        Positions are stable because the log is append-only, so a cursor
+        stays valid while new events are appended.
+        """
+        if limit <= 0:
+            raise ValueError("limit must be > 0")
+        positions = self._matching_positions(kind, actor_id)
+        start = bisect.bisect_left(positions, cursor)
+        window = positions[start:start + limit + 1]
+        next_cursor = window[limit] if len(window) > limit else None
+        return EventPage(
+            events=[self._events[p] for p in window[:limit]],
+            next_cursor=next_cursor,
+        )
+
+    def iter_pages(
+        self,
+        page_size: int = 500,
+        kind: Optional[EventKind] = None,
+        actor_id: Optional[str] = None,
+    ) -> Iterator[EventPage]:
+        """Iterate over matching events page by page, oldest first."""
+        cursor: Optional[int] = 0
+        while cursor is not None:
+            result = self.page(cursor, page_size, kind=kind, actor_id=actor_id)
+            if result.events:
+                yield result
+            cursor = result.next_cursor
+
+    def _matching_positions(
+        self,
+        kind: Optional[EventKind],
+        actor_id: Optional[str],
+    ) -> list[int] | range:
+        """Ascending positions in _events matching kind and actor_id."""
+        if actor_id is None:
+            if kind is None:
+                return range(len(self._events))
+            return self._by_kind.get(kind, [])
+        positions = self._by_actor.get(actor_id, [])
+        if kind is None:
+            return positions
+        return [p for p in positions if self._events[p].event_kind == kind]
+
+    def _positions_since(
+        self,
+        since_utc: str,
+        kind: Optional[EventKind],
+    ) -> list[int]:
+        """Ascending positions of events with timestamp >= since_utc."""
+        first = bisect.bisect_left(self._bucket_keys, _time_bucket(since_utc))
+        buckets = [self._by_bucket[key] for key in self._bucket_keys[first:]]
+        if kind is not None:
+            kind_positions = self._by_kind.get(kind, [])
+            if len(kind_positions) < sum(len(b) for b in buckets):
+                return [
+                    p for p in kind_positions
+                    if self._events[p].timestamp_utc >= since_utc
+                ]
+        return [
+            p for p in heapq.merge(*buckets)
+            if self._events[p].timestamp_utc >= since_utc
+            and (kind is None or self._events[p].event_kind == kind)
+        ]
+
     def event_hashes(self, kind: Optional[EventKind] = None) -> list[str]:
         """Return all event hashes for Merkle tree construction."""
         return [e.event_hash for e in self.events(kind)]
@@ -357,19 +805,38 @@ class EventLog:
     def last_event(self) -> Optional[EventRecord]:
         return self._events[-1] if self._events else None
 
-    def _append_to_file(self, event: EventRecord) -> None:
-        """Append a single event to the JSONL file."""
-        record = {
-            "event_id": event.event_id,
-            "event_kind": event.event_kind.value,
-            "timestamp_utc": event.timestamp_utc,
-            "actor_id": event.actor_id,
-            "payload": event.payload,
-            "event_hash": event.event_hash,
-            "previous_hash": event.previous_hash,
-        }
-        with self._storage_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, sort_keys=True, ensure_ascii=False) + "\n")
+    # ------------------------------------------------------------------
+    # Integrity verification
+    # ------------------------------------------------------------------
+
+    def _base_head(self) -> str:
+        """Chain head preceding the first event in _events."""
+        return GENESIS_HASH
+
+    def _checkpoint_path(self, path: Path) -> Path:
+        return path.with_name(path.name + ".verified.json")
+
+    def _read_checkpoint(self, path: Path) -> Optional[VerificationCheckpoint]:
+        try:
+            data = json.loads(self._checkpoint_path(path).read_text(encoding="utf-8"))
+            return VerificationCheckpoint(
+                offset=int(data["offset"]),
+                count=int(data["count"]),
+                chain_head=str(data["chain_head"]),
+                prefix_sha256=str(data["prefix_sha256"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_checkpoint(self, checkpoint: VerificationCheckpoint) -> None:
+        """Atomically replace the checkpoint sidecar of the storage file."""
+        path = self._checkpoint_path(self._storage_path)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(asdict(checkpoint), f, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
 
     def _load_from_file(self, path: Path) -> None:
         """Load events from a JSONL file with integrity verification.
@@ -380,65 +847,306 @@ class EventLog:
 
         Legacy events without previous_hash are accepted but the chain
         link is not verified for that event (backward compatibility).
+
+        Content hashes are independent per record, so with
+        verify_workers > 1 they are recomputed across a process pool;
+        chain linking and duplicate checks stay sequential here. With
+        checkpointing enabled, progress is recorded every
+        CHECKPOINT_INTERVAL records and a restart resumes after the last
+        verified offset.
         """
-        with path.open("r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                data = json.loads(line)
+        checkpoint = self._read_checkpoint(path) if self._checkpointing else None
+
+        digest = hashlib.sha256()
+        offset = 0
+        line_num = 0
+        pending: list[tuple[int, str]] = []
+        pool = None
+        try:
+            with path.open("rb") as f:
+                if checkpoint is not None:
+                    loaded_before = len(self._events)
+                    try:
+                        offset, line_num = self._load_verified_prefix(f, checkpoint, digest)
+                    except ValueError:
+                        # Stale or forged checkpoint: fall back to full verification.
+                        self._unindex_from(loaded_before)
+                        f.seek(0)
+                        digest = hashlib.sha256()
+                        offset = 0
+                        line_num = 0
+                for raw in f:
+                    line_num += 1
+                    digest.update(raw)
+                    line = raw.decode("utf-8").strip()
+                    if line:
+                        self._mark_stride(
+                            len(self._events) + len(pending), offset, line_num,
+                        )
+                        pending.append((line_num, line))
+                    offset += len(raw)
+                    if len(pending) >= CHECKPOINT_INTERVAL:
+                        pool = pool or self._verify_pool()
+                        self._link_records(_decode_lines(pending, pool), pending)
+                        pending = []
+                        self._checkpoint_progress(path, offset, digest)
+            if pending:
+                if len(pending) >= 2 * VERIFY_CHUNK_SIZE:
+                    pool = pool or self._verify_pool()
+                self._link_records(_decode_lines(pending, pool), pending)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        self._durable_lines = line_num
+        self._checkpoint_progress(path, offset, digest)
+        if self._checkpointing:
+            self._prefix_digest = digest
+
+    def _load_verified_prefix(
+        self,
+        f: BinaryIO,
+        checkpoint: VerificationCheckpoint,
+        digest: Any,
+    ) -> tuple[int, int]:
+        """Load the checkpointed prefix without recomputing content hashes.
 
-                event_id = data["event_id"]
+        Reads the prefix once, in the same pass that feeds ``digest`` and
+        parses the records; chain links and duplicates are still checked.
+        Returns (offset, line number) at the end of the prefix, with ``f``
+        positioned there. Raises ValueError if the prefix does not end on
+        a record boundary or disagrees with the checkpoint.
+        """
+        numbered: list[tuple[int, str]] = []
+        base = len(self._events)
+        offset = 0
+        line_num = 0
+        while offset < checkpoint.offset:
+            raw = f.readline()
+            if not raw:
+                break
+            line_num += 1
+            digest.update(raw)
+            line = raw.decode("utf-8").strip()
+            if line:
+                self._mark_stride(len(self._events) + len(numbered), offset, line_num)
+                numbered.append((line_num, line))
+            offset += len(raw)
+            if len(numbered) >= CHECKPOINT_INTERVAL:
+                self._link_unverified(numbered)
+                numbered = []
+        self._link_unverified(numbered)
+        if offset != checkpoint.offset:
+            raise ValueError("Verification checkpoint is not on a record boundary")
+        if (
+            digest.hexdigest() != checkpoint.prefix_sha256
+            or len(self._events) - base != checkpoint.count
+            or self.chain_head != checkpoint.chain_head
+        ):
+            raise ValueError("Verification checkpoint does not match the log")
+        return offset, line_num
 
-                # Replay protection: reject duplicate IDs on load
-                if event_id in self._event_ids:
+    def _link_unverified(self, numbered: list[tuple[int, str]]) -> None:
+        self._link_records(
+            [_decode_line(line, f"line {n}", verify=False) for n, line in numbered],
+            numbered,
+        )
+
+    def _verify_pool(self) -> Optional[Any]:
+        if self._verify_workers <= 1:
+            return None
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(max_workers=self._verify_workers)
+
+    def _checkpoint_progress(self, path: Path, offset: int, digest: Any) -> None:
+        if not self._checkpointing or self._storage_path != path:
+            return
+        try:
+            self._write_checkpoint(VerificationCheckpoint(
+                offset=offset,
+                count=len(self._events),
+                chain_head=self.chain_head,
+                prefix_sha256=digest.hexdigest(),
+            ))
+        except OSError:
+            pass  # A missing checkpoint only costs re-verification
+
+    def _link_records(
+        self,
+        records: list[tuple[EventRecord, Optional[str]]],
+        numbered: list[tuple[int, str]],
+    ) -> None:
+        """Check duplicates and chain links in order, then index the events."""
+        for (event, stored_prev), (line_num, _) in zip(records, numbered):
+            # Replay protection: reject duplicate IDs on load
+            if event.event_id in self._event_ids:
+                raise ValueError(
+                    f"Duplicate event ID on recovery (line {line_num}): {event.event_id}"
+                )
+
+            # Chain integrity: verify previous_hash links to preceding event
+            if stored_prev is not None:
+                expected_prev = self.chain_head
+                if stored_prev != expected_prev:
                     raise ValueError(
-                        f"Duplicate event ID on recovery (line {line_num}): {event_id}"
+                        f"Hash chain broken on recovery (line {line_num}): "
+                        f"event {event.event_id} has previous_hash={stored_prev} "
+                        f"but expected {expected_prev}"
                     )
 
-                # Recompute canonical hash to verify content integrity
-                canonical = json.dumps(
-                    {
-                        "event_id": data["event_id"],
-                        "event_kind": data["event_kind"],
-                        "timestamp_utc": data["timestamp_utc"],
-                        "actor_id": data["actor_id"],
-                        "payload": data["payload"],
-                    },
-                    sort_keys=True,
-                    ensure_ascii=False,
-                ).encode("utf-8")
-                expected_hash = f"sha256:{hashlib.sha256(canonical).hexdigest()}"
-
-                if data["event_hash"] != expected_hash:
+            self._index_event(event)
+
+    def verify_range(self, start: int = 0, end: Optional[int] = None) -> int:
+        """Re-verify events at positions [start, end) for an on-demand audit.
+
+        For a file-backed log the records are re-read from disk, starting
+        from the nearest remembered offset (see OFFSET_STRIDE): content
+        hashes are recomputed (in parallel with verify_workers > 1), chain
+        links are checked, and each record must match the event held in
+        memory. An in-memory log recomputes the content hashes and chain
+        links of its events. Returns the number of events verified;
+        raises ValueError on the first failure.
+        """
+        with self._lock:
+            events = self._events[:self._durable_count]
+        if end is None:
+            end = len(events)
+        if not 0 <= start <= end <= len(events):
+            raise ValueError(f"Invalid range [{start}, {end}) for {len(events)} events")
+        expected_prev = events[start - 1].event_hash if start else self._base_head()
+
+        if self._storage_path is None or not self._storage_path.exists():
+            for position in range(start, end):
+                event = events[position]
+                computed = _content_hash(
+                    event.event_id, event.event_kind.value, event.timestamp_utc,
+                    event.actor_id, event.payload,
+                )
+                if computed != event.event_hash:
                     raise ValueError(
-                        f"Integrity check failed (line {line_num}): event {event_id} "
-                        f"stored hash {data['event_hash']} != computed {expected_hash}"
+                        f"Integrity check failed (position {position}): event "
+                        f"{event.event_id} stored hash {event.event_hash} != "
+                        f"computed {computed}"
                     )
-
-                # Chain integrity: verify previous_hash links to preceding event
-                stored_prev = data.get("previous_hash")
-                if stored_prev is not None:
-                    expected_prev = (
-                        self._events[-1].event_hash
-                        if self._events
-                        else GENESIS_HASH
+                if event.previous_hash != expected_prev:
+                    raise ValueError(
+                        f"Hash chain broken (position {position}): event "
+                        f"{event.event_id} has previous_hash={event.previous_hash} "
+                        f"but expected {expected_prev}"
                     )
-                    if stored_prev != expected_prev:
-                        raise ValueError(
-                            f"Hash chain broken on recovery (line {line_num}): "
-                            f"event {event_id} has previous_hash={stored_prev} "
-                            f"but expected {expected_prev}"
-                        )
+                expected_prev = event.event_hash
+            return end - start
 
-                event = EventRecord(
-                    event_id=data["event_id"],
-                    event_kind=EventKind(data["event_kind"]),
-                    timestamp_utc=data["timestamp_utc"],
-                    actor_id=data["actor_id"],
-                    payload=data["payload"],
-                    event_hash=data["event_hash"],
-                    previous_hash=stored_prev or GENESIS_HASH,
+        numbered: list[tuple[int, str]] = []
+        position = 0
+        first_line = 1
+        mark = min(start // OFFSET_STRIDE, len(self._stride_marks) - 1)
+        with self._storage_path.open("rb") as f:
+            if mark > 0:
+                offset, first_line = self._stride_marks[mark]
+                position = mark * OFFSET_STRIDE
+                f.seek(offset)
+            for line_num, raw in enumerate(f, first_line):
+                if position >= end:
+                    break
+                line = raw.decode("utf-8").strip()
+                if not line:
+                    continue
+                if position >= start:
+                    numbered.append((line_num, line))
+                position += 1
+        if position < end:
+            raise ValueError(
+                f"Event log file holds {position} events, expected at least {end}"
+            )
+
+        pool = self._verify_pool() if len(numbered) >= 2 * VERIFY_CHUNK_SIZE else None
+        try:
+            records = _decode_lines(numbered, pool)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        for offset, ((event, stored_prev), (line_num, _)) in enumerate(
+            zip(records, numbered)
+        ):
+            held = events[start + offset]
+            if event.event_id != held.event_id or event.event_hash != held.event_hash:
+                raise ValueError(
+                    f"Event log file diverges from memory (line {line_num}): "
+                    f"{event.event_id} != {held.event_id}"
                 )
-                self._events.append(event)
-                self._event_ids.add(event.event_id)
+            if stored_prev is not None and stored_prev != expected_prev:
+                raise ValueError(
+                    f"Hash chain broken (line {line_num}): event {event.event_id} "
+                    f"has previous_hash={stored_prev} but expected {expected_prev}"
+                )
+            expected_prev = event.event_hash
+        return end - start
+
+
+def _decode_chunk(
+    numbered: list[tuple[int, str]],
+) -> list[tuple[EventRecord, Optional[str]]]:
+    """Decode and hash-verify (line_num, line) pairs. Runs in pool workers."""
+    return [_decode_line(line, f"line {line_num}") for line_num, line in numbered]
+
+
+def _decode_lines(
+    numbered: list[tuple[int, str]],
+    pool: Optional[Any] = None,
+) -> list[tuple[EventRecord, Optional[str]]]:
+    """Decode and hash-verify lines, across pool in chunks if given.
+
+    Results keep input order; the first integrity failure is re-raised
+    here as ValueError.
+    """
+    if pool is None or len(numbered) < 2 * VERIFY_CHUNK_SIZE:
+        return _decode_chunk(numbered)
+    chunks = [
+        numbered[i:i + VERIFY_CHUNK_SIZE]
+        for i in range(0, len(numbered), VERIFY_CHUNK_SIZE)
+    ]
+    records: list[tuple[EventRecord, Optional[str]]] = []
+    for part in pool.map(_decode_chunk, chunks):
+        records.extend(part)
+    return records
+
+
+def _decode_line(
+    line: str,
+    where: str,
+    verify: bool = True,
+) -> tuple[EventRecord, Optional[str]]:
+    """Parse one JSONL record and verify its content hash.
+
+    Returns (event, stored_previous_hash); stored_previous_hash is None
+    for legacy records written before chain linking. Chain linking is
+    left to the caller, which knows the preceding event. verify=False
+    skips the hash recomputation for records already verified.
+    Raises ValueError on a content-hash mismatch.
+    """
+    data = json.loads(line)
+    event_id = data["event_id"]
+
+    if verify:
+        # Recompute canonical hash to verify content integrity
+        expected_hash = _content_hash(
+            data["event_id"], data["event_kind"], data["timestamp_utc"],
+            data["actor_id"], data["payload"],
+        )
+        if data["event_hash"] != expected_hash:
+            raise ValueError(
+                f"Integrity check failed ({where}): event {event_id} "
+                f"stored hash {data['event_hash']} != computed {expected_hash}"
+            )
+
+    stored_prev = data.get("previous_hash")
+    event = EventRecord(
+        event_id=data["event_id"],
+        event_kind=EventKind(data["event_kind"]),
+        timestamp_utc=data["timestamp_utc"],
+        actor_id=data["actor_id"],
+        payload=data["payload"],
+        event_hash=data["event_hash"],
+        previous_hash=stored_prev or GENESIS_HASH,
+    )
+    return event, stored_prev
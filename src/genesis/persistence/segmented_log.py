@@ -0,0 +1,702 @@
+"""Segmented event log — bounded startup cost for long-lived deployments.
+
+The single-file EventLog loads and re-verifies the whole history on
+every start. SegmentedEventLog keeps the same append/read interface but
+splits storage into a directory of segment files, normally one per
+epoch (GenesisService.close_epoch calls roll_segment()):
+
+    events/
+        segment-000000.jsonl        sealed segment (same JSONL records)
+        segment-000000.index.json   sidecar index for the sealed segment
+        segment-000001.jsonl        ...
+        segment-000002.jsonl        open tail segment (no index yet)
+
+Each sidecar index records, for its segment: the byte offset, event_id,
+event_hash and timestamp of every record, the positions of each EventKind, the
+previous_hash the segment starts from, its verified chain head, its
+byte size and a SHA-256 of the whole file. Positions per EventKind and
+per actor_id let kind and actor queries skip segments with no match.
+
+Startup cost:
+- Sealed segments are not read. Their indexes are loaded, their size is
+  checked against the index, the index's head must be its last indexed
+  event_hash, and each segment's first_previous_hash is checked against
+  the previous segment's head (cross-segment chain).
+- Only the open tail segment is parsed and verified record by record.
+- A sealed segment whose index is missing or whose size disagrees with
+  it is fully re-verified and its index rebuilt (see rebuilt_indexes).
+
+Reads from sealed segments happen on demand: get_event() and kind- or
+time-filtered queries seek straight to the indexed offsets. Every record
+read from disk has its content hash re-verified and must carry the
+event_hash the index recorded for it, linked to its indexed predecessor,
+so a record rewritten in place (even with a recomputed hash) is refused. Whole-segment
+reads also re-verify the chain from first_previous_hash to head. A small
+LRU cache keeps recently read segments decoded. verify() walks every
+segment end to end for audits.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import shutil
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from genesis.persistence.event_log import (
+    GENESIS_HASH,
+    EventKind,
+    EventLog,
+    EventPage,
+    EventRecord,
+    _decode_line,
+)
+from genesis.persistence.state_store import _atomic_write_text
+
+INDEX_VERSION = 3
+_SEGMENT_GLOB = "segment-*.jsonl"
+
+
+def _segment_name(number: int) -> str:
+    return f"segment-{number:06d}"
+
+
+@dataclass(frozen=True)
+class SegmentIndex:
+    """Sidecar index of one sealed segment."""
+
+    segment: int
+    first_previous_hash: str
+    head: str
+    byte_size: int
+    sha256: str
+    event_ids: tuple[str, ...]
+    event_hashes: tuple[str, ...]
+    offsets: tuple[int, ...]
+    timestamps: tuple[str, ...]
+    kinds: dict[str, tuple[int, ...]]  # EventKind value -> positions
+    actors: dict[str, tuple[int, ...]]  # actor_id -> positions
+    max_timestamp: str = ""  # latest timestamp in the segment ("" if empty)
+
+    @property
+    def count(self) -> int:
+        return len(self.event_ids)
+
+    def previous_hash(self, position: int) -> str:
+        """Chain predecessor of the event at ``position``."""
+        return self.event_hashes[position - 1] if position else self.first_previous_hash
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": INDEX_VERSION,
+                "segment": self.segment,
+                "first_previous_hash": self.first_previous_hash,
+                "head": self.head,
+                "byte_size": self.byte_size,
+                "sha256": self.sha256,
+                "event_ids": list(self.event_ids),
+                "event_hashes": list(self.event_hashes),
+                "offsets": list(self.offsets),
+                "timestamps": list(self.timestamps),
+                "kinds": {k: list(v) for k, v in sorted(self.kinds.items())},
+                "actors": {k: list(v) for k, v in sorted(self.actors.items())},
+                "max_timestamp": self.max_timestamp,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> SegmentIndex:
+        data = json.loads(text)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported segment index version: {data.get('version')}")
+        return cls(
+            segment=data["segment"],
+            first_previous_hash=data["first_previous_hash"],
+            head=data["head"],
+            byte_size=data["byte_size"],
+            sha256=data["sha256"],
+            event_ids=tuple(data["event_ids"]),
+            event_hashes=tuple(data["event_hashes"]),
+            offsets=tuple(data["offsets"]),
+            timestamps=tuple(data["timestamps"]),
+            kinds={k: tuple(v) for k, v in data["kinds"].items()},
+            actors={k: tuple(v) for k, v in data["actors"].items()},
+            # Indexes sealed before max_timestamp existed derive it once here.
+            max_timestamp=data.get("max_timestamp", max(data["timestamps"], default="")),
+        )
+
+
+def _scan_segment(
+    path: Path,
+    segment: int,
+    first_previous_hash: str,
+) -> tuple[SegmentIndex, list[EventRecord]]:
+    """Fully read and verify a segment file and build its index.
+
+    Verifies every content hash and every chain link starting from
+    first_previous_hash. Raises ValueError on any integrity failure.
+    """
+    events: list[EventRecord] = []
+    offsets: list[int] = []
+    kinds: dict[str, list[int]] = {}
+    actors: dict[str, list[int]] = {}
+    digest = hashlib.sha256()
+    head = first_previous_hash
+    offset = 0
+    with path.open("rb") as f:
+        for raw in f:
+            digest.update(raw)
+            line = raw.decode("utf-8").strip()
+            if line:
+                where = f"{path.name} offset {offset}"
+                event, stored_prev = _decode_line(line, where)
+                if stored_prev is not None and stored_prev != head:
+                    raise ValueError(
+                        f"Hash chain broken ({where}): event {event.event_id} "
+                        f"has previous_hash={stored_prev} but expected {head}"
+                    )
+                kinds.setdefault(event.event_kind.value, []).append(len(events))
+                actors.setdefault(event.actor_id, []).append(len(events))
+                events.append(event)
+                offsets.append(offset)
+                head = event.event_hash
+            offset += len(raw)
+    index = SegmentIndex(
+        segment=segment,
+        first_previous_hash=first_previous_hash,
+        head=head,
+        byte_size=offset,
+        sha256=f"sha256:{digest.hexdigest()}",
+        event_ids=tuple(e.event_id for e in events),
+        event_hashes=tuple(e.event_hash for e in events),
+        offsets=tuple(offsets),
+        timestamps=tuple(e.timestamp_utc for e in events),
+        kinds={k: tuple(v) for k, v in kinds.items()},
+        actors={k: tuple(v) for k, v in actors.items()},
+        max_timestamp=max((e.timestamp_utc for e in events), default=""),
+    )
+    return index, events
+
+
+def _sealed_positions(
+    index: SegmentIndex,
+    kind: Optional[EventKind],
+    actor_id: Optional[str],
+) -> tuple[int, ...] | range:
+    """Ascending positions in a sealed segment matching kind and actor_id."""
+    if actor_id is None:
+        if kind is None:
+            return range(index.count)
+        return index.kinds.get(kind.value, ())
+    positions = index.actors.get(actor_id, ())
+    if kind is None:
+        return positions
+    of_kind = set(index.kinds.get(kind.value, ()))
+    return tuple(p for p in positions if p in of_kind)
+
+
+class SegmentedEventLog(EventLog):
+    """EventLog stored as sealed, indexed segments plus one open tail.
+
+    Usage:
+        log = SegmentedEventLog(Path("data/events"))
+        log.append(event)          # goes to the open tail segment
+        log.roll_segment()         # seal the tail (e.g. at epoch close)
+        log.get_event(event_id)    # one seek into the right segment
+
+        # Migrate an existing single-file log:
+        log = SegmentedEventLog.from_jsonl(
+            Path("data/events.jsonl"), Path("data/events"),
+        )
+
+    max_segment_events, if set, also seals the tail automatically once
+    it holds that many events.
+    """
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        fsync: bool = True,
+        commit_window_seconds: float = 0.0,
+        max_segment_events: Optional[int] = None,
+        cache_segments: int = 4,
+        verify_workers: int = 1,
+        checkpoint: bool = False,
+    ) -> None:
+        if max_segment_events is not None and max_segment_events <= 0:
+            raise ValueError("max_segment_events must be > 0")
+        super().__init__(
+            storage_path=None,
+            fsync=fsync,
+            commit_window_seconds=commit_window_seconds,
+            verify_workers=verify_workers,
+            checkpoint=checkpoint,
+        )
+        self._dir = storage_dir
+        self._max_segment_events = max_segment_events
+        self._cache_size = max(cache_segments, 0)
+        self._cache: OrderedDict[int, list[EventRecord]] = OrderedDict()
+        self._sealed: list[SegmentIndex] = []
+        self._sealed_starts: list[int] = []  # global position of each segment's first event
+        self._sealed_count = 0
+        self._locations: dict[str, tuple[int, int]] = {}  # event_id -> (segment list index, position)
+        self.rebuilt_indexes: list[int] = []
+
+        storage_dir.mkdir(parents=True, exist_ok=True)
+        numbers = sorted(
+            int(p.stem.split("-", 1)[1]) for p in storage_dir.glob(_SEGMENT_GLOB)
+        )
+        tail_number = 0
+        for i, number in enumerate(numbers):
+            is_last = i == len(numbers) - 1
+            index_path = self._index_path(number)
+            if is_last and not index_path.exists():
+                tail_number = number
+                break
+            self._load_sealed(number)
+            tail_number = number + 1
+
+        self._tail_number = tail_number
+        self._storage_path = self._segment_path(tail_number)
+        if self._storage_path.exists():
+            self._load_from_file(self._storage_path)
+            self._durable_offset = self._storage_path.stat().st_size
+        self._durable_count = len(self._events)
+        if checkpoint and self._prefix_digest is None:
+            self._prefix_digest = hashlib.sha256()
+
+    # ------------------------------------------------------------------
+    # Paths and startup
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, number: int) -> Path:
+        return self._dir / f"{_segment_name(number)}.jsonl"
+
+    def _index_path(self, number: int) -> Path:
+        return self._dir / f"{_segment_name(number)}.index.json"
+
+    def _load_sealed(self, number: int) -> None:
+        """Register a sealed segment from its index, rebuilding it if needed."""
+        path = self._segment_path(number)
+        index_path = self._index_path(number)
+        expected_prev = self._sealed[-1].head if self._sealed else GENESIS_HASH
+
+        index: Optional[SegmentIndex] = None
+        if index_path.exists():
+            try:
+                index = SegmentIndex.from_json(index_path.read_text(encoding="utf-8"))
+            except (ValueError, KeyError):
+                index = None
+        if (
+            index is None
+            or index.segment != number
+            or index.byte_size != path.stat().st_size
+            or index.count != len(index.event_hashes)
+            or index.head != (
+                index.event_hashes[-1] if index.count else index.first_previous_hash
+            )
+        ):
+            index, _ = _scan_segment(path, number, expected_prev)
+            _atomic_write_text(index_path, index.to_json())
+            self.rebuilt_indexes.append(number)
+
+        if index.first_previous_hash != expected_prev:
+            raise ValueError(
+                f"Hash chain broken between segments: {path.name} starts from "
+                f"{index.first_previous_hash} but expected {expected_prev}"
+            )
+        self._register_sealed(index)
+
+    def _register_sealed(self, index: SegmentIndex) -> None:
+        slot = len(self._sealed)
+        for position, event_id in enumerate(index.event_ids):
+            if event_id in self._event_ids:
+                raise ValueError(
+                    f"Duplicate event ID on recovery (segment {index.segment}): {event_id}"
+                )
+            self._event_ids.add(event_id)
+            self._locations[event_id] = (slot, position)
+        self._sealed.append(index)
+        self._sealed_starts.append(self._sealed_count)
+        self._sealed_count += index.count
+
+    @classmethod
+    def from_jsonl(
+        cls,
+        legacy_path: Path,
+        storage_dir: Path,
+        **kwargs,
+    ) -> SegmentedEventLog:
+        """Open storage_dir, first migrating a single-file log into it.
+
+        Migration only happens when storage_dir holds no segments yet: the
+        legacy file is verified, copied in as segment 0 and sealed. The
+        legacy file itself is left untouched.
+        """
+        storage_dir.mkdir(parents=True, exist_ok=True)
+        if legacy_path.exists() and not any(storage_dir.glob(_SEGMENT_GLOB)):
+            # Verify before copying so a corrupt file is never adopted.
+            index, _ = _scan_segment(legacy_path, 0, GENESIS_HASH)
+            tmp = storage_dir / f"{_segment_name(0)}.jsonl.tmp"
+            shutil.copyfile(legacy_path, tmp)
+            tmp.replace(storage_dir / f"{_segment_name(0)}.jsonl")
+            _atomic_write_text(
+                storage_dir / f"{_segment_name(0)}.index.json", index.to_json(),
+            )
+        return cls(storage_dir, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Sealing
+    # ------------------------------------------------------------------
+
+    def append_many(self, events: list[EventRecord]) -> None:
+        super().append_many(events)
+        if (
+            self._max_segment_events is not None
+            and len(self._events) >= self._max_segment_events
+        ):
+            self.roll_segment()
+
+    def roll_segment(self) -> None:
+        """Seal the open tail segment and start a new one.
+
+        Waits for any in-flight group commit, writes the tail's index
+        atomically, and moves appends to the next segment file. A crash
+        before the index is written leaves the segment as the tail, and
+        it is simply sealed again later. No-op when the tail is empty.
+        Raises OSError if the index cannot be written.
+        """
+        with self._lock:
+            while self._committing:
+                self._committed.wait()
+            if not self._events:
+                return
+            first_prev = self._sealed[-1].head if self._sealed else GENESIS_HASH
+            try:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                index, _ = _scan_segment(
+                    self._storage_path, self._tail_number, first_prev,
+                )
+                _atomic_write_text(self._index_path(self._tail_number), index.to_json())
+            except ValueError as e:
+                raise OSError(f"Cannot seal segment {self._storage_path}: {e}") from e
+
+            tail_events = self._events
+            for event_id in index.event_ids:
+                self._event_ids.discard(event_id)
+            self._register_sealed(index)
+            self._cache_put(len(self._sealed) - 1, tail_events)
+
+            # The sealed index supersedes the tail's verification checkpoint.
+            self._checkpoint_path(self._storage_path).unlink(missing_ok=True)
+            self._tail_number += 1
+            self._storage_path = self._segment_path(self._tail_number)
+            self._reset_indexes()
+            self._durable_count = 0
+            self._durable_offset = 0
+            if self._prefix_digest is not None:
+                self._prefix_digest = hashlib.sha256()
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segments, including the open tail."""
+        return len(self._sealed) + 1
+
+    def segment_indexes(self) -> list[SegmentIndex]:
+        """Indexes of all sealed segments, oldest first."""
+        return list(self._sealed)
+
+    # ------------------------------------------------------------------
+    # On-demand segment reads
+    # ------------------------------------------------------------------
+
+    def _cache_put(self, slot: int, events: list[EventRecord]) -> None:
+        if not self._cache_size:
+            return
+        self._cache[slot] = events
+        self._cache.move_to_end(slot)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _segment_events(self, slot: int) -> list[EventRecord]:
+        """All events of a sealed segment, chain-verified against its index."""
+        cached = self._cache.get(slot)
+        if cached is not None:
+            self._cache.move_to_end(slot)
+            return cached
+        index = self._sealed[slot]
+        scanned, events = _scan_segment(
+            self._segment_path(index.segment), index.segment, index.first_previous_hash,
+        )
+        if (
+            scanned.head != index.head
+            or scanned.event_ids != index.event_ids
+            or scanned.event_hashes != index.event_hashes
+        ):
+            raise ValueError(
+                f"Segment {index.segment} does not match its index"
+            )
+        self._cache_put(slot, events)
+        return events
+
+    def _read_positions(self, slot: int, positions: list[int]) -> list[EventRecord]:
+        """Read selected records of a sealed segment by indexed offset."""
+        cached = self._cache.get(slot)
+        if cached is not None:
+            self._cache.move_to_end(slot)
+            return [cached[p] for p in positions]
+        index = self._sealed[slot]
+        path = self._segment_path(index.segment)
+        result: list[EventRecord] = []
+        with path.open("rb") as f:
+            for position in positions:
+                f.seek(index.offsets[position])
+                line = f.readline().decode("utf-8").strip()
+                event, stored_prev = _decode_line(line, f"{path.name} position {position}")
+                if (
+                    event.event_id != index.event_ids[position]
+                    or event.event_hash != index.event_hashes[position]
+                    or (
+                        stored_prev is not None
+                        and stored_prev != index.previous_hash(position)
+                    )
+                ):
+                    raise ValueError(
+                        f"Segment {index.segment} does not match its index "
+                        f"at position {position}"
+                    )
+                result.append(event)
+        return result
+
+    # ------------------------------------------------------------------
+    # Read interface
+    # ------------------------------------------------------------------
+
+    @property
+    def chain_head(self) -> str:
+        if self._events:
+            return self._events[-1].event_hash
+        return self._base_head()
+
+    def _base_head(self) -> str:
+        return self._sealed[-1].head if self._sealed else GENESIS_HASH
+
+    @property
+    def count(self) -> int:
+        return self._sealed_count + len(self._events)
+
+    @property
+    def last_event(self) -> Optional[EventRecord]:
+        if self._events:
+            return self._events[-1]
+        for slot in range(len(self._sealed) - 1, -1, -1):
+            if self._sealed[slot].count:
+                last = self._sealed[slot].count - 1
+                return self._read_positions(slot, [last])[0]
+        return None
+
+    def __iter__(self) -> Iterator[EventRecord]:
+        for slot in range(len(self._sealed)):
+            yield from self._segment_events(slot)
+        yield from list(self._events)
+
+    def get_event(self, event_id: str) -> Optional[EventRecord]:
+        location = self._locations.get(event_id)
+        if location is None:
+            return super().get_event(event_id)
+        slot, position = location
+        return self._read_positions(slot, [position])[0]
+
+    def events(self, kind: Optional[EventKind] = None) -> list[EventRecord]:
+        if kind is None:
+            return list(self)
+        result: list[EventRecord] = []
+        for slot, index in enumerate(self._sealed):
+            positions = index.kinds.get(kind.value)
+            if positions:
+                result.extend(self._read_positions(slot, list(positions)))
+        result.extend(super().events(kind))
+        return result
+
+    def recent_events(
+        self,
+        limit: int,
+        kind: Optional[EventKind] = None,
+    ) -> list[EventRecord]:
+        if limit <= 0:
+            return []
+        result = super().recent_events(limit, kind)
+        for slot in range(len(self._sealed) - 1, -1, -1):
+            missing = limit - len(result)
+            if missing <= 0:
+                break
+            index = self._sealed[slot]
+            if kind is None:
+                positions = list(range(max(index.count - missing, 0), index.count))
+            else:
+                positions = list(index.kinds.get(kind.value, ())[-missing:])
+            if positions:
+                result = self._read_positions(slot, positions) + result
+        return result
+
+    def events_since(
+        self,
+        since_utc: str,
+        kind: Optional[EventKind] = None,
+    ) -> list[EventRecord]:
+        result: list[EventRecord] = []
+        for slot, index in enumerate(self._sealed):
+            if not index.count or index.max_timestamp < since_utc:
+                continue
+            wanted = (
+                range(index.count) if kind is None
+                else index.kinds.get(kind.value, ())
+            )
+            positions = [p for p in wanted if index.timestamps[p] >= since_utc]
+            if positions:
+                result.extend(self._read_positions(slot, positions))
+        result.extend(super().events_since(since_utc, kind))
+        return result
+
+    def events_for_actor(
+        self,
+        actor_id: str,
+        since: Optional[str] = None,
+        kind: Optional[EventKind] = None,
+    ) -> list[EventRecord]:
+        result: list[EventRecord] = []
+        for slot, index in enumerate(self._sealed):
+            positions = [
+                p for p in _sealed_positions(index, kind, actor_id)
+                if since is None or index.timestamps[p] >= since
+            ]
+            if positions:
+                result.extend(self._read_positions(slot, positions))
+        result.extend(super().events_for_actor(actor_id, since, kind))
+        return result
+
+    def page(
+        self,
+        cursor: int = 0,
+        limit: int = 100,
+        kind: Optional[EventKind] = None,
+        actor_id: Optional[str] = None,
+    ) -> EventPage:
+        if limit <= 0:
+            raise ValueError("limit must be > 0")
+        # Collect limit + 1 matches as (slot, local position); slot None
+        # is the open tail. The extra match supplies next_cursor.
+        matches: list[tuple[Optional[int], int]] = []
+        for slot, index in enumerate(self._sealed):
+            start = self._sealed_starts[slot]
+            if start + index.count <= cursor:
+                continue
+            positions = _sealed_positions(index, kind, actor_id)
+            first = bisect.bisect_left(positions, cursor - start)
+            for p in positions[first:first + limit + 1 - len(matches)]:
+                matches.append((slot, p))
+            if len(matches) > limit:
+                break
+        if len(matches) <= limit:
+            positions = self._matching_positions(kind, actor_id)
+            first = bisect.bisect_left(positions, max(cursor - self._sealed_count, 0))
+            for p in positions[first:first + limit + 1 - len(matches)]:
+                matches.append((None, p))
+
+        next_cursor: Optional[int] = None
+        if len(matches) > limit:
+            slot, p = matches.pop()
+            next_cursor = p + (
+                self._sealed_count if slot is None else self._sealed_starts[slot]
+            )
+        events: list[EventRecord] = []
+        by_slot: dict[Optional[int], list[int]] = {}
+        for slot, p in matches:
+            by_slot.setdefault(slot, []).append(p)
+        for slot, positions in by_slot.items():
+            if slot is None:
+                events.extend(self._events[p] for p in positions)
+            else:
+                events.extend(self._read_positions(slot, positions))
+        return EventPage(events=events, next_cursor=next_cursor)
+
+    def position_of(self, event_id: str) -> Optional[int]:
+        """Global 0-based position of an event in the log, or None."""
+        location = self._locations.get(event_id)
+        if location is not None:
+            slot, position = location
+            return self._sealed_starts[slot] + position
+        position = self._by_id.get(event_id)
+        if position is None:
+            return None
+        return self._sealed_count + position
+
+    def segment_of(self, position: int) -> int:
+        """Segment number holding the event at a global position."""
+        if position < 0 or position >= self.count:
+            raise IndexError(position)
+        if position >= self._sealed_count:
+            return self._tail_number
+        return self._sealed[bisect.bisect_right(self._sealed_starts, position) - 1].segment
+
+    # ------------------------------------------------------------------
+    # Audit
+    # ------------------------------------------------------------------
+
+    def verify(self, workers: Optional[int] = None) -> None:
+        """Re-verify every sealed segment end to end.
+
+        Checks each file's SHA-256 and chain against its index, bypassing
+        the cache. Sealed segments are independent given their indexed
+        first_previous_hash, so with workers > 1 (default: verify_workers)
+        they are verified in parallel across a process pool. Raises
+        ValueError on the first failure.
+        """
+        tasks = [
+            (self._segment_path(index.segment), index)
+            for index in self._sealed
+        ]
+        workers = self._verify_workers if workers is None else workers
+        if workers > 1 and len(tasks) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(_verify_segment, tasks))
+        else:
+            for task in tasks:
+                _verify_segment(task)
+
+    def verify_range(self, start: int = 0, end: Optional[int] = None) -> int:
+        """Re-verify events at global positions [start, end).
+
+        Sealed segments overlapping the range are verified whole against
+        their indexes; the overlapping part of the open tail is verified
+        as in EventLog.verify_range().
+        """
+        if end is None:
+            end = self.count
+        if not 0 <= start <= end <= self.count:
+            raise ValueError(f"Invalid range [{start}, {end}) for {self.count} events")
+        for slot, index in enumerate(self._sealed):
+            first = self._sealed_starts[slot]
+            if first < end and start < first + index.count:
+                _verify_segment((self._segment_path(index.segment), index))
+        if end > self._sealed_count:
+            super().verify_range(max(start - self._sealed_count, 0), end - self._sealed_count)
+        return end - start
+
+
+def _verify_segment(task: tuple[Path, SegmentIndex]) -> None:
+    """Verify one sealed segment against its index. Runs in pool workers."""
+    path, index = task
+    scanned, _ = _scan_segment(path, index.segment, index.first_previous_hash)
+    if scanned != index:
+        raise ValueError(f"Segment {index.segment} does not match its index")
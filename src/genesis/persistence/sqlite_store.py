@@ -0,0 +1,314 @@
+"""SQLite state store — row-level persistence behind the StateStore interface.
+
+Selected by PERSISTENCE_BACKEND = "sqlite" in constitutional_params.json
+(see open_state_store()). Every save_*/load_* method is inherited from
+StateStore unchanged; only the storage primitives differ:
+
+- Collection sections (roster, trust records, missions, listings, bids,
+  leave, escrows, workflows, amendments, ...) get one table each, with
+  one row per entity. A save diffs the new rows against the last
+  written encoding and upserts only changed rows, so a single trust
+  update writes one row instead of the whole state. Finding the
+  changed rows still encodes every row of the saved section: the I/O
+  is per entity, the CPU is per section.
+- Scalar sections (epoch, lifecycle, GCF tracker, machine agency) are
+  stored whole in a shared singleton_sections table.
+- Sections are read lazily on first access, so cold start does not
+  parse state the caller never asks for.
+- The database runs in WAL mode and each flush is one transaction, so
+  a crash leaves either the previous or the new commit, never a mix.
+
+The JSON path is kept for import/export via export_json()/import_json().
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+from genesis.persistence.state_store import (
+    RecoveryReport,
+    StateStore,
+    _encode_section,
+)
+
+SCHEMA_VERSION = 1
+
+# Sections shaped as {entity_id: row}.
+_MAPPING_SECTIONS: frozenset[str] = frozenset({
+    "trust_records",
+    "missions",
+    "reviewer_histories",
+    "skill_profiles",
+    "listings",
+    "bids",
+    "leave_records",
+    "escrows",
+    "workflows",
+    "disbursement_proposals",
+    "disbursement_votes",
+    "amendment_proposals",
+    "g0_ratification_items",
+    "assembly_compliance_salts",
+})
+
+# Sections shaped as [row, ...], keyed by the named id field. Each of
+# these is serialised from an engine dict keyed by the same id, so ids
+# are unique by construction.
+_LIST_SECTIONS: dict[str, str] = {
+    "roster": "actor_id",
+    "assembly_topics": "topic_id",
+    "org_registry": "org_id",
+    "domain_clearances": "clearance_id",
+}
+
+_ENTITY_SECTIONS: frozenset[str] = _MAPPING_SECTIONS | frozenset(_LIST_SECTIONS)
+
+# entity_id -> (position, encoded row)
+_RowMap = dict[str, tuple[int, str]]
+
+
+class SQLiteStateStore(StateStore):
+    """SQLite-backed state persistence with per-entity tables.
+
+    Usage:
+        store = SQLiteStateStore(Path("data/state.db"))
+        store.save_trust_records(records)   # upserts changed rows only
+        records = store.load_trust_records()
+
+        # Migrate from / back to the flat JSON format:
+        store.import_json(Path("data/state.json"))
+        store.export_json(Path("backup/state.json"))
+    """
+
+    def __init__(self, storage_path: Path) -> None:
+        self._conn: Optional[sqlite3.Connection] = None
+        self._rows: dict[str, _RowMap] = {}
+        self._pending_upserts: dict[str, _RowMap] = {}
+        self._pending_deletes: dict[str, set[str]] = {}
+        self._loaded: set[str] = set()
+        super().__init__(storage_path)
+
+    # ------------------------------------------------------------------
+    # Connection and schema
+    # ------------------------------------------------------------------
+
+    def _open(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            with conn:
+                for section in sorted(_ENTITY_SECTIONS):
+                    conn.execute(
+                        f"CREATE TABLE IF NOT EXISTS {section} ("
+                        "entity_id TEXT PRIMARY KEY, "
+                        "position INTEGER NOT NULL, "
+                        "body TEXT NOT NULL)"
+                    )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS singleton_sections ("
+                    "section TEXT PRIMARY KEY, body TEXT NOT NULL)"
+                )
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.Error as e:
+            raise OSError(f"Cannot open SQLite state store {self._path}: {e}") from e
+        self._conn = conn
+        self._recovery_report = self.recover()
+
+    def recover(self) -> RecoveryReport:
+        """Drop cached sections so they reload from the database.
+
+        SQLite rolls back incomplete transactions and replays its WAL
+        when the connection opens, so no repair is needed here.
+        """
+        self._state = {}
+        self._encoded = {}
+        self._dirty = set()
+        self._rows = {}
+        self._pending_upserts = {}
+        self._pending_deletes = {}
+        self._loaded = set()
+        return RecoveryReport()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ------------------------------------------------------------------
+    # Lazy section loading
+    # ------------------------------------------------------------------
+
+    def _ensure_loaded(self, section: str) -> None:
+        if section in self._loaded:
+            return
+        assert self._conn is not None
+        if section in _ENTITY_SECTIONS:
+            cursor = self._conn.execute(
+                f"SELECT entity_id, position, body FROM {section} ORDER BY position"
+            )
+            rows: _RowMap = {}
+            for entity_id, position, body in cursor:
+                rows[entity_id] = (position, body)
+            self._rows[section] = rows
+            if rows:
+                if section in _MAPPING_SECTIONS:
+                    self._state[section] = {
+                        entity_id: json.loads(body)
+                        for entity_id, (_, body) in rows.items()
+                    }
+                else:
+                    self._state[section] = [
+                        json.loads(body) for _, body in rows.values()
+                    ]
+        else:
+            found = self._conn.execute(
+                "SELECT body FROM singleton_sections WHERE section = ?",
+                (section,),
+            ).fetchone()
+            if found is not None:
+                self._encoded[section] = found[0]
+                self._state[section] = json.loads(found[0])
+        self._loaded.add(section)
+
+    def _get_section(self, section: str, default: Any = None) -> Any:
+        self._ensure_loaded(section)
+        return super()._get_section(section, default)
+
+    def _section_names(self) -> list[str]:
+        assert self._conn is not None
+        names = {
+            row[0] for row in self._conn.execute(
+                "SELECT section FROM singleton_sections"
+            )
+        }
+        for section in _ENTITY_SECTIONS:
+            if self._conn.execute(f"SELECT 1 FROM {section} LIMIT 1").fetchone():
+                names.add(section)
+        names.update(self._state)
+        return sorted(names)
+
+    # ------------------------------------------------------------------
+    # Row-level staging
+    # ------------------------------------------------------------------
+
+    def _put_section(self, section: str, value: Any) -> None:
+        # Entity sections always compare row by row: the comparison is
+        # what yields the upserts, so batch(assume_changed=True) only
+        # applies to singleton sections.
+        if section not in _ENTITY_SECTIONS:
+            self._ensure_loaded(section)
+            super()._put_section(section, value)
+            return
+        self._ensure_loaded(section)
+        self._state[section] = value
+
+        if section in _MAPPING_SECTIONS:
+            encoded = [
+                (str(entity_id), _encode_section(row))
+                for entity_id, row in value.items()
+            ]
+        else:
+            id_field = _LIST_SECTIONS[section]
+            encoded = [
+                (str(row[id_field]), _encode_section(row)) for row in value
+            ]
+
+        old_rows = self._rows.get(section, {})
+        new_rows = self._assign_positions(old_rows, encoded)
+        upserts = {
+            entity_id: row
+            for entity_id, row in new_rows.items()
+            if old_rows.get(entity_id) != row
+        }
+        deletes = set(old_rows) - set(new_rows)
+        if not upserts and not deletes:
+            return
+
+        pending_upserts = self._pending_upserts.setdefault(section, {})
+        pending_deletes = self._pending_deletes.setdefault(section, set())
+        for entity_id in deletes:
+            pending_upserts.pop(entity_id, None)
+            pending_deletes.add(entity_id)
+        for entity_id, row in upserts.items():
+            pending_deletes.discard(entity_id)
+            pending_upserts[entity_id] = row
+        self._rows[section] = new_rows
+        self._dirty.add(section)
+
+    @staticmethod
+    def _assign_positions(
+        old_rows: _RowMap,
+        encoded: list[tuple[str, str]],
+    ) -> _RowMap:
+        """Give each row a sort position that reproduces the in-memory order.
+
+        Existing rows keep their position and new rows are appended when
+        that preserves order (the common dict-insertion case), so
+        untouched rows are not rewritten. Otherwise every row is
+        renumbered.
+        """
+        next_position = max((pos for pos, _ in old_rows.values()), default=-1) + 1
+        last = -1
+        appending = False
+        new_rows: _RowMap = {}
+        for entity_id, body in encoded:
+            old = old_rows.get(entity_id)
+            if old is not None and not appending and old[0] > last:
+                last = old[0]
+                new_rows[entity_id] = (old[0], body)
+            elif old is None:
+                appending = True
+                new_rows[entity_id] = (next_position, body)
+                next_position += 1
+            else:
+                return {
+                    entity_id: (position, body)
+                    for position, (entity_id, body) in enumerate(encoded)
+                }
+        return new_rows
+
+    # ------------------------------------------------------------------
+    # Flush
+    # ------------------------------------------------------------------
+
+    def _write_sections(self, sections: list[str]) -> None:
+        assert self._conn is not None
+        try:
+            with self._conn:
+                for section in sections:
+                    if section not in _ENTITY_SECTIONS:
+                        self._conn.execute(
+                            "INSERT INTO singleton_sections (section, body) "
+                            "VALUES (?, ?) ON CONFLICT(section) "
+                            "DO UPDATE SET body = excluded.body",
+                            (section, self._staged_encoding(section)),
+                        )
+                        continue
+                    deletes = self._pending_deletes.get(section, set())
+                    if deletes:
+                        self._conn.executemany(
+                            f"DELETE FROM {section} WHERE entity_id = ?",
+                            [(entity_id,) for entity_id in sorted(deletes)],
+                        )
+                    upserts = self._pending_upserts.get(section, {})
+                    if upserts:
+                        self._conn.executemany(
+                            f"INSERT INTO {section} (entity_id, position, body) "
+                            "VALUES (?, ?, ?) ON CONFLICT(entity_id) DO UPDATE "
+                            "SET position = excluded.position, body = excluded.body",
+                            [
+                                (entity_id, position, body)
+                                for entity_id, (position, body) in upserts.items()
+                            ],
+                        )
+        except sqlite3.Error as e:
+            raise OSError(f"SQLite state write failed: {e}") from e
+        for section in sections:
+            self._pending_upserts.pop(section, None)
+            self._pending_deletes.pop(section, None)
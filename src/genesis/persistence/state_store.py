@@ -2,15 +2,22 @@
 
 STUB STATUS: json_flat (see PERSISTENCE_BACKEND in constitutional_params.json)
 CURRENT BEHAVIOUR: Flat JSON file storage — single-node only, no concurrent
-    access, no transactions, no crash recovery. Suitable for development and
-    single-user proof-of-concept.
+    access. Suitable for development and single-user proof-of-concept.
+    Writes are dirty-section tracked and can be batched into one flush per
+    service call (see StateStore.batch()). Commits are atomic (temp file +
+    fsync + rename, journalled in the sectioned layout) and recover()
+    repairs half-written state on open.
 LIVE BEHAVIOUR: Event-sourced persistence with real database backend
     (SQLite minimum, PostgreSQL for production). Atomic writes, crash recovery,
     concurrent access. JSON path kept as import/export only.
 TRIGGER: Before any multi-user deployment or when state files exceed ~10MB.
-ACTIVATION: Set PERSISTENCE_BACKEND to "sqlite" or "postgresql" in
-    constitutional_params.json and implement the corresponding backend
-    behind the same StateStore interface.
+ACTIVATION: Set PERSISTENCE_BACKEND to "sqlite" in constitutional_params.json
+    (see open_state_store() and persistence/sqlite_store.py). A "postgresql"
+    backend would follow the same pattern behind the StateStore interface.
+    For json_flat, PERSISTENCE_LAYOUT selects the single-file "flat" layout
+    or the one-file-per-section "sectioned" layout (the shipped default).
+    An empty store adopts (and renames to *.migrated) the state another
+    layout or backend left behind.
 
 Stores and recovers:
 - Actor roster (all registered actors with trust scores)
@@ -19,16 +26,19 @@ Stores and recovers:
 - Actor skill profiles (proficiency per skill)
 - Protected leave records (leave requests, adjudications, trust freeze snapshots)
 - Epoch chain state (previous hash, committed record count)
+- Compliance re-screening checkpoint (cursor of the last recorded subject)
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
+import os
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from genesis.models.mission import (
     DomainType,
@@ -82,6 +92,60 @@ from genesis.compensation.gcf_disbursement import (
 from genesis.workflow.orchestrator import WorkflowState, WorkflowStatus
 
 
+LAYOUT_FLAT = "flat"
+LAYOUT_SECTIONED = "sectioned"
+
+BACKEND_JSON_FLAT = "json_flat"
+BACKEND_SQLITE = "sqlite"
+
+
+def _encode_section(value: Any) -> str:
+    """Canonical compact JSON encoding of one state section."""
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Make a rename in directory durable (no-op where unsupported)."""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write text to path via temp file + fsync + rename.
+
+    Readers see either the previous content or the new content, never a
+    truncated file. The rename is made durable before returning.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(path.parent)
+
+
+@dataclass(frozen=True)
+class RecoveryReport:
+    """Outcome of StateStore.recover().
+
+    actions: human-readable repairs performed (empty if the store was clean).
+    restored_from_backup: True if the primary state was unreadable and the
+        previous committed generation was restored. State is then one
+        commit behind the event log and should be treated as degraded.
+    """
+    actions: tuple[str, ...] = ()
+    restored_from_backup: bool = False
+
+
 class StateStore:
     """JSON file-based state persistence.
 
@@ -95,22 +159,281 @@ class StateStore:
         roster = store.load_roster()
         missions = store.load_missions()
         prev_hash, count = store.load_epoch_state()
+
+    Dirty-section tracking:
+        Each save_* call encodes its section and compares it with the
+        last written encoding. Unchanged sections are not marked dirty.
+        Inside a batch() block, writes are deferred and all dirty
+        sections are flushed once when the outermost block exits:
+
+            with store.batch():
+                store.save_roster(roster)
+                store.save_trust_records(records)
+            # one flush here, covering only the sections that changed
+
+        A caller that knows which sections it changed passes
+        batch(assume_changed=True): the sections it saves are marked
+        dirty without the comparison, and each is encoded once, when
+        it is written.
+
+    Layouts:
+        "flat" (default) keeps every section in the single file at
+        storage_path. Unchanged sections are spliced in from their
+        cached encoding, so only changed sections are re-serialised.
+        "sectioned" treats storage_path as a directory holding one
+        <section>.json file per section, so a flush rewrites only the
+        files of dirty sections.
     """
 
-    def __init__(self, storage_path: Path) -> None:
+    def __init__(self, storage_path: Path, layout: str = LAYOUT_FLAT) -> None:
+        if layout not in (LAYOUT_FLAT, LAYOUT_SECTIONED):
+            raise ValueError(f"Unknown state store layout: {layout}")
         self._path = storage_path
+        self._layout = layout
         self._state: dict[str, Any] = {}
-        if storage_path.exists():
-            self._load()
+        # section -> last written canonical encoding
+        self._encoded: dict[str, str] = {}
+        self._dirty: set[str] = set()
+        self._batch_depth = 0
+        self._assume_changed = False
+        self._open()
+
+    def _open(self) -> None:
+        self._recovery_report = self.recover()
+
+    def _section_path(self, section: str) -> Path:
+        return self._path / f"{section}.json"
+
+    @property
+    def _journal_path(self) -> Path:
+        return self._path / ".journal"
+
+    @property
+    def _backup_path(self) -> Path:
+        return self._path.with_name(self._path.name + ".bak")
+
+    @property
+    def recovery_report(self) -> RecoveryReport:
+        """Report from the recovery pass run when the store was opened."""
+        return self._recovery_report
+
+    def recover(self) -> RecoveryReport:
+        """Repair half-written state left by an unclean shutdown, then load.
+
+        Cost is bounded by the size of the state itself — no event-log
+        replay is needed:
+        - Orphaned *.tmp files are discarded. A flush that never reached
+          its rename did not return success, so its content was never
+          committed (and may have been rolled back in memory).
+        - Sectioned layout: a pending journal is complete by construction
+          (it is itself committed by rename), so its sections are
+          re-applied idempotently and the journal removed.
+        - Flat layout: if the state file cannot be parsed, the previous
+          committed generation (<name>.bak) is restored.
+
+        Raises OSError if the state is unreadable and cannot be repaired.
+        """
+        actions: list[str] = []
+        restored = False
+        self._state = {}
+        self._encoded = {}
+        self._dirty = set()
+
+        if self._layout == LAYOUT_SECTIONED:
+            if self._path.is_dir():
+                for tmp in sorted(self._path.glob("*.tmp")):
+                    tmp.unlink()
+                    actions.append(f"discarded uncommitted {tmp.name}")
+                if self._journal_path.exists():
+                    with self._journal_path.open("r", encoding="utf-8") as f:
+                        pending = json.load(f)
+                    for section, encoded in sorted(pending.items()):
+                        _atomic_write_text(self._section_path(section), encoded)
+                    self._journal_path.unlink()
+                    _fsync_dir(self._path)
+                    actions.append(
+                        f"replayed journal for {len(pending)} section(s)"
+                    )
+                self._load()
+            return RecoveryReport(tuple(actions), restored)
+
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        if tmp.exists():
+            tmp.unlink()
+            actions.append(f"discarded uncommitted {tmp.name}")
+        if self._path.exists():
+            try:
+                self._load()
+            except (ValueError, UnicodeDecodeError) as e:
+                backup = self._backup_path
+                if not backup.exists():
+                    raise OSError(
+                        f"State file {self._path} is unreadable and no backup exists: {e}"
+                    ) from e
+                self._state = {}
+                os.replace(self._path, self._path.with_name(self._path.name + ".corrupt"))
+                _atomic_write_text(self._path, backup.read_text(encoding="utf-8"))
+                self._load()
+                restored = True
+                actions.append(
+                    f"restored {self._path.name} from {backup.name} "
+                    f"(corrupt copy kept as {self._path.name}.corrupt)"
+                )
+        return RecoveryReport(tuple(actions), restored)
 
     def _load(self) -> None:
-        with self._path.open("r", encoding="utf-8") as f:
-            self._state = json.load(f)
+        if self._layout == LAYOUT_SECTIONED:
+            for section_file in sorted(self._path.glob("*.json")):
+                with section_file.open("r", encoding="utf-8") as f:
+                    self._state[section_file.stem] = json.load(f)
+        else:
+            with self._path.open("r", encoding="utf-8") as f:
+                self._state = json.load(f)
+        self._encoded = {
+            section: _encode_section(value)
+            for section, value in self._state.items()
+        }
+
+    def _get_section(self, section: str, default: Any = None) -> Any:
+        """Return the stored value of a section, or default if absent."""
+        return self._state.get(section, default)
+
+    def _section_names(self) -> list[str]:
+        """Names of all sections currently held by the store."""
+        return sorted(self._state)
+
+    def _put_section(self, section: str, value: Any) -> None:
+        """Stage a section value, marking it dirty only if it changed.
+
+        Inside batch(assume_changed=True) the section is marked dirty
+        without encoding it; flush() encodes it.
+        """
+        self._state[section] = value
+        if self._assume_changed:
+            self._encoded.pop(section, None)
+            self._dirty.add(section)
+            return
+        encoded = _encode_section(value)
+        if self._encoded.get(section) == encoded:
+            return
+        self._encoded[section] = encoded
+        self._dirty.add(section)
+
+    def _put_stamped_section(self, section: str, value: dict[str, Any]) -> None:
+        """Stage a section carrying a saved_utc stamp.
+
+        The stamp is refreshed only when the rest of the section changed,
+        so an unchanged section does not become dirty every second.
+        """
+        previous = dict(self._get_section(section, {}))
+        previous_stamp = previous.pop("saved_utc", None)
+        if previous_stamp is not None and previous == value:
+            return
+        value["saved_utc"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._put_section(section, value)
 
     def _save(self) -> None:
+        """Flush dirty sections now, unless a batch() block defers it."""
+        if self._batch_depth:
+            return
+        self.flush()
+
+    @property
+    def dirty_sections(self) -> frozenset[str]:
+        """Sections changed since the last successful flush."""
+        return frozenset(self._dirty)
+
+    @contextmanager
+    def batch(self, assume_changed: bool = False) -> Iterator["StateStore"]:
+        """Defer writes until the outermost batch exits, then flush once.
+
+        If the block raises, nothing is flushed; dirty sections stay
+        marked and are written by the next successful flush. With
+        assume_changed, sections saved in this block (not in blocks
+        nested inside it) are marked dirty without comparing them to
+        their last written encoding.
+        """
+        self._batch_depth += 1
+        outer_assume_changed = self._assume_changed
+        self._assume_changed = assume_changed
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self._assume_changed = outer_assume_changed
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all dirty sections to storage. Raises OSError on failure."""
+        if not self._dirty:
+            return
+        self._write_sections(sorted(self._dirty))
+        self._dirty.clear()
+
+    def export_json(self, path: Path) -> None:
+        """Export every section as one flat JSON document.
+
+        The output is loadable by a flat-layout StateStore and by
+        import_json() on any backend.
+        """
+        snapshot = {
+            section: self._get_section(section)
+            for section in self._section_names()
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+    def import_json(self, path: Path) -> None:
+        """Import every section from a flat JSON document and flush."""
+        with path.open("r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        with self.batch():
+            for section, value in snapshot.items():
+                self._put_section(section, value)
+
+    def _staged_encoding(self, section: str) -> str:
+        """Return a staged section's encoding, encoding it if not cached."""
+        encoded = self._encoded.get(section)
+        if encoded is None:
+            encoded = _encode_section(self._state[section])
+            self._encoded[section] = encoded
+        return encoded
+
+    def _write_sections(self, sections: list[str]) -> None:
+        if self._layout == LAYOUT_SECTIONED:
+            # Commit the journal first (by rename, so it is all-or-nothing),
+            # then apply each section atomically. A crash at any point is
+            # repaired by recover() replaying the journal.
+            self._path.mkdir(parents=True, exist_ok=True)
+            pending = {section: self._staged_encoding(section) for section in sections}
+            _atomic_write_text(self._journal_path, json.dumps(pending, ensure_ascii=False))
+            for section in sections:
+                _atomic_write_text(self._section_path(section), pending[section])
+            self._journal_path.unlink()
+            _fsync_dir(self._path)
+            return
+        # Flat layout: one section per line, unchanged sections spliced
+        # in from their cached encoding rather than re-serialised.
+        for section in sections:
+            self._staged_encoding(section)
+        lines = [
+            f"{json.dumps(section, ensure_ascii=False)}:{self._encoded[section]}"
+            for section in sorted(self._encoded)
+        ]
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        with self._path.open("w", encoding="utf-8") as f:
-            json.dump(self._state, f, indent=2, sort_keys=True, ensure_ascii=False)
+        if self._path.exists():
+            # Keep the previous committed generation for recover().
+            backup_tmp = self._backup_path.with_name(self._backup_path.name + ".tmp")
+            try:
+                if backup_tmp.exists():
+                    backup_tmp.unlink()
+                os.link(self._path, backup_tmp)
+                os.replace(backup_tmp, self._backup_path)
+            except OSError:
+                pass  # Backup is best-effort; the commit itself stays atomic
+        _atomic_write_text(self._path, "{\n" + ",\n".join(lines) + "\n}\n")
 
     # ------------------------------------------------------------------
     # Roster persistence
@@ -153,13 +476,13 @@ class StateStore:
             if actor.identity_method is not None:
                 entry_data["identity_method"] = actor.identity_method
             entries.append(entry_data)
-        self._state["roster"] = entries
+        self._put_section("roster", entries)
         self._save()
 
     def load_roster(self) -> ActorRoster:
         """Deserialize the actor roster from state."""
         roster = ActorRoster()
-        for data in self._state.get("roster", []):
+        for data in self._get_section("roster", []):
             registered_utc = None
             if data.get("registered_utc"):
                 registered_utc = datetime.strptime(
@@ -261,13 +584,13 @@ class StateStore:
                 ),
                 "domain_scores": domain_scores_data,
             }
-        self._state["trust_records"] = entries
+        self._put_section("trust_records", entries)
         self._save()
 
     def load_trust_records(self) -> dict[str, TrustRecord]:
         """Deserialize trust records from state."""
         records = {}
-        for actor_id, data in self._state.get("trust_records", {}).items():
+        for actor_id, data in self._get_section("trust_records", {}).items():
             # Deserialize domain scores
             domain_scores: dict[str, DomainTrustScore] = {}
             for domain, ds_data in data.get("domain_scores", {}).items():
@@ -385,13 +708,13 @@ class StateStore:
                     for req in m.skill_requirements
                 ],
             }
-        self._state["missions"] = entries
+        self._put_section("missions", entries)
         self._save()
 
     def load_missions(self) -> dict[str, Mission]:
         """Deserialize missions from state."""
         missions = {}
-        for mid, data in self._state.get("missions", {}).items():
+        for mid, data in self._get_section("missions", {}).items():
             mission = Mission(
                 mission_id=data["mission_id"],
                 mission_title=data["mission_title"],
@@ -455,7 +778,7 @@ class StateStore:
                 }
                 for a in assessments
             ]
-        self._state["reviewer_histories"] = entries
+        self._put_section("reviewer_histories", entries)
         self._save()
 
     def load_reviewer_histories(
@@ -463,7 +786,7 @@ class StateStore:
     ) -> dict[str, list[ReviewerQualityAssessment]]:
         """Deserialize reviewer quality assessment histories from state."""
         histories: dict[str, list[ReviewerQualityAssessment]] = {}
-        for reviewer_id, entries in self._state.get(
+        for reviewer_id, entries in self._get_section(
             "reviewer_histories", {}
         ).items():
             assessments = []
@@ -519,13 +842,13 @@ class StateStore:
                     else None
                 ),
             }
-        self._state["skill_profiles"] = entries
+        self._put_section("skill_profiles", entries)
         self._save()
 
     def load_skill_profiles(self) -> dict[str, ActorSkillProfile]:
         """Deserialize actor skill profiles from state."""
         profiles: dict[str, ActorSkillProfile] = {}
-        for actor_id, data in self._state.get("skill_profiles", {}).items():
+        for actor_id, data in self._get_section("skill_profiles", {}).items():
             skills: dict[str, SkillProficiency] = {}
             for canonical, sp_data in data.get("skills", {}).items():
                 skill_id = SkillId(
@@ -637,8 +960,8 @@ class StateStore:
                 for b in bid_list
             ]
 
-        self._state["listings"] = listing_entries
-        self._state["bids"] = bid_entries
+        self._put_section("listings", listing_entries)
+        self._put_section("bids", bid_entries)
         self._save()
 
     def load_listings(self) -> tuple[dict[str, MarketListing], dict[str, list[Bid]]]:
@@ -647,7 +970,7 @@ class StateStore:
         Returns (listings_dict, bids_dict).
         """
         listings: dict[str, MarketListing] = {}
-        for lid, data in self._state.get("listings", {}).items():
+        for lid, data in self._get_section("listings", {}).items():
             created_utc = None
             if data.get("created_utc"):
                 created_utc = datetime.strptime(
@@ -699,7 +1022,7 @@ class StateStore:
             )
 
         bids: dict[str, list[Bid]] = {}
-        for lid, bid_list in self._state.get("bids", {}).items():
+        for lid, bid_list in self._get_section("bids", {}).items():
             bids[lid] = []
             for bd in bid_list:
                 submitted_utc = None
@@ -817,7 +1140,7 @@ class StateStore:
                     if record.restored_utc else None
                 ),
             }
-        self._state["leave_records"] = entries
+        self._put_section("leave_records", entries)
         self._save()
 
     def load_leave_records(self) -> dict[str, LeaveRecord]:
@@ -827,7 +1150,7 @@ class StateStore:
         and trust freeze domain score snapshots.
         """
         records: dict[str, LeaveRecord] = {}
-        for leave_id, data in self._state.get("leave_records", {}).items():
+        for leave_id, data in self._get_section("leave_records", {}).items():
             # Deserialize adjudications
             adjudications: list[LeaveAdjudication] = []
             for adj_data in data.get("adjudications", []):
@@ -951,11 +1274,11 @@ class StateStore:
         committed_count: int,
     ) -> None:
         """Save epoch chain continuity state."""
-        self._state["epoch"] = {
+        epoch: dict[str, Any] = {
             "previous_hash": previous_hash,
             "committed_count": committed_count,
-            "saved_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         }
+        self._put_stamped_section("epoch", epoch)
         self._save()
 
     def load_epoch_state(self) -> tuple[str, int]:
@@ -964,7 +1287,7 @@ class StateStore:
         Returns (previous_hash, committed_count).
         Returns defaults if no state exists.
         """
-        epoch = self._state.get("epoch", {})
+        epoch = self._get_section("epoch", {})
         from genesis.crypto.epoch_service import GENESIS_PREVIOUS_HASH
         return (
             epoch.get("previous_hash", GENESIS_PREVIOUS_HASH),
@@ -990,7 +1313,6 @@ class StateStore:
         """
         lifecycle: dict[str, Any] = {
             "first_light_achieved": first_light_achieved,
-            "saved_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         }
         if founder_id is not None:
             lifecycle["founder_id"] = founder_id
@@ -998,7 +1320,7 @@ class StateStore:
             lifecycle["founder_last_action_utc"] = (
                 founder_last_action_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
             )
-        self._state["lifecycle"] = lifecycle
+        self._put_stamped_section("lifecycle", lifecycle)
         self._save()
 
     def load_lifecycle_state(
@@ -1011,7 +1333,7 @@ class StateStore:
             founder_id (str or None)
             founder_last_action_utc (datetime or None)
         """
-        data = self._state.get("lifecycle", {})
+        data = self._get_section("lifecycle", {})
         result: dict[str, Any] = {
             "first_light_achieved": data.get("first_light_achieved", False),
             "founder_id": data.get("founder_id"),
@@ -1061,13 +1383,13 @@ class StateStore:
                 "commission_amount": str(rec.commission_amount) if rec.commission_amount is not None else None,
                 "worker_payout": str(rec.worker_payout) if rec.worker_payout is not None else None,
             }
-        self._state["escrows"] = entries
+        self._put_section("escrows", entries)
         self._save()
 
     def load_escrows(self) -> dict[str, EscrowRecord]:
         """Deserialize escrow records from state."""
         escrows: dict[str, EscrowRecord] = {}
-        for eid, data in self._state.get("escrows", {}).items():
+        for eid, data in self._get_section("escrows", {}).items():
             def _parse_ts(key: str) -> Optional[datetime]:
                 v = data.get(key)
                 if v is None:
@@ -1143,13 +1465,13 @@ class StateStore:
                     if wf.visibility_expiry_utc else None
                 ),
             }
-        self._state["workflows"] = entries
+        self._put_section("workflows", entries)
         self._save()
 
     def load_workflows(self) -> dict[str, WorkflowState]:
         """Deserialize workflow states from state."""
         workflows: dict[str, WorkflowState] = {}
-        for wid, data in self._state.get("workflows", {}).items():
+        for wid, data in self._get_section("workflows", {}).items():
             def _parse_ts(key: str) -> Optional[datetime]:
                 v = data.get(key)
                 if v is None:
@@ -1188,11 +1510,12 @@ class StateStore:
 
     def save_gcf(self, gcf_data: dict) -> None:
         """Serialize GCF tracker state (balance, contributions, disbursements, refunds)."""
-        self._state["gcf_tracker"] = gcf_data
+        self._put_section("gcf_tracker", gcf_data)
+        self._save()
 
     def load_gcf(self) -> Optional[dict]:
         """Load GCF tracker state, or None if never saved."""
-        return self._state.get("gcf_tracker")
+        return self._get_section("gcf_tracker")
 
     # ------------------------------------------------------------------
     # GCF Disbursement persistence
@@ -1251,8 +1574,8 @@ class StateStore:
                 for v in vote_list
             ]
 
-        self._state["disbursement_proposals"] = prop_entries
-        self._state["disbursement_votes"] = vote_entries
+        self._put_section("disbursement_proposals", prop_entries)
+        self._put_section("disbursement_votes", vote_entries)
         self._save()
 
     def load_disbursements(
@@ -1264,11 +1587,11 @@ class StateStore:
         by DisbursementEngine.from_records().
         """
         proposals: list[dict[str, Any]] = []
-        for _pid, data in self._state.get("disbursement_proposals", {}).items():
+        for _pid, data in self._get_section("disbursement_proposals", {}).items():
             proposals.append(data)
 
         votes: list[dict[str, Any]] = []
-        for _pid, vote_list in self._state.get("disbursement_votes", {}).items():
+        for _pid, vote_list in self._get_section("disbursement_votes", {}).items():
             for v in vote_list:
                 votes.append(v)
 
@@ -1351,7 +1674,7 @@ class StateStore:
                 "confirmation_votes": conf_votes_data,
             }
 
-        self._state["amendment_proposals"] = entries
+        self._put_section("amendment_proposals", entries)
         self._save()
 
     def load_amendments(self) -> list[dict[str, Any]]:
@@ -1361,7 +1684,7 @@ class StateStore:
         AmendmentEngine.from_records().
         """
         proposals: list[dict[str, Any]] = []
-        for _pid, data in self._state.get("amendment_proposals", {}).items():
+        for _pid, data in self._get_section("amendment_proposals", {}).items():
             proposals.append(data)
         return proposals
 
@@ -1415,7 +1738,7 @@ class StateStore:
                 "genesis_provisional": item.genesis_provisional,
             }
 
-        self._state["g0_ratification_items"] = entries
+        self._put_section("g0_ratification_items", entries)
         self._save()
 
     def load_ratification_items(self) -> list[dict[str, Any]]:
@@ -1425,7 +1748,7 @@ class StateStore:
         G0RatificationEngine.from_records().
         """
         items: list[dict[str, Any]] = []
-        for _iid, data in self._state.get("g0_ratification_items", {}).items():
+        for _iid, data in self._get_section("g0_ratification_items", {}).items():
             items.append(data)
         return items
 
@@ -1442,7 +1765,7 @@ class StateStore:
         Args:
             topics_data: Serialised topic records from AssemblyEngine.to_records().
         """
-        self._state["assembly_topics"] = topics_data
+        self._put_section("assembly_topics", topics_data)
         self._save()
 
     def load_assembly_topics(self) -> list[dict[str, Any]]:
@@ -1451,19 +1774,19 @@ class StateStore:
         Returns list of topic dicts in the format expected by
         AssemblyEngine.from_records().
         """
-        return self._state.get("assembly_topics", [])
+        return self._get_section("assembly_topics", [])
 
     def save_assembly_compliance_salts(
         self,
         compliance_salts: dict[str, str],
     ) -> None:
         """Persist Assembly compliance salt index (contribution_id -> salt)."""
-        self._state["assembly_compliance_salts"] = dict(compliance_salts)
+        self._put_section("assembly_compliance_salts", dict(compliance_salts))
         self._save()
 
     def load_assembly_compliance_salts(self) -> dict[str, str]:
         """Load Assembly compliance salt index (contribution_id -> salt)."""
-        raw = self._state.get("assembly_compliance_salts", {})
+        raw = self._get_section("assembly_compliance_salts", {})
         if not isinstance(raw, dict):
             return {}
         return {
@@ -1485,7 +1808,7 @@ class StateStore:
         Args:
             orgs_data: Serialised org records from OrgRegistryEngine.to_records().
         """
-        self._state["org_registry"] = orgs_data
+        self._put_section("org_registry", orgs_data)
         self._save()
 
     def load_org_registry(self) -> list[dict[str, Any]]:
@@ -1494,7 +1817,7 @@ class StateStore:
         Returns list of org dicts in the format expected by
         OrgRegistryEngine.from_records().
         """
-        return self._state.get("org_registry", [])
+        return self._get_section("org_registry", [])
 
     # ------------------------------------------------------------------
     # Domain Expert / Machine Clearance persistence (Phase F-3)
@@ -1509,7 +1832,7 @@ class StateStore:
         Args:
             clearance_data: Serialised records from DomainExpertEngine.to_records().
         """
-        self._state["domain_clearances"] = clearance_data
+        self._put_section("domain_clearances", clearance_data)
         self._save()
 
     def load_domain_clearances(self) -> list[dict[str, Any]]:
@@ -1518,7 +1841,7 @@ class StateStore:
         Returns list of clearance dicts in the format expected by
         DomainExpertEngine.from_records().
         """
-        return self._state.get("domain_clearances", [])
+        return self._get_section("domain_clearances", [])
 
     def save_machine_agency(
         self,
@@ -1529,7 +1852,7 @@ class StateStore:
         Expects a dict with 'grants' and 'class_grants' keys from
         MachineAgencyEngine.to_records().
         """
-        self._state["machine_agency"] = agency_data
+        self._put_section("machine_agency", agency_data)
         self._save()
 
     def load_machine_agency(self) -> Any:
@@ -1538,4 +1861,76 @@ class StateStore:
         Returns data in the format expected by MachineAgencyEngine.from_records().
         Backward compatible: old format (list) is handled by from_records().
         """
-        return self._state.get("machine_agency", {"grants": [], "class_grants": []})
+        return self._get_section("machine_agency", {"grants": [], "class_grants": []})
+
+    # ------------------------------------------------------------------
+    # Compliance re-screening checkpoint
+    # ------------------------------------------------------------------
+
+    def save_compliance_rescreen_cursor(self, cursor: Optional[str]) -> None:
+        """Persist the re-screening checkpoint (None when no job is running)."""
+        self._put_section("compliance_rescreen", {"cursor": cursor})
+        self._save()
+
+    def load_compliance_rescreen_cursor(self) -> Optional[str]:
+        """Load the re-screening checkpoint, or None if there is none."""
+        return self._get_section("compliance_rescreen", {}).get("cursor")
+
+
+def open_state_store(
+    data_dir: Path,
+    backend: str = BACKEND_JSON_FLAT,
+    layout: str = LAYOUT_FLAT,
+) -> StateStore:
+    """Open the state store for a PERSISTENCE_BACKEND value.
+
+    "json_flat" uses <data_dir>/state.json, or the <data_dir>/state/
+    directory with layout "sectioned" (PERSISTENCE_LAYOUT). "sqlite"
+    uses <data_dir>/state.db. Any other value (including "postgresql",
+    which has no backend yet) raises ValueError.
+
+    A store that is still empty adopts the state another layout or
+    backend left in data_dir (see _adopt_existing_state()), so switching
+    PERSISTENCE_BACKEND or PERSISTENCE_LAYOUT never starts from empty
+    state.
+    """
+    if backend == BACKEND_JSON_FLAT:
+        if layout == LAYOUT_SECTIONED:
+            store = StateStore(data_dir / "state", LAYOUT_SECTIONED)
+        else:
+            store = StateStore(data_dir / "state.json", layout)
+    elif backend == BACKEND_SQLITE:
+        from genesis.persistence.sqlite_store import SQLiteStateStore
+        store = SQLiteStateStore(data_dir / "state.db")
+    else:
+        raise ValueError(f"Unknown PERSISTENCE_BACKEND: {backend}")
+    _adopt_existing_state(store, data_dir)
+    return store
+
+
+def _adopt_existing_state(store: StateStore, data_dir: Path) -> None:
+    """Import state left by another layout or backend into an empty store.
+
+    Sources, in order: the sectioned <data_dir>/state/ directory, then
+    the flat <data_dir>/state.json. The first one holding state is
+    imported and renamed with a ".migrated" suffix, so it cannot go
+    stale next to the store that replaced it or be imported twice.
+    """
+    if store._section_names():
+        return
+    sources = [
+        (data_dir / "state", LAYOUT_SECTIONED),
+        (data_dir / "state.json", LAYOUT_FLAT),
+    ]
+    for path, layout in sources:
+        if path == store._path or not path.exists():
+            continue
+        source = StateStore(path, layout)
+        sections = source._section_names()
+        if not sections:
+            continue
+        with store.batch():
+            for section in sections:
+                store._put_section(section, source._get_section(section))
+        os.replace(path, path.with_name(path.name + ".migrated"))
+        return
@@ -1,5 +1,6 @@
 """Policy resolution — the single runtime source of truth."""
 
+from genesis.policy.compiled import CompiledPolicy
 from genesis.policy.resolver import PolicyResolver
 
-__all__ = ["PolicyResolver"]
+__all__ = ["CompiledPolicy", "PolicyResolver"]
@@ -0,0 +1,169 @@
+"""Compiled policy — an immutable, typed snapshot of hot-path parameters.
+
+PolicyResolver methods return fresh dict copies on every call, which is
+the right trade for governance code but costly inside per-candidate,
+per-bid and per-domain loops. CompiledPolicy resolves those values once,
+validates them, and exposes them as plain attributes.
+
+The resolver owns the current snapshot and replaces it wholesale when
+policy changes (see PolicyResolver.recompile). Each snapshot carries a
+monotonically increasing version so that caches keyed on policy can
+detect staleness.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Mapping
+
+if TYPE_CHECKING:
+    from genesis.policy.resolver import PolicyResolver
+
+
+@dataclass(frozen=True)
+class AllocationWeights:
+    """Composite-score weights for ranking workers or bids."""
+    relevance: float
+    global_trust: float
+    domain_trust: float
+
+
+@dataclass(frozen=True)
+class MatchingPolicy:
+    """Skill relevance parameters (SkillMatchEngine, WorkerMatcher)."""
+    proficiency_weight: float
+    domain_trust_weight: float
+    min_relevance: float
+    worker_allocation: AllocationWeights
+
+
+@dataclass(frozen=True)
+class TrustPolicy:
+    """Trust scoring and inactivity decay parameters (TrustEngine)."""
+    weights: tuple[float, float, float, float]  # (w_Q, w_R, w_V, w_E)
+    domain_weights: tuple[float, float, float, float]
+    quality_gate_human: float
+    quality_gate_machine: float
+    trust_floor_human: float
+    trust_floor_machine: float
+    delta_fast: float
+    half_life_human: float
+    half_life_machine: float
+    decay_floor: float
+    recency_weight: float
+    volume_weight: float
+
+    def half_life(self, is_machine: bool) -> float:
+        return self.half_life_machine if is_machine else self.half_life_human
+
+    def trust_floor(self, is_machine: bool) -> float:
+        return self.trust_floor_machine if is_machine else self.trust_floor_human
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """Immutable snapshot of the parameters used in inner loops.
+
+    Usage:
+        policy = resolver.compiled()
+        w = policy.matching.worker_allocation
+        score = w.relevance * rel + w.global_trust * g + w.domain_trust * d
+    """
+    version: int
+    matching: MatchingPolicy
+    market_allocation: AllocationWeights
+    trust: TrustPolicy
+
+    @classmethod
+    def compile(cls, resolver: PolicyResolver, version: int) -> CompiledPolicy:
+        """Resolve and validate every field from ``resolver``.
+
+        Raises ValueError if any parameter is not a finite, non-negative
+        number, or a half-life is not positive.
+        """
+        sm = resolver.skill_matching_config()
+        if resolver.has_skill_trust_config():
+            p_weight = sm.get("proficiency_weight", 0.60)
+            dt_weight = sm.get("domain_trust_weight", 0.40)
+            min_relevance = sm.get("min_relevance_score", 0.3)
+            decay_floor = resolver.inactivity_decay_config().get("decay_floor", 0.01)
+        else:
+            p_weight, dt_weight, min_relevance = 0.60, 0.40, 0.3
+            decay_floor = 0.01
+        matching = MatchingPolicy(
+            proficiency_weight=_number("proficiency_weight", p_weight),
+            domain_trust_weight=_number("domain_trust_weight", dt_weight),
+            min_relevance=_number("min_relevance_score", min_relevance),
+            worker_allocation=_weights(
+                "worker_allocation_weights",
+                sm.get("worker_allocation_weights", {}),
+            ),
+        )
+
+        if resolver.has_market_config():
+            market_allocation = _weights(
+                "allocation_weights", resolver.market_allocation_weights(),
+            )
+        else:
+            market_allocation = matching.worker_allocation
+
+        aggregation = resolver.global_score_aggregation()
+        half_life_human = _number("half_life_days_human", resolver.half_life_days(False))
+        half_life_machine = _number("half_life_days_machine", resolver.half_life_days(True))
+        if half_life_human <= 0 or half_life_machine <= 0:
+            raise ValueError("Inactivity decay half-lives must be positive")
+        trust = TrustPolicy(
+            weights=_quad("trust_weights", resolver.trust_weights()),
+            domain_weights=_quad("domain_trust_weights", resolver.domain_trust_weights()),
+            quality_gate_human=_number("Q_min_H", resolver.quality_gate(False)),
+            quality_gate_machine=_number("Q_min_M", resolver.quality_gate(True)),
+            trust_floor_human=_number("T_floor_H", resolver.trust_floor(False)),
+            trust_floor_machine=_number("T_floor_M", resolver.trust_floor(True)),
+            delta_fast=_number("delta_fast", resolver.delta_fast()),
+            half_life_human=half_life_human,
+            half_life_machine=half_life_machine,
+            decay_floor=_number("decay_floor", decay_floor),
+            recency_weight=_number("recency_weight", aggregation.get("recency_weight", 0.3)),
+            volume_weight=_number("volume_weight", aggregation.get("volume_weight", 0.7)),
+        )
+
+        return cls(
+            version=version,
+            matching=matching,
+            market_allocation=market_allocation,
+            trust=trust,
+        )
+
+
+def _number(name: str, value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Policy parameter {name} must be a number, got {value!r}")
+    if not math.isfinite(value) or value < 0:
+        raise ValueError(
+            f"Policy parameter {name} must be finite and non-negative, got {value!r}"
+        )
+    # Preserve the configured value exactly; ints stay ints so that
+    # arithmetic matches the uncompiled path bit for bit.
+    return value
+
+
+def _quad(
+    name: str,
+    values: tuple[float, float, float, float],
+) -> tuple[float, float, float, float]:
+    w_q, w_r, w_v, w_e = values
+    return (
+        _number(f"{name}.w_Q", w_q),
+        _number(f"{name}.w_R", w_r),
+        _number(f"{name}.w_V", w_v),
+        _number(f"{name}.w_E", w_e),
+    )
+
+
+def _weights(name: str, config: Mapping[str, Any]) -> AllocationWeights:
+    return AllocationWeights(
+        relevance=_number(f"{name}.relevance", config.get("relevance", 0.50)),
+        global_trust=_number(f"{name}.global_trust", config.get("global_trust", 0.20)),
+        domain_trust=_number(f"{name}.domain_trust", config.get("domain_trust", 0.30)),
+    )
@@ -13,6 +13,7 @@ from typing import Any
 
 from genesis.models.mission import DomainType, MissionClass, RiskTier
 from genesis.models.governance import Chamber, ChamberKind, GenesisPhase
+from genesis.policy.compiled import CompiledPolicy
 
 
 @dataclass(frozen=True)
@@ -58,6 +59,9 @@ class PolicyResolver:
         self._leave_policy = leave_policy
         self._commission_policy = commission_policy
         self._validate_versions()
+        # Hot-path snapshot, compiled on first use and swapped by recompile().
+        self._compiled: CompiledPolicy | None = None
+        self._compiled_version = 0
 
     def _validate_versions(self) -> None:
         if "version" not in self._params:
@@ -65,6 +69,56 @@ class PolicyResolver:
         if "version" not in self._policy:
             raise ValueError("runtime_policy.json missing version")
 
+    # ------------------------------------------------------------------
+    # Compiled policy snapshot
+    # ------------------------------------------------------------------
+
+    def compiled(self) -> CompiledPolicy:
+        """Return the current immutable hot-path policy snapshot."""
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self.recompile()
+        return compiled
+
+    def recompile(self) -> CompiledPolicy:
+        """Rebuild the compiled snapshot from the live config dicts.
+
+        Call after any in-place change to the underlying config (e.g. an
+        applied amendment). The new snapshot is built and validated in
+        full before it replaces the old one, so readers only ever see a
+        complete snapshot. Raises ValueError, leaving the previous
+        snapshot in place, if the config no longer validates.
+        """
+        compiled = CompiledPolicy.compile(self, self._compiled_version + 1)
+        self._compiled_version = compiled.version
+        self._compiled = compiled
+        return compiled
+
+    def replace_params(self, params: dict[str, Any]) -> CompiledPolicy:
+        """Swap in new constitutional params together with their snapshot.
+
+        The snapshot is compiled from ``params`` before anything changes,
+        so a value that fails validation raises ValueError and leaves both
+        the live params and the current snapshot untouched. The live dict
+        is updated in place because engines hold references to it.
+        """
+        staged = PolicyResolver(
+            params, self._policy, self._taxonomy, self._skill_trust,
+            self._market_policy, self._skill_lifecycle, self._leave_policy,
+            self._commission_policy,
+        )
+        compiled = CompiledPolicy.compile(staged, self._compiled_version + 1)
+        self._params.clear()
+        self._params.update(params)
+        self._compiled_version = compiled.version
+        self._compiled = compiled
+        return compiled
+
+    @property
+    def policy_version(self) -> int:
+        """Version of the current compiled snapshot (compiling if needed)."""
+        return self.compiled().version
+
     # ------------------------------------------------------------------
     # Mission class → risk tier
     # ------------------------------------------------------------------
@@ -709,6 +763,20 @@ class PolicyResolver:
         """
         return bool(self._params.get("genesis", {}).get("founder_veto_active", False))
 
+    def persistence_backend(self) -> str:
+        """Return the configured PERSISTENCE_BACKEND (default "json_flat")."""
+        stubs = self._params.get("stub_configuration", {})
+        return str(stubs.get("PERSISTENCE_BACKEND", "json_flat"))
+
+    def persistence_layout(self) -> str:
+        """Return the json_flat PERSISTENCE_LAYOUT (default "flat").
+
+        "sectioned" keeps one file per state section, so a flush rewrites
+        only the sections that changed.
+        """
+        stubs = self._params.get("stub_configuration", {})
+        return str(stubs.get("PERSISTENCE_LAYOUT", "flat"))
+
     def adjudication_config(self) -> dict[str, Any]:
         """Return adjudication engine configuration.
 
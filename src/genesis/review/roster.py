@@ -18,6 +18,7 @@ Constitutional invariants enforced:
 from __future__ import annotations
 
 import enum
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
@@ -89,6 +90,26 @@ class RosterEntry:
     identity_expires_utc: Optional[datetime] = None
     identity_method: Optional[str] = None
 
+    def __setattr__(self, name: str, value: object) -> None:
+        # Keep the owning roster's bucket indexes live: any change to an
+        # indexed field re-files the entry. Unregistered entries (including
+        # ones under construction, and copies) have no owner and behave
+        # like a plain dataclass. An entry has at most one owner.
+        roster = self.__dict__.get("_roster")
+        if roster is not None and name in _INDEXED_FIELDS:
+            roster._unindex(self)
+            object.__setattr__(self, name, value)
+            roster._index(self)
+        else:
+            object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> dict:
+        # Copies and unpickled entries start unowned, so writes to them
+        # never re-file the registered original.
+        state = dict(self.__dict__)
+        state.pop("_roster", None)
+        return state
+
     def is_available(self) -> bool:
         """An actor is available if provisional, active, or on probation.
 
@@ -100,15 +121,64 @@ class RosterEntry:
         )
 
 
+# Statuses in which RosterEntry.is_available() holds.
+_AVAILABLE_STATUSES = (
+    ActorStatus.PROVISIONAL, ActorStatus.ACTIVE, ActorStatus.PROBATION,
+)
+
+# Statuses from which an actor may be drawn as a reviewer.
+REVIEWER_STATUSES = (ActorStatus.ACTIVE, ActorStatus.PROBATION)
+
+# Diversity dimensions bucketed for reviewer sampling.
+DIVERSITY_DIMENSIONS = ("model_family", "method_type", "region", "organization")
+
+# Width of a trust band: band = int(trust_score * TRUST_BANDS).
+TRUST_BANDS = 10
+
+_INDEXED_FIELDS = frozenset(
+    ("status", "actor_kind", "trust_score") + DIVERSITY_DIMENSIONS
+)
+
+
+def trust_band(score: float) -> int:
+    """Return the trust band (0..TRUST_BANDS) containing ``score``."""
+    return max(0, min(TRUST_BANDS, int(score * TRUST_BANDS)))
+
+
 class ActorRoster:
     """Registry of all actors in the Genesis system.
 
+    Besides the primary id → entry map, the roster keeps live bucket
+    indexes over reviewer-eligible actors (status ACTIVE or PROBATION):
+    the full pool, one bucket per value of each diversity dimension, and
+    per-trust-band counts. Buckets hold registration ordinals in sorted
+    order, so their contents and order depend only on roster state, not
+    on the history of mutations. Entries re-file themselves when an
+    indexed field is assigned; an entry belongs to at most one roster.
+
     Thread-safety: this class is not thread-safe. The caller must
     synchronise access if used from multiple threads.
     """
 
     def __init__(self) -> None:
         self._actors: dict[str, RosterEntry] = {}
+        # Registration order, used to break ranking ties the same way a
+        # full scan of all_actors() would.
+        self._ordinals: dict[str, int] = {}
+        self._next_ordinal = 0
+        self._by_ordinal: dict[int, RosterEntry] = {}
+        # Actor counts per (actor_kind, status).
+        self._status_counts: dict[tuple[ActorKind, ActorStatus], int] = {}
+        # Reviewer buckets: sorted ordinal lists.
+        self._reviewable: list[int] = []
+        self._reviewable_by: dict[str, dict[str, list[int]]] = {
+            dim: {} for dim in DIVERSITY_DIMENSIONS
+        }
+        # Sorted non-empty bucket values per dimension.
+        self._dimension_values: dict[str, list[str]] = {
+            dim: [] for dim in DIVERSITY_DIMENSIONS
+        }
+        self._band_counts: list[int] = [0] * (TRUST_BANDS + 1)
 
     def register(self, entry: RosterEntry) -> None:
         """Register a new actor or update an existing one.
@@ -116,7 +186,14 @@ class ActorRoster:
         Raises ValueError if:
         - actor_id is blank/empty
         - trust_score is out of [0, 1]
+        - the entry is registered in another roster (an entry re-files
+          itself in one roster only, so it must be removed there first)
         """
+        owner = entry.__dict__.get("_roster")
+        if owner is not None and owner is not self:
+            raise ValueError(
+                f"Actor {entry.actor_id} is registered in another roster"
+            )
         canonical_id = entry.actor_id.strip()
         if not canonical_id:
             raise ValueError("Cannot register actor with blank ID")
@@ -125,18 +202,36 @@ class ActorRoster:
                 f"Trust score must be in [0, 1], got {entry.trust_score}"
             )
         entry.actor_id = canonical_id
+        previous = self._actors.get(canonical_id)
+        if previous is None:
+            self._ordinals[canonical_id] = self._next_ordinal
+            self._next_ordinal += 1
+        else:
+            self._detach(previous)
         self._actors[canonical_id] = entry
+        self._by_ordinal[self._ordinals[canonical_id]] = entry
+        object.__setattr__(entry, "_roster", self)
+        self._index(entry)
 
     def remove(self, actor_id: str) -> None:
         """Remove an actor from the roster."""
         canonical = actor_id.strip()
         if canonical in self._actors:
-            del self._actors[canonical]
+            self._detach(self._actors.pop(canonical))
+            self._by_ordinal.pop(self._ordinals.pop(canonical), None)
 
     def get(self, actor_id: str) -> Optional[RosterEntry]:
         """Look up an actor by ID."""
         return self._actors.get(actor_id.strip())
 
+    def ordinal(self, actor_id: str) -> int:
+        """Return an actor's position in registration order.
+
+        Matches the iteration order of all_actors(). Raises KeyError
+        for unknown actors.
+        """
+        return self._ordinals[actor_id.strip()]
+
     def all_actors(self) -> list[RosterEntry]:
         """Return all registered actors."""
         return list(self._actors.values())
@@ -155,35 +250,108 @@ class ActorRoster:
         - Actors below min_trust threshold
         """
         exclude = exclude_ids or set()
+        by_ordinal = self._by_ordinal
         return [
-            a for a in self._actors.values()
-            if a.is_available()
-            and a.status != ActorStatus.PROVISIONAL
-            and a.actor_id not in exclude
+            a for a in (by_ordinal[o] for o in self._reviewable)
+            if a.actor_id not in exclude
             and a.trust_score >= min_trust
         ]
 
+    # ------------------------------------------------------------------
+    # Reviewer buckets
+    # ------------------------------------------------------------------
+
+    def reviewer_pool_size(self, min_trust: float = 0.0) -> int:
+        """Upper bound on reviewer-eligible actors with trust >= min_trust.
+
+        Counts whole trust bands, so actors in the band containing
+        ``min_trust`` are included even if just below it.
+        """
+        return sum(self._band_counts[trust_band(min_trust):])
+
+    @property
+    def reviewer_count(self) -> int:
+        """Number of actors whose status allows reviewing."""
+        return len(self._reviewable)
+
+    def reviewer_at(self, index: int) -> RosterEntry:
+        """Return the index-th reviewer-eligible actor in roster order."""
+        return self._by_ordinal[self._reviewable[index]]
+
+    def reviewer_values(self, dimension: str) -> list[str]:
+        """Return the sorted values of a diversity dimension held by
+        at least one reviewer-eligible actor."""
+        return self._dimension_values[dimension]
+
+    def reviewer_bucket(self, dimension: str, value: str) -> list[RosterEntry]:
+        """Return reviewer-eligible actors with ``dimension == value``,
+        in roster order."""
+        by_ordinal = self._by_ordinal
+        return [by_ordinal[o] for o in self._reviewable_by[dimension].get(value, ())]
+
+    def reviewer_bucket_size(self, dimension: str, value: str) -> int:
+        return len(self._reviewable_by[dimension].get(value, ()))
+
+    def reviewer_bucket_at(self, dimension: str, value: str, index: int) -> RosterEntry:
+        """Return the index-th actor of a dimension bucket in roster order."""
+        return self._by_ordinal[self._reviewable_by[dimension][value][index]]
+
+    def _index(self, entry: RosterEntry) -> None:
+        key = (entry.actor_kind, entry.status)
+        self._status_counts[key] = self._status_counts.get(key, 0) + 1
+        if entry.status not in REVIEWER_STATUSES:
+            return
+        ordinal = self._ordinals[entry.actor_id]
+        insort(self._reviewable, ordinal)
+        for dim in DIVERSITY_DIMENSIONS:
+            value = getattr(entry, dim)
+            buckets = self._reviewable_by[dim]
+            bucket = buckets.get(value)
+            if bucket is None:
+                bucket = buckets[value] = []
+                insort(self._dimension_values[dim], value)
+            insort(bucket, ordinal)
+        self._band_counts[trust_band(entry.trust_score)] += 1
+
+    def _unindex(self, entry: RosterEntry) -> None:
+        self._status_counts[(entry.actor_kind, entry.status)] -= 1
+        if entry.status not in REVIEWER_STATUSES:
+            return
+        ordinal = self._ordinals[entry.actor_id]
+        _discard(self._reviewable, ordinal)
+        for dim in DIVERSITY_DIMENSIONS:
+            value = getattr(entry, dim)
+            buckets = self._reviewable_by[dim]
+            bucket = buckets[value]
+            _discard(bucket, ordinal)
+            if not bucket:
+                del buckets[value]
+                _discard(self._dimension_values[dim], value)
+        self._band_counts[trust_band(entry.trust_score)] -= 1
+
+    def _detach(self, entry: RosterEntry) -> None:
+        self._unindex(entry)
+        object.__setattr__(entry, "_roster", None)
+
     @property
     def count(self) -> int:
         return len(self._actors)
 
     @property
     def active_count(self) -> int:
-        return sum(1 for a in self._actors.values() if a.is_available())
+        return sum(self._available_count(kind) for kind in ActorKind)
 
     @property
     def human_count(self) -> int:
-        return sum(
-            1 for a in self._actors.values()
-            if a.actor_kind == ActorKind.HUMAN and a.is_available()
-        )
+        return self._available_count(ActorKind.HUMAN)
 
     @property
     def machine_count(self) -> int:
-        return sum(
-            1 for a in self._actors.values()
-            if a.actor_kind == ActorKind.MACHINE and a.is_available()
-        )
+        return self._available_count(ActorKind.MACHINE)
+
+    def _available_count(self, kind: ActorKind) -> int:
+        counts = self._status_counts
+        return sum(counts.get((kind, s), 0) for s in _AVAILABLE_STATUSES)
 
     def machines_for_operator(self, operator_id: str) -> list[RosterEntry]:
         """Return all machines registered by a given human operator."""
@@ -192,3 +360,15 @@ class ActorRoster:
             if a.actor_kind == ActorKind.MACHINE
             and a.registered_by == operator_id
         ]
+
+
+def _discard(sorted_list: list, value: object) -> None:
+    """Remove ``value`` from a sorted list.
+
+    Raises ValueError if it is absent rather than removing a neighbour:
+    a missing value means an index has drifted from the roster.
+    """
+    i = bisect_left(sorted_list, value)
+    if i == len(sorted_list) or sorted_list[i] != value:
+        raise ValueError(f"Roster index out of step: {value!r} not indexed")
+    del sorted_list[i]
@@ -32,10 +32,19 @@ from genesis.models.mission import Mission, Reviewer, RiskTier
 from genesis.models.skill import ActorSkillProfile
 from genesis.models.trust import TrustRecord
 from genesis.policy.resolver import PolicyResolver, TierPolicy
-from genesis.review.roster import ActorRoster, RosterEntry
+from genesis.review.roster import REVIEWER_STATUSES, ActorRoster, RosterEntry
+from genesis.skills.index import SkillIndex
 from genesis.skills.matching import SkillMatchEngine
 
 
+# Pools at least this large (and at least 4x the panel) are sampled from
+# roster buckets; smaller pools use the exhaustive shuffle.
+INDEXED_POOL_MIN = 256
+
+# Rejection-sampling attempts before falling back to a full bucket scan.
+_MAX_REJECTIONS = 64
+
+
 @dataclass(frozen=True)
 class SelectionResult:
     """Result of a reviewer selection attempt."""
@@ -63,11 +72,13 @@ class ReviewerSelector:
         roster: ActorRoster,
         skill_profiles: dict[str, ActorSkillProfile] | None = None,
         trust_records: dict[str, TrustRecord] | None = None,
+        skill_index: SkillIndex | None = None,
     ) -> None:
         self._resolver = resolver
         self._roster = roster
         self._skill_profiles = skill_profiles or {}
         self._trust_records = trust_records or {}
+        self._skill_index = skill_index
         self._match_engine = SkillMatchEngine(resolver)
 
     def select(
@@ -96,50 +107,118 @@ class ReviewerSelector:
                 errors=["R3 constitutional flow — reviewer selection handled by governance module"],
             )
 
-        # Build candidate pool, excluding the worker
+        needed = policy.reviewers_required
         exclude_ids = {mission.worker_id} if mission.worker_id else set()
+
+        # Skill-aware pre-filtering: if mission has skill requirements,
+        # prefer candidates with relevant skills. Falls back to full pool
+        # if filtering would leave too few candidates.
+        skill_requirements = (
+            mission.skill_requirements
+            if getattr(mission, "skill_requirements", None) and self._skill_profiles
+            else []
+        )
+        if (
+            skill_requirements
+            and self._skill_index is not None
+            and self._match_engine.min_relevance() > 0
+        ):
+            filtered = self._skill_filtered_pool(
+                skill_requirements, exclude_ids, min_trust,
+            )
+            if len(filtered) >= needed:
+                return self._select_from_pool(mission, policy, filtered, self._rng(seed))
+            skill_requirements = []
+
+        # Large pools: sample straight from the roster's diversity buckets.
+        # Cost scales with the panel, not the roster. Small pools and any
+        # sampling failure take the exhaustive path below.
+        if (
+            not skill_requirements
+            and self._roster.reviewer_pool_size(min_trust)
+            >= max(INDEXED_POOL_MIN, 4 * needed)
+        ):
+            selected = self._bucket_select(
+                policy, exclude_ids, min_trust, self._rng(seed),
+            )
+            if selected is not None:
+                return SelectionResult(reviewers=_as_reviewers(selected), errors=[])
+
+        # Build candidate pool, excluding the worker
         candidates = self._roster.available_reviewers(
             exclude_ids=exclude_ids,
             min_trust=min_trust,
         )
 
-        if len(candidates) < policy.reviewers_required:
+        if len(candidates) < needed:
             return SelectionResult(
                 reviewers=[],
                 errors=[
-                    f"Insufficient candidates: need {policy.reviewers_required}, "
+                    f"Insufficient candidates: need {needed}, "
                     f"found {len(candidates)} eligible"
                 ],
             )
 
-        # Skill-aware pre-filtering: if mission has skill requirements,
-        # prefer candidates with relevant skills. Falls back to full pool
-        # if filtering would leave too few candidates.
-        if (
-            hasattr(mission, "skill_requirements")
-            and mission.skill_requirements
-            and self._skill_profiles
-        ):
+        if skill_requirements:
             filtered = [
                 c for c in candidates
                 if self._match_engine.meets_minimum_relevance(
                     self._skill_profiles.get(c.actor_id),
-                    mission.skill_requirements,
+                    skill_requirements,
                     self._trust_records.get(c.actor_id),
                 )
             ]
             # Only use filtered pool if it has enough candidates
-            if len(filtered) >= policy.reviewers_required:
+            if len(filtered) >= needed:
                 candidates = filtered
 
-        # Set up deterministic PRNG
+        return self._select_from_pool(mission, policy, candidates, self._rng(seed))
+
+    @staticmethod
+    def _rng(seed: str | None) -> random.Random:
+        """Deterministic PRNG for a seed; system entropy if None."""
         rng = random.Random()
         if seed is not None:
             rng.seed(seed)
         else:
             rng.seed()
+        return rng
 
-        # Attempt constrained selection
+    def _skill_filtered_pool(
+        self,
+        requirements: list,
+        exclude_ids: set[str],
+        min_trust: float,
+    ) -> list[RosterEntry]:
+        """Eligible, skill-relevant candidates in roster order, drawn from
+        the skill index postings instead of the full roster."""
+        assert self._skill_index is not None
+        entries = []
+        for actor_id in self._skill_index.candidates(requirements):
+            entry = self._roster.get(actor_id)
+            if (
+                entry is not None
+                and entry.status in REVIEWER_STATUSES
+                and actor_id not in exclude_ids
+                and entry.trust_score >= min_trust
+                and self._match_engine.meets_minimum_relevance(
+                    self._skill_profiles.get(actor_id),
+                    requirements,
+                    self._trust_records.get(actor_id),
+                )
+            ):
+                entries.append(entry)
+        entries.sort(key=lambda e: self._roster.ordinal(e.actor_id))
+        return entries
+
+    def _select_from_pool(
+        self,
+        mission: Mission,
+        policy: TierPolicy,
+        candidates: list[RosterEntry],
+        rng: random.Random,
+    ) -> SelectionResult:
+        """Run the exhaustive constrained selection over an explicit pool."""
         selected = self._constrained_select(
             candidates=candidates,
             policy=policy,
@@ -156,18 +235,77 @@ class ReviewerSelector:
                 ],
             )
 
-        reviewers = [
-            Reviewer(
-                id=entry.actor_id,
-                model_family=entry.model_family,
-                method_type=entry.method_type,
-                region=entry.region,
-                organization=entry.organization,
+        return SelectionResult(reviewers=_as_reviewers(selected), errors=[])
+
+    def _bucket_select(
+        self,
+        policy: TierPolicy,
+        exclude_ids: set[str],
+        min_trust: float,
+        rng: random.Random,
+    ) -> Optional[list[RosterEntry]]:
+        """Constrained-random selection sampled from roster buckets.
+
+        Same greedy strategy as _constrained_select — cover each required
+        diversity dimension with a random new value and a random member,
+        then fill — but draws uniformly from the roster's sorted buckets
+        instead of shuffling the whole pool. Deterministic for a given
+        seed and roster state. Returns None if sampling cannot produce a
+        valid panel; the caller then runs the exhaustive algorithm.
+        """
+        roster = self._roster
+        needed = policy.reviewers_required
+        selected: list[RosterEntry] = []
+        selected_ids: set[str] = set()
+
+        def eligible(entry: RosterEntry) -> bool:
+            return (
+                entry.actor_id not in selected_ids
+                and entry.actor_id not in exclude_ids
+                and entry.trust_score >= min_trust
             )
-            for entry in selected
-        ]
 
-        return SelectionResult(reviewers=reviewers, errors=[])
+        for dim, min_unique in (
+            ("model_family", policy.min_model_families),
+            ("method_type", policy.min_method_types),
+            ("region", policy.min_regions),
+            ("organization", policy.min_organizations),
+        ):
+            if min_unique <= 0:
+                continue
+            covered = {getattr(e, dim) for e in selected}
+            values = roster.reviewer_values(dim)
+            exhausted: set[str] = set()
+            while len(covered) < min_unique:
+                value = _sample(
+                    values.__getitem__, len(values),
+                    lambda v: v not in covered and v not in exhausted, rng,
+                )
+                if value is None:
+                    break
+                chosen = _sample(
+                    lambda i, v=value: roster.reviewer_bucket_at(dim, v, i),
+                    roster.reviewer_bucket_size(dim, value),
+                    eligible, rng,
+                )
+                if chosen is None:
+                    exhausted.add(value)
+                    continue
+                selected.append(chosen)
+                selected_ids.add(chosen.actor_id)
+                covered.add(value)
+
+        while len(selected) < needed:
+            chosen = _sample(roster.reviewer_at, roster.reviewer_count, eligible, rng)
+            if chosen is None:
+                return None
+            selected.append(chosen)
+            selected_ids.add(chosen.actor_id)
+
+        selected = selected[:needed]
+        if not self._meets_constraints(selected, policy):
+            return None
+        return selected
 
     def _constrained_select(
         self,
@@ -316,3 +454,34 @@ class ReviewerSelector:
             return False
 
         return True
+
+
+def _as_reviewers(selected: list[RosterEntry]) -> list[Reviewer]:
+    return [
+        Reviewer(
+            id=entry.actor_id,
+            model_family=entry.model_family,
+            method_type=entry.method_type,
+            region=entry.region,
+            organization=entry.organization,
+        )
+        for entry in selected
+    ]
+
+
+def _sample(at, size: int, accept, rng: random.Random):
+    """Uniformly sample an accepted item from ``at(0) .. at(size - 1)``.
+
+    Rejection-samples first; if that keeps missing, scans the whole
+    range so the draw stays uniform over accepted items. Returns None
+    if no item is accepted.
+    """
+    if size > _MAX_REJECTIONS:
+        for _ in range(_MAX_REJECTIONS):
+            item = at(rng.randrange(size))
+            if accept(item):
+                return item
+    accepted = [item for item in (at(i) for i in range(size)) if accept(item)]
+    if not accepted:
+        return None
+    return rng.choice(accepted)
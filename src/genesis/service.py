@@ -19,16 +19,20 @@ closed rather than proceeding without an audit record.
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 import secrets
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
+from genesis.crypto.anchor_queue import AnchorQueue
 from genesis.crypto.epoch_service import EpochService, GENESIS_PREVIOUS_HASH
+from genesis.crypto.merkle import verify_inclusion
 from genesis.engine.reviewer_router import ReviewerRouter
 from genesis.engine.state_machine import MissionStateMachine
 from genesis.engine.evidence import EvidenceValidator
@@ -72,15 +76,18 @@ from genesis.models.market import (
     MarketListing,
     WorkVisibility,
 )
+from genesis.models.tally import StateTally, scan_counts
 from genesis.models.trust import ActorKind, TrustDelta, TrustRecord
 from genesis.leave.engine import LeaveAdjudicationEngine
 from genesis.market.allocator import AllocationEngine
 from genesis.market.listing_state_machine import ListingStateMachine
 from genesis.skills.decay import SkillDecayEngine
 from genesis.skills.endorsement import EndorsementEngine
+from genesis.skills.index import SkillIndex
 from genesis.skills.matching import SkillMatchEngine
 from genesis.skills.outcome_updater import SkillOutcomeUpdater
 from genesis.skills.worker_matcher import WorkerMatcher
+from genesis.persistence.commitment_store import CommitmentStore
 from genesis.persistence.event_log import EventLog, EventRecord, EventKind
 from genesis.persistence.state_store import StateStore
 from genesis.policy.resolver import PolicyResolver
@@ -98,6 +105,7 @@ from genesis.identity.challenge import ChallengeGenerator
 from genesis.identity.voice_verifier import VoiceVerifier
 from genesis.identity.session import SessionManager, SessionState
 from genesis.identity.quorum_verifier import QuorumVerifier
+from genesis.trust.bulk_decay import BulkDecayEngine
 from genesis.trust.engine import TrustEngine
 from genesis.compensation.gcf import GCFTracker
 from genesis.compensation.gcf_disbursement import (
@@ -114,7 +122,16 @@ from genesis.governance.amendment import (
     AmendmentStatus,
     ConstitutionalViolation,
 )
-from genesis.compliance.screener import ComplianceScreener, ComplianceVerdict
+from genesis.compliance.rescreen import (
+    ComplianceRescreener,
+    ScreeningSubject,
+    cursor_order_key,
+)
+from genesis.compliance.screener import (
+    ComplianceScreener,
+    ComplianceVerdict,
+    gcf_proposal_text,
+)
 from genesis.compliance.penalties import (
     PenaltyEscalationEngine,
     PenaltySeverity,
@@ -131,6 +148,7 @@ from genesis.legal.rights import RightsEnforcer
 from genesis.legal.rehabilitation import RehabilitationEngine
 from genesis.workflow.orchestrator import WorkflowOrchestrator, WorkflowStatus
 from genesis.governance.assembly import AssemblyEngine, AssemblyTopicStatus
+from genesis.governance.deadlines import DeadlineKind, DeadlineScheduler
 from genesis.governance.org_registry import (
     OrgRegistryEngine,
     OrgVerificationTier,
@@ -138,6 +156,7 @@ from genesis.governance.org_registry import (
 )
 from genesis.governance.domain_expert import (
     ClearanceLevel,
+    DomainClearance,
     DomainClearanceStatus,
     DomainExpertEngine,
 )
@@ -191,15 +210,22 @@ class GenesisService:
         # State is persisted on each mutation and loaded on construction.
     """
 
+    # When True, _persist_state(sections=...) asserts that no section
+    # outside ``sections`` changed. Costs a full comparison per persist.
+    CHECK_DECLARED_SECTIONS = False
+
     def __init__(
         self,
         resolver: PolicyResolver,
         previous_hash: str = GENESIS_PREVIOUS_HASH,
         event_log: Optional[EventLog] = None,
         state_store: Optional[StateStore] = None,
+        anchor_queue: Optional[AnchorQueue] = None,
+        commitment_store: Optional[CommitmentStore] = None,
     ) -> None:
         self._resolver = resolver
         self._trust_engine = TrustEngine(resolver)
+        self._bulk_decay_engine = BulkDecayEngine(resolver)
         self._quality_engine = QualityEngine(resolver)
         self._state_machine = MissionStateMachine(resolver)
         self._reviewer_router = ReviewerRouter(resolver)
@@ -214,6 +240,13 @@ class GenesisService:
         # Persistence layer (optional — in-memory if not provided)
         self._event_log = event_log
         self._state_store = state_store
+        # Store that has had every section staged at least once; until
+        # then a declared-sections persist stages them all.
+        self._fully_staged_store: Optional[StateStore] = None
+
+        # Asynchronous L1 anchoring (optional — close_epoch() enqueues
+        # commitments; collect_anchor_results() records finished anchors)
+        self._anchor_queue = anchor_queue
 
         # Market layer
         self._allocation_engine = AllocationEngine(resolver)
@@ -299,6 +332,8 @@ class GenesisService:
         # Assembly — anonymous deliberation (Phase F-1)
         self._assembly_engine = AssemblyEngine(resolver.assembly_config())
         self._assembly_compliance_salts: dict[str, str] = {}
+        # Checkpoint of the running compliance re-screening job, if any
+        self._rescreen_cursor: Optional[str] = None
 
         # Organisation Registry — coordination structures (Phase F-2)
         self._org_registry_engine = OrgRegistryEngine(
@@ -312,6 +347,11 @@ class GenesisService:
         self._machine_agency_engine = MachineAgencyEngine(
             resolver.machine_agency_config()
         )
+        # machine_id → ((clearance revision, grant revision), domain tiers,
+        # effective tier). An entry is stale once either revision moves.
+        self._machine_tier_cache: dict[
+            str, tuple[tuple[int, int], dict[str, str], str]
+        ] = {}
 
         # Founder dormancy tracking — last cryptographically signed action.
         # Any signed action (login, transaction, governance, proof-of-life
@@ -329,7 +369,7 @@ class GenesisService:
             self._listings, self._bids = state_store.load_listings()
             self._leave_records = state_store.load_leave_records()
             stored_hash, _ = state_store.load_epoch_state()
-            self._epoch_service = EpochService(resolver, stored_hash)
+            self._epoch_service = EpochService(resolver, stored_hash, commitment_store)
             # Restore lifecycle state (First Light, founder dormancy)
             lifecycle = state_store.load_lifecycle_state()
             self._first_light_achieved = lifecycle["first_light_achieved"]
@@ -411,6 +451,7 @@ class GenesisService:
                     resolver.machine_agency_config(),
                     agency_records,
                 )
+            self._rescreen_cursor = state_store.load_compliance_rescreen_cursor()
         else:
             self._roster = ActorRoster()
             self._trust_records: dict[str, TrustRecord] = {}
@@ -420,17 +461,36 @@ class GenesisService:
             self._listings: dict[str, MarketListing] = {}
             self._bids: dict[str, list[Bid]] = {}
             self._leave_records: dict[str, LeaveRecord] = {}
-            self._epoch_service = EpochService(resolver, previous_hash)
+            self._epoch_service = EpochService(resolver, previous_hash, commitment_store)
 
+        # Live per-state counts for status(): the record collections count
+        # their own members, and bids are counted as they are added.
+        self._missions = StateTally(self._missions)
+        self._listings = StateTally(self._listings)
+        self._leave_records = StateTally(self._leave_records)
+        self._bid_count = sum(len(bids) for bids in self._bids.values())
+
+        # Inverted skill/domain index — derived, rebuilt on every start.
+        self._skill_index = SkillIndex.build(
+            self._skill_profiles, self._trust_records,
+        )
         self._selector = ReviewerSelector(
             resolver, self._roster,
             skill_profiles=self._skill_profiles,
             trust_records=self._trust_records,
+            skill_index=self._skill_index,
         )
         # Initialize counter from persisted log to avoid ID collision on restart
         self._event_counter = event_log.count if event_log is not None else 0
         # Leave ID counter: initialise from persisted records
         self._leave_counter = len(self._leave_records)
+        # actor_id → leave_ids of ACTIVE/MEMORIALISED records (trust frozen)
+        self._leave_index: dict[str, set[str]] = {}
+        # Pending time-based deadlines for run_due() — derived, rebuilt here.
+        self._deadlines = DeadlineScheduler()
+        for record in self._leave_records.values():
+            self._index_leave(record)
+        self._load_deadlines()
 
         # Persistence health flag: set to True if a StateStore write fails
         # after an audit event has been durably committed. In-memory state
@@ -438,6 +498,17 @@ class GenesisService:
         # stale and needs operator intervention or event-log replay.
         self._persistence_degraded: bool = False
 
+        # Crash recovery: the StateStore repairs half-written state when it
+        # is opened (atomic commits + journal, no event-log replay). If it
+        # had to fall back to the previous committed generation, state may
+        # trail the audit trail by one commit — flag it for the operator.
+        self._persistence_recovery: tuple[str, ...] = ()
+        if state_store is not None:
+            report = state_store.recovery_report
+            self._persistence_recovery = report.actions
+            if report.restored_from_backup:
+                self._persistence_degraded = True
+
     # ------------------------------------------------------------------
     # Actor management
     # ------------------------------------------------------------------
@@ -538,6 +609,7 @@ class GenesisService:
                 actor_kind=ActorKind.HUMAN,
                 score=initial_trust,
             )
+            self._index_trust(aid, self._trust_records[aid])
 
             # Log registration event
             if self._event_log is not None:
@@ -553,10 +625,13 @@ class GenesisService:
                     pass  # Non-critical — roster update is the primary action
 
             def _rollback() -> None:
-                self._roster._actors.pop(aid, None)
+                self._roster.remove(aid)
                 self._trust_records.pop(aid, None)
+                self._index_trust(aid, None)
 
-            err = self._safe_persist(on_rollback=_rollback)
+            err = self._safe_persist(
+                on_rollback=_rollback, sections=("roster", "trust_records"),
+            )
             if err:
                 return ServiceResult(success=False, errors=[err])
             return ServiceResult(success=True, data={"actor_id": aid})
@@ -667,6 +742,7 @@ class GenesisService:
                 actor_kind=ActorKind.MACHINE,
                 score=initial_trust,
             )
+            self._index_trust(aid, self._trust_records[aid])
 
             # Log machine registration event
             if self._event_log is not None:
@@ -688,10 +764,13 @@ class GenesisService:
                     pass  # Non-critical — roster update is the primary action
 
             def _rollback() -> None:
-                self._roster._actors.pop(aid, None)
+                self._roster.remove(aid)
                 self._trust_records.pop(aid, None)
+                self._index_trust(aid, None)
 
-            err = self._safe_persist(on_rollback=_rollback)
+            err = self._safe_persist(
+                on_rollback=_rollback, sections=("roster", "trust_records"),
+            )
             if err:
                 return ServiceResult(success=False, errors=[err])
             return ServiceResult(success=True, data={"actor_id": aid})
@@ -721,6 +800,7 @@ class GenesisService:
         prev_quarantined = trust.quarantined if trust else None
         if trust:
             trust.quarantined = True
+        self._schedule_deadline(DeadlineKind.MACHINE_DECOMMISSION, actor_id.strip())
 
         def _rollback() -> None:
             entry.status = prev_status
@@ -996,52 +1076,20 @@ class GenesisService:
 
         return ServiceResult(success=True, data={"actor_id": actor_id, "status": "decommissioned"})
 
-    def check_auto_decommission(self) -> ServiceResult:
+    def check_auto_decommission(self, now: Optional[datetime] = None) -> ServiceResult:
         """Auto-decommission machines quarantined with T=0 for too long.
 
         Checks all quarantined machines with trust score 0. If quarantined
         for >= M_ZERO_DECOMMISSION_DAYS, auto-decommissions.
         Should be called periodically (e.g. daily).
         """
-        decomm = self._resolver.decommission_rules()
-        threshold_days = decomm["M_ZERO_DECOMMISSION_DAYS"]
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
         decommissioned: list[str] = []
 
-        for actor_id, trust in list(self._trust_records.items()):
-            if trust.actor_kind != ActorKind.MACHINE:
-                continue
-            if trust.decommissioned:
-                continue
-            if not trust.quarantined or trust.score > 0.0:
-                continue
-
-            entry = self._roster.get(actor_id)
-            if entry is None or entry.status != ActorStatus.QUARANTINED:
-                continue
-
-            # Check how long quarantined — use last_active_utc as proxy
-            quarantine_start = trust.last_active_utc or trust.last_recertification_utc
-            if quarantine_start is None:
-                continue  # No timestamp to judge duration
-
-            if (now - quarantine_start).days >= threshold_days:
-                entry.status = ActorStatus.DECOMMISSIONED
-                trust.decommissioned = True
-                trust.score = 0.0
-
-                err = self._record_actor_lifecycle_event(
-                    actor_id,
-                    EventKind.MACHINE_DECOMMISSIONED,
-                    {
-                        "reason": "auto_decommission_zero_trust",
-                        "quarantine_days": (now - quarantine_start).days,
-                    },
-                )
-                if not err:
-                    decommissioned.append(actor_id)
-                    if entry:
-                        entry.trust_score = 0.0
+        for actor_id in list(self._trust_records):
+            due = self._decommission_deadline(actor_id)
+            if due is not None and now >= due and self._auto_decommission(actor_id, now):
+                decommissioned.append(actor_id)
 
         if decommissioned:
             self._safe_persist(on_rollback=lambda: None)
@@ -1051,6 +1099,55 @@ class GenesisService:
             data={"decommissioned_count": len(decommissioned), "actors": decommissioned},
         )
 
+    def _decommission_deadline(self, actor_id: str) -> Optional[datetime]:
+        """When a quarantined zero-trust machine becomes due for
+        auto-decommission, or None if it is not on that path."""
+        trust = self._trust_records.get(actor_id)
+        if trust is None or trust.actor_kind != ActorKind.MACHINE:
+            return None
+        if trust.decommissioned:
+            return None
+        if not trust.quarantined or trust.score > 0.0:
+            return None
+
+        entry = self._roster.get(actor_id)
+        if entry is None or entry.status != ActorStatus.QUARANTINED:
+            return None
+
+        # Check how long quarantined — use last_active_utc as proxy
+        quarantine_start = trust.last_active_utc or trust.last_recertification_utc
+        if quarantine_start is None:
+            return None  # No timestamp to judge duration
+
+        threshold_days = self._resolver.decommission_rules()["M_ZERO_DECOMMISSION_DAYS"]
+        return quarantine_start + timedelta(days=threshold_days)
+
+    def _auto_decommission(self, actor_id: str, now: datetime) -> bool:
+        """Decommission one machine found due by _decommission_deadline().
+
+        Returns True if the decommission event was recorded.
+        """
+        trust = self._trust_records[actor_id]
+        entry = self._roster.get(actor_id)
+        quarantine_start = trust.last_active_utc or trust.last_recertification_utc
+
+        entry.status = ActorStatus.DECOMMISSIONED
+        trust.decommissioned = True
+        trust.score = 0.0
+
+        err = self._record_actor_lifecycle_event(
+            actor_id,
+            EventKind.MACHINE_DECOMMISSIONED,
+            {
+                "reason": "auto_decommission_zero_trust",
+                "quarantine_days": (now - quarantine_start).days,
+            },
+        )
+        if err:
+            return False
+        entry.trust_score = 0.0
+        return True
+
     # ------------------------------------------------------------------
     # Identity verification lifecycle
     # ------------------------------------------------------------------
@@ -1124,6 +1221,7 @@ class GenesisService:
         entry.identity_verified_utc = now
         entry.identity_expires_utc = now + timedelta(days=expiry_days)
         entry.identity_method = method
+        self._schedule_deadline(DeadlineKind.IDENTITY_EXPIRY, entry.actor_id)
 
         err = self._record_actor_lifecycle_event(
             actor_id,
@@ -1135,6 +1233,7 @@ class GenesisService:
             entry.identity_verified_utc = prev_verified
             entry.identity_expires_utc = prev_expires
             entry.identity_method = prev_method
+            self._schedule_deadline(DeadlineKind.IDENTITY_EXPIRY, entry.actor_id)
             return ServiceResult(success=False, errors=[err])
 
         def _rollback() -> None:
@@ -1142,6 +1241,7 @@ class GenesisService:
             entry.identity_verified_utc = prev_verified
             entry.identity_expires_utc = prev_expires
             entry.identity_method = prev_method
+            self._schedule_deadline(DeadlineKind.IDENTITY_EXPIRY, entry.actor_id)
 
         err = self._safe_persist(on_rollback=_rollback)
         if err:
@@ -1267,6 +1367,41 @@ class GenesisService:
 
         return ServiceResult(success=True, data=result_data)
 
+    def _facilitator_pool(
+        self,
+        actor_id: str,
+        region: Optional[str],
+    ) -> tuple[list[tuple[str, float, str]], dict[str, str]]:
+        """Gather candidate facilitators: ACTIVE, HUMAN, VERIFIED, minted.
+
+        When the verifier requires same-region facilitators, candidates
+        are read from the roster's region bucket rather than the whole
+        roster. Returns (available_verifiers, verifier_orgs).
+        """
+        if region is not None and self._quorum_verifier.region_required:
+            candidates = self._roster.reviewer_bucket("region", region)
+        else:
+            candidates = self._roster.all_actors()
+        available_verifiers: list[tuple[str, float, str]] = []
+        verifier_orgs: dict[str, str] = {}
+        for roster_entry in candidates:
+            if roster_entry.actor_id == actor_id:
+                continue  # Can't verify yourself
+            if roster_entry.status != ActorStatus.ACTIVE:
+                continue
+            if roster_entry.actor_kind != ActorKind.HUMAN:
+                continue
+            if roster_entry.identity_status != IdentityVerificationStatus.VERIFIED:
+                continue
+            trust_rec = self._trust_records.get(roster_entry.actor_id)
+            if not trust_rec or not trust_rec.trust_minted:
+                continue  # Must be trust-minted
+            available_verifiers.append(
+                (roster_entry.actor_id, trust_rec.score, roster_entry.region)
+            )
+            verifier_orgs[roster_entry.actor_id] = roster_entry.organization
+        return available_verifiers, verifier_orgs
+
     def request_quorum_verification(
         self,
         actor_id: str,
@@ -1298,26 +1433,9 @@ class GenesisService:
                 ],
             )
 
-        # Gather eligible verifiers: ACTIVE, HUMAN, VERIFIED, minted
-        available_verifiers: list[tuple[str, float, str]] = []
-        verifier_orgs: dict[str, str] = {}
-        for roster_entry in self._roster.all_actors():
-            if roster_entry.actor_id == actor_id:
-                continue  # Can't verify yourself
-            if roster_entry.status != ActorStatus.ACTIVE:
-                continue
-            if roster_entry.actor_kind != ActorKind.HUMAN:
-                continue
-            if roster_entry.identity_status != IdentityVerificationStatus.VERIFIED:
-                continue
-            trust_rec = self._trust_records.get(roster_entry.actor_id)
-            if not trust_rec or not trust_rec.trust_minted:
-                continue  # Must be trust-minted
-            score = trust_rec.score
-            available_verifiers.append(
-                (roster_entry.actor_id, score, roster_entry.region)
-            )
-            verifier_orgs[roster_entry.actor_id] = roster_entry.organization
+        available_verifiers, verifier_orgs = self._facilitator_pool(
+            actor_id, entry.region,
+        )
 
         try:
             request = self._quorum_verifier.request_quorum_verification(
@@ -1600,26 +1718,10 @@ class GenesisService:
         now: Optional[datetime] = None,
     ) -> ServiceResult:
         """Appeal a rejected facilitated verification. Assigns a DIFFERENT facilitator."""
-        # Gather eligible facilitators (same logic as request_quorum_verification)
-        available_verifiers: list[tuple[str, float, str]] = []
-        verifier_orgs: dict[str, str] = {}
-        for roster_entry in self._roster.all_actors():
-            if roster_entry.actor_id == actor_id:
-                continue
-            if roster_entry.status != ActorStatus.ACTIVE:
-                continue
-            if roster_entry.actor_kind != ActorKind.HUMAN:
-                continue
-            if roster_entry.identity_status != IdentityVerificationStatus.VERIFIED:
-                continue
-            trust_rec = self._trust_records.get(roster_entry.actor_id)
-            if not trust_rec or not trust_rec.trust_minted:
-                continue
-            score = trust_rec.score
-            available_verifiers.append(
-                (roster_entry.actor_id, score, roster_entry.region)
-            )
-            verifier_orgs[roster_entry.actor_id] = roster_entry.organization
+        original = self._quorum_verifier.get_request(original_request_id)
+        available_verifiers, verifier_orgs = self._facilitator_pool(
+            actor_id, original.region_constraint if original else None,
+        )
 
         try:
             request = self._quorum_verifier.request_appeal(
@@ -2086,6 +2188,7 @@ class GenesisService:
 
         # Attach to roster entry for future matching
         actor.skill_profile = profile
+        self._skill_index.index_profile(actor_id, profile)
 
         def _rollback() -> None:
             if old_profile is None:
@@ -2095,6 +2198,9 @@ class GenesisService:
                 old_profile.primary_domains = old_domains  # type: ignore[assignment]
                 old_profile.updated_utc = old_updated
             actor.skill_profile = old_roster_profile
+            self._skill_index.index_profile(
+                actor_id, self._skill_profiles.get(actor_id),
+            )
 
         err = self._safe_persist(on_rollback=_rollback)
         if err:
@@ -2178,6 +2284,7 @@ class GenesisService:
             self._roster,
             self._trust_records,
             self._skill_profiles,
+            skill_index=self._skill_index,
         )
         matches = matcher.find_matches(
             requirements=requirements,
@@ -2254,12 +2361,14 @@ class GenesisService:
 
         if not result.success:
             return ServiceResult(success=False, errors=result.errors)
+        self._skill_index.index_profile(target_id, target_profile)
 
         def _rollback() -> None:
             if old_sp is not None:
                 target_profile.skills[skill_id.canonical] = old_sp
             else:
                 target_profile.skills.pop(skill_id.canonical, None)
+            self._skill_index.index_profile(target_id, target_profile)
 
         err = self._safe_persist(on_rollback=_rollback)
         if err:
@@ -2324,6 +2433,7 @@ class GenesisService:
                 roster_entry = self._roster.get(aid)
                 snapshots[aid] = (profile, roster_entry.skill_profile if roster_entry else None)
                 self._skill_profiles[aid] = new_profile
+                self._skill_index.index_profile(aid, new_profile)
                 # Update roster entry skill profile
                 if roster_entry:
                     roster_entry.skill_profile = new_profile
@@ -2341,6 +2451,7 @@ class GenesisService:
             def _rollback() -> None:
                 for s_aid, (old_prof, old_roster_prof) in snapshots.items():
                     self._skill_profiles[s_aid] = old_prof
+                    self._skill_index.index_profile(s_aid, old_prof)
                     r_entry = self._roster.get(s_aid)
                     if r_entry:
                         r_entry.skill_profile = old_roster_prof
@@ -2384,6 +2495,7 @@ class GenesisService:
         )
 
         if result.skills_updated > 0:
+            self._skill_index.index_profile(worker_id, profile)
             # Update roster entry
             roster_entry = self._roster.get(worker_id)
             if roster_entry:
@@ -2629,14 +2741,16 @@ class GenesisService:
             notes=notes,
         )
         self._bids.setdefault(listing_id, []).append(bid)
+        self._bid_count += 1
 
         # Record bid event
         err = self._record_bid_event(bid)
         if err:
             self._bids[listing_id].pop()
+            self._bid_count -= 1
             return ServiceResult(success=False, errors=[err])
 
-        warning = self._safe_persist_post_audit()
+        warning = self._safe_persist_post_audit(sections=("listings",))
         data: dict[str, Any] = {
             "bid_id": bid_id,
             "listing_id": listing_id,
@@ -2673,7 +2787,7 @@ class GenesisService:
                 def _rollback() -> None:
                     bid.state = prev_state
 
-                err = self._safe_persist(on_rollback=_rollback)
+                err = self._safe_persist(on_rollback=_rollback, sections=("listings",))
                 if err:
                     return ServiceResult(success=False, errors=[err])
                 return ServiceResult(
@@ -2973,7 +3087,7 @@ class GenesisService:
             return ServiceResult(success=False, errors=[err])
 
         # Audit event is now committed — do NOT rollback in-memory state
-        persist_warning = self._safe_persist_post_audit()
+        persist_warning = self._safe_persist_post_audit(sections=("missions",))
         result_data: dict[str, Any] = {
             "mission_id": mission_id, "risk_tier": tier.value,
         }
@@ -3307,6 +3421,7 @@ class GenesisService:
                     )
 
         self._trust_records[actor_id.strip()] = new_record
+        self._index_trust(actor_id.strip(), new_record)
 
         # Update roster trust score
         if roster_entry:
@@ -3320,10 +3435,13 @@ class GenesisService:
             if roster_entry:
                 roster_entry.trust_score = record.score
                 roster_entry.status = prior_roster_status
+            self._index_trust(actor_id.strip(), record)
             return ServiceResult(success=False, errors=[err])
 
         # Audit event committed — do NOT rollback in-memory state
-        persist_warning = self._safe_persist_post_audit()
+        persist_warning = self._safe_persist_post_audit(
+            sections=("trust_records", "roster"),
+        )
 
         result_data: dict[str, Any] = {
             "actor_id": actor_id,
@@ -3384,18 +3502,23 @@ class GenesisService:
         # Snapshot for rollback: {actor_id: (old_record, old_roster_score)}
         snapshots: dict[str, tuple[TrustRecord, float | None]] = {}
 
+        # Skip actors on protected leave — trust is frozen
+        on_leave = {actor_id.strip() for actor_id in self.actors_on_leave()}
+        # One columnar pass; only actors that actually decay come back.
+        decayed = self._bulk_decay_engine.decay(
+            self._trust_records.values(), skip=on_leave,
+        )
+
         for actor_id, record in list(self._trust_records.items()):
-            # Skip actors on protected leave — trust is frozen
-            if self.is_actor_on_leave(actor_id):
-                continue
-            new_record = self._trust_engine.apply_inactivity_decay(record)
-            if new_record is not record:  # identity check — was actually decayed
+            new_record = decayed.get(actor_id)
+            if new_record is not None:
                 roster_entry = self._roster.get(actor_id)
                 snapshots[actor_id] = (
                     record,
                     roster_entry.trust_score if roster_entry else None,
                 )
                 self._trust_records[actor_id] = new_record
+                self._index_trust(actor_id, new_record)
                 # Update roster trust score
                 if roster_entry:
                     roster_entry.trust_score = new_record.score
@@ -3409,6 +3532,7 @@ class GenesisService:
             def _rollback() -> None:
                 for s_aid, (old_rec, old_roster_score) in snapshots.items():
                     self._trust_records[s_aid] = old_rec
+                    self._index_trust(s_aid, old_rec)
                     r_entry = self._roster.get(s_aid)
                     if r_entry and old_roster_score is not None:
                         r_entry.trust_score = old_roster_score
@@ -3425,6 +3549,12 @@ class GenesisService:
             },
         )
 
+    def _index_trust(self, actor_id: str, record: Optional[TrustRecord]) -> None:
+        """Re-file a trust record in the skill index and the deadline
+        scheduler after it is replaced."""
+        self._skill_index.index_trust(actor_id, record)
+        self._schedule_deadline(DeadlineKind.MACHINE_DECOMMISSION, actor_id)
+
     # ------------------------------------------------------------------
     # Protected leave
     # ------------------------------------------------------------------
@@ -3752,6 +3882,7 @@ class GenesisService:
         # Transition
         record.state = LeaveState.RETURNED
         record.returned_utc = now
+        self._index_leave(record)
         if entry:
             # Restore pre-leave status (prevents PROBATION → ACTIVE escalation)
             restored_status = ActorStatus.ACTIVE
@@ -3773,6 +3904,7 @@ class GenesisService:
         if err:
             record.state = LeaveState.ACTIVE
             record.returned_utc = None
+            self._index_leave(record)
             if entry and old_status is not None:
                 entry.status = old_status
             if trust:
@@ -4027,6 +4159,7 @@ class GenesisService:
         record.state = LeaveState.MEMORIALISED
         record.approved_utc = now
         record.memorialised_utc = now
+        self._index_leave(record)
         if entry:
             entry.status = ActorStatus.MEMORIALISED
 
@@ -4082,11 +4215,27 @@ class GenesisService:
         permanent (death). Either way the constitutional guarantee is the
         same — no gain, no loss, decay clock stopped.
         """
-        return any(
-            r.state in (LeaveState.ACTIVE, LeaveState.MEMORIALISED)
-            for r in self._leave_records.values()
-            if r.actor_id == actor_id.strip()
-        )
+        return actor_id.strip() in self._leave_index
+
+    def actors_on_leave(self) -> set[str]:
+        """Return the IDs of all actors with an ACTIVE or MEMORIALISED leave.
+
+        Bulk form of is_actor_on_leave() for sweeps.
+        """
+        return set(self._leave_index)
+
+    def _index_leave(self, record: LeaveRecord) -> None:
+        """Re-file a leave record in the on-leave index and the deadline
+        scheduler after a state change."""
+        self._schedule_deadline(DeadlineKind.LEAVE_EXPIRY, record.leave_id)
+        if record.state in (LeaveState.ACTIVE, LeaveState.MEMORIALISED):
+            self._leave_index.setdefault(record.actor_id, set()).add(record.leave_id)
+            return
+        leave_ids = self._leave_index.get(record.actor_id)
+        if leave_ids is not None:
+            leave_ids.discard(record.leave_id)
+            if not leave_ids:
+                del self._leave_index[record.actor_id]
 
     def get_leave_status(self) -> dict[str, Any]:
         """System-wide leave statistics."""
@@ -4144,6 +4293,7 @@ class GenesisService:
         # Set leave state
         record.state = LeaveState.ACTIVE
         record.approved_utc = now
+        self._index_leave(record)
 
         # Compute expiry if category has duration limit
         record.expires_utc = self._leave_engine.compute_expires_utc(
@@ -4180,6 +4330,7 @@ class GenesisService:
         """Rollback helper for a failed leave activation."""
         actor_id = record.actor_id
         record.state = old_state
+        self._index_leave(record)
         record.approved_utc = old_approved_utc
         record.adjudications = old_adjudications
         # Restore pre-leave status
@@ -4210,6 +4361,7 @@ class GenesisService:
         """Rollback helper for a failed memorialisation."""
         actor_id = record.actor_id
         record.state = old_state
+        self._index_leave(record)
         record.approved_utc = old_approved_utc
         record.memorialised_utc = None
         record.adjudications = old_adjudications
@@ -4272,11 +4424,13 @@ class GenesisService:
         if death_record:
             death_record.state = LeaveState.RESTORED
             death_record.restored_utc = now
+            self._index_leave(death_record)
 
         # Mark the proof-of-life record as approved
         record.state = LeaveState.RESTORED
         record.approved_utc = now
         record.restored_utc = now
+        self._index_leave(record)
 
         # Restore actor status to pre-memorialisation state
         if entry and death_record and death_record.pre_leave_status:
@@ -4314,6 +4468,7 @@ class GenesisService:
         """Rollback helper for a failed restoration."""
         actor_id = record.actor_id
         record.state = old_state
+        self._index_leave(record)
         record.approved_utc = old_approved_utc
         record.restored_utc = None
         record.adjudications = old_adjudications
@@ -4326,6 +4481,7 @@ class GenesisService:
                 if death_record:
                     death_record.state = LeaveState.MEMORIALISED
                     death_record.restored_utc = None
+                    self._index_leave(death_record)
 
             # Restore actor status
             entry = self._roster.get(actor_id)
@@ -4564,6 +4720,9 @@ class GenesisService:
                         mission_id=mission_id,
                     )
                     self._trust_records[report.worker_assessment.worker_id] = new_record
+                    self._index_trust(
+                        report.worker_assessment.worker_id, new_record,
+                    )
                     worker_record = new_record  # chain updates
 
                     # Update roster trust score to reflect new aggregate
@@ -4634,13 +4793,21 @@ class GenesisService:
         beacon_round: int,
         chamber_nonce: Optional[str] = None,
     ) -> ServiceResult:
-        """Close the current epoch and build the commitment record."""
+        """Close the current epoch and build the commitment record.
+
+        With an anchor queue, the commitment is queued only when
+        should_anchor() says L1 anchoring is due (tier cadence, or a
+        constitutional event in the epoch). A skipped commitment is still
+        covered by the next anchored one through the hash chain.
+        """
+        epoch = self._epoch_service.current_epoch
+        constitutional = epoch is not None and epoch.constitutional_events_pending
         try:
             record = self._epoch_service.close_epoch(
                 beacon_round=beacon_round,
                 chamber_nonce=chamber_nonce,
             )
-            warning = self._safe_persist_post_audit()
+            warning = self._safe_persist_post_audit(sections=("epoch_state",))
             data: dict[str, Any] = {
                 "epoch_id": record.epoch_id,
                 "previous_hash": self._epoch_service.previous_hash,
@@ -4648,9 +4815,38 @@ class GenesisService:
             }
             if warning:
                 data["warning"] = warning
+            # Anchoring never blocks epoch close: the commitment is only
+            # journaled here and anchored by the queue's worker.
+            if self._anchor_queue is not None:
+                tier = self._epoch_service.resolve_commitment_tier(
+                    self._roster.human_count,
+                )
+                if self.should_anchor(
+                    tier, self._anchor_queue.hours_since_last_enqueue(),
+                    constitutional,
+                ):
+                    try:
+                        data["anchor_queued"] = self._epoch_service.queue_anchor(
+                            record, self._anchor_queue,
+                        )
+                    except OSError as e:
+                        data["anchor_warning"] = f"Commitment not queued for anchoring: {e}"
+                else:
+                    data["anchor_deferred"] = True
+            # One event log segment per epoch. Sealing is an optimisation
+            # of later reads, so a failure is reported but not fatal.
+            if self._event_log is not None:
+                try:
+                    self._event_log.roll_segment()
+                except OSError as e:
+                    data["segment_warning"] = f"Event log segment not sealed: {e}"
             return ServiceResult(success=True, data=data)
         except RuntimeError as e:
             return ServiceResult(success=False, errors=[str(e)])
+        except (OSError, ValueError) as e:
+            return ServiceResult(
+                success=False, errors=[f"Commitment store failure: {e}"],
+            )
 
     def should_anchor(
         self,
@@ -4727,12 +4923,143 @@ class GenesisService:
         warnings: list[str] = []
         if event_warning:
             warnings.append(event_warning)
+        if self._epoch_service.unsaved_anchor_count:
+            warnings.append(
+                "Anchor not yet written to the commitment store; "
+                "it will be retried on the next store write."
+            )
         if warning:
             warnings.append(str(warning))
         if warnings:
             data["warning"] = " | ".join(warnings)
         return ServiceResult(success=True, data=data)
 
+    def collect_anchor_results(self) -> ServiceResult:
+        """Record anchors the anchor queue has finished since the last call.
+
+        Emits one COMMITMENT_ANCHORED event per epoch commitment — payload
+        as in anchor_commitment(), plus the batch_id and merkle_root the
+        commitment was anchored under — then marks the batches collected.
+        A batch's events are appended all-or-nothing; on failure the batch
+        stays uncollected and is retried by the next call. The queue's
+        journal is then compacted down to what is still outstanding.
+
+        Can be passed to AnchorQueue.start(on_anchored=...) so results
+        are collected as the worker anchors them.
+        """
+        if self._anchor_queue is None:
+            return ServiceResult(
+                success=False, errors=["No anchor queue configured"],
+            )
+
+        collected: list[str] = []
+        errors: list[str] = []
+        for batch in self._anchor_queue.uncollected_batches():
+            anchor = batch.anchor
+            events = [
+                EventRecord.create(
+                    event_id=self._next_event_id(),
+                    event_kind=EventKind.COMMITMENT_ANCHORED,
+                    actor_id="system",
+                    payload={
+                        "tx_hash": anchor.tx_hash,
+                        "block_number": anchor.block_number,
+                        "chain_id": anchor.chain_id,
+                        "explorer_url": anchor.explorer_url,
+                        "sha256_hash": anchor.sha256_hash,
+                        "document_path": anchor.document_path,
+                        "epoch_id": epoch_id,
+                        "commitment_hash": commitment_hash,
+                        "batch_id": batch.batch_id,
+                        "merkle_root": batch.merkle_root,
+                        "batch_size": len(batch.commitment_hashes),
+                    },
+                )
+                for epoch_id, commitment_hash in zip(
+                    batch.epoch_ids, batch.commitment_hashes,
+                )
+            ]
+            if self._event_log is not None:
+                try:
+                    self._event_log.append_many(events)
+                except (ValueError, OSError) as e:
+                    errors.append(f"{batch.batch_id}: event log failure: {e}")
+                    break
+            self._epoch_service.record_anchor(anchor)
+            collected.append(batch.batch_id)
+
+        data: dict[str, Any] = {"collected_batches": collected}
+        if collected:
+            try:
+                self._anchor_queue.mark_collected(collected)
+                # Collected batches live on in the event log and epoch
+                # service; drop them so the queue stays the size of its
+                # backlog.
+                self._anchor_queue.compact()
+            except OSError as e:
+                # Events are recorded; the batches will be offered again.
+                errors.append(f"Anchor queue not updated: {e}")
+        warning = self._safe_persist_post_audit()
+        if warning:
+            data["warning"] = warning
+        data["pending"] = len(self._anchor_queue.pending())
+        data["failed"] = len(self._anchor_queue.failed())
+        return ServiceResult(success=not errors, data=data, errors=errors)
+
+    def event_inclusion_proof(
+        self,
+        event_ref: str,
+        epoch_id: Optional[str] = None,
+    ) -> ServiceResult:
+        """Inclusion proof of an event in a closed epoch's commitment.
+
+        ``event_ref`` is the committed event hash ("sha256:...") or an
+        event_id from the event log. Proofs are served from the
+        commitment store in O(log n) reads, for any past epoch.
+        """
+        store = self._epoch_service.commitment_store
+        if store is None:
+            return ServiceResult(
+                success=False, errors=["No commitment store configured"],
+            )
+
+        candidates = [event_ref]
+        if not event_ref.startswith("sha256:"):
+            event = self._event_log.get_event(event_ref) if self._event_log else None
+            if event is None:
+                return ServiceResult(
+                    success=False, errors=[f"Event not found: {event_ref}"],
+                )
+            # Mission transitions commit the hash carried in their payload.
+            candidates = [
+                h for h in (event.payload.get("event_hash"), event.event_hash) if h
+            ]
+
+        for leaf_hash in candidates:
+            found = store.inclusion_proof(leaf_hash, epoch_id)
+            if found is not None:
+                break
+        else:
+            return ServiceResult(
+                success=False,
+                errors=[f"Event is not in a committed epoch: {event_ref}"],
+            )
+
+        proof = found.proof
+        return ServiceResult(success=True, data={
+            "epoch_id": found.epoch_id,
+            "domain": found.domain,
+            "leaf_hash": proof.leaf_hash,
+            "path": [
+                {"sibling": sibling, "position": position}
+                for sibling, position in proof.path
+            ],
+            "root": proof.root,
+            "verified": verify_inclusion(proof),
+            "commitment_hash": found.commitment_hash,
+            "commitment": asdict(found.record),
+        })
+
     # ------------------------------------------------------------------
     # Founder's veto — pre-sustainability constitutional guardian
     # ------------------------------------------------------------------
@@ -5102,7 +5429,7 @@ class GenesisService:
                 errors=["No founder designated — call set_founder() first"],
             )
         self._founder_last_action_utc = datetime.now(timezone.utc)
-        warning = self._safe_persist_post_audit()
+        warning = self._safe_persist_post_audit(sections=("lifecycle_state",))
         data: dict[str, Any] = {
             "founder_id": self._founder_id,
             "last_action_utc": self._founder_last_action_utc.isoformat(),
@@ -5190,35 +5517,16 @@ class GenesisService:
                 errors=[f"Mission {mission_id} not APPROVED (state: {mission.state.value})"],
             )
 
-        # Determine worker actor kind and tier for equilibrium calculation
-        worker_actor_kind = None
-        machine_tier = 0
-        tier3_recognized = False
-        mission_domain = "general"
-
-        if mission.worker_id:
-            worker_entry = self._roster.get(mission.worker_id)
-            if worker_entry is not None:
-                worker_actor_kind = worker_entry.actor_kind
-                if worker_actor_kind == ActorKind.MACHINE:
-                    # Compute machine tier for equilibrium
-                    tier_result = self.compute_machine_tier(mission.worker_id)
-                    if tier_result.success and tier_result.data:
-                        effective = tier_result.data.get("effective_tier", "tier_0")
-                        tier_map = {"tier_0": 0, "tier_1": 1, "tier_2": 2,
-                                    "tier_3": 3, "tier_4": 4}
-                        machine_tier = tier_map.get(effective, 0)
-                        tier3_recognized = machine_tier >= 3
-
+        terms = self._payout_terms(mission, mission_reward, {})
         engine = CommissionEngine(self._resolver)
         breakdown = engine.compute_commission(
             mission_reward=mission_reward,
             ledger=ledger,
             reserve=reserve,
-            worker_actor_kind=worker_actor_kind,
-            machine_tier=machine_tier,
-            mission_domain=mission_domain,
-            tier3_recognized=tier3_recognized,
+            worker_actor_kind=terms.worker_actor_kind,
+            machine_tier=terms.machine_tier,
+            mission_domain=terms.mission_domain,
+            tier3_recognized=terms.tier3_recognized,
         )
 
         # Wire: record both-sides creator allocation event in the audit trail
@@ -5263,7 +5571,196 @@ class GenesisService:
                 except (ValueError, OSError, RuntimeError):
                     pass  # Best-effort for audit trail
 
+        data = self._payment_data(mission_id, breakdown, gcf_recorded)
+        return ServiceResult(success=True, data=data)
+
+    def settle_missions(
+        self,
+        batch: list[tuple[str, "Decimal"]],
+        ledger: "OperationalLedger",
+        reserve: "ReserveFundState",
+        now: Optional[datetime] = None,
+    ) -> ServiceResult:
+        """Settle payment for a batch of approved missions at once.
+
+        ``batch`` is a list of (mission_id, mission_reward) pairs. Each
+        mission gets the breakdown process_mission_payment() would give
+        it at ``now``, but the commission window and policy are resolved
+        once for the batch and each machine worker's tier is computed
+        once. All creator allocation and GCF contribution events are
+        appended as one batch, and state is persisted once at the end.
+
+        The batch is all-or-nothing: if any mission is unknown, not
+        APPROVED or listed twice, or the events cannot be recorded,
+        nothing is settled.
+        """
+        from decimal import Decimal
+        from genesis.compensation.engine import CommissionEngine
+
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        errors: list[str] = []
+        seen: set[str] = set()
+        for mission_id, _ in batch:
+            mission = self._missions.get(mission_id)
+            if mission_id in seen:
+                errors.append(f"Mission listed twice in batch: {mission_id}")
+            elif mission is None:
+                errors.append(f"Mission not found: {mission_id}")
+            elif mission.state != MissionState.APPROVED:
+                errors.append(
+                    f"Mission {mission_id} not APPROVED (state: {mission.state.value})"
+                )
+            seen.add(mission_id)
+        if errors:
+            return ServiceResult(success=False, errors=errors)
+
+        tiers: dict[str, tuple[int, bool]] = {}
+        payouts = [
+            self._payout_terms(self._missions[mission_id], reward, tiers)
+            for mission_id, reward in batch
+        ]
+        breakdowns = CommissionEngine(self._resolver).compute_commissions(
+            payouts, ledger, reserve, now=now,
+        )
+
+        # Build every audit event first; nothing is mutated until the
+        # whole batch is durably appended.
+        params = self._resolver.commission_params()
+        worker_side_rate = str(params.get("creator_allocation_rate", Decimal("0")))
+        employer_side_rate = str(params.get("employer_creator_fee_rate", Decimal("0")))
+        gcf_active = self._gcf_tracker.is_active
+        gcf_balance = self._gcf_tracker.get_state().balance
+        events: list[EventRecord] = []
+        contributions: list[tuple[str, Decimal]] = []
+        for (mission_id, reward), breakdown in zip(batch, breakdowns):
+            if breakdown.total_creator_income > Decimal("0"):
+                events.append(EventRecord.create(
+                    event_id=self._next_event_id(),
+                    event_kind=EventKind.CREATOR_ALLOCATION_DISBURSED,
+                    actor_id="founder",
+                    payload={
+                        "mission_id": mission_id,
+                        "worker_side_allocation": str(breakdown.creator_allocation),
+                        "employer_side_fee": str(breakdown.employer_creator_fee),
+                        "total_creator_income": str(breakdown.total_creator_income),
+                        "mission_reward": str(reward),
+                        "worker_id": self._missions[mission_id].worker_id or "unknown",
+                        "worker_side_rate": worker_side_rate,
+                        "employer_side_rate": employer_side_rate,
+                    },
+                ))
+            if gcf_active and breakdown.gcf_contribution > Decimal("0"):
+                gcf_balance += breakdown.gcf_contribution
+                contributions.append((mission_id, breakdown.gcf_contribution))
+                events.append(EventRecord.create(
+                    event_id=self._next_event_id(),
+                    event_kind=EventKind.GCF_CONTRIBUTION_RECORDED,
+                    actor_id="system",
+                    payload={
+                        "mission_id": mission_id,
+                        "gcf_contribution": str(breakdown.gcf_contribution),
+                        "gcf_balance": str(gcf_balance),
+                        "mission_reward": str(reward),
+                    },
+                ))
+
+        # As in the single-payment path, audit events (and the open epoch
+        # they are committed to) are only required when an event log is wired.
+        if events and self._event_log is not None:
+            epoch = self._epoch_service.current_epoch
+            if epoch is None or epoch.closed:
+                return ServiceResult(
+                    success=False,
+                    errors=["Audit-trail failure (no epoch open): No open epoch — call open_epoch() first."],
+                )
+            try:
+                self._event_log.append_many(events)
+            except (ValueError, OSError) as e:
+                return ServiceResult(
+                    success=False, errors=[f"Event log failure: {e}"],
+                )
+            for event in events:
+                self._epoch_service.record_mission_event(event.event_hash)
+
+        for mission_id, amount in contributions:
+            self._gcf_tracker.record_contribution(
+                amount=amount, mission_id=mission_id, now=now,
+            )
+        gcf_missions = {mission_id for mission_id, _ in contributions}
+
+        warning = self._safe_persist_post_audit()
         data: dict[str, Any] = {
+            "settled": [
+                self._payment_data(mission_id, breakdown, mission_id in gcf_missions)
+                for (mission_id, _), breakdown in zip(batch, breakdowns)
+            ],
+            "settled_count": len(batch),
+            "events_recorded": len(events),
+            "total_mission_reward": str(sum(
+                (b.mission_reward for b in breakdowns), Decimal("0"),
+            )),
+            "total_commission": str(sum(
+                (b.commission_amount for b in breakdowns), Decimal("0"),
+            )),
+            "total_gcf_contribution": str(sum(
+                (amount for _, amount in contributions), Decimal("0"),
+            )),
+        }
+        if warning:
+            data["warning"] = warning
+        return ServiceResult(success=True, data=data)
+
+    def _payout_terms(
+        self,
+        mission: Mission,
+        mission_reward: "Decimal",
+        tiers: dict[str, tuple[int, bool]],
+    ) -> "PayoutTerms":
+        """Commission inputs for a mission's worker.
+
+        Machine tiers are memoised in ``tiers`` (worker_id -> (tier,
+        tier3_recognized)) so that a batch computes each one once.
+        """
+        from genesis.models.compensation import PayoutTerms
+
+        worker_actor_kind = None
+        machine_tier = 0
+        tier3_recognized = False
+
+        if mission.worker_id:
+            worker_entry = self._roster.get(mission.worker_id)
+            if worker_entry is not None:
+                worker_actor_kind = worker_entry.actor_kind
+                if worker_actor_kind == ActorKind.MACHINE:
+                    if mission.worker_id not in tiers:
+                        # Compute machine tier for equilibrium
+                        tier = 0
+                        tier_result = self.compute_machine_tier(mission.worker_id)
+                        if tier_result.success and tier_result.data:
+                            effective = tier_result.data.get("effective_tier", "tier_0")
+                            tier_map = {"tier_0": 0, "tier_1": 1, "tier_2": 2,
+                                        "tier_3": 3, "tier_4": 4}
+                            tier = tier_map.get(effective, 0)
+                        tiers[mission.worker_id] = (tier, tier >= 3)
+                    machine_tier, tier3_recognized = tiers[mission.worker_id]
+
+        return PayoutTerms(
+            mission_reward=mission_reward,
+            worker_actor_kind=worker_actor_kind,
+            machine_tier=machine_tier,
+            mission_domain="general",
+            tier3_recognized=tier3_recognized,
+        )
+
+    @staticmethod
+    def _payment_data(
+        mission_id: str,
+        breakdown: "CommissionBreakdown",
+        gcf_recorded: bool,
+    ) -> dict[str, Any]:
+        return {
             "mission_id": mission_id,
             "commission_rate": str(breakdown.rate),
             "commission_amount": str(breakdown.commission_amount),
@@ -5271,12 +5768,11 @@ class GenesisService:
             "employer_creator_fee": str(breakdown.employer_creator_fee),
             "total_creator_income": str(breakdown.total_creator_income),
             "worker_payout": str(breakdown.worker_payout),
-            "mission_reward": str(mission_reward),
+            "mission_reward": str(breakdown.mission_reward),
             "total_escrow": str(breakdown.total_escrow),
             "gcf_contribution": str(breakdown.gcf_contribution),
             "gcf_recorded": gcf_recorded,
         }
-        return ServiceResult(success=True, data=data)
 
     def periodic_first_light_check(
         self,
@@ -5305,6 +5801,174 @@ class GenesisService:
             commission_rate=commission_rate,
         )
 
+    # ------------------------------------------------------------------
+    # Deadline scheduler — periodic sweeps
+    # ------------------------------------------------------------------
+
+    def run_due(self, now: Optional[datetime] = None) -> ServiceResult:
+        """Run every time-based governance deadline that has fallen due.
+
+        Single entry point for the periodic sweeps: identity lapse,
+        zero-trust machine decommission, leave expiry, suspension expiry,
+        visibility lapse, G0 ratification deadline, Assembly topic archival
+        and clearance expiry. Only scheduled entries due at ``now`` are
+        touched; each is re-checked against current state and then handled
+        exactly as the corresponding check_* / sweep method would.
+
+        Entries whose deadline moved later are re-filed; entries whose
+        handler failed stay scheduled and are retried on the next run.
+        """
+        now = now or datetime.now(timezone.utc)
+        handled: dict[str, list[str]] = {kind.value: [] for kind in DeadlineKind}
+        errors: list[str] = []
+        mutated = False
+
+        due_entries = self._deadlines.pop_due(now)
+        for kind, key, _ in due_entries:
+            due = self._deadline_for(kind, key)
+            if due is None or not self._deadline_passed(kind, due, now):
+                continue  # Obsolete or moved later — re-filed below
+            done, err = self._run_deadline(kind, key, now)
+            if err:
+                errors.append(err)
+            if done:
+                handled[kind.value].append(key)
+                mutated = mutated or kind not in (
+                    DeadlineKind.IDENTITY_EXPIRY,  # persisted by lapse_verification
+                    DeadlineKind.LEAVE_EXPIRY,  # persisted by return_from_leave
+                )
+
+        for kind, key, _ in due_entries:
+            self._schedule_deadline(kind, key)
+
+        if mutated:
+            self._safe_persist_post_audit()
+
+        next_due = self._deadlines.next_due()
+        return ServiceResult(
+            success=len(errors) == 0,
+            errors=errors,
+            data={
+                "handled": handled,
+                "handled_count": sum(len(keys) for keys in handled.values()),
+                "next_due_utc": next_due.isoformat() if next_due else None,
+            },
+        )
+
+    def _run_deadline(
+        self,
+        kind: DeadlineKind,
+        key: str,
+        now: datetime,
+    ) -> tuple[bool, Optional[str]]:
+        """Handle one due deadline. Returns (handled, error)."""
+        if kind == DeadlineKind.IDENTITY_EXPIRY:
+            return self.lapse_verification(key).success, None
+        if kind == DeadlineKind.MACHINE_DECOMMISSION:
+            return self._auto_decommission(key, now), None
+        if kind == DeadlineKind.LEAVE_EXPIRY:
+            result = self.return_from_leave(key)
+            return result.success, "; ".join(result.errors) or None
+        if kind == DeadlineKind.SUSPENSION_EXPIRY:
+            return self.check_suspension_expiry(key, now).data.get("expired", False), None
+        if kind == DeadlineKind.VISIBILITY_EXPIRY:
+            err = self._lapse_visibility(key)
+            if err is not None:
+                return False, f"Audit-trail failure for workflow {key}: {err}"
+            return True, None
+        if kind == DeadlineKind.RATIFICATION_DEADLINE:
+            if not self._g0_ratification_engine.lapse_if_undecided(key, now):
+                return False, None
+            self._record_g0_lapses([key], now)
+            return True, None
+        if kind == DeadlineKind.TOPIC_INACTIVITY:
+            if not self._assembly_engine.archive_if_inactive(key, now):
+                return False, None
+            self._record_topic_archived(key)
+            return True, None
+        clearance = self._domain_expert_engine.expire_if_due(key, now)
+        if clearance is None:
+            return False, None
+        self._record_clearance_expired(clearance)
+        return True, None
+
+    def _deadline_for(self, kind: DeadlineKind, key: str) -> Optional[datetime]:
+        """Compute the current deadline for (kind, key) from canonical state.
+
+        Returns None when the object no longer has a pending deadline.
+        """
+        if kind == DeadlineKind.IDENTITY_EXPIRY:
+            entry = self._roster.get(key)
+            if entry is None or entry.identity_status != IdentityVerificationStatus.VERIFIED:
+                return None
+            return entry.identity_expires_utc
+        if kind == DeadlineKind.MACHINE_DECOMMISSION:
+            return self._decommission_deadline(key)
+        if kind == DeadlineKind.LEAVE_EXPIRY:
+            record = self._leave_records.get(key)
+            if record is None or record.state != LeaveState.ACTIVE:
+                return None
+            return record.expires_utc
+        if kind == DeadlineKind.SUSPENSION_EXPIRY:
+            entry = self._roster.get(key)
+            if entry is None or entry.status != ActorStatus.SUSPENDED:
+                return None
+            return self._suspended_until.get(key)
+        if kind == DeadlineKind.VISIBILITY_EXPIRY:
+            return self._visibility_deadline(key)
+        if kind == DeadlineKind.RATIFICATION_DEADLINE:
+            if self._g0_ratification_engine is None:
+                return None
+            return self._g0_ratification_engine.item_deadline(key)
+        if kind == DeadlineKind.TOPIC_INACTIVITY:
+            return self._assembly_engine.inactivity_deadline(key)
+        clearance = self._domain_expert_engine.get_clearance(key)
+        if clearance is None or clearance.status != DomainClearanceStatus.ACTIVE:
+            return None
+        return clearance.expires_utc
+
+    @staticmethod
+    def _deadline_passed(kind: DeadlineKind, due: datetime, now: datetime) -> bool:
+        # Identity and leave expiry are strict (now > expires), matching
+        # check_lapsed_identities() and LeaveAdjudicationEngine.
+        if kind in (DeadlineKind.IDENTITY_EXPIRY, DeadlineKind.LEAVE_EXPIRY):
+            return now > due
+        return now >= due
+
+    def _schedule_deadline(self, kind: DeadlineKind, key: str) -> None:
+        """Re-file (kind, key) in the scheduler from current state.
+
+        Called wherever a deadline is created or brought forward; entries
+        that become obsolete or move later are corrected lazily by
+        run_due().
+        """
+        due = self._deadline_for(kind, key)
+        if due is None:
+            self._deadlines.cancel(kind, key)
+        else:
+            self._deadlines.schedule(kind, key, due)
+
+    def _load_deadlines(self) -> None:
+        """Rebuild the deadline scheduler from canonical state."""
+        self._deadlines.clear()
+        for entry in self._roster.all_actors():
+            self._schedule_deadline(DeadlineKind.IDENTITY_EXPIRY, entry.actor_id)
+        for actor_id in self._trust_records:
+            self._schedule_deadline(DeadlineKind.MACHINE_DECOMMISSION, actor_id)
+        for leave_id in self._leave_records:
+            self._schedule_deadline(DeadlineKind.LEAVE_EXPIRY, leave_id)
+        for actor_id in self._suspended_until:
+            self._schedule_deadline(DeadlineKind.SUSPENSION_EXPIRY, actor_id)
+        for wf_id in self._workflow_orchestrator._workflows:
+            self._schedule_deadline(DeadlineKind.VISIBILITY_EXPIRY, wf_id)
+        if self._g0_ratification_engine is not None:
+            for item in self._g0_ratification_engine.list_pending():
+                self._schedule_deadline(DeadlineKind.RATIFICATION_DEADLINE, item.item_id)
+        for topic in self._assembly_engine.list_topics(AssemblyTopicStatus.ACTIVE):
+            self._schedule_deadline(DeadlineKind.TOPIC_INACTIVITY, topic.topic_id)
+        for clearance in self._domain_expert_engine.get_active_clearances():
+            self._schedule_deadline(DeadlineKind.CLEARANCE_EXPIRY, clearance.clearance_id)
+
     # ------------------------------------------------------------------
     # Status and queries
     # ------------------------------------------------------------------
@@ -5383,22 +6047,15 @@ class GenesisService:
             },
             "market": {
                 "total_listings": len(self._listings),
-                "open_listings": sum(
-                    1 for l in self._listings.values()
-                    if l.state in (ListingState.OPEN, ListingState.ACCEPTING_BIDS)
+                "open_listings": self._listings.count(
+                    ListingState.OPEN, ListingState.ACCEPTING_BIDS,
                 ),
-                "total_bids": sum(len(b) for b in self._bids.values()),
+                "total_bids": self._bid_count,
             },
             "leave": {
                 "total_records": len(self._leave_records),
-                "active_leaves": sum(
-                    1 for r in self._leave_records.values()
-                    if r.state == LeaveState.ACTIVE
-                ),
-                "pending_requests": sum(
-                    1 for r in self._leave_records.values()
-                    if r.state == LeaveState.PENDING
-                ),
+                "active_leaves": self._leave_records.count(LeaveState.ACTIVE),
+                "pending_requests": self._leave_records.count(LeaveState.PENDING),
             },
             "epochs": {
                 "committed": len(self._epoch_service.committed_records),
@@ -5421,8 +6078,38 @@ class GenesisService:
                 ),
             },
             "persistence_degraded": self._persistence_degraded,
+            "persistence_recovery": list(self._persistence_recovery),
         }
 
+    def verify_status_counters(self) -> ServiceResult:
+        """Check the counters behind status() against a full scan.
+
+        Consistency-check mode for tests and diagnostics: O(n), unlike
+        status() itself. Each mismatch is reported as an error.
+        """
+        errors: list[str] = []
+
+        def compare(name: str, live: Any, scanned: Any) -> None:
+            if live != scanned:
+                errors.append(f"{name}: counter {live!r} != scan {scanned!r}")
+
+        actors = self._roster.all_actors()
+        compare("actors.active", self._roster.active_count,
+                sum(1 for a in actors if a.is_available()))
+        compare("actors.humans", self._roster.human_count, sum(
+            1 for a in actors
+            if a.actor_kind == ActorKind.HUMAN and a.is_available()
+        ))
+        for name, tally in (
+            ("missions", self._missions),
+            ("listings", self._listings),
+            ("leave", self._leave_records),
+        ):
+            compare(f"{name}.by_state", tally.counts(), scan_counts(tally.values()))
+        compare("market.total_bids", self._bid_count,
+                sum(len(b) for b in self._bids.values()))
+        return ServiceResult(success=not errors, errors=errors)
+
     def recent_events(
         self,
         limit: int = 120,
@@ -5783,66 +6470,171 @@ class GenesisService:
         self._epoch_service.record_mission_event(event_hash)
         return None
 
-    def _persist_state(self) -> None:
+    def _record_actor_lifecycle_events(
+        self,
+        actor_id: str,
+        event_kind: EventKind,
+        payloads: list[tuple[str, dict[str, Any]]],
+    ) -> Optional[str]:
+        """Record many lifecycle events as one durable batch.
+
+        payloads is a list of (subject, payload) pairs; the subject makes
+        each event hash unique within the batch. Either every event is
+        appended and recorded in the epoch, or none is. Returns error
+        string or None.
+        """
+        epoch = self._epoch_service.current_epoch
+        if epoch is None or epoch.closed:
+            return "Audit-trail failure (no epoch open): No open epoch — call open_epoch() first."
+
+        stamp = datetime.now(timezone.utc).isoformat()
+        hashes = [
+            "sha256:" + hashlib.sha256(
+                f"{actor_id}:{event_kind.value}:{subject}:{stamp}".encode()
+            ).hexdigest()
+            for subject, _ in payloads
+        ]
+
+        if self._event_log is not None:
+            try:
+                events = [
+                    EventRecord.create(
+                        event_id=self._next_event_id(),
+                        event_kind=event_kind,
+                        actor_id=actor_id,
+                        payload={**payload, "event_hash": event_hash},
+                    )
+                    for (_, payload), event_hash in zip(payloads, hashes)
+                ]
+                self._event_log.append_many(events)
+            except (ValueError, OSError) as e:
+                return f"Event log failure: {e}"
+
+        for event_hash in hashes:
+            self._epoch_service.record_mission_event(event_hash)
+        return None
+
+    def _persist_state(self, sections: Optional[tuple[str, ...]] = None) -> None:
         """Persist current state to the state store (if wired).
 
+        ``sections`` names the state sections the caller mutated (keys of
+        _state_section_writers(), e.g. ("roster", "trust_records")). They
+        are staged with StateStore.batch(assume_changed=True), so each is
+        encoded once, when written, without a comparison pass. None
+        stages every section and writes only those whose encoding
+        changed, which is always correct. Every section is also staged
+        on the first persist to a store, which may lack sections this
+        service holds, and when the store still holds sections from a
+        failed flush, because the caller may have rolled back the state
+        they were staged from.
+
+        A caller may only name sections if nothing else changed since
+        the last persist. With CHECK_DECLARED_SECTIONS set (the test
+        suite sets it), the remaining sections are staged too and an
+        AssertionError names any that changed.
+
         NOTE: This method can raise OSError. High-impact mutators
         should use _safe_persist() instead for fail-closed behavior.
         """
-        if self._state_store is None:
+        store = self._state_store
+        if store is None:
             return
-        self._state_store.save_roster(self._roster)
-        self._state_store.save_trust_records(self._trust_records)
-        self._state_store.save_missions(self._missions)
-        self._state_store.save_reviewer_histories(self._reviewer_assessment_history)
-        self._state_store.save_skill_profiles(self._skill_profiles)
-        self._state_store.save_listings(self._listings, self._bids)
-        self._state_store.save_leave_records(self._leave_records)
-        self._state_store.save_epoch_state(
-            self._epoch_service.previous_hash,
-            len(self._epoch_service.committed_records),
-        )
-        self._state_store.save_lifecycle_state(
-            self._first_light_achieved,
-            self._founder_id,
-            self._founder_last_action_utc,
-        )
-        self._state_store.save_gcf(self._gcf_tracker.to_dict())
-        self._state_store.save_escrows(self._escrow_manager._escrows)
-        self._state_store.save_workflows(self._workflow_orchestrator._workflows)
-        self._state_store.save_disbursements(
-            self._disbursement_engine._proposals,
-            self._disbursement_engine._votes,
-        )
-        self._state_store.save_amendments(
-            self._amendment_engine._proposals,
-        )
+        writers = self._state_section_writers()
+        if (
+            sections is None
+            or store.dirty_sections
+            or self._fully_staged_store is not store
+        ):
+            with store.batch():
+                for write in writers.values():
+                    write()
+            self._fully_staged_store = store
+            return
+        with store.batch():
+            with store.batch(assume_changed=True):
+                for section in sections:
+                    writers[section]()
+            if self.CHECK_DECLARED_SECTIONS:
+                declared = store.dirty_sections
+                for section, write in writers.items():
+                    if section not in sections:
+                        write()
+                undeclared = store.dirty_sections - declared
+                assert not undeclared, (
+                    f"_persist_state{sections} left changed sections "
+                    f"undeclared: {sorted(undeclared)}"
+                )
+
+    def _state_section_writers(self) -> dict[str, Callable[[], None]]:
+        """Save callables per state section, in full-persist order."""
+        store = self._state_store
+        assert store is not None
+        return {
+            "roster": lambda: store.save_roster(self._roster),
+            "trust_records": lambda: store.save_trust_records(self._trust_records),
+            "missions": lambda: store.save_missions(self._missions),
+            "reviewer_histories": lambda: store.save_reviewer_histories(
+                self._reviewer_assessment_history,
+            ),
+            "skill_profiles": lambda: store.save_skill_profiles(self._skill_profiles),
+            "listings": lambda: store.save_listings(self._listings, self._bids),
+            "leave_records": lambda: store.save_leave_records(self._leave_records),
+            "epoch_state": lambda: store.save_epoch_state(
+                self._epoch_service.previous_hash,
+                len(self._epoch_service.committed_records),
+            ),
+            "lifecycle_state": lambda: store.save_lifecycle_state(
+                self._first_light_achieved,
+                self._founder_id,
+                self._founder_last_action_utc,
+            ),
+            "gcf": lambda: store.save_gcf(self._gcf_tracker.to_dict()),
+            "escrows": lambda: store.save_escrows(self._escrow_manager._escrows),
+            "workflows": lambda: store.save_workflows(
+                self._workflow_orchestrator._workflows,
+            ),
+            "disbursements": lambda: store.save_disbursements(
+                self._disbursement_engine._proposals,
+                self._disbursement_engine._votes,
+            ),
+            "amendments": lambda: store.save_amendments(
+                self._amendment_engine._proposals,
+            ),
+            "ratification_items": self._save_ratification_items,
+            # Assembly (Phase F-1)
+            "assembly_topics": lambda: store.save_assembly_topics(
+                self._assembly_engine.to_records(),
+            ),
+            "assembly_compliance_salts": lambda: store.save_assembly_compliance_salts(
+                self._assembly_compliance_salts,
+            ),
+            # Organisation Registry (Phase F-2)
+            "org_registry": lambda: store.save_org_registry(
+                self._org_registry_engine.to_records(),
+            ),
+            # Domain Expert / Machine Clearance (Phase F-3)
+            "domain_clearances": lambda: store.save_domain_clearances(
+                self._domain_expert_engine.to_records(),
+            ),
+            "machine_agency": lambda: store.save_machine_agency(
+                self._machine_agency_engine.to_records(),
+            ),
+            "compliance_rescreen": lambda: store.save_compliance_rescreen_cursor(
+                self._rescreen_cursor,
+            ),
+        }
+
+    def _save_ratification_items(self) -> None:
+        assert self._state_store is not None
         if self._g0_ratification_engine is not None:
             self._state_store.save_ratification_items(
                 self._g0_ratification_engine.items,
             )
-        # Assembly (Phase F-1)
-        self._state_store.save_assembly_topics(
-            self._assembly_engine.to_records(),
-        )
-        self._state_store.save_assembly_compliance_salts(
-            self._assembly_compliance_salts,
-        )
-        # Organisation Registry (Phase F-2)
-        self._state_store.save_org_registry(
-            self._org_registry_engine.to_records(),
-        )
-        # Domain Expert / Machine Clearance (Phase F-3)
-        self._state_store.save_domain_clearances(
-            self._domain_expert_engine.to_records(),
-        )
-        self._state_store.save_machine_agency(
-            self._machine_agency_engine.to_records(),
-        )
 
     def _safe_persist(
         self,
         on_rollback: Optional[Callable[[], None]] = None,
+        sections: Optional[tuple[str, ...]] = None,
     ) -> Optional[str]:
         """Persist state with fail-closed error handling (pre-audit mode).
 
@@ -5851,17 +6643,20 @@ class GenesisService:
         2. Returns an error string for the caller to include in
            a ServiceResult.
 
-        On success, returns None.
+        On success, returns None. ``sections`` is passed to _persist_state().
         """
         try:
-            self._persist_state()
+            self._persist_state(sections)
             return None
         except OSError as e:
             if on_rollback is not None:
                 on_rollback()
             return f"Persistence failure: {e}"
 
-    def _safe_persist_post_audit(self) -> Optional[str]:
+    def _safe_persist_post_audit(
+        self,
+        sections: Optional[tuple[str, ...]] = None,
+    ) -> Optional[str]:
         """Persist state after audit events have been committed.
 
         MUST NOT rollback in-memory state — the audit trail is already
@@ -5869,10 +6664,11 @@ class GenesisService:
         (aligned with audit events), but StateStore is stale.
 
         Sets _persistence_degraded flag for operator awareness and
-        returns a warning string (not a hard error).
+        returns a warning string (not a hard error). ``sections`` is
+        passed to _persist_state().
         """
         try:
-            self._persist_state()
+            self._persist_state(sections)
             return None
         except OSError as e:
             self._persistence_degraded = True
@@ -5922,6 +6718,160 @@ class GenesisService:
             },
         )
 
+    def rescreen_compliance(
+        self,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        chunk_size: int = 500,
+        workers: int = 0,
+        now: Optional[datetime] = None,
+        restart: bool = False,
+    ) -> ServiceResult:
+        """Re-screen existing listings, missions and GCF proposals.
+
+        Subjects are screened in (kind, ID) order, starting after the
+        checkpoint ``cursor`` and stopping after ``limit`` subjects (all
+        remaining if None). Each chunk's COMPLIANCE_SCREENING_COMPLETED
+        events are appended as one batch, then the checkpoint is saved
+        to the state store; the returned ``next_cursor`` is the
+        checkpoint after the last recorded chunk. ``complete`` is True
+        once nothing is left to screen, and clears the saved checkpoint.
+
+        Without ``cursor`` the job resumes from the saved checkpoint, so
+        an interrupted job picks up where it stopped, even across a
+        restart. ``restart`` starts from the beginning instead.
+
+        Re-screening only records verdicts; it does not change the status
+        of any listing, mission or proposal.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+        if limit is not None and limit < 0:
+            return ServiceResult(success=False, errors=["limit must be non-negative"])
+        if cursor is None and not restart:
+            cursor = self._rescreen_cursor
+        try:
+            after = cursor_order_key(cursor) if cursor is not None else None
+            rescreener = ComplianceRescreener(
+                self._compliance_screener, chunk_size=chunk_size, workers=workers,
+            )
+        except ValueError as e:
+            return ServiceResult(success=False, errors=[str(e)])
+
+        subjects = self._rescreening_subjects(after)
+        batch = subjects if limit is None else islice(subjects, limit)
+
+        next_cursor = cursor
+        by_verdict = {v.value: 0 for v in ComplianceVerdict}
+        flagged: list[str] = []
+        rejected: list[str] = []
+        screened = 0
+        warnings: list[str] = []
+        for chunk, results in rescreener.run(batch, now):
+            payloads = [
+                (subject.cursor, {
+                    "subject_kind": subject.kind,
+                    "subject_id": subject.subject_id,
+                    "verdict": result.verdict.value,
+                    "categories_matched": result.categories_matched,
+                    "reason": result.reason,
+                    "confidence": result.confidence,
+                })
+                for subject, result in zip(chunk, results)
+            ]
+            err = self._record_actor_lifecycle_events(
+                "system", EventKind.COMPLIANCE_SCREENING_COMPLETED, payloads,
+            )
+            if err:
+                return ServiceResult(
+                    success=False,
+                    errors=[err],
+                    data={"screened": screened, "next_cursor": next_cursor},
+                )
+            for subject, result in zip(chunk, results):
+                by_verdict[result.verdict.value] += 1
+                if result.verdict == ComplianceVerdict.FLAGGED:
+                    flagged.append(subject.cursor)
+                elif result.verdict == ComplianceVerdict.REJECTED:
+                    rejected.append(subject.cursor)
+            screened += len(chunk)
+            next_cursor = chunk[-1].cursor
+            self._rescreen_cursor = next_cursor
+            warning = self._safe_persist_post_audit(sections=("compliance_rescreen",))
+            if warning:
+                warnings.append(warning)
+
+        remaining = self._rescreening_subjects(
+            cursor_order_key(next_cursor) if next_cursor is not None else None,
+        )
+        complete = next(remaining, None) is None
+        if complete and self._rescreen_cursor is not None:
+            self._rescreen_cursor = None
+            warning = self._safe_persist_post_audit(sections=("compliance_rescreen",))
+            if warning:
+                warnings.append(warning)
+
+        data: dict[str, Any] = {
+            "screened": screened,
+            "by_verdict": by_verdict,
+            "flagged": flagged,
+            "rejected": rejected,
+            "next_cursor": next_cursor,
+            "complete": complete,
+        }
+        if warnings:
+            data["warning"] = warnings[-1]
+        return ServiceResult(success=True, data=data)
+
+    def _rescreening_subjects(
+        self,
+        after: Optional[tuple[int, str]] = None,
+    ) -> Iterator[ScreeningSubject]:
+        """Yield screenable subjects in re-screening order, after ``after``.
+
+        ``after`` is an order key (see cursor_order_key). Each kind's
+        records are held in ID order, so a resumed walk starts with a
+        binary search instead of sorting the whole corpus.
+        """
+        listings = self._listings
+        missions = self._missions
+        engine = self._disbursement_engine
+
+        def proposal_subject(proposal_id: str) -> ScreeningSubject:
+            proposal = engine.get_proposal(proposal_id)
+            assert proposal is not None
+            return ScreeningSubject(
+                "disbursement", proposal_id,
+                gcf_proposal_text(
+                    proposal.title,
+                    proposal.description,
+                    proposal.recipient_description,
+                    proposal.measurable_deliverables,
+                ),
+                "",
+            )
+
+        sources: list[tuple[
+            Callable[[Optional[str]], Iterator[str]],
+            Callable[[str], ScreeningSubject],
+        ]] = [
+            (listings.keys_after, lambda listing_id: ScreeningSubject(
+                "listing", listing_id, listings[listing_id].title,
+                listings[listing_id].description,
+                tuple(listings[listing_id].domain_tags),
+            )),
+            (missions.keys_after, lambda mission_id: ScreeningSubject(
+                "mission", mission_id, missions[mission_id].mission_title, "",
+            )),
+            (engine.proposal_ids_after, proposal_subject),
+        ]
+        for rank, (ids_after, subject) in enumerate(sources):
+            if after is not None and rank < after[0]:
+                continue
+            start = after[1] if after is not None and rank == after[0] else None
+            for subject_id in ids_after(start):
+                yield subject(subject_id)
+
     def file_compliance_complaint(
         self,
         mission_id: str,
@@ -6030,6 +6980,7 @@ class GenesisService:
             new_score = max(0.0, trust_record.score + outcome.trust_target)
             actor.trust_score = new_score
             trust_record.score = new_score
+        self._schedule_deadline(DeadlineKind.MACHINE_DECOMMISSION, actor_id)
 
         # Apply status change
         if outcome.permanent:
@@ -6047,6 +6998,7 @@ class GenesisService:
             actor.status = ActorStatus.SUSPENDED
             suspension_end = now + timedelta(days=outcome.suspension_days)
             self._suspended_until[actor_id] = suspension_end
+            self._schedule_deadline(DeadlineKind.SUSPENSION_EXPIRY, actor_id)
             self._record_actor_lifecycle_event(
                 actor_id,
                 EventKind.ACTOR_SUSPENDED,
@@ -6712,6 +7664,7 @@ class GenesisService:
             wf.workflow_id, compliance_verdict, now,
         )
         self._workflows[wf.workflow_id] = wf
+        self._schedule_deadline(DeadlineKind.VISIBILITY_EXPIRY, wf.workflow_id)
 
         # Emit visibility restriction event if applicable
         if visibility == WorkVisibility.METADATA_ONLY:
@@ -7226,38 +8179,13 @@ class GenesisService:
         lapsed_ids: list[str] = []
         audit_failures: list[dict[str, Any]] = []
 
-        for wf_id, wf in self._workflow_orchestrator._workflows.items():
-            if (
-                wf.visibility == "metadata_only"
-                and wf.visibility_expiry_utc is not None
-                and wf.visibility_expiry_utc <= now
-            ):
-                # Fail-closed: record audit event BEFORE mutating state.
-                # If event recording fails, skip this workflow entirely.
-                err = self._record_actor_lifecycle_event(
-                    wf.creator_id,
-                    EventKind.VISIBILITY_RESTRICTION_LAPSED,
-                    {
-                        "workflow_id": wf_id,
-                        "listing_id": wf.listing_id,
-                    },
-                )
+        for wf_id in list(self._workflow_orchestrator._workflows):
+            expiry = self._visibility_deadline(wf_id)
+            if expiry is not None and expiry <= now:
+                err = self._lapse_visibility(wf_id)
                 if err is not None:
                     audit_failures.append({"workflow_id": wf_id, "error": err})
-                    continue  # Do NOT mutate — fail closed
-
-                # Event recorded successfully — now safe to mutate state
-                wf.visibility = "public"
-                wf.visibility_justification = None
-                wf.visibility_expiry_utc = None
-
-                # Also lapse the listing if it exists
-                listing = self._listings.get(wf.listing_id)
-                if listing is not None:
-                    listing.visibility = WorkVisibility.PUBLIC
-                    listing.visibility_justification = None
-                    listing.visibility_expiry_utc = None
-
+                    continue
                 lapsed_ids.append(wf_id)
 
         if lapsed_ids:
@@ -7280,6 +8208,44 @@ class GenesisService:
             ),
         )
 
+    def _visibility_deadline(self, workflow_id: str) -> Optional[datetime]:
+        """When a workflow's METADATA_ONLY restriction lapses, or None."""
+        wf = self._workflow_orchestrator.get_workflow(workflow_id)
+        if wf is None or wf.visibility != "metadata_only":
+            return None
+        return wf.visibility_expiry_utc
+
+    def _lapse_visibility(self, workflow_id: str) -> Optional[str]:
+        """Lapse one workflow's restriction. Returns an error or None.
+
+        Fail-closed: record audit event BEFORE mutating state. If event
+        recording fails, the workflow is left untouched.
+        """
+        wf = self._workflow_orchestrator.get_workflow(workflow_id)
+        err = self._record_actor_lifecycle_event(
+            wf.creator_id,
+            EventKind.VISIBILITY_RESTRICTION_LAPSED,
+            {
+                "workflow_id": workflow_id,
+                "listing_id": wf.listing_id,
+            },
+        )
+        if err is not None:
+            return err  # Do NOT mutate — fail closed
+
+        # Event recorded successfully — now safe to mutate state
+        wf.visibility = "public"
+        wf.visibility_justification = None
+        wf.visibility_expiry_utc = None
+
+        # Also lapse the listing if it exists
+        listing = self._listings.get(wf.listing_id)
+        if listing is not None:
+            listing.visibility = WorkVisibility.PUBLIC
+            listing.visibility_justification = None
+            listing.visibility_expiry_utc = None
+        return None
+
     # ------------------------------------------------------------------
     # GCF Disbursement Governance (Phase E-5)
     # ------------------------------------------------------------------
@@ -8612,19 +9578,29 @@ class GenesisService:
         - For entrenched: cooling-off elapsed + confirmation vote passed.
         - Status is CONFIRMED.
 
-        On success, the provision value is updated in constitutional_params.
+        On success, the provision value is updated in constitutional_params
+        and the resolver's compiled policy snapshot is rebuilt.
         """
         if now is None:
             now = datetime.now(timezone.utc)
 
+        # Apply to a staged copy so a value that fails snapshot validation
+        # leaves neither the live config nor the proposal changed.
+        staged = copy.deepcopy(self._resolver._params)
         try:
             proposal = self._amendment_engine.apply_amendment(
                 proposal_id=proposal_id,
-                config_target=self._resolver._params,
+                config_target=staged,
                 now=now,
             )
         except (ValueError, ConstitutionalViolation) as e:
             return ServiceResult(success=False, errors=[str(e)])
+        try:
+            # Swap in the params and a fresh hot-path snapshot together.
+            self._resolver.replace_params(staged)
+        except ValueError as e:
+            proposal.status = AmendmentStatus.CONFIRMED
+            return ServiceResult(success=False, errors=[str(e)])
 
         # Emit event
         event_id = self._next_event_id()
@@ -8767,6 +9743,9 @@ class GenesisService:
                             "event_kind": item.event_kind,
                             "event_id": item.event_id,
                         })
+                        self._schedule_deadline(
+                            DeadlineKind.RATIFICATION_DEADLINE, item.item_id,
+                        )
 
                         # Emit event for each submission
                         if self._event_log is not None:
@@ -9024,8 +10003,21 @@ class GenesisService:
             )
 
         lapsed_ids = self._g0_ratification_engine.check_deadline(now, deadline)
+        self._record_g0_lapses(lapsed_ids, now)
 
-        # Emit events for each auto-lapsed item
+        if lapsed_ids:
+            self._safe_persist_post_audit()
+
+        return ServiceResult(
+            success=True,
+            data={
+                "lapsed_count": len(lapsed_ids),
+                "lapsed_items": lapsed_ids,
+            },
+        )
+
+    def _record_g0_lapses(self, lapsed_ids: list[str], now: datetime) -> None:
+        """Emit events for each auto-lapsed item."""
         for lid in lapsed_ids:
             if self._event_log is not None:
                 try:
@@ -9044,17 +10036,6 @@ class GenesisService:
                 except (ValueError, OSError, RuntimeError):
                     pass
 
-        if lapsed_ids:
-            self._safe_persist_post_audit()
-
-        return ServiceResult(
-            success=True,
-            data={
-                "lapsed_count": len(lapsed_ids),
-                "lapsed_items": lapsed_ids,
-            },
-        )
-
     def reverse_lapsed_g0_decision(
         self,
         item_id: str,
@@ -9137,10 +10118,9 @@ class GenesisService:
         )
 
     def _count_missions_by_state(self) -> dict[str, int]:
-        counts: dict[str, int] = {}
-        for m in self._missions.values():
-            counts[m.state.value] = counts.get(m.state.value, 0) + 1
-        return counts
+        return {
+            state.value: n for state, n in self._missions.counts().items()
+        }
 
     # ------------------------------------------------------------------
     # Assembly — anonymous deliberation (Phase F-1)
@@ -9230,6 +10210,7 @@ class GenesisService:
             )
         except ValueError as e:
             return ServiceResult(success=False, errors=[str(e)])
+        self._schedule_deadline(DeadlineKind.TOPIC_INACTIVITY, topic.topic_id)
 
         # Log event (no actor_id in payload — identity blinding)
         self._record_actor_lifecycle_event(
@@ -9350,11 +10331,7 @@ class GenesisService:
         archived_ids = self._assembly_engine.archive_inactive_topics(now)
 
         for topic_id in archived_ids:
-            self._record_actor_lifecycle_event(
-                "system",
-                EventKind.ASSEMBLY_TOPIC_ARCHIVED,
-                {"topic_id": topic_id},
-            )
+            self._record_topic_archived(topic_id)
 
         if archived_ids:
             self._safe_persist_post_audit()
@@ -9367,6 +10344,13 @@ class GenesisService:
             },
         )
 
+    def _record_topic_archived(self, topic_id: str) -> None:
+        self._record_actor_lifecycle_event(
+            "system",
+            EventKind.ASSEMBLY_TOPIC_ARCHIVED,
+            {"topic_id": topic_id},
+        )
+
     def list_assembly_topics(
         self,
         status_filter: Optional[str] = None,
@@ -10150,6 +11134,7 @@ class GenesisService:
             )
         except ValueError as e:
             return ServiceResult(success=False, errors=[str(e)])
+        self._schedule_deadline(DeadlineKind.CLEARANCE_EXPIRY, clearance_id)
 
         if result.status == DomainClearanceStatus.ACTIVE:
             err = self._record_actor_lifecycle_event(
@@ -10244,16 +11229,7 @@ class GenesisService:
         expired = self._domain_expert_engine.check_expirations(now=now)
 
         for c in expired:
-            self._record_actor_lifecycle_event(
-                c.nominated_by,
-                EventKind.CLEARANCE_EXPIRED,
-                {
-                    "clearance_id": c.clearance_id,
-                    "machine_id": c.machine_id,
-                    "domain": c.domain,
-                    "level": c.level.value,
-                },
-            )
+            self._record_clearance_expired(c)
 
         if expired:
             self._safe_persist_post_audit()
@@ -10266,6 +11242,18 @@ class GenesisService:
             },
         )
 
+    def _record_clearance_expired(self, c: DomainClearance) -> None:
+        self._record_actor_lifecycle_event(
+            c.nominated_by,
+            EventKind.CLEARANCE_EXPIRED,
+            {
+                "clearance_id": c.clearance_id,
+                "machine_id": c.machine_id,
+                "domain": c.domain,
+                "level": c.level.value,
+            },
+        )
+
     def get_active_clearances(
         self,
         machine_id: Optional[str] = None,
@@ -10322,6 +11310,8 @@ class GenesisService:
         """Compute the current agency tier for a machine across all domains.
 
         Returns domain-level tiers and the effective (highest) tier.
+        Results are cached per machine and recomputed only after that
+        machine's active clearances or Tier 3 grants change.
         """
         entry = self._roster.get(machine_id)
         if entry is None:
@@ -10335,34 +11325,44 @@ class GenesisService:
                 errors=[f"{machine_id} is not a machine"],
             )
 
-        # Get active clearances as dicts for the engine
-        active_clearances = self._domain_expert_engine.get_active_clearances(
-            machine_id=machine_id,
+        revisions = (
+            self._domain_expert_engine.machine_revision(machine_id),
+            self._machine_agency_engine.machine_revision(machine_id),
         )
-        clearance_dicts = [
-            {
-                "machine_id": c.machine_id,
-                "domain": c.domain,
-                "level": c.level.value,
-            }
-            for c in active_clearances
-        ]
+        cached = self._machine_tier_cache.get(machine_id)
+        if cached is None or cached[0] != revisions:
+            # Get active clearances as dicts for the engine
+            active_clearances = self._domain_expert_engine.get_active_clearances(
+                machine_id=machine_id,
+            )
+            clearance_dicts = [
+                {
+                    "machine_id": c.machine_id,
+                    "domain": c.domain,
+                    "level": c.level.value,
+                }
+                for c in active_clearances
+            ]
 
-        domain_tiers = self._machine_agency_engine.compute_current_tier(
-            machine_id, clearance_dicts,
-        )
-        effective = self._machine_agency_engine.compute_effective_tier(
-            machine_id, clearance_dicts,
-        )
+            domain_tiers = self._machine_agency_engine.compute_current_tier(
+                machine_id, clearance_dicts,
+            )
+            effective = self._machine_agency_engine.compute_effective_tier(
+                machine_id, clearance_dicts,
+            )
+            cached = (
+                revisions,
+                {d: t.value for d, t in domain_tiers.items()},
+                effective.value,
+            )
+            self._machine_tier_cache[machine_id] = cached
 
         return ServiceResult(
             success=True,
             data={
                 "machine_id": machine_id,
-                "domain_tiers": {
-                    d: t.value for d, t in domain_tiers.items()
-                },
-                "effective_tier": effective.value,
+                "domain_tiers": dict(cached[1]),
+                "effective_tier": cached[2],
             },
         )
 
@@ -10418,10 +11418,9 @@ class GenesisService:
 
         # Count violations (simplified — uses trust penalty events)
         violation_count = 0
-        for event in self._event_log.events():
+        for event in self._event_log.events_for_actor(machine_id):
             if (
-                event.actor_id == machine_id
-                and event.payload.get("domain") == domain
+                event.payload.get("domain") == domain
                 and event.event_kind in (
                     EventKind.ADJUDICATION_DECIDED,
                     EventKind.ACTOR_SUSPENDED,
@@ -2,6 +2,7 @@
 
 from genesis.skills.decay import SkillDecayEngine
 from genesis.skills.endorsement import EndorsementEngine
+from genesis.skills.index import SkillIndex
 from genesis.skills.matching import SkillMatchEngine
 from genesis.skills.outcome_updater import SkillOutcomeUpdater
 from genesis.skills.taxonomy import SkillTaxonomy
@@ -10,6 +11,7 @@ from genesis.skills.worker_matcher import WorkerMatcher
 __all__ = [
     "SkillDecayEngine",
     "EndorsementEngine",
+    "SkillIndex",
     "SkillMatchEngine",
     "SkillOutcomeUpdater",
     "SkillTaxonomy",
@@ -0,0 +1,158 @@
+"""Skill index — inverted postings from skills and domains to actors.
+
+Maintained by the service layer alongside the skill profile and trust
+record maps so that worker discovery and reviewer pre-filtering touch
+only actors who can possibly be relevant to a set of requirements,
+rather than scanning the whole roster.
+
+Two posting maps are kept:
+- canonical skill ID → {actor_id: proficiency_score}
+- domain → {actor_id: domain trust score}
+
+An actor with neither a required skill nor domain trust in a required
+domain has relevance 0.0 (see SkillMatchEngine.compute_relevance), so
+the union of the postings for a requirement set is a complete candidate
+set whenever the minimum relevance threshold is positive.
+
+The index is a pure in-memory structure. It is never persisted; it is
+rebuilt from the canonical maps on service construction.
+"""
+
+from __future__ import annotations
+
+from typing import Mapping, Optional
+
+from genesis.models.skill import ActorSkillProfile, SkillId, SkillRequirement
+from genesis.models.trust import TrustRecord
+
+
+class SkillIndex:
+    """Inverted index from skills and domains to the actors holding them.
+
+    Usage:
+        index = SkillIndex.build(skill_profiles, trust_records)
+        index.index_profile(actor_id, profile)   # after skill changes
+        index.index_trust(actor_id, record)      # after trust changes
+        candidates = index.candidates(requirements)
+    """
+
+    def __init__(self) -> None:
+        self._by_skill: dict[str, dict[str, float]] = {}
+        self._by_domain: dict[str, dict[str, float]] = {}
+        # Reverse maps so an actor's postings can be replaced in place.
+        self._actor_skills: dict[str, set[str]] = {}
+        self._actor_domains: dict[str, set[str]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        skill_profiles: Mapping[str, ActorSkillProfile],
+        trust_records: Mapping[str, TrustRecord],
+    ) -> SkillIndex:
+        """Build an index from the service's profile and trust maps."""
+        index = cls()
+        for actor_id, profile in skill_profiles.items():
+            index.index_profile(actor_id, profile)
+        for actor_id, record in trust_records.items():
+            index.index_trust(actor_id, record)
+        return index
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def index_profile(
+        self,
+        actor_id: str,
+        profile: Optional[ActorSkillProfile],
+    ) -> None:
+        """Replace an actor's skill postings with those of ``profile``.
+
+        Passing None drops the actor's skill postings.
+        """
+        for canonical in self._actor_skills.pop(actor_id, ()):
+            postings = self._by_skill.get(canonical)
+            if postings is not None:
+                postings.pop(actor_id, None)
+                if not postings:
+                    del self._by_skill[canonical]
+
+        if profile is None or not profile.skills:
+            return
+
+        held: set[str] = set()
+        for canonical, sp in profile.skills.items():
+            self._by_skill.setdefault(canonical, {})[actor_id] = sp.proficiency_score
+            held.add(canonical)
+        self._actor_skills[actor_id] = held
+
+    def index_trust(
+        self,
+        actor_id: str,
+        record: Optional[TrustRecord],
+    ) -> None:
+        """Replace an actor's domain postings with those of ``record``.
+
+        Passing None drops the actor's domain postings.
+        """
+        for domain in self._actor_domains.pop(actor_id, ()):
+            postings = self._by_domain.get(domain)
+            if postings is not None:
+                postings.pop(actor_id, None)
+                if not postings:
+                    del self._by_domain[domain]
+
+        if record is None or not record.domain_scores:
+            return
+
+        held: set[str] = set()
+        for domain, ds in record.domain_scores.items():
+            self._by_domain.setdefault(domain, {})[actor_id] = ds.score
+            held.add(domain)
+        self._actor_domains[actor_id] = held
+
+    def remove_actor(self, actor_id: str) -> None:
+        """Drop every posting for an actor."""
+        self.index_profile(actor_id, None)
+        self.index_trust(actor_id, None)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def holders(self, skill_id: SkillId) -> dict[str, float]:
+        """Return {actor_id: proficiency_score} for actors holding a skill."""
+        return dict(self._by_skill.get(skill_id.canonical, {}))
+
+    def skill_proficiency(self, actor_id: str, canonical: str) -> Optional[float]:
+        """Return the indexed proficiency for one actor and skill, or None."""
+        postings = self._by_skill.get(canonical)
+        if postings is None:
+            return None
+        return postings.get(actor_id)
+
+    def domain_trust(self, actor_id: str, domain: str) -> Optional[float]:
+        """Return the indexed domain trust for one actor and domain, or None."""
+        postings = self._by_domain.get(domain)
+        if postings is None:
+            return None
+        return postings.get(actor_id)
+
+    def candidates(self, requirements: list[SkillRequirement]) -> set[str]:
+        """Return every actor holding a required skill or domain trust.
+
+        Actors outside this set have zero relevance to ``requirements``.
+        """
+        result: set[str] = set()
+        domains: set[str] = set()
+        for req in requirements:
+            result.update(self._by_skill.get(req.skill_id.canonical, ()))
+            domains.add(req.skill_id.domain)
+        for domain in domains:
+            result.update(self._by_domain.get(domain, ()))
+        return result
+
+    @property
+    def skill_count(self) -> int:
+        """Number of distinct skills with at least one holder."""
+        return len(self._by_skill)
@@ -63,7 +63,7 @@ class SkillMatchEngine:
         if profile is None:
             return 0.0  # No profile → zero relevance
 
-        p_weight, dt_weight = self._match_weights()
+        p_weight, dt_weight = self.match_weights()
 
         # Proficiency component: how well does the actor's proficiency
         # match the requirements?
@@ -147,7 +147,7 @@ class SkillMatchEngine:
         if not requirements:
             return True
         relevance = self.compute_relevance(profile, requirements, trust_record)
-        return relevance >= self._min_relevance()
+        return relevance >= self.min_relevance()
 
     def meets_required_skills(
         self,
@@ -176,19 +176,11 @@ class SkillMatchEngine:
 
         return True
 
-    def _match_weights(self) -> tuple[float, float]:
+    def match_weights(self) -> tuple[float, float]:
         """Return (proficiency_weight, domain_trust_weight)."""
-        if not self._resolver.has_skill_trust_config():
-            return (0.60, 0.40)
-        config = self._resolver.skill_matching_config()
-        return (
-            config.get("proficiency_weight", 0.60),
-            config.get("domain_trust_weight", 0.40),
-        )
-
-    def _min_relevance(self) -> float:
+        matching = self._resolver.compiled().matching
+        return (matching.proficiency_weight, matching.domain_trust_weight)
+
+    def min_relevance(self) -> float:
         """Return the minimum relevance score threshold."""
-        if not self._resolver.has_skill_trust_config():
-            return 0.3
-        config = self._resolver.skill_matching_config()
-        return config.get("min_relevance_score", 0.3)
+        return self._resolver.compiled().matching.min_relevance
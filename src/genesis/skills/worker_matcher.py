@@ -8,6 +8,7 @@ Pure computation engine. The service layer handles side effects.
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -16,8 +17,12 @@ from genesis.models.skill import ActorSkillProfile, SkillRequirement
 from genesis.models.trust import TrustRecord
 from genesis.policy.resolver import PolicyResolver
 from genesis.review.roster import ActorRoster, RosterEntry
+from genesis.skills.index import SkillIndex
 from genesis.skills.matching import SkillMatchEngine
 
+# Tolerance for float reordering between the bound and the exact score.
+_BOUND_SLACK = 1e-9
+
 
 @dataclass(frozen=True)
 class WorkerMatch:
@@ -36,6 +41,12 @@ class WorkerMatcher:
         matcher = WorkerMatcher(resolver, roster, trust_records, skill_profiles)
         matches = matcher.find_matches(requirements)
         # matches is sorted by composite_score descending
+
+    When a SkillIndex is supplied, only actors holding a required skill
+    or domain trust in a required domain are considered, and candidates
+    are evaluated in descending order of a score upper bound so that
+    evaluation stops once no remaining candidate can enter the top
+    ``limit``. Results are identical to the full roster scan.
     """
 
     def __init__(
@@ -44,11 +55,13 @@ class WorkerMatcher:
         roster: ActorRoster,
         trust_records: dict[str, TrustRecord],
         skill_profiles: dict[str, ActorSkillProfile],
+        skill_index: Optional[SkillIndex] = None,
     ) -> None:
         self._resolver = resolver
         self._roster = roster
         self._trust_records = trust_records
         self._skill_profiles = skill_profiles
+        self._skill_index = skill_index
         self._match_engine = SkillMatchEngine(resolver)
 
     def find_matches(
@@ -70,73 +83,180 @@ class WorkerMatcher:
             List of WorkerMatch, sorted by composite_score descending.
         """
         exclude = exclude_ids or set()
-        w_rel, w_global, w_domain = self._allocation_weights()
+        weights = self._allocation_weights()
+        min_relevance = self._match_engine.min_relevance()
+
+        # The index can only answer queries where zero-relevance actors
+        # are excluded: with no requirements, or a non-positive threshold,
+        # every available actor qualifies.
+        if self._skill_index is not None and requirements and min_relevance > 0:
+            return self._find_indexed(
+                requirements, exclude, min_trust, limit, weights, min_relevance,
+            )
 
         matches: list[WorkerMatch] = []
         for entry in self._roster.all_actors():
-            if not entry.is_available():
-                continue
-            if entry.actor_id in exclude:
-                continue
-            if entry.trust_score < min_trust:
+            if not self._eligible(entry, exclude, min_trust):
                 continue
+            match = self._score(
+                entry.actor_id, requirements, weights, min_relevance,
+            )
+            if match is not None:
+                matches.append(match)
+
+        # Sort by composite score descending, then by relevance (tie-break)
+        matches.sort(key=lambda m: (-m.composite_score, -m.relevance_score))
 
-            profile = self._skill_profiles.get(entry.actor_id)
-            trust_record = self._trust_records.get(entry.actor_id)
+        return matches[:limit]
 
-            # Compute relevance
-            relevance = self._match_engine.compute_relevance(
-                profile, requirements, trust_record,
+    def _find_indexed(
+        self,
+        requirements: list[SkillRequirement],
+        exclude: set[str],
+        min_trust: float,
+        limit: int,
+        weights: tuple[float, float, float],
+        min_relevance: float,
+    ) -> list[WorkerMatch]:
+        """Top-k matching over the skill index with upper-bound pruning."""
+        assert self._skill_index is not None
+        if limit <= 0:
+            return []
+
+        match_weights = self._match_engine.match_weights()
+        bounded: list[tuple[float, int, str]] = []
+        for actor_id in self._skill_index.candidates(requirements):
+            entry = self._roster.get(actor_id)
+            if entry is None or not self._eligible(entry, exclude, min_trust):
+                continue
+            bound = self._upper_bound(
+                actor_id, requirements, weights, match_weights,
             )
+            bounded.append((bound, self._roster.ordinal(actor_id), actor_id))
+
+        # Highest bound first; registration order keeps evaluation stable.
+        bounded.sort(key=lambda b: (-b[0], b[1]))
 
-            # Check minimum relevance (skip if below threshold and requirements exist)
-            if requirements and not self._match_engine.meets_minimum_relevance(
-                profile, requirements, trust_record,
-            ):
+        top: list[tuple[float, float, int, WorkerMatch]] = []
+        kth_best: list[float] = []  # min-heap of the best `limit` composites
+        for bound, ordinal, actor_id in bounded:
+            if len(kth_best) >= limit and bound < kth_best[0] - _BOUND_SLACK:
+                break
+            match = self._score(actor_id, requirements, weights, min_relevance)
+            if match is None:
                 continue
+            top.append((-match.composite_score, -match.relevance_score, ordinal, match))
+            if len(kth_best) < limit:
+                heapq.heappush(kth_best, match.composite_score)
+            elif match.composite_score > kth_best[0]:
+                heapq.heapreplace(kth_best, match.composite_score)
 
-            # Global trust
-            global_trust = trust_record.score if trust_record else 0.0
-
-            # Domain trust: average across required domains
-            domain_trust = 0.0
-            if trust_record and requirements:
-                domains = {r.skill_id.domain for r in requirements}
-                domain_scores = [
-                    trust_record.domain_scores[d].score
-                    for d in domains
-                    if d in trust_record.domain_scores
-                ]
-                if domain_scores:
-                    domain_trust = sum(domain_scores) / len(domains)
-
-            composite = (
-                w_rel * relevance
-                + w_global * global_trust
-                + w_domain * domain_trust
-            )
+        top.sort(key=lambda t: t[:3])
+        return [t[3] for t in top[:limit]]
 
-            matches.append(WorkerMatch(
-                actor_id=entry.actor_id,
-                relevance_score=relevance,
-                global_trust=global_trust,
-                domain_trust=domain_trust,
-                composite_score=composite,
-            ))
+    def _eligible(
+        self,
+        entry: RosterEntry,
+        exclude: set[str],
+        min_trust: float,
+    ) -> bool:
+        return (
+            entry.is_available()
+            and entry.actor_id not in exclude
+            and entry.trust_score >= min_trust
+        )
 
-        # Sort by composite score descending, then by relevance (tie-break)
-        matches.sort(key=lambda m: (-m.composite_score, -m.relevance_score))
+    def _score(
+        self,
+        actor_id: str,
+        requirements: list[SkillRequirement],
+        weights: tuple[float, float, float],
+        min_relevance: float,
+    ) -> Optional[WorkerMatch]:
+        """Score one actor, or None if below the relevance threshold."""
+        w_rel, w_global, w_domain = weights
+        profile = self._skill_profiles.get(actor_id)
+        trust_record = self._trust_records.get(actor_id)
 
-        return matches[:limit]
+        relevance = self._match_engine.compute_relevance(
+            profile, requirements, trust_record,
+        )
+
+        # Skip if below threshold and requirements exist
+        if requirements and relevance < min_relevance:
+            return None
+
+        # Global trust
+        global_trust = trust_record.score if trust_record else 0.0
+
+        # Domain trust: average across required domains
+        domain_trust = 0.0
+        if trust_record and requirements:
+            domains = {r.skill_id.domain for r in requirements}
+            domain_scores = [
+                trust_record.domain_scores[d].score
+                for d in domains
+                if d in trust_record.domain_scores
+            ]
+            if domain_scores:
+                domain_trust = sum(domain_scores) / len(domains)
+
+        composite = (
+            w_rel * relevance
+            + w_global * global_trust
+            + w_domain * domain_trust
+        )
+
+        return WorkerMatch(
+            actor_id=actor_id,
+            relevance_score=relevance,
+            global_trust=global_trust,
+            domain_trust=domain_trust,
+            composite_score=composite,
+        )
+
+    def _upper_bound(
+        self,
+        actor_id: str,
+        requirements: list[SkillRequirement],
+        weights: tuple[float, float, float],
+        match_weights: tuple[float, float],
+    ) -> float:
+        """Upper bound on an actor's composite score from indexed values.
+
+        Each held skill contributes at most its proficiency match and each
+        indexed domain its trust score; global trust is read live.
+        """
+        assert self._skill_index is not None
+        index = self._skill_index
+        w_rel, w_global, w_domain = weights
+        p_weight, dt_weight = match_weights
+
+        proficiency = 0.0
+        for req in requirements:
+            score = index.skill_proficiency(actor_id, req.skill_id.canonical)
+            if score is None:
+                continue
+            if req.minimum_proficiency > 0:
+                proficiency += min(1.0, score / req.minimum_proficiency)
+            else:
+                proficiency += 1.0 if score > 0 else 0.5
+        proficiency /= len(requirements)
+
+        domains = {r.skill_id.domain for r in requirements}
+        domain_total = 0.0
+        for domain in domains:
+            score = index.domain_trust(actor_id, domain)
+            if score is not None:
+                domain_total += score
+        domain_trust = domain_total / len(domains)
+
+        relevance = max(0.0, min(1.0, p_weight * proficiency + dt_weight * domain_trust))
+        trust_record = self._trust_records.get(actor_id)
+        global_trust = trust_record.score if trust_record else 0.0
+        return w_rel * relevance + w_global * global_trust + w_domain * domain_trust
 
     def _allocation_weights(self) -> tuple[float, float, float]:
         """Return (w_relevance, w_global_trust, w_domain_trust)."""
-        if not self._resolver.has_skill_trust_config():
-            return (0.50, 0.20, 0.30)
-        config = self._resolver.skill_matching_config()
-        alloc = config.get("worker_allocation_weights", {})
-        return (
-            alloc.get("relevance", 0.50),
-            alloc.get("global_trust", 0.20),
-            alloc.get("domain_trust", 0.30),
-        )
+        alloc = self._resolver.compiled().matching.worker_allocation
+        return (alloc.relevance, alloc.global_trust, alloc.domain_trust)
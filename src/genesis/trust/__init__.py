@@ -1,5 +1,6 @@
 """Trust update engine — bounded trust lifecycle management."""
 
+from genesis.trust.bulk_decay import BulkDecayEngine, DecayPolicy
 from genesis.trust.engine import TrustEngine
 
-__all__ = ["TrustEngine"]
+__all__ = ["BulkDecayEngine", "DecayPolicy", "TrustEngine"]
@@ -0,0 +1,233 @@
+"""Bulk inactivity decay — one columnar pass over every trust record.
+
+TrustEngine.apply_inactivity_decay() is the reference single-record
+decay. Running it for every actor re-reads policy per record and per
+domain and rebuilds every record. BulkDecayEngine produces the same
+records (bit-for-bit identical scores) for a whole population:
+
+1. Policy (half-lives, decay floor, trust floors, aggregation weights)
+   is resolved once per run.
+2. Every domain's days-since-active and mission count, and every actor's
+   global days-since-active and volume, are laid out as flat columns.
+3. All decay factors are computed in one pass over those columns, with
+   the volume dampening term 1 + ln(1 + volume) computed once per
+   distinct volume.
+4. New DomainTrustScore/TrustRecord objects are materialised only for
+   actors whose factors show they actually decay.
+
+The columns are plain array.array buffers and the factor pass is a
+single comprehension; NumPy is not a dependency of this package, and
+the arithmetic is kept in Python floats so results match the reference
+path exactly.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from genesis.models.domain_trust import DomainTrustScore
+from genesis.models.trust import ActorKind, TrustRecord
+from genesis.policy.resolver import PolicyResolver
+
+# Absolute floor for minted humans (mirrors TrustEngine.apply_inactivity_decay).
+MINTED_HUMAN_FLOOR = 0.001
+
+
+@dataclass(frozen=True)
+class DecayPolicy:
+    """Decay parameters resolved once per bulk run."""
+
+    half_life_human: float
+    half_life_machine: float
+    decay_floor: float
+    trust_floor_human: float
+    trust_floor_machine: float
+    recency_weight: float
+    volume_weight: float
+
+    @classmethod
+    def from_resolver(cls, resolver: PolicyResolver) -> DecayPolicy:
+        trust = resolver.compiled().trust
+        return cls(
+            half_life_human=trust.half_life_human,
+            half_life_machine=trust.half_life_machine,
+            decay_floor=trust.decay_floor,
+            trust_floor_human=trust.trust_floor_human,
+            trust_floor_machine=trust.trust_floor_machine,
+            recency_weight=trust.recency_weight,
+            volume_weight=trust.volume_weight,
+        )
+
+
+class BulkDecayEngine:
+    """Applies inactivity decay to many trust records at once.
+
+    Usage:
+        engine = BulkDecayEngine(resolver)
+        changed = engine.decay(records.values(), skip=actors_on_leave)
+        records.update(changed)
+    """
+
+    def __init__(self, resolver: PolicyResolver) -> None:
+        self._resolver = resolver
+
+    def decay(
+        self,
+        records: Iterable[TrustRecord],
+        now: Optional[datetime] = None,
+        skip: frozenset[str] | set[str] = frozenset(),
+    ) -> dict[str, TrustRecord]:
+        """Return {actor_id: decayed record} for records that decay.
+
+        Records in skip (e.g. actors on protected leave) and records with
+        nothing to decay are left out. Inputs are never mutated.
+        """
+        now = now or datetime.now(timezone.utc)
+        policy = DecayPolicy.from_resolver(self._resolver)
+
+        # -- Layout: one row per actor, one row per dated domain score --
+        actors: list[TrustRecord] = []
+        actor_half_life = array("d")
+        actor_days = array("d")  # global days since active (0 if never)
+        actor_volume = array("q")
+        domain_days = array("d")
+        domain_volume = array("q")
+        domain_half_life = array("d")
+        for record in records:
+            if record.actor_id in skip:
+                continue
+            half_life = (
+                policy.half_life_machine
+                if record.actor_kind == ActorKind.MACHINE
+                else policy.half_life_human
+            )
+            actors.append(record)
+            actor_half_life.append(half_life)
+            actor_days.append(
+                (now - record.last_active_utc).total_seconds() / 86400.0
+                if record.last_active_utc is not None else 0.0
+            )
+            volume = 0
+            for ds in record.domain_scores.values():
+                volume += ds.mission_count
+                if ds.last_active_utc is not None:
+                    domain_days.append(
+                        (now - ds.last_active_utc).total_seconds() / 86400.0
+                    )
+                    domain_volume.append(ds.mission_count)
+                    domain_half_life.append(half_life)
+            actor_volume.append(volume)
+
+        # -- Factor pass over the columns --
+        dampening: dict[int, float] = {}
+        floor = policy.decay_floor
+
+        def factors(days, half_lives, volumes) -> list[float]:
+            for v in set(volumes):
+                if v not in dampening:
+                    dampening[v] = 1.0 + math.log(1.0 + v)
+            return [
+                1.0 if d <= 0 or h <= 0
+                else max(floor, min(1.0, 1.0 - (d / h) / dampening[v]))
+                for d, h, v in zip(days, half_lives, volumes)
+            ]
+
+        domain_factors = factors(domain_days, domain_half_life, domain_volume)
+        global_factors = factors(actor_days, actor_half_life, actor_volume)
+        zero_volume = array("q", [0]) * len(actors)
+        flat_factors = factors(actor_days, actor_half_life, zero_volume)
+
+        # -- Materialise only actors that decay --
+        changed: dict[str, TrustRecord] = {}
+        cursor = 0
+        for i, record in enumerate(actors):
+            new_domain_scores: dict[str, DomainTrustScore] = {}
+            any_decayed = False
+            for domain, ds in record.domain_scores.items():
+                if ds.last_active_utc is None:
+                    new_domain_scores[domain] = ds
+                    continue
+                factor = domain_factors[cursor]
+                cursor += 1
+                if factor < 1.0:
+                    any_decayed = True
+                    new_domain_scores[domain] = DomainTrustScore(
+                        domain=ds.domain,
+                        score=ds.score * factor,
+                        quality=ds.quality,
+                        reliability=ds.reliability,
+                        volume=ds.volume,
+                        effort=ds.effort,
+                        mission_count=ds.mission_count,
+                        last_active_utc=ds.last_active_utc,
+                    )
+                else:
+                    new_domain_scores[domain] = ds
+
+            if not any_decayed and (
+                record.last_active_utc is None or global_factors[i] >= 1.0
+            ):
+                continue
+
+            is_machine = record.actor_kind == ActorKind.MACHINE
+            trust_floor = (
+                policy.trust_floor_machine if is_machine else policy.trust_floor_human
+            )
+            if new_domain_scores:
+                decayed_score = max(
+                    _aggregate(new_domain_scores, policy), trust_floor,
+                )
+            else:
+                decayed_score = max(record.score * flat_factors[i], trust_floor)
+            if (
+                record.actor_kind == ActorKind.HUMAN
+                and record.trust_minted
+                and decayed_score < MINTED_HUMAN_FLOOR
+            ):
+                decayed_score = MINTED_HUMAN_FLOOR
+
+            changed[record.actor_id] = TrustRecord(
+                actor_id=record.actor_id,
+                actor_kind=record.actor_kind,
+                score=decayed_score,
+                quality=record.quality,
+                reliability=record.reliability,
+                volume=record.volume,
+                effort=record.effort,
+                quarantined=record.quarantined,
+                recertification_failures=record.recertification_failures,
+                last_recertification_utc=record.last_recertification_utc,
+                decommissioned=record.decommissioned,
+                recertification_failure_timestamps=list(
+                    record.recertification_failure_timestamps
+                ),
+                probation_tasks_completed=record.probation_tasks_completed,
+                trust_minted=record.trust_minted,
+                trust_minted_utc=record.trust_minted_utc,
+                last_active_utc=record.last_active_utc,
+                domain_scores=new_domain_scores,
+            )
+        return changed
+
+
+def _aggregate(
+    domain_scores: dict[str, DomainTrustScore],
+    policy: DecayPolicy,
+) -> float:
+    """TrustEngine.aggregate_global_score() with pre-resolved weights."""
+    total_missions = sum(ds.mission_count for ds in domain_scores.values())
+    if total_missions == 0:
+        scores = [ds.score for ds in domain_scores.values()]
+        return sum(scores) / len(scores)
+    volume_component = sum(
+        ds.score * ds.mission_count for ds in domain_scores.values()
+    ) / total_missions
+    aggregate = (
+        policy.volume_weight * volume_component
+        + policy.recency_weight * volume_component
+    )
+    return max(0.0, min(1.0, aggregate))
@@ -48,7 +48,7 @@ class TrustEngine:
         effort: float = 0.0,
     ) -> float:
         """Compute raw trust score from components, clamped to [0, 1]."""
-        w_q, w_r, w_v, w_e = self._resolver.trust_weights()
+        w_q, w_r, w_v, w_e = self._resolver.compiled().trust.weights
         raw = w_q * quality + w_r * reliability + w_v * volume + w_e * effort
         return max(0.0, min(1.0, raw))
 
@@ -72,9 +72,10 @@ class TrustEngine:
         Does NOT mutate the input record. Returns new copies.
         """
         is_machine = record.actor_kind == ActorKind.MACHINE
-        q_min = self._resolver.quality_gate(is_machine)
-        floor = self._resolver.trust_floor(is_machine)
-        delta_fast = self._resolver.delta_fast()
+        policy = self._resolver.compiled().trust
+        q_min = policy.quality_gate_machine if is_machine else policy.quality_gate_human
+        floor = policy.trust_floor(is_machine)
+        delta_fast = policy.delta_fast
 
         # Compute new raw score (includes effort component)
         new_raw = self.compute_score(quality, reliability, volume, effort)
@@ -199,7 +200,7 @@ class TrustEngine:
         Uses domain-specific weights from skill_trust_params.json if
         available, otherwise falls back to global trust weights.
         """
-        w_q, w_r, w_v, w_e = self._resolver.domain_trust_weights()
+        w_q, w_r, w_v, w_e = self._resolver.compiled().trust.domain_weights
         raw = w_q * quality + w_r * reliability + w_v * volume + w_e * effort
         return max(0.0, min(1.0, raw))
 
@@ -263,7 +264,7 @@ class TrustEngine:
         new_record = TrustRecord(
             actor_id=record.actor_id,
             actor_kind=record.actor_kind,
-            score=max(new_global, self._resolver.trust_floor(
+            score=max(new_global, self._resolver.compiled().trust.trust_floor(
                 record.actor_kind == ActorKind.MACHINE
             )),
             quality=record.quality,
@@ -296,9 +297,9 @@ class TrustEngine:
         if not domain_scores:
             return 0.0
 
-        agg_config = self._resolver.global_score_aggregation()
-        recency_w = agg_config.get("recency_weight", 0.3)
-        volume_w = agg_config.get("volume_weight", 0.7)
+        policy = self._resolver.compiled().trust
+        recency_w = policy.recency_weight
+        volume_w = policy.volume_weight
 
         total_missions = sum(ds.mission_count for ds in domain_scores.values())
         if total_missions == 0:
@@ -339,11 +340,8 @@ class TrustEngine:
         volume_dampening = 1.0 + math.log(1.0 + volume)
         raw_decay = 1.0 - (days_since_last / half_life) / volume_dampening
 
-        floor = 0.01  # never decay completely to zero
-        if self._resolver.has_skill_trust_config():
-            decay_config = self._resolver.inactivity_decay_config()
-            floor = decay_config.get("decay_floor", 0.01)
-
+        # Never decay completely to zero (decay_floor, default 0.01)
+        floor = self._resolver.compiled().trust.decay_floor
         return max(floor, min(1.0, raw_decay))
 
     def apply_inactivity_decay(
@@ -358,7 +356,8 @@ class TrustEngine:
         """
         now = now or datetime.now(timezone.utc)
         is_machine = record.actor_kind == ActorKind.MACHINE
-        half_life = self._resolver.half_life_days(is_machine)
+        policy = self._resolver.compiled().trust
+        half_life = policy.half_life(is_machine)
 
         # Decay each domain score
         new_domain_scores: dict[str, DomainTrustScore] = {}
@@ -410,7 +409,7 @@ class TrustEngine:
             factor = self.compute_decay_factor(days_global, half_life, 0)
             new_global = record.score * factor
 
-        floor = self._resolver.trust_floor(is_machine)
+        floor = policy.trust_floor(is_machine)
 
         # Compute decayed score
         if new_domain_scores:
@@ -465,7 +464,7 @@ class TrustEngine:
         """
         now = now or datetime.now(timezone.utc)
         is_machine = record.actor_kind == ActorKind.MACHINE
-        half_life = self._resolver.half_life_days(is_machine)
+        half_life = self._resolver.compiled().trust.half_life(is_machine)
 
         # Global decay forecast
         if record.last_active_utc is not None:
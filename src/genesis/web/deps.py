@@ -8,7 +8,11 @@ from pathlib import Path
 
 from fastapi import Request
 
+from genesis.crypto.anchor import Web3Chain
+from genesis.crypto.anchor_queue import AnchorQueue
+from genesis.persistence.commitment_store import CommitmentStore
 from genesis.persistence.event_log import EventLog
+from genesis.persistence.segmented_log import SegmentedEventLog
 from genesis.policy.resolver import PolicyResolver
 from genesis.service import GenesisService
 
@@ -28,12 +32,33 @@ def get_service() -> GenesisService:
         return GenesisService(resolver, event_log=EventLog())
 
     # Web runtime uses durable event storage so audit evidence survives restarts.
+    # Segmented storage keeps startup proportional to the current epoch;
+    # an older single-file log is migrated in on first start.
     data_dir = Path(__file__).resolve().parents[3] / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
-    return GenesisService(
+
+    # Closed epochs are anchored by a background worker when a chain is
+    # configured (SEPOLIA_RPC_URL / PRIVATE_KEY); otherwise nothing is queued.
+    anchor_queue = None
+    chain = Web3Chain.from_env()
+    if chain is not None:
+        anchor_queue = AnchorQueue(data_dir / "anchors.web.jsonl", chain, linger_seconds=60)
+    service = GenesisService(
         resolver,
-        event_log=EventLog(storage_path=data_dir / "events.web.jsonl"),
+        event_log=SegmentedEventLog.from_jsonl(
+            data_dir / "events.web.jsonl", data_dir / "events.web",
+            verify_workers=os.cpu_count() or 1,
+            checkpoint=True,
+        ),
+        # Closed epochs and their trees, so old events stay provable.
+        commitment_store=CommitmentStore(data_dir / "commitments.web"),
+        anchor_queue=anchor_queue,
     )
+    if anchor_queue is not None:
+        # Record each anchor (and compact the journal) as soon as it lands.
+        service.collect_anchor_results()
+        anchor_queue.start(on_anchored=lambda _: service.collect_anchor_results())
+    return service
 
 
 def get_templates(request: Request):
@@ -8,6 +8,9 @@ Three event sources, strictly separated:
     Same verified badge treatment — only shown when tx_hash + explorer_url exist.
   • Internal ledger: all other governance events from the in-memory event log.
     No chain badge — these are platform-internal records.
+
+/audit/proof/{event_ref} serves the Merkle inclusion proof of any event in
+a closed epoch, from the service's commitment store.
 """
 
 from __future__ import annotations
@@ -19,6 +22,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 
 from genesis.persistence.event_log import EventKind
 from genesis.web.deps import get_service, get_templates
@@ -106,7 +110,8 @@ def _iter_event_records(source) -> list:
 def _extract_runtime_anchors(event_source) -> list[dict]:
     """Extract COMMITMENT_ANCHORED events from the event log.
 
-    These are runtime anchor records emitted by GenesisService.anchor_commitment().
+    These are runtime anchor records emitted by GenesisService.anchor_commitment()
+    and GenesisService.collect_anchor_results().
     Only included if they have a real tx_hash and explorer_url — no badge without proof.
     """
     runtime = []
@@ -232,3 +237,12 @@ async def audit_trail(request: Request):
         "latest_chain_anchor_display": _format_timestamp_compact(latest_chain_anchor),
     }
     return respond(request, templates, "audit/trail.html", context)
+
+
+@router.get("/proof/{event_ref}")
+async def event_proof(event_ref: str, epoch_id: str | None = None):
+    """Inclusion proof of an event (event_id or sha256 hash) in its epoch."""
+    result = get_service().event_inclusion_proof(event_ref, epoch_id)
+    if not result.success:
+        return JSONResponse({"errors": result.errors}, status_code=404)
+    return JSONResponse(result.data)
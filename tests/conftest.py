@@ -0,0 +1,7 @@
+"""Suite-wide test configuration."""
+
+from genesis.service import GenesisService
+
+# Every persist that declares its sections is checked against the full
+# set of sections, so an undeclared mutation fails the test that made it.
+GenesisService.CHECK_DECLARED_SECTIONS = True
@@ -1332,6 +1332,32 @@ class TestAmendmentApplicationService:
         assert result.success is False
         assert "not CONFIRMED" in result.errors[0]
 
+    def test_invalid_value_leaves_config_and_proposal_unchanged(
+        self, service: GenesisService,
+    ) -> None:
+        """A value that fails snapshot validation is not half-applied."""
+        proposal = AmendmentProposal(
+            proposal_id="AMD-BAD", proposer_id="proposer_1",
+            provision_key="fast_elevation.delta_fast",
+            current_value=0.02, proposed_value=-1,
+            justification="Test", is_entrenched=False,
+            status=AmendmentStatus.CONFIRMED,
+            chamber_votes={
+                ChamberKind.PROPOSAL.value: [], ChamberKind.RATIFICATION.value: [],
+            },
+        )
+        service._amendment_engine._proposals[proposal.proposal_id] = proposal
+        resolver = service._resolver
+        before = resolver.compiled()
+        delta_fast = resolver.delta_fast()
+
+        result = service.apply_confirmed_amendment("AMD-BAD")
+        assert result.success is False
+        assert "delta_fast" in result.errors[0]
+        assert resolver.delta_fast() == delta_fast
+        assert resolver.compiled() is before
+        assert proposal.status is AmendmentStatus.CONFIRMED
+
 
 # ======================================================================
 # E-6e: Persistence + invariants
@@ -0,0 +1,351 @@
+"""Tests for the anchoring queue — proves commitments are anchored
+asynchronously, batched under one Merkle root, retried with backoff and
+never lost across restarts, and that epoch close never waits for the chain."""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from genesis.crypto.anchor import MockChain, Web3Chain
+from genesis.crypto.anchor_queue import AnchorQueue, AnchorStatus
+from genesis.crypto.epoch_service import EpochService
+from genesis.crypto.merkle import verify_inclusion
+from genesis.persistence.event_log import EventKind, EventLog
+from genesis.policy.resolver import PolicyResolver
+from genesis.service import GenesisService
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
+
+
+@pytest.fixture
+def resolver() -> PolicyResolver:
+    return PolicyResolver.from_config_dir(CONFIG_DIR)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+def _hash(n: int) -> str:
+    return f"sha256:{n:064x}"
+
+
+class TestAnchorQueue:
+    def test_batch_anchors_one_root_with_proofs(self) -> None:
+        chain = MockChain()
+        queue = AnchorQueue(None, chain, batch_size=3)
+        for i in range(5):
+            queue.enqueue(f"epoch-{i}", _hash(i))
+
+        batches = queue.run_until_idle()
+        assert [len(b.commitment_hashes) for b in batches] == [3, 2]
+        assert len(chain.transactions) == 2
+        for batch in batches:
+            assert chain.lookup(batch.anchor.tx_hash) == batch.merkle_root.removeprefix("sha256:")
+            for leaf in batch.commitment_hashes:
+                proof = batch.proof_for(leaf)
+                assert proof.root == batch.merkle_root
+                assert verify_inclusion(proof)
+        assert not queue.pending()
+        assert queue.batch_for(_hash(4)) == batches[1]
+
+    def test_single_commitment_anchors_its_own_hash(self) -> None:
+        queue = AnchorQueue(None, MockChain())
+        queue.enqueue("epoch-1", _hash(7))
+        batch = queue.process_once()
+        assert batch.merkle_root == _hash(7)
+        assert batch.anchor.sha256_hash == f"{7:064x}"
+
+    def test_enqueue_is_idempotent(self) -> None:
+        queue = AnchorQueue(None, MockChain())
+        first = queue.enqueue("epoch-1", _hash(1))
+        assert queue.enqueue("epoch-1", _hash(1)) == first
+        assert len(queue.pending()) == 1
+
+    def test_linger_holds_partial_batches(self) -> None:
+        clock = _Clock()
+        queue = AnchorQueue(None, MockChain(), batch_size=4, linger_seconds=60, clock=clock)
+        queue.enqueue("epoch-1", _hash(1))
+        assert queue.process_once() is None
+        clock.advance(30)
+        queue.enqueue("epoch-2", _hash(2))
+        assert queue.process_once() is None
+        clock.advance(30)
+        batch = queue.process_once()
+        assert batch.epoch_ids == ("epoch-1", "epoch-2")
+
+    def test_retry_with_exponential_backoff(self) -> None:
+        clock = _Clock()
+        chain = MockChain()
+        chain.fail_next(3)
+        queue = AnchorQueue(
+            None, chain, base_delay_seconds=10, max_delay_seconds=25, clock=clock,
+        )
+        entry_id = queue.enqueue("epoch-1", _hash(1))
+
+        delays = []
+        for _ in range(3):
+            before = clock.now
+            assert queue.process_once() is None
+            entry = queue.get_entry(entry_id)
+            delays.append((entry.next_attempt_utc - before).total_seconds())
+            assert queue.process_once() is None  # not due yet
+            clock.now = entry.next_attempt_utc
+        assert delays == [10, 20, 25]
+        assert "injected" in queue.get_entry(entry_id).last_error
+
+        assert queue.process_once() is not None
+        entry = queue.get_entry(entry_id)
+        assert entry.status is AnchorStatus.ANCHORED
+        assert entry.attempts == 4
+
+    def test_max_attempts_then_requeue(self) -> None:
+        chain = MockChain()
+        chain.fail_next(2)
+        queue = AnchorQueue(None, chain, base_delay_seconds=0, max_attempts=2)
+        queue.enqueue("epoch-1", _hash(1))
+        queue.process_once()
+        queue.process_once()
+        assert [e.epoch_id for e in queue.failed()] == ["epoch-1"]
+        assert queue.process_once() is None
+
+        assert queue.requeue_failed() == 1
+        assert queue.process_once() is not None
+        assert not queue.failed()
+
+    def test_state_survives_restart(self, tmp_path: Path) -> None:
+        path = tmp_path / "anchors.jsonl"
+        clock = _Clock()
+        chain = MockChain()
+        queue = AnchorQueue(path, chain, batch_size=2, clock=clock)
+        for i in range(3):
+            queue.enqueue(f"epoch-{i}", _hash(i))
+        first = queue.process_once()
+        queue.mark_collected([first.batch_id])
+        chain.fail_next()
+        queue.process_once()
+
+        reloaded = AnchorQueue(path, chain, batch_size=2, clock=clock)
+        assert reloaded.batches() == queue.batches()
+        assert reloaded.uncollected_batches() == []
+        [entry] = reloaded.pending()
+        assert entry.epoch_id == "epoch-2"
+        assert entry.attempts == 1
+        assert entry.next_attempt_utc == queue.get_entry(entry.entry_id).next_attempt_utc
+
+        clock.advance(3600)
+        batch = reloaded.process_once()
+        assert batch.batch_id == "BATCH-000002"
+        assert reloaded.enqueue("epoch-3", _hash(3)) == "ANCHOR-000004"
+
+    def test_torn_tail_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "anchors.jsonl"
+        queue = AnchorQueue(path, MockChain())
+        queue.enqueue("epoch-1", _hash(1))
+        with path.open("ab") as f:
+            f.write(b'{"op": "enq')
+
+        reloaded = AnchorQueue(path, MockChain())
+        assert [e.epoch_id for e in reloaded.pending()] == ["epoch-1"]
+        reloaded.enqueue("epoch-2", _hash(2))
+        assert len(AnchorQueue(path, MockChain()).pending()) == 2
+
+    def test_compact_keeps_live_state(self, tmp_path: Path) -> None:
+        path = tmp_path / "anchors.jsonl"
+        queue = AnchorQueue(path, MockChain(), batch_size=1)
+        for i in range(4):
+            queue.enqueue(f"epoch-{i}", _hash(i))
+        done = queue.process_once()
+        queue.process_once()
+        queue.mark_collected([done.batch_id])
+        size = path.stat().st_size
+
+        queue.compact()
+        assert path.stat().st_size < size
+        reloaded = AnchorQueue(path, MockChain(), batch_size=1)
+        assert [b.epoch_ids for b in reloaded.uncollected_batches()] == [("epoch-1",)]
+        assert [e.epoch_id for e in reloaded.pending()] == ["epoch-2", "epoch-3"]
+        assert reloaded.enqueue("epoch-9", _hash(9)) == "ANCHOR-000005"
+
+    def test_last_enqueue_survives_compact(self, tmp_path: Path) -> None:
+        path = tmp_path / "anchors.jsonl"
+        clock = _Clock()
+        queue = AnchorQueue(path, MockChain(), clock=clock)
+        assert queue.hours_since_last_enqueue() == float("inf")
+        queue.enqueue("epoch-1", _hash(1))
+        queue.mark_collected([queue.process_once().batch_id])
+        queue.compact()
+        clock.advance(2 * 3600)
+        reloaded = AnchorQueue(path, MockChain(), clock=clock)
+        assert not reloaded.pending() and not reloaded.batches()
+        assert reloaded.hours_since_last_enqueue() == 2
+
+    def test_worker_survives_unexpected_errors(self, monkeypatch) -> None:
+        queue = AnchorQueue(None, MockChain())
+        rounds = []
+        run = queue.run_until_idle
+
+        def flaky() -> list:
+            rounds.append(1)
+            if len(rounds) == 1:
+                raise KeyError("boom")
+            return run()
+
+        monkeypatch.setattr(queue, "run_until_idle", flaky)
+        queue.start(poll_interval=0.01)
+        try:
+            queue.enqueue("epoch-1", _hash(1))
+            deadline = time.monotonic() + 5
+            while queue.pending() and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            queue.stop()
+        assert len(rounds) > 1
+        assert not queue.pending()
+
+
+class _LatchChain(MockChain):
+    """MockChain whose submissions block until the test releases them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.submitting = threading.Event()
+        self.release = threading.Event()
+
+    def submit(self, digest: str):
+        self.submitting.set()
+        assert self.release.wait(10), "chain never released"
+        return super().submit(digest)
+
+
+def _close_constitutional_epoch(svc: GenesisService, i: int):
+    svc.open_epoch(f"epoch-{i}")
+    # Constitutional events make every epoch due for anchoring.
+    svc._epoch_service.record_governance_ballot(_hash(i), is_constitutional=True)
+    return svc.close_epoch(beacon_round=i)
+
+
+class TestAsyncAnchoring:
+    def test_epoch_close_does_not_wait_for_chain(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        chain = _LatchChain()
+        queue = AnchorQueue(tmp_path / "anchors.jsonl", chain)
+        svc = GenesisService(resolver, event_log=EventLog(), anchor_queue=queue)
+        queue.start(poll_interval=0.05)
+        try:
+            assert _close_constitutional_epoch(svc, 0).success
+            assert chain.submitting.wait(5)
+            # The worker is stuck inside the chain call; closes still finish.
+            for i in range(1, 3):
+                result = _close_constitutional_epoch(svc, i)
+                assert result.success
+                assert result.data["anchor_queued"]
+            assert len(queue.pending()) == 3
+            chain.release.set()
+
+            deadline = time.monotonic() + 10
+            while queue.pending() and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            chain.release.set()
+            queue.stop()
+        assert not queue.pending()
+
+        collected = svc.collect_anchor_results()
+        assert collected.success
+        events = svc._event_log.events(EventKind.COMMITMENT_ANCHORED)
+        assert sorted(e.payload["epoch_id"] for e in events) == [
+            "epoch-0", "epoch-1", "epoch-2",
+        ]
+        assert len(svc._epoch_service.anchor_records) == len(collected.data["collected_batches"])
+        assert svc.collect_anchor_results().data["collected_batches"] == []
+
+    def test_worker_collects_and_compacts_as_anchors_land(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        journal = tmp_path / "anchors.jsonl"
+        queue = AnchorQueue(journal, MockChain())
+        svc = GenesisService(resolver, event_log=EventLog(), anchor_queue=queue)
+        queue.start(
+            poll_interval=0.01,
+            on_anchored=lambda _: svc.collect_anchor_results(),
+        )
+        try:
+            for i in range(3):
+                assert _close_constitutional_epoch(svc, i).success
+            deadline = time.monotonic() + 10
+            while (
+                len(svc._event_log.events(EventKind.COMMITMENT_ANCHORED)) < 3
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+        finally:
+            queue.stop()
+
+        events = svc._event_log.events(EventKind.COMMITMENT_ANCHORED)
+        assert sorted(e.payload["epoch_id"] for e in events) == [
+            "epoch-0", "epoch-1", "epoch-2",
+        ]
+        assert svc._epoch_service.anchor_records
+        # Everything was collected, so the queue and its journal are empty
+        # apart from the id sequences.
+        assert queue.batches() == [] and queue.pending() == []
+        lines = journal.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["op"] for line in lines] == ["sequence"]
+
+    def test_close_epoch_follows_anchor_cadence(self, resolver: PolicyResolver) -> None:
+        clock = _Clock()
+        queue = AnchorQueue(None, MockChain(), clock=clock)
+        svc = GenesisService(resolver, event_log=EventLog(), anchor_queue=queue)
+        interval = resolver.l1_anchor_interval_hours("C0")
+
+        def close(epoch_id: str, constitutional: bool = False) -> dict:
+            svc.open_epoch(epoch_id)
+            if constitutional:
+                svc._epoch_service.record_governance_ballot(
+                    _hash(len(epoch_id)), is_constitutional=True,
+                )
+            result = svc.close_epoch(beacon_round=1)
+            assert result.success
+            return result.data
+
+        assert close("epoch-1")["anchor_queued"]
+        clock.advance(3600)
+        assert close("epoch-2")["anchor_deferred"]
+        assert close("epoch-3", constitutional=True)["anchor_queued"]
+        clock.advance(interval * 3600)
+        data = close("epoch-4")
+        assert data["anchor_queued"] and "anchor_deferred" not in data
+        assert [e.epoch_id for e in queue.pending()] == ["epoch-1", "epoch-3", "epoch-4"]
+
+    def test_queued_anchor_matches_direct_digest(self, resolver: PolicyResolver) -> None:
+        epochs = EpochService(resolver)
+        epochs.open_epoch("epoch-1")
+        record = epochs.close_epoch(beacon_round=1)
+        queue = AnchorQueue(None, MockChain())
+        epochs.queue_anchor(record, queue)
+        batch = queue.process_once()
+        assert "sha256:" + batch.anchor.sha256_hash == epochs.previous_hash
+
+
+class TestChainFromEnv:
+    def test_needs_rpc_url_and_key(self, monkeypatch) -> None:
+        for name in ("SEPOLIA_RPC_URL", "PRIVATE_KEY", "SEPOLIA_PRIVATE_KEY"):
+            monkeypatch.delenv(name, raising=False)
+        assert Web3Chain.from_env() is None
+        monkeypatch.setenv("SEPOLIA_RPC_URL", "https://rpc.example")
+        assert Web3Chain.from_env() is None
+        monkeypatch.setenv("SEPOLIA_PRIVATE_KEY", "0xkey")
+        assert isinstance(Web3Chain.from_env(), Web3Chain)
@@ -0,0 +1,73 @@
+"""Tests for the bulk trust decay engine — proves it reproduces
+TrustEngine.apply_inactivity_decay record for record."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from genesis.models.domain_trust import DomainTrustScore
+from genesis.models.trust import ActorKind, TrustRecord
+from genesis.policy.resolver import PolicyResolver
+from genesis.trust.bulk_decay import BulkDecayEngine
+from genesis.trust.engine import TrustEngine
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def resolver() -> PolicyResolver:
+    return PolicyResolver.from_config_dir(CONFIG_DIR)
+
+
+def _population(n: int, seed: int = 7) -> list[TrustRecord]:
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        domains = {}
+        for d in range(rng.randint(0, 4)):
+            last = None if rng.random() < 0.2 else NOW - timedelta(
+                days=rng.choice([0, rng.uniform(-3, 800)]),
+            )
+            domains[f"domain_{d}"] = DomainTrustScore(
+                domain=f"domain_{d}", score=rng.random(),
+                mission_count=rng.randint(0, 60), last_active_utc=last,
+            )
+        records.append(TrustRecord(
+            actor_id=f"actor_{i}",
+            actor_kind=ActorKind.MACHINE if i % 5 == 0 else ActorKind.HUMAN,
+            score=rng.random() * 0.02 if i % 7 == 0 else rng.random(),
+            trust_minted=i % 3 == 0,
+            last_active_utc=None if i % 11 == 0 else NOW - timedelta(days=rng.uniform(0, 900)),
+            domain_scores=domains,
+        ))
+    return records
+
+
+class TestBulkDecayParity:
+    def test_matches_single_record_decay(self, resolver: PolicyResolver) -> None:
+        records = _population(600)
+        reference = TrustEngine(resolver)
+        changed = BulkDecayEngine(resolver).decay(records, now=NOW)
+
+        for record in records:
+            expected = reference.apply_inactivity_decay(record, now=NOW)
+            if expected is record:
+                assert record.actor_id not in changed
+            else:
+                assert changed[record.actor_id] == expected
+
+    def test_skip_and_no_mutation(self, resolver: PolicyResolver) -> None:
+        records = _population(50)
+        before = [r.score for r in records]
+        changed = BulkDecayEngine(resolver).decay(
+            records, now=NOW, skip={"actor_1", "actor_2"},
+        )
+        assert "actor_1" not in changed and "actor_2" not in changed
+        assert [r.score for r in records] == before
+
+    def test_inactive_actor_without_dates_unchanged(self, resolver: PolicyResolver) -> None:
+        record = TrustRecord(actor_id="a", actor_kind=ActorKind.HUMAN, score=0.5)
+        assert BulkDecayEngine(resolver).decay([record], now=NOW) == {}
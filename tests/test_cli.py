@@ -1,9 +1,16 @@
 """Tests for Genesis CLI — proves CLI dispatches correctly."""
 
 import pytest
+from genesis import cli
 from genesis.cli import main, build_parser
 
 
+@pytest.fixture(autouse=True)
+def _isolated_data_dir(tmp_path, monkeypatch) -> None:
+    """Keep CLI runs (event log, state, backups, sidecars) out of the repo."""
+    monkeypatch.setattr(cli, "DEFAULT_DATA", tmp_path / "data")
+
+
 class TestCLIParsing:
     def test_status_command(self) -> None:
         parser = build_parser()
@@ -50,12 +57,23 @@ class TestCLIExecution:
         ])
         assert exit_code == 0
 
-    def test_create_mission_fails_without_epoch(self) -> None:
-        """Creating a mission via CLI fails closed when no epoch is open."""
-        exit_code = main([
+    def test_create_mission_duplicate_fails_closed(self) -> None:
+        """The CLI opens an epoch, so creation succeeds once; a duplicate fails."""
+        argv = [
             "create-mission", "--id", "M-CLI-001",
             "--title", "CLI test mission",
             "--class", "documentation_update",
-        ])
-        # Fail-closed: no epoch open → error exit
-        assert exit_code == 1
+        ]
+        assert main(argv) == 0
+        assert main(argv) == 1
+
+    def test_state_stays_in_data_dir(self, tmp_path) -> None:
+        """State and its journal are written under --data, never in the repo."""
+        data = tmp_path / "elsewhere"
+        for actor in ("cli_a", "cli_b"):
+            assert main([
+                "--data", str(data), "register-actor", "--id", actor,
+                "--kind", "human", "--region", "EU", "--org", "TestOrg",
+            ]) == 0
+        assert (data / "state" / "roster.json").exists()
+        assert not cli.DEFAULT_DATA.exists()
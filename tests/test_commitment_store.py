@@ -0,0 +1,276 @@
+"""Tests for the commitment store — proves closed epochs survive restarts
+and that historical inclusion proofs equal in-memory proofs, read O(log n)
+nodes and fail closed on tampered tree files."""
+
+import hashlib
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+from genesis.crypto.anchor import MockChain
+from genesis.crypto.epoch_service import EpochService
+from genesis.crypto.merkle import MerkleTree, verify_inclusion
+from genesis.models.mission import DomainType, MissionClass
+from genesis.models.trust import ActorKind
+from genesis.persistence import commitment_store
+from genesis.persistence.commitment_store import CommitmentStore
+from genesis.persistence.event_log import EventLog
+from genesis.policy.resolver import PolicyResolver
+from genesis.service import GenesisService
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
+
+
+@pytest.fixture
+def resolver() -> PolicyResolver:
+    return PolicyResolver.from_config_dir(CONFIG_DIR)
+
+
+def _hash(rng: random.Random) -> str:
+    return f"sha256:{rng.getrandbits(256):064x}"
+
+
+def _fill_epochs(epochs: EpochService, rng: random.Random, count: int) -> dict:
+    """Close ``count`` epochs of random events; return {epoch_id: {domain: leaves}}."""
+    recorders = {
+        "mission": epochs.record_mission_event,
+        "trust": epochs.record_trust_delta,
+        "governance": epochs.record_governance_ballot,
+        "review": epochs.record_review_decision,
+    }
+    leaves: dict = {}
+    start = len(epochs.committed_records)
+    for i in range(start, start + count):
+        epoch_id = epochs.open_epoch(f"epoch-{i}")
+        leaves[epoch_id] = {}
+        for domain, record in recorders.items():
+            n = rng.choice([0, 1, 2, 3, 7, 40])
+            leaves[epoch_id][domain] = [_hash(rng) for _ in range(n)]
+            for leaf in leaves[epoch_id][domain]:
+                record(leaf)
+        epochs.close_epoch(beacon_round=1)
+    return leaves
+
+
+class TestCommitmentStore:
+    def test_proofs_match_in_memory_trees_after_reopen(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        rng = random.Random(25)
+        epochs = EpochService(resolver, commitment_store=CommitmentStore(tmp_path))
+        leaves = _fill_epochs(epochs, rng, 6)
+
+        store = CommitmentStore(tmp_path)
+        assert store.records() == epochs.committed_records
+        assert store.head == epochs.previous_hash
+        for epoch_id, domains in leaves.items():
+            assert store.verify_epoch(epoch_id)
+            for domain, domain_leaves in domains.items():
+                if not domain_leaves:
+                    continue
+                tree = MerkleTree()
+                for leaf in domain_leaves:
+                    tree.add_leaf(leaf)
+                tree.compute_root()
+                for leaf in domain_leaves:
+                    found = store.inclusion_proof(leaf)
+                    assert (found.epoch_id, found.domain) == (epoch_id, domain)
+                    assert store.locate(leaf) == (epoch_id, domain)
+                    assert found.proof == tree.inclusion_proof(leaf)
+                    assert verify_inclusion(found.proof)
+                    assert found.proof.root == getattr(
+                        found.record, commitment_store._ROOT_FIELDS[domain],
+                    )
+        assert store.inclusion_proof(_hash(rng)) is None
+        assert store.inclusion_proof("not-a-hash") is None
+
+    def test_epoch_service_resumes_chain_from_store(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        epochs = EpochService(resolver, commitment_store=CommitmentStore(tmp_path))
+        _fill_epochs(epochs, random.Random(1), 2)
+        chain = MockChain()
+        epochs.record_anchor(chain.submit("ab" * 32))
+
+        resumed = EpochService(resolver, commitment_store=CommitmentStore(tmp_path))
+        assert resumed.previous_hash == epochs.previous_hash
+        assert resumed.anchor_records == epochs.anchor_records
+        _fill_epochs(resumed, random.Random(2), 1)
+        records = resumed.committed_records
+        assert len(records) == 3
+        assert records[2].previous_commitment_hash == epochs.previous_hash
+
+    def test_proof_reads_logarithmic_nodes(
+        self, resolver: PolicyResolver, tmp_path: Path, monkeypatch,
+    ) -> None:
+        rng = random.Random(3)
+        epochs = EpochService(resolver, commitment_store=CommitmentStore(tmp_path))
+        epochs.open_epoch()
+        leaves = [_hash(rng) for _ in range(5000)]
+        for leaf in leaves:
+            epochs.record_mission_event(leaf)
+        epochs.close_epoch(beacon_round=1)
+        store = CommitmentStore(tmp_path)
+
+        reads = []
+        node = commitment_store._TreeFile.node
+        monkeypatch.setattr(
+            commitment_store._TreeFile, "node",
+            lambda self, *args: reads.append(args) or node(self, *args),
+        )
+        assert verify_inclusion(store.inclusion_proof(leaves[1234]).proof)
+        assert len(reads) <= 2 * math.ceil(math.log2(5000)) + 3
+
+    def test_tampered_tree_file_fails_closed(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        epochs = EpochService(resolver, commitment_store=CommitmentStore(tmp_path))
+        leaves = _fill_epochs(epochs, random.Random(4), 1)
+        epoch_id = next(iter(leaves))
+        tree_path = tmp_path / "epoch-000000.tree"
+
+        # Flip a leaf byte: the file still opens, but a full verify fails.
+        layout = commitment_store._TreeFile.open(tree_path)
+        offset = next(
+            levels[0][0] for levels in layout.levels if len(levels) > 1
+        )
+        data = bytearray(tree_path.read_bytes())
+        data[offset + 5] ^= 0xFF
+        tree_path.write_bytes(bytes(data))
+        assert not CommitmentStore(tmp_path).verify_epoch(epoch_id)
+
+        # Truncate it: opening the store rejects the file.
+        tree_path.write_bytes(bytes(data[:-1]))
+        with pytest.raises(ValueError):
+            CommitmentStore(tmp_path)
+
+    def test_torn_journal_line_is_discarded(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        epochs = EpochService(resolver, commitment_store=CommitmentStore(tmp_path))
+        _fill_epochs(epochs, random.Random(5), 2)
+        with (tmp_path / "commitments.jsonl").open("ab") as f:
+            f.write(b'{"ordinal": 2, "comm')
+        store = CommitmentStore(tmp_path)
+        assert len(store) == 2
+        resumed = EpochService(resolver, commitment_store=store)
+        _fill_epochs(resumed, random.Random(6), 1)
+        assert len(CommitmentStore(tmp_path)) == 3
+
+    def test_open_reads_no_leaves_and_keeps_few_index_runs(
+        self, resolver: PolicyResolver, tmp_path: Path, monkeypatch,
+    ) -> None:
+        epochs = EpochService(resolver, commitment_store=CommitmentStore(tmp_path))
+        leaves = _fill_epochs(epochs, random.Random(7), 11)
+        runs = sorted(p.name for p in tmp_path.glob("index-*.idx"))
+        assert runs == [  # 11 = 8 + 2 + 1 epochs
+            "index-000000-000007.idx", "index-000008-000009.idx",
+            "index-000010-000010.idx",
+        ]
+
+        reads = []
+        level = commitment_store._TreeFile.level
+        monkeypatch.setattr(
+            commitment_store._TreeFile, "level",
+            lambda self, *args: reads.append(args) or level(self, *args),
+        )
+        store = CommitmentStore(tmp_path)
+        assert reads == []
+        for epoch_id, domains in leaves.items():
+            for domain, domain_leaves in domains.items():
+                for leaf in domain_leaves:
+                    assert store.locate(leaf) == (epoch_id, domain)
+
+    def test_missing_index_runs_are_rebuilt(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        epochs = EpochService(resolver, commitment_store=CommitmentStore(tmp_path))
+        leaves = _fill_epochs(epochs, random.Random(8), 3)
+        for path in tmp_path.glob("index-*.idx"):
+            path.unlink()
+        # A run for an epoch the journal never recorded is dropped.
+        (tmp_path / "index-000003-000003.idx").write_bytes(b"")
+
+        store = CommitmentStore(tmp_path)
+        assert sorted(p.name for p in tmp_path.glob("index-*.idx")) == [
+            "index-000000-000001.idx", "index-000002-000002.idx",
+        ]
+        for epoch_id, domains in leaves.items():
+            for domain, domain_leaves in domains.items():
+                for leaf in domain_leaves:
+                    assert store.locate(leaf) == (epoch_id, domain)
+
+    def test_duplicate_leaf_resolves_to_oldest_epoch(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        leaf = _hash(random.Random(9))
+        epochs = EpochService(resolver, commitment_store=CommitmentStore(tmp_path))
+        for i, record in enumerate([epochs.record_review_decision, epochs.record_trust_delta]):
+            epochs.open_epoch(f"epoch-{i}")
+            record(leaf)
+            epochs.close_epoch(beacon_round=1)
+        assert CommitmentStore(tmp_path).locate(leaf) == ("epoch-0", "review")
+
+    def test_store_failure_keeps_epoch_open(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        store = CommitmentStore(tmp_path)
+        epochs = EpochService(resolver, commitment_store=store)
+        epochs.open_epoch("epoch-1")
+        epochs.record_mission_event("event-without-sha256-form")
+        with pytest.raises(ValueError):
+            epochs.close_epoch(beacon_round=1)
+        assert not epochs.current_epoch.closed
+        assert len(store) == 0
+
+
+class TestEventProofService:
+    def test_proof_for_historical_event(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        def make() -> GenesisService:
+            return GenesisService(
+                resolver, event_log=EventLog(tmp_path / "events.jsonl"),
+                commitment_store=CommitmentStore(tmp_path / "commitments"),
+            )
+
+        svc = make()
+        svc.open_epoch("epoch-1")
+        svc.register_actor("human-1", ActorKind.HUMAN, "eu", "org-1", initial_trust=0.6)
+        svc.create_mission(
+            mission_id="M-1", title="Mission",
+            mission_class=MissionClass.DOCUMENTATION_UPDATE,
+            domain_type=DomainType.OBJECTIVE,
+        )
+        assert svc.close_epoch(beacon_round=1).success
+        svc.open_epoch("epoch-2")
+        assert svc.close_epoch(beacon_round=2).success
+        event = svc._event_log.events()[-1]
+
+        reloaded = make()
+        result = reloaded.event_inclusion_proof(event.event_id)
+        assert result.success, result.errors
+        assert result.data["epoch_id"] == "epoch-1"
+        assert result.data["verified"]
+        canonical = "|".join(str(result.data["commitment"][f]) for f in (
+            "commitment_version", "epoch_id", "previous_commitment_hash",
+            "mission_event_root", "trust_delta_root", "governance_ballot_root",
+            "review_decision_root", "public_beacon_round", "chamber_nonce",
+            "timestamp_utc",
+        ))
+        assert result.data["commitment_hash"] == (
+            "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        )
+
+        by_hash = reloaded.event_inclusion_proof(result.data["leaf_hash"])
+        assert by_hash.data == result.data
+        assert not reloaded.event_inclusion_proof("EVT-missing").success
+        assert not reloaded.event_inclusion_proof(
+            result.data["leaf_hash"], epoch_id="epoch-2",
+        ).success
+
+    def test_requires_store(self, resolver: PolicyResolver) -> None:
+        svc = GenesisService(resolver, event_log=EventLog())
+        assert not svc.event_inclusion_proof("EVT-00000001").success
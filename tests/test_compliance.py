@@ -30,6 +30,7 @@ from genesis.compliance.screener import (
     ComplianceVerdict,
     ComplaintStatus,
 )
+from genesis.compliance.rescreen import ComplianceRescreener, ScreeningSubject
 from genesis.compliance.penalties import (
     PenaltyEscalationEngine,
     PenaltySeverity,
@@ -38,7 +39,7 @@ from genesis.compliance.penalties import (
 )
 from genesis.models.mission import DomainType, MissionClass
 from genesis.models.trust import ActorKind
-from genesis.persistence.event_log import EventKind
+from genesis.persistence.event_log import EventKind, EventLog
 from genesis.policy.resolver import PolicyResolver
 from genesis.review.roster import ActorStatus
 from genesis.service import GenesisService
@@ -190,6 +191,65 @@ class TestComplianceScreener:
         assert result.verdict == ComplianceVerdict.REJECTED
 
 
+# =====================================================================
+# TestKeywordAutomaton — single-pass matching parity
+# =====================================================================
+
+def _reference_categories(keywords: dict[str, list[str]], text: str) -> set[str]:
+    """The original per-keyword substring loop."""
+    return {c for c, kws in keywords.items() if any(k in text for k in kws)}
+
+
+class TestKeywordAutomaton:
+    def test_matches_substring_loops(self):
+        import random
+        from genesis.compliance.keywords import KeywordAutomaton
+
+        reject = ComplianceScreener._REJECT_KEYWORDS
+        flag = ComplianceScreener._FLAG_KEYWORDS
+        automaton = KeywordAutomaton({"reject": reject, "flag": flag})
+        vocab = [k for kws in [*reject.values(), *flag.values()] for k in kws]
+        vocab += ["data", "pipeline", "s", "ed", "x", "weapons", "laun"]
+        rng = random.Random(7)
+        for _ in range(3000):
+            parts = [rng.choice(vocab) for _ in range(rng.randint(0, 6))]
+            text = rng.choice([" ", ""]).join(parts)
+            hits = automaton.scan(text)
+            assert hits["reject"] == _reference_categories(reject, text), text
+            assert hits["flag"] == _reference_categories(flag, text), text
+
+    def test_overlapping_keywords_all_reported(self, screener: ComplianceScreener):
+        """'weapon design' starts inside 'biological weapon'."""
+        result = screener.screen_mission(
+            title="biological weapon design", description="", now=_now(),
+        )
+        assert result.categories_matched == [
+            "biological_weapons", "weapons_development",
+        ]
+
+    def test_screen_many_matches_screen_mission(self, screener: ComplianceScreener):
+        proposals = [
+            ("Build a dashboard", "Weekly metrics.", ["python"]),
+            ("Ponzi scheme", "Guaranteed returns", None),
+            ("Tracking device firmware", "", ["iot"]),
+            ("", "", None),
+            ("Fraud-detection", "for a bank", ["money laundering"]),
+        ]
+        bulk = screener.screen_many(proposals, now=_now())
+        single = [
+            screener.screen_mission(t, d, tags, now=_now())
+            for t, d, tags in proposals
+        ]
+        assert bulk == single
+        assert [r.verdict for r in bulk] == [
+            ComplianceVerdict.CLEAR,
+            ComplianceVerdict.REJECTED,
+            ComplianceVerdict.FLAGGED,
+            ComplianceVerdict.CLEAR,
+            ComplianceVerdict.REJECTED,
+        ]
+
+
 # =====================================================================
 # TestComplianceComplaint — post-hoc complaints
 # =====================================================================
@@ -692,6 +752,135 @@ class TestComplianceServiceIntegration:
         assert "Mission not found" in result.errors[0]
 
 
+# =====================================================================
+# TestComplianceRescreening — bulk re-screening with checkpoints
+# =====================================================================
+
+def _rescreen_service(resolver: PolicyResolver) -> GenesisService:
+    svc = GenesisService(resolver, event_log=EventLog())
+    svc.open_epoch("test-epoch")
+    titles = [
+        "Write documentation",
+        "Fraud detection dashboard",
+        "Weapons trafficking network",
+        "Translate the user guide",
+        "Review a scam report",
+    ]
+    for i, title in enumerate(titles):
+        svc.create_mission(
+            mission_id=f"m_{i}",
+            title=title,
+            mission_class=MissionClass.DOCUMENTATION_UPDATE,
+            domain_type=DomainType.OBJECTIVE,
+        )
+    return svc
+
+
+class TestComplianceRescreening:
+    """Bulk re-screening matches per-item screening and resumes cleanly."""
+
+    def test_matches_screen_mission(self, resolver: PolicyResolver):
+        svc = _rescreen_service(resolver)
+        result = svc.rescreen_compliance(chunk_size=2, now=_now())
+        assert result.success
+        assert result.data["complete"]
+        assert result.data["screened"] == 5
+        assert result.data["rejected"] == ["mission/m_2"]
+        assert result.data["flagged"] == ["mission/m_1", "mission/m_4"]
+
+        events = svc._event_log.events(EventKind.COMPLIANCE_SCREENING_COMPLETED)
+        assert [e.payload["subject_id"] for e in events] == [f"m_{i}" for i in range(5)]
+        for event in events:
+            mission = svc._missions[event.payload["subject_id"]]
+            expected = ComplianceScreener().screen_mission(
+                mission.mission_title, "", now=_now(),
+            )
+            assert event.payload["verdict"] == expected.verdict.value
+        assert len({e.payload["event_hash"] for e in events}) == 5
+
+    def test_resume_from_checkpoint(self, resolver: PolicyResolver):
+        whole = _rescreen_service(resolver).rescreen_compliance(now=_now())
+
+        svc = _rescreen_service(resolver)
+        first = svc.rescreen_compliance(limit=3, chunk_size=2, now=_now())
+        assert first.data["next_cursor"] == "mission/m_2"
+        assert not first.data["complete"]
+        rest = svc.rescreen_compliance(
+            cursor=first.data["next_cursor"], chunk_size=2, now=_now(),
+        )
+        assert rest.data["complete"]
+        assert first.data["flagged"] + rest.data["flagged"] == whole.data["flagged"]
+        assert first.data["rejected"] + rest.data["rejected"] == whole.data["rejected"]
+        events = svc._event_log.events(EventKind.COMPLIANCE_SCREENING_COMPLETED)
+        assert len(events) == 5
+
+    def test_saved_checkpoint_survives_restart(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ):
+        from genesis.persistence.state_store import StateStore
+
+        svc = _rescreen_service(resolver)
+        svc._state_store = StateStore(tmp_path / "state.json")
+        svc._persist_state()
+        first = svc.rescreen_compliance(limit=3, chunk_size=2, now=_now())
+        assert first.data["next_cursor"] == "mission/m_2"
+
+        resumed = GenesisService(
+            resolver, event_log=EventLog(),
+            state_store=StateStore(tmp_path / "state.json"),
+        )
+        assert resumed._rescreen_cursor == "mission/m_2"
+        resumed.open_epoch("resumed-epoch")
+        rest = resumed.rescreen_compliance(now=_now())
+        assert rest.data["screened"] == 2
+        assert rest.data["complete"]
+        assert StateStore(tmp_path / "state.json").load_compliance_rescreen_cursor() is None
+
+    def test_restart_ignores_saved_checkpoint(self, resolver: PolicyResolver):
+        svc = _rescreen_service(resolver)
+        svc.rescreen_compliance(limit=3, now=_now())
+        assert svc.rescreen_compliance(now=_now()).data["screened"] == 2
+        assert svc.rescreen_compliance(now=_now()).data["screened"] == 5
+        svc.rescreen_compliance(limit=1, now=_now())
+        assert svc.rescreen_compliance(restart=True, now=_now()).data["screened"] == 5
+
+    def test_in_process_reuses_screener_automaton(
+        self, screener: ComplianceScreener, monkeypatch,
+    ):
+        from genesis.compliance import rescreen
+
+        def no_compile(*args, **kwargs):
+            raise AssertionError("automaton compiled per chunk")
+
+        monkeypatch.setattr(rescreen, "KeywordAutomaton", no_compile)
+        subjects = [ScreeningSubject("listing", "l_1", "ponzi scheme", "")]
+        [(_, results)] = ComplianceRescreener(screener).run(subjects, _now())
+        assert results[0].verdict == ComplianceVerdict.REJECTED
+
+    def test_keyword_lists_are_a_copy(self, screener: ComplianceScreener):
+        keywords = screener.keyword_lists()
+        keywords["reject"]["financial_fraud"].append("anything")
+        assert "anything" not in ComplianceScreener._REJECT_KEYWORDS["financial_fraud"]
+
+    def test_process_pool_matches_in_process(self, screener: ComplianceScreener):
+        subjects = [
+            ScreeningSubject("listing", f"l_{i:03d}", title, "")
+            for i, title in enumerate(
+                ["ponzi scheme", "a clean task", "fraud audit", "plain"] * 5
+            )
+        ]
+        serial = list(ComplianceRescreener(screener, chunk_size=3).run(subjects, _now()))
+        pooled = list(
+            ComplianceRescreener(screener, chunk_size=3, workers=2).run(subjects, _now())
+        )
+        assert [c for c, _ in pooled] == [c for c, _ in serial]
+        assert [r for _, r in pooled] == [r for _, r in serial]
+
+    def test_invalid_cursor_rejected(self, service: GenesisService):
+        result = service.rescreen_compliance(cursor="nonsense")
+        assert not result.success
+
+
 # =====================================================================
 # TestProhibitedCategories — configuration integrity
 # =====================================================================
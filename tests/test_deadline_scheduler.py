@@ -0,0 +1,183 @@
+"""Tests for the deadline scheduler — proves run_due() handles exactly the
+deadlines the per-domain sweeps would, touches nothing early, and that the
+scheduler rebuilds identically from persisted state."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from genesis.governance.assembly import AssemblyTopicStatus
+from genesis.governance.deadlines import DeadlineKind, DeadlineScheduler
+from genesis.models.trust import ActorKind
+from genesis.persistence.event_log import EventLog
+from genesis.persistence.state_store import StateStore
+from genesis.policy.resolver import PolicyResolver
+from genesis.review.roster import ActorStatus, IdentityVerificationStatus
+from genesis.service import GenesisService
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
+
+T0 = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def resolver() -> PolicyResolver:
+    return PolicyResolver.from_config_dir(CONFIG_DIR)
+
+
+def _make_service(resolver: PolicyResolver, **kwargs) -> GenesisService:
+    svc = GenesisService(resolver, event_log=EventLog(), **kwargs)
+    svc.open_epoch()
+    for i, region in enumerate(["eu", "us", "asia"]):
+        svc.register_actor(
+            f"human-{i}", ActorKind.HUMAN, region, f"org-{i}", initial_trust=0.5,
+        )
+    return svc
+
+
+def _verify(svc: GenesisService, actor_id: str, now: datetime) -> None:
+    assert svc.request_verification(actor_id).success
+    assert svc.complete_verification(actor_id, "voice_liveness", now=now).success
+
+
+class TestDeadlineScheduler:
+    def test_pops_in_due_then_kind_then_key_order(self) -> None:
+        s = DeadlineScheduler()
+        s.schedule(DeadlineKind.TOPIC_INACTIVITY, "t1", T0)
+        s.schedule(DeadlineKind.IDENTITY_EXPIRY, "b", T0)
+        s.schedule(DeadlineKind.IDENTITY_EXPIRY, "a", T0)
+        s.schedule(DeadlineKind.LEAVE_EXPIRY, "l1", T0 - timedelta(days=1))
+        s.schedule(DeadlineKind.LEAVE_EXPIRY, "later", T0 + timedelta(days=1))
+
+        popped = [(kind, key) for kind, key, _ in s.pop_due(T0)]
+        assert popped == [
+            (DeadlineKind.LEAVE_EXPIRY, "l1"),
+            (DeadlineKind.IDENTITY_EXPIRY, "a"),
+            (DeadlineKind.IDENTITY_EXPIRY, "b"),
+            (DeadlineKind.TOPIC_INACTIVITY, "t1"),
+        ]
+        assert len(s) == 1
+        assert s.next_due() == T0 + timedelta(days=1)
+
+    def test_reschedule_and_cancel_supersede_old_entries(self) -> None:
+        s = DeadlineScheduler()
+        s.schedule(DeadlineKind.IDENTITY_EXPIRY, "a", T0)
+        s.schedule(DeadlineKind.IDENTITY_EXPIRY, "a", T0 + timedelta(days=5))
+        s.schedule(DeadlineKind.IDENTITY_EXPIRY, "b", T0)
+        s.cancel(DeadlineKind.IDENTITY_EXPIRY, "b")
+
+        assert s.pop_due(T0 + timedelta(days=1)) == []
+        assert s.pop_due(T0 + timedelta(days=5)) == [
+            (DeadlineKind.IDENTITY_EXPIRY, "a", T0 + timedelta(days=5)),
+        ]
+        assert len(s) == 0 and s.next_due() is None
+
+    def test_heap_compacts_under_churn(self) -> None:
+        s = DeadlineScheduler()
+        for i in range(1000):
+            s.schedule(DeadlineKind.TOPIC_INACTIVITY, "t", T0 + timedelta(seconds=i))
+        assert len(s) == 1
+        assert len(s._heap) < 200
+        assert s.pop_due(T0 + timedelta(days=1)) == [
+            (DeadlineKind.TOPIC_INACTIVITY, "t", T0 + timedelta(seconds=999)),
+        ]
+
+
+class TestRunDue:
+    def test_identity_lapse_is_strict(self, resolver: PolicyResolver) -> None:
+        svc = _make_service(resolver)
+        _verify(svc, "human-0", T0)
+        expires = svc.get_actor("human-0").identity_expires_utc
+
+        assert svc.run_due(expires).data["handled_count"] == 0
+        result = svc.run_due(expires + timedelta(seconds=1))
+        assert result.data["handled"]["identity_expiry"] == ["human-0"]
+        assert svc.get_actor("human-0").identity_status == IdentityVerificationStatus.LAPSED
+        assert len(svc._deadlines) == 0
+
+    def test_topic_activity_defers_archival(self, resolver: PolicyResolver) -> None:
+        svc = _make_service(resolver)
+        topic_id = svc.create_assembly_topic(
+            "human-0", "Topic", "Opening", now=T0,
+        ).data["topic_id"]
+        svc.contribute_to_assembly(
+            "human-1", topic_id, "Reply", now=T0 + timedelta(days=20),
+        )
+
+        # The original deadline surfaces, is found stale, and is re-filed.
+        assert svc.run_due(T0 + timedelta(days=31)).data["handled_count"] == 0
+        assert svc._deadlines.due_utc(
+            DeadlineKind.TOPIC_INACTIVITY, topic_id,
+        ) == T0 + timedelta(days=50)
+
+        result = svc.run_due(T0 + timedelta(days=50))
+        assert result.data["handled"]["topic_inactivity"] == [topic_id]
+        topic = svc._assembly_engine.get_topic(topic_id)
+        assert topic.status == AssemblyTopicStatus.ARCHIVED
+
+    def test_zero_trust_machine_decommission(self, resolver: PolicyResolver) -> None:
+        svc = _make_service(resolver)
+        svc.register_machine(
+            "bot-1", operator_id="human-0", region="eu", organization="org-0",
+            model_family="gpt", method_type="reasoning_model",
+        )
+        trust = svc._trust_records["bot-1"]
+        trust.score = 0.0
+        trust.last_active_utc = T0
+        svc.quarantine_actor("bot-1")
+
+        threshold = resolver.decommission_rules()["M_ZERO_DECOMMISSION_DAYS"]
+        due = T0 + timedelta(days=threshold)
+        assert svc.run_due(due - timedelta(seconds=1)).data["handled_count"] == 0
+        result = svc.run_due(due)
+        assert result.data["handled"]["machine_decommission"] == ["bot-1"]
+        assert svc.get_actor("bot-1").status == ActorStatus.DECOMMISSIONED
+
+    def test_matches_full_sweeps(self, resolver: PolicyResolver) -> None:
+        """run_due() at a given instant changes exactly what the sweeps do."""
+        def build() -> GenesisService:
+            svc = _make_service(resolver)
+            for i in range(3):
+                _verify(svc, f"human-{i}", T0 + timedelta(days=10 * i))
+                svc.create_assembly_topic(
+                    f"human-{i}", f"Topic {i}", "Content",
+                    now=T0 + timedelta(days=15 * i),
+                )
+            return svc
+
+        now = T0 + timedelta(days=400)
+        swept, scheduled = build(), build()
+        swept.check_lapsed_identities(now)
+        swept.archive_inactive_assembly_topics(now)
+        scheduled.run_due(now)
+
+        for i in range(3):
+            aid = f"human-{i}"
+            assert (
+                swept.get_actor(aid).identity_status
+                == scheduled.get_actor(aid).identity_status
+            )
+        assert (
+            [t.status for t in swept._assembly_engine.list_topics()]
+            == [t.status for t in scheduled._assembly_engine.list_topics()]
+        )
+
+
+class TestRebuild:
+    def test_rebuilds_identically_from_state_store(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        store = StateStore(tmp_path / "state.json")
+        svc = _make_service(resolver, state_store=store)
+        _verify(svc, "human-0", T0)
+        svc.create_assembly_topic("human-1", "Topic", "Content", now=T0)
+        live = svc._deadlines.entries()
+        assert {kind for kind, _ in live} == {
+            DeadlineKind.IDENTITY_EXPIRY, DeadlineKind.TOPIC_INACTIVITY,
+        }
+
+        reloaded = GenesisService(
+            resolver, event_log=EventLog(), state_store=StateStore(tmp_path / "state.json"),
+        )
+        assert reloaded._deadlines.entries() == live
@@ -268,3 +268,20 @@ class TestCommitmentContent:
         record = service.close_epoch(beacon_round=99)
         fields = record.canonical_fields()
         assert len(fields) == 10
+
+
+class TestRunningRoots:
+    def test_current_roots_match_committed_roots(self, service: EpochService) -> None:
+        service.open_epoch("live-roots")
+        for n in (7, 3, 11, 5):
+            service.record_mission_event(_hash(n))
+        service.record_trust_delta(_hash(99))
+        live = service.current_roots()
+        record = service.close_epoch(beacon_round=1)
+        assert live["mission"] == record.mission_event_root
+        assert live["trust"] == record.trust_delta_root
+        assert live["governance"] == record.governance_ballot_root
+
+    def test_current_roots_requires_open_epoch(self, service: EpochService) -> None:
+        with pytest.raises(RuntimeError):
+            service.current_roots()
@@ -276,6 +276,19 @@ class TestDisbursementEngine:
         voting = engine.list_proposals(DisbursementStatus.VOTING)
         assert len(voting) == 0
 
+    def test_proposal_ids_after(self) -> None:
+        engine = self._engine()
+        ids = sorted(
+            engine.create_proposal(
+                f"h{i}", f"T{i}", "d", Decimal("10"), "r",
+                DisbursementCategory.PUBLIC_GOOD_MISSION, ["d1"], "clear", _now(),
+            ).proposal_id
+            for i in range(3)
+        )
+        assert list(engine.proposal_ids_after()) == ids
+        assert list(engine.proposal_ids_after(ids[0])) == ids[1:]
+        assert list(engine.proposal_ids_after(ids[-1])) == []
+
 
 # ======================================================================
 # Compliance screening for proposals
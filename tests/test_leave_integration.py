@@ -751,6 +751,33 @@ class TestQueryMethods:
         service.request_leave(actors["applicant"], LeaveCategory.ILLNESS)
         assert service.is_actor_on_leave(actors["applicant"]) is False
 
+    def test_leave_index_matches_record_scan(self) -> None:
+        """is_actor_on_leave/actors_on_leave agree with a full scan
+        through activation, return and memorialisation."""
+        service = _make_service(event_log=EventLog())
+        actors = _setup_leave_scenario(service)
+
+        def scan() -> set[str]:
+            return {
+                r.actor_id for r in service._leave_records.values()
+                if r.state in (LeaveState.ACTIVE, LeaveState.MEMORIALISED)
+            }
+
+        leave_id = service.request_leave(
+            actors["applicant"], LeaveCategory.ILLNESS,
+        ).data["leave_id"]
+        assert service.actors_on_leave() == scan() == set()
+        for doc_key in ["doc1", "doc2", "doc3"]:
+            service.adjudicate_leave(
+                leave_id, actors[doc_key], AdjudicationVerdict.APPROVE,
+            )
+        assert service.actors_on_leave() == scan() == {actors["applicant"]}
+        assert service.is_actor_on_leave(f" {actors['applicant']} ")
+
+        service.return_from_leave(leave_id)
+        assert service.actors_on_leave() == scan() == set()
+        assert not service.is_actor_on_leave(actors["applicant"])
+
     def test_get_leave_status(self) -> None:
         service = _make_service(event_log=EventLog())
         actors = _setup_leave_scenario(service)
@@ -813,6 +840,8 @@ class TestPersistenceRoundTrip:
         # Verify actor is still on leave
         entry = service2._roster.get(actors["applicant"])
         assert entry.status == ActorStatus.ON_LEAVE
+        assert service2.is_actor_on_leave(actors["applicant"]) is True
+        assert service2.actors_on_leave() == {actors["applicant"]}
 
     def test_leave_records_empty_on_fresh_start(self, tmp_path: Path) -> None:
         store_path = tmp_path / "genesis_state.json"
@@ -49,12 +49,18 @@ reject design.
 from __future__ import annotations
 
 import dataclasses
+import random
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from genesis.governance.domain_expert import (
+    ClearanceLevel,
+    DomainClearanceStatus,
+    DomainExpertEngine,
+)
 from genesis.governance.machine_agency import (
     MachineAgencyEngine,
     MachineTier,
@@ -1224,3 +1230,112 @@ class TestMachineAgencyServiceIntegration:
         # Bot-1 won't have 5 years — just verify the check runs
         assert result.data["has_5_years_tier2"] is False
         assert "all_met" in result.data
+
+
+# ==================================================================
+# Per-machine indexes and tier cache
+# ==================================================================
+
+class TestPerMachineIndexes:
+    """Per-machine clearance/grant indexes agree with full scans."""
+
+    def test_clearance_index_matches_scan(self) -> None:
+        rng = random.Random(22)
+        clearances = DomainExpertEngine({})
+        grants = MachineAgencyEngine(_default_config())
+        machines, domains = ["m1", "m2", "m3"], ["eng", "med", "law"]
+        now = _now()
+        for step in range(300):
+            now += timedelta(hours=1)
+            machine, domain = rng.choice(machines), rng.choice(domains)
+            level = rng.choice(list(ClearanceLevel))
+            pending = [c for c in clearances._clearances.values()
+                       if c.status == DomainClearanceStatus.PENDING]
+            active = [c for c in clearances._clearances.values()
+                      if c.status == DomainClearanceStatus.ACTIVE]
+            op = rng.randrange(6)
+            try:
+                if op == 0:
+                    clearances.nominate_for_clearance(
+                        machine, "org", domain, "h1", level, now=now,
+                    )
+                elif op == 1 and pending:
+                    c = rng.choice(pending)
+                    for v in range(5):
+                        clearances.vote_on_clearance(
+                            c.clearance_id, f"h{v}", 0.9, True, "ok", now=now,
+                        )
+                    clearances.evaluate_clearance(c.clearance_id, 0.9, now=now)
+                elif op == 2 and active:
+                    clearances.revoke_clearance(
+                        rng.choice(active).clearance_id, "h1", now=now,
+                    )
+                elif op == 3 and active:
+                    clearances.renew_clearance(
+                        rng.choice(active).clearance_id, now=now,
+                    )
+                elif op == 4 and active:
+                    c = rng.choice(active)
+                    clearances.expire_if_due(c.clearance_id, c.expires_utc)
+                elif op == 5:
+                    grant = grants.initiate_tier3_petition(
+                        machine, domain, "h1", f"p{step}", now=now,
+                    )
+                    if rng.random() < 0.7:
+                        grants.on_amendment_confirmed(grant.petition_id, now=now)
+            except ValueError:
+                pass
+
+        restored = DomainExpertEngine.from_records({}, clearances.to_records())
+        for engine in (clearances, restored):
+            for machine in machines:
+                scanned = sorted(
+                    (c for c in engine._clearances.values()
+                     if c.machine_id == machine
+                     and c.status == DomainClearanceStatus.ACTIVE),
+                    key=lambda c: c.approved_utc or c.nominated_utc,
+                    reverse=True,
+                )
+                assert engine.get_active_clearances(machine_id=machine) == scanned
+                for domain in domains:
+                    for level in ClearanceLevel:
+                        assert engine.has_active_clearance(
+                            machine, domain, level,
+                        ) == any(c.domain == domain and c.level == level
+                                 for c in scanned)
+        for machine in machines:
+            assert grants.get_all_grants(machine_id=machine) == [
+                g for g in grants._tier3_grants.values()
+                if g.machine_id == machine
+            ]
+
+    def test_tier_cache_invalidated_per_machine(
+        self, service: GenesisService,
+    ) -> None:
+        clearances = service._domain_expert_engine
+        assert service.compute_machine_tier("bot-1").data["effective_tier"] == "tier_0"
+        bot2_revision = clearances.machine_revision("bot-2")
+
+        c = clearances.nominate_for_clearance(
+            "bot-1", "acme", "engineering", "human-1", now=_now(),
+        )
+        # A pending nomination changes nothing the tier depends on.
+        assert clearances.machine_revision("bot-1") == 0
+        for v in range(3):
+            clearances.vote_on_clearance(
+                c.clearance_id, f"human-{v + 1}", 0.75, True, "ok", now=_now(),
+            )
+        clearances.evaluate_clearance(c.clearance_id, now=_now())
+        assert service.compute_machine_tier("bot-1").data["effective_tier"] == "tier_1"
+        assert clearances.machine_revision("bot-2") == bot2_revision
+
+        pet = service.initiate_tier3_petition(
+            "bot-1", "engineering", "human-1", "Ready",
+        )
+        service.on_tier3_amendment_confirmed(pet.data["amendment_proposal_id"])
+        assert service.compute_machine_tier("bot-1").data["effective_tier"] == "tier_3"
+
+        clearances.revoke_clearance(c.clearance_id, "human-2", now=_now())
+        assert service.compute_machine_tier("bot-1").data["domain_tiers"] == {
+            "engineering": "tier_3",
+        }
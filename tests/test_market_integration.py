@@ -590,7 +590,7 @@ class TestPostAuditPersistDegraded:
         count_before = log.count
         # Inject persist failure
         original_persist = svc._persist_state
-        def failing_persist():
+        def failing_persist(sections=None):
             raise OSError("Simulated disk full")
         svc._persist_state = failing_persist
 
@@ -623,7 +623,7 @@ class TestPostAuditPersistDegraded:
 
         # Inject persist failure
         original_persist = svc._persist_state
-        def failing_persist():
+        def failing_persist(sections=None):
             raise OSError("Simulated save failure")
         svc._persist_state = failing_persist
 
@@ -653,7 +653,7 @@ class TestPostAuditPersistDegraded:
 
         # Inject persist failure
         original_persist = svc._persist_state
-        def failing_persist():
+        def failing_persist(sections=None):
             raise OSError("Simulated save failure")
         svc._persist_state = failing_persist
 
@@ -676,7 +676,7 @@ class TestPostAuditPersistDegraded:
 
         # Inject persist failure
         original_persist = svc._persist_state
-        def failing_persist():
+        def failing_persist(sections=None):
             raise OSError("Simulated save failure")
         svc._persist_state = failing_persist
 
@@ -715,7 +715,7 @@ class TestExtendedPostAuditPersistDegraded:
 
         count_before = log.count
         # Inject persist failure
-        svc._persist_state = lambda: (_ for _ in ()).throw(OSError("Simulated"))
+        svc._persist_state = lambda sections=None: (_ for _ in ()).throw(OSError("Simulated"))
 
         result = svc.create_listing("L-ext1", "Test", "Desc", "c1")
         assert result.success
@@ -747,7 +747,7 @@ class TestExtendedPostAuditPersistDegraded:
 
         count_before = log.count
         # Inject persist failure
-        svc._persist_state = lambda: (_ for _ in ()).throw(OSError("Simulated"))
+        svc._persist_state = lambda sections=None: (_ for _ in ()).throw(OSError("Simulated"))
 
         result = svc.submit_bid("B-ext2", "L-ext2", "w1")
         assert result.success
@@ -780,7 +780,7 @@ class TestExtendedPostAuditPersistDegraded:
         )
 
         # Inject persist failure
-        svc._persist_state = lambda: (_ for _ in ()).throw(OSError("Simulated"))
+        svc._persist_state = lambda sections=None: (_ for _ in ()).throw(OSError("Simulated"))
 
         result = svc.submit_mission("m-ext3")
         assert result.success
@@ -797,7 +797,7 @@ class TestExtendedPostAuditPersistDegraded:
         svc = GenesisService(resolver)
 
         # Inject persist failure
-        svc._persist_state = lambda: (_ for _ in ()).throw(OSError("Simulated"))
+        svc._persist_state = lambda sections=None: (_ for _ in ()).throw(OSError("Simulated"))
 
         result = svc.open_epoch()
         assert result.success
@@ -815,7 +815,7 @@ class TestExtendedPostAuditPersistDegraded:
         svc.open_epoch()
 
         # Inject persist failure
-        svc._persist_state = lambda: (_ for _ in ()).throw(OSError("Simulated"))
+        svc._persist_state = lambda sections=None: (_ for _ in ()).throw(OSError("Simulated"))
 
         result = svc.close_epoch(beacon_round=99)
         assert result.success
@@ -844,7 +844,7 @@ class TestNonAuditPersistFailClosed:
         svc.submit_bid("B-wb1", "L-wb1", "w1")
 
         # Inject persist failure
-        svc._persist_state = lambda: (_ for _ in ()).throw(OSError("Simulated"))
+        svc._persist_state = lambda sections=None: (_ for _ in ()).throw(OSError("Simulated"))
 
         result = svc.withdraw_bid("B-wb1", "L-wb1")
         # Must return failure, not raise
@@ -868,7 +868,7 @@ class TestNonAuditPersistFailClosed:
         svc.submit_bid("B-cl1", "L-cl1", "w1")
 
         # Inject persist failure
-        svc._persist_state = lambda: (_ for _ in ()).throw(OSError("Simulated"))
+        svc._persist_state = lambda sections=None: (_ for _ in ()).throw(OSError("Simulated"))
 
         result = svc.cancel_listing("L-cl1")
         # Must return failure, not raise
@@ -889,7 +889,7 @@ class TestNonAuditPersistFailClosed:
         svc = GenesisService(resolver)
 
         # Inject persist failure
-        svc._persist_state = lambda: (_ for _ in ()).throw(OSError("Simulated"))
+        svc._persist_state = lambda sections=None: (_ for _ in ()).throw(OSError("Simulated"))
 
         result = svc.register_actor("a-fail", ActorKind.HUMAN, "us", "acme", initial_trust=0.5)
         assert not result.success
@@ -906,7 +906,7 @@ class TestNonAuditPersistFailClosed:
         svc.register_actor("a-q1", ActorKind.HUMAN, "us", "acme", initial_trust=0.5)
 
         # Inject persist failure
-        svc._persist_state = lambda: (_ for _ in ()).throw(OSError("Simulated"))
+        svc._persist_state = lambda sections=None: (_ for _ in ()).throw(OSError("Simulated"))
 
         result = svc.quarantine_actor("a-q1")
         assert not result.success
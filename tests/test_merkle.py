@@ -1,9 +1,17 @@
 """Tests for Merkle tree and commitment builder."""
 
+import hashlib
+
 import pytest
 from datetime import datetime, timezone
 
-from genesis.crypto.merkle import MerkleTree
+from genesis.crypto.merkle import (
+    MerkleAccumulator,
+    MerkleMultiProof,
+    MerkleTree,
+    verify_inclusion,
+    verify_multi_proof,
+)
 from genesis.crypto.commitment_builder import CommitmentBuilder
 
 
@@ -74,6 +82,132 @@ class TestMerkleTree:
             tree.add_leaf("sha256:" + "b" * 64)
 
 
+class TestMerkleProofs:
+    @staticmethod
+    def _tree(n: int) -> tuple[MerkleTree, list[str]]:
+        leaves = ["sha256:" + hashlib.sha256(str(i).encode()).hexdigest() for i in range(n)]
+        tree = MerkleTree()
+        for leaf in leaves:
+            tree.add_leaf(leaf)
+        tree.compute_root()
+        return tree, leaves
+
+    def test_every_proof_verifies(self) -> None:
+        for n in (1, 2, 3, 7, 16, 33):
+            tree, leaves = self._tree(n)
+            for leaf in leaves:
+                assert verify_inclusion(tree.inclusion_proof(leaf))
+
+    def test_batch_matches_single_proofs(self) -> None:
+        tree, leaves = self._tree(45)
+        missing = "sha256:" + "f" * 64
+        batch = tree.batch_inclusion_proofs(leaves + [missing])
+        assert batch[-1] is None
+        assert batch[:-1] == [tree.inclusion_proof(leaf) for leaf in leaves]
+
+    def test_leaf_index(self) -> None:
+        tree, leaves = self._tree(10)
+        assert tree.leaf_index(sorted(leaves)[4]) == 4
+        assert tree.leaf_index("sha256:" + "f" * 64) is None
+
+    def test_multi_proof_is_compact_and_verifies(self) -> None:
+        tree, leaves = self._tree(64)
+        chosen = leaves[:20]
+        proof = tree.multi_proof(chosen)
+        assert verify_multi_proof(proof)
+        single_hashes = sum(len(tree.inclusion_proof(l).path) for l in chosen)
+        assert len(proof.hashes) < single_hashes
+        assert tree.multi_proof(chosen + ["sha256:" + "f" * 64]) is None
+
+    def test_multi_proof_odd_sizes(self) -> None:
+        for n in (1, 3, 5, 11, 21):
+            tree, leaves = self._tree(n)
+            for chosen in (leaves[:1], leaves[-1:], leaves[::2], leaves):
+                assert verify_multi_proof(tree.multi_proof(chosen))
+
+    def test_tampered_multi_proof_rejected(self) -> None:
+        tree, leaves = self._tree(12)
+        proof = tree.multi_proof(leaves[:3])
+        forged = MerkleMultiProof(
+            leaf_count=proof.leaf_count,
+            leaf_indices=proof.leaf_indices,
+            leaf_hashes=("sha256:" + "0" * 64,) + proof.leaf_hashes[1:],
+            hashes=proof.hashes,
+            root=proof.root,
+        )
+        assert not verify_multi_proof(forged)
+
+    def test_persisted_tree_round_trip(self, tmp_path) -> None:
+        tree, leaves = self._tree(9)
+        tree.save(tmp_path / "tree.json")
+        loaded = MerkleTree.load(tmp_path / "tree.json")
+        assert loaded.inclusion_proof(leaves[3]) == tree.inclusion_proof(leaves[3])
+
+    def test_tampered_tree_file_rejected(self, tmp_path) -> None:
+        tree, leaves = self._tree(9)
+        text = tree.to_json().replace(sorted(leaves)[2], "sha256:" + "1" * 64)
+        with pytest.raises(ValueError):
+            MerkleTree.from_json(text)
+
+    def test_accumulator_snapshot_proves(self) -> None:
+        tree, leaves = self._tree(13)
+        acc = MerkleAccumulator()
+        for leaf in leaves:
+            acc.add_leaf(leaf)
+        snapshot = acc.to_tree()
+        proof = snapshot.inclusion_proof(leaves[0])
+        assert proof.root == acc.root()
+        assert verify_inclusion(proof)
+
+
+class TestMerkleAccumulator:
+    @staticmethod
+    def _leaf(n: int) -> str:
+        return "sha256:" + hashlib.sha256(str(n).encode()).hexdigest()
+
+    @staticmethod
+    def _tree_root(leaves: list[str]) -> str:
+        tree = MerkleTree()
+        for leaf in leaves:
+            tree.add_leaf(leaf)
+        return tree.compute_root()
+
+    def test_empty_and_single_match_tree(self) -> None:
+        acc = MerkleAccumulator()
+        assert acc.root() == MerkleTree().compute_root()
+        acc.add_leaf(self._leaf(1))
+        assert acc.root() == self._tree_root([self._leaf(1)])
+
+    def test_running_root_matches_rebuild_at_every_step(self) -> None:
+        acc = MerkleAccumulator()
+        leaves: list[str] = []
+        for n in range(70):
+            leaf = self._leaf(n % 60)  # includes duplicate leaves
+            acc.add_leaf(leaf)
+            leaves.append(leaf)
+            assert acc.root() == self._tree_root(leaves)
+
+    def test_batched_adds_between_reads(self) -> None:
+        acc = MerkleAccumulator()
+        leaves = [self._leaf(n) for n in range(257)]
+        for start in range(0, len(leaves), 40):
+            for leaf in leaves[start:start + 40]:
+                acc.add_leaf(leaf)
+            assert acc.root() == self._tree_root(leaves[:start + 40])
+        assert acc.leaves() == sorted(leaves)
+
+    def test_adds_are_deferred_until_read(self) -> None:
+        acc = MerkleAccumulator()
+        acc.add_leaf(self._leaf(1))
+        acc.root()
+        leaves = [self._leaf(n) for n in range(2, 500)]
+        for leaf in leaves:
+            acc.add_leaf(leaf)
+        assert acc._levels[0] == [self._leaf(1)]  # nothing sorted or inserted yet
+        assert acc.leaf_count == 499
+        assert acc.root() == self._tree_root([self._leaf(1)] + leaves)
+
+
 class TestCommitmentBuilder:
     def test_builds_valid_record(self) -> None:
         builder = CommitmentBuilder(
@@ -1,5 +1,7 @@
 """Tests for operational ledger — proves rolling window mechanics work correctly."""
 
+import random
+
 import pytest
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
@@ -176,3 +178,78 @@ class TestFutureDateExclusion:
         result = ledger.costs_in_window(90, 3, now)
         assert all(c.cost_id != "future_cost" for c in result)
         assert len(result) == 3
+
+
+def _reference_window(missions, costs, window_days, min_missions, now):
+    """The original filter-and-sort window computation."""
+    cutoff = now - timedelta(days=window_days)
+    valid = sorted(
+        (m for m in missions if m.completed_utc <= now),
+        key=lambda m: m.completed_utc, reverse=True,
+    )
+    in_window = [m for m in valid if m.completed_utc >= cutoff]
+    window = in_window if len(in_window) >= min_missions else valid[:min_missions]
+    if not window:
+        return window, []
+    earliest = min(m.completed_utc for m in window)
+    return window, [c for c in costs if earliest <= c.timestamp_utc <= now]
+
+
+class TestWindowAggregates:
+    def test_matches_reference_computation(self) -> None:
+        """Bisection + prefix sums reproduce the filter-and-sort window exactly."""
+        rng = random.Random(7)
+        amounts = ["500", "12.5", "0.01", "3E+2", "75.00", "0"]
+        categories = list(CostCategory)[:3]
+        ledger = OperationalLedger()
+        missions: list[CompletedMission] = []
+        costs: list[OperationalCostEntry] = []
+        for i in range(300):
+            # Coarse, partly out-of-order timestamps produce many ties.
+            days = rng.randint(-5, 200)
+            if rng.random() < 0.6:
+                m = CompletedMission(
+                    mission_id=f"m{i}",
+                    reward_amount=Decimal(rng.choice(amounts)),
+                    completed_utc=_now() - timedelta(days=days),
+                    operational_costs=Decimal("0"),
+                )
+                missions.append(m)
+                ledger.record_completed_mission(m)
+            else:
+                c = OperationalCostEntry(
+                    cost_id=f"c{i}",
+                    category=rng.choice(categories),
+                    amount=Decimal(rng.choice(amounts)),
+                    timestamp_utc=_now() - timedelta(days=days),
+                    description="cost",
+                )
+                costs.append(c)
+                ledger.record_operational_cost(c)
+
+            if i % 10 == 0:
+                for window_days, min_missions in [(30, 5), (90, 50), (7, 0), (365, 1)]:
+                    exp_missions, exp_costs = _reference_window(
+                        missions, costs, window_days, min_missions, _now(),
+                    )
+                    assert ledger.missions_in_window(
+                        window_days, min_missions, _now(),
+                    ) == exp_missions
+                    assert ledger.costs_in_window(
+                        window_days, min_missions, _now(),
+                    ) == exp_costs
+
+                    window = ledger.window(window_days, min_missions, _now())
+                    value = sum((m.reward_amount for m in exp_missions), Decimal("0"))
+                    ops = sum((c.amount for c in exp_costs), Decimal("0"))
+                    by_category: dict = {}
+                    for c in exp_costs:
+                        by_category[c.category] = (
+                            by_category.get(c.category, Decimal("0")) + c.amount
+                        )
+                    assert window.mission_count == len(exp_missions)
+                    assert str(window.mission_value) == str(value)
+                    assert str(window.ops_costs) == str(ops)
+                    assert {k: str(v) for k, v in window.costs_by_category.items()} == {
+                        k: str(v) for k, v in by_category.items()
+                    }
@@ -0,0 +1,134 @@
+"""Tests for PanelBuilder — proves the shared panel engine selects exactly
+what the list-based greedy loops it replaced selected, and scales linearly."""
+
+import random
+import time
+
+from genesis.governance.panels import PanelBuilder
+
+
+# Reference implementations: the greedy loops PanelBuilder replaced.
+
+
+def _reference_seed(selected, remaining, pool, key, minimum, limit=None):
+    present = {s[key] for s in selected}
+    for value in {c[key] for c in pool}:
+        if len(present) >= minimum:
+            break
+        if value in present:
+            continue
+        for c in remaining:
+            if c[key] == value and c not in selected:
+                if limit is None or len(selected) < limit:
+                    selected.append(c)
+                    remaining.remove(c)
+                    present.add(value)
+                    break
+
+
+def _reference_chamber(pool, size, r_min, org_min, c_max):
+    selected, remaining = [], list(pool)
+    _reference_seed(selected, remaining, pool, "region", r_min)
+    _reference_seed(selected, remaining, pool, "organization", org_min, size)
+    cap = max(1, int(size * c_max))
+    while len(selected) < size and remaining:
+        regions, orgs = {}, {}
+        for s in selected:
+            regions[s["region"]] = regions.get(s["region"], 0) + 1
+            orgs[s["organization"]] = orgs.get(s["organization"], 0) + 1
+        for tier in (("region", "organization"), ("region",)):
+            counts = {"region": regions, "organization": orgs}
+            pick = next((
+                c for c in remaining
+                if all(counts[k].get(c[k], 0) < cap for k in tier)
+            ), None)
+            if pick is not None:
+                selected.append(pick)
+                remaining.remove(pick)
+                break
+        else:
+            return None
+    return selected
+
+
+def _reference_court(pool, size, min_orgs, min_regions):
+    selected, remaining = [], list(pool)
+    _reference_seed(selected, remaining, pool, "organization", min_orgs)
+    _reference_seed(selected, remaining, pool, "region", min_regions)
+    while len(selected) < size and remaining:
+        selected.append(remaining.pop(0))
+    return selected if len(selected) >= size else None
+
+
+def _pool(rng: random.Random, n: int) -> list[dict]:
+    regions = [f"r{i}" for i in range(rng.randint(1, 6))]
+    orgs = [f"o{i}" for i in range(rng.randint(1, 8))]
+    return [
+        {
+            "actor_id": f"a{i}",
+            "region": rng.choice(regions),
+            "organization": rng.choice(orgs),
+        }
+        for i in range(n)
+    ]
+
+
+class TestPanelBuilder:
+    def test_chamber_selection_matches_reference(self) -> None:
+        rng = random.Random(21)
+        for _ in range(400):
+            pool = _pool(rng, rng.randint(1, 40))
+            size = rng.randint(1, len(pool))
+            r_min, org_min = rng.randint(1, 4), rng.randint(1, 4)
+            c_max = rng.choice([0.2, 0.34, 0.5, 1.0])
+
+            builder = PanelBuilder(pool)
+            builder.seed("region", r_min)
+            builder.seed("organization", org_min, limit=size)
+            cap = max(1, int(size * c_max))
+            ok = builder.fill(
+                size, {"region": cap, "organization": cap}, {"region": cap},
+            )
+            expected = _reference_chamber(pool, size, r_min, org_min, c_max)
+            if expected is None:
+                assert not ok
+            else:
+                assert ok
+                assert builder.selected == expected
+
+    def test_court_selection_matches_reference(self) -> None:
+        rng = random.Random(7)
+        for _ in range(400):
+            pool = _pool(rng, rng.randint(1, 40))
+            size = rng.randint(1, 12)
+            min_orgs, min_regions = rng.randint(1, 4), rng.randint(1, 4)
+
+            builder = PanelBuilder(pool)
+            builder.seed("organization", min_orgs)
+            builder.seed("region", min_regions)
+            ok = builder.fill(size)
+            expected = _reference_court(pool, size, min_orgs, min_regions)
+            assert ok == (expected is not None)
+            if ok:
+                assert builder.selected == expected
+
+    def test_counts_follow_selection(self) -> None:
+        pool = _pool(random.Random(3), 30)
+        builder = PanelBuilder(pool)
+        builder.seed("region", 3)
+        builder.fill(10, {"region": 4})
+        expected: dict = {}
+        for c in builder.selected:
+            expected[c["organization"]] = expected.get(c["organization"], 0) + 1
+        assert builder.counts("organization") == expected
+        assert len(builder) == len(builder.selected)
+
+    def test_large_pool_is_linear(self) -> None:
+        n = 20_000
+        pool = _pool(random.Random(5), n)
+        start = time.perf_counter()
+        builder = PanelBuilder(pool)
+        builder.seed("region", 3)
+        builder.fill(n // 2, {"region": n, "organization": n})
+        assert len(builder) == n // 2
+        assert time.perf_counter() - start < 5.0
@@ -1,8 +1,9 @@
 """Tests for persistence layer — proves event log and state store work correctly."""
 
+import json
 import pytest
 import tempfile
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from genesis.models.mission import (
@@ -356,6 +357,307 @@ class TestEventLog:
         )
 
 
+class TestEventLogIndexes:
+    KINDS = (EventKind.MISSION_CREATED, EventKind.TRUST_UPDATED, EventKind.COMMITMENT_ANCHORED)
+
+    def _log(self, n: int = 60, path: Path | None = None) -> EventLog:
+        log = EventLog(storage_path=path)
+        base = datetime(2026, 2, 14, tzinfo=timezone.utc)
+        for i in range(n):
+            log.append(EventRecord.create(
+                f"E-{i:03d}", self.KINDS[i % 3], f"actor_{i % 4}", {"i": i},
+                base + timedelta(minutes=17 * i),
+            ))
+        return log
+
+    def test_kind_queries_match_scan(self) -> None:
+        log = self._log()
+        for kind in self.KINDS:
+            scanned = [e for e in log.events() if e.event_kind == kind]
+            assert log.events(kind) == scanned
+            assert log.recent_events(4, kind) == scanned[-4:]
+
+    def test_events_since_matches_scan(self) -> None:
+        log = self._log()
+        since = log.events()[23].timestamp_utc
+        assert log.events_since(since) == log.events()[23:]
+        assert log.events_since(since, EventKind.TRUST_UPDATED) == [
+            e for e in log.events()[23:] if e.event_kind == EventKind.TRUST_UPDATED
+        ]
+
+    def test_events_for_actor(self) -> None:
+        log = self._log()
+        since = log.events()[30].timestamp_utc
+        result = log.events_for_actor("actor_1", since=since, kind=EventKind.MISSION_CREATED)
+        assert result == [
+            e for e in log.events()[30:]
+            if e.actor_id == "actor_1" and e.event_kind == EventKind.MISSION_CREATED
+        ]
+        assert log.events_for_actor("nobody") == []
+
+    def test_pagination_covers_all_matches(self) -> None:
+        log = self._log()
+        pages = list(log.iter_pages(page_size=7, actor_id="actor_2"))
+        assert [len(p.events) for p in pages] == [7, 7, 1]
+        flattened = [e for p in pages for e in p.events]
+        assert flattened == log.events_for_actor("actor_2")
+
+    def test_cursor_survives_appends(self) -> None:
+        log = self._log(10)
+        first = log.page(cursor=0, limit=6)
+        log.append(EventRecord.create("E-new", EventKind.TRUST_UPDATED, "bob", {}))
+        second = log.page(cursor=first.next_cursor, limit=6)
+        assert [e.event_id for e in second.events] == [
+            "E-006", "E-007", "E-008", "E-009", "E-new",
+        ]
+        assert second.next_cursor is None
+
+    def test_get_event_by_id(self) -> None:
+        log = self._log()
+        assert log.get_event("E-041") is log.events()[41]
+        assert log.get_event("E-999") is None
+
+    def test_indexes_rebuilt_on_load(self, tmp_path: Path) -> None:
+        self._log(path=tmp_path / "events.jsonl").close()
+        log = EventLog(storage_path=tmp_path / "events.jsonl")
+        assert len(log.events(EventKind.COMMITMENT_ANCHORED)) == 20
+        assert len(log.events_for_actor("actor_0")) == 15
+
+    def test_failed_commit_rolls_back_indexes(self, tmp_path: Path) -> None:
+        log = self._log(6, path=tmp_path / "events.jsonl")
+
+        def failing_write(lines):
+            raise OSError("disk full")
+
+        log._write_lines = failing_write
+        with pytest.raises(OSError):
+            log.append(EventRecord.create("E-fail", EventKind.TRUST_UPDATED, "zed", {}))
+        assert log.events_for_actor("zed") == []
+        assert log.get_event("E-fail") is None
+        assert len(log.events(EventKind.TRUST_UPDATED)) == 2
+        assert log.page(limit=100).events == log.events()
+
+
+class TestEventLogVerification:
+    def _write_log(self, path: Path, n: int, **kwargs) -> EventLog:
+        log = EventLog(storage_path=path, **kwargs)
+        for i in range(n):
+            log.append(EventRecord.create(
+                f"E-{i:05d}", EventKind.TRUST_UPDATED, f"actor_{i % 5}", {"i": i},
+            ))
+        log.close()
+        return log
+
+    def test_parallel_load_matches_sequential(self, tmp_path: Path, monkeypatch) -> None:
+        import genesis.persistence.event_log as event_log_module
+        monkeypatch.setattr(event_log_module, "VERIFY_CHUNK_SIZE", 10)
+        path = tmp_path / "events.jsonl"
+        self._write_log(path, 95)
+        sequential = EventLog(storage_path=path)
+        parallel = EventLog(storage_path=path, verify_workers=2)
+        assert parallel.events() == sequential.events()
+
+    def test_parallel_load_rejects_tampering(self, tmp_path: Path, monkeypatch) -> None:
+        import genesis.persistence.event_log as event_log_module
+        monkeypatch.setattr(event_log_module, "VERIFY_CHUNK_SIZE", 10)
+        path = tmp_path / "events.jsonl"
+        self._write_log(path, 60)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        lines[47] = lines[47].replace('"i": 47', '"i": 470')
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="Integrity check failed \\(line 48\\)"):
+            EventLog(storage_path=path, verify_workers=2)
+
+    def test_checkpoint_resumes_without_rehashing(self, tmp_path: Path, monkeypatch) -> None:
+        import genesis.persistence.event_log as event_log_module
+        path = tmp_path / "events.jsonl"
+        self._write_log(path, 20, checkpoint=True)
+        checkpoint = json.loads((tmp_path / "events.jsonl.verified.json").read_text())
+        assert checkpoint["count"] == 20
+
+        hashed: list[str] = []
+        real = event_log_module._content_hash
+        monkeypatch.setattr(
+            event_log_module, "_content_hash",
+            lambda *args: hashed.append(args[0]) or real(*args),
+        )
+        log = EventLog(storage_path=path, checkpoint=True)
+        assert log.count == 20 and hashed == []
+
+        log.append(EventRecord.create("E-new", EventKind.TRUST_UPDATED, "bob", {}))
+        del log
+        hashed.clear()
+        # Not closed: the appended record is past the checkpoint and is re-verified.
+        assert EventLog(storage_path=path, checkpoint=True).count == 21
+        assert hashed == ["E-new"]
+
+    def test_stale_checkpoint_falls_back_to_full_verification(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        self._write_log(path, 10, checkpoint=True)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        lines[3] = lines[3].replace('"i": 3', '"i": 9')
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="Integrity check failed"):
+            EventLog(storage_path=path, checkpoint=True)
+
+    def test_verify_range_detects_on_disk_tampering(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        self._write_log(path, 10)
+        log = EventLog(storage_path=path)
+        assert log.verify_range() == 10
+        assert log.verify_range(4, 7) == 3
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        lines[5] = lines[5].replace('"i": 5', '"i": 50')
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        assert log.verify_range(0, 5) == 5
+        with pytest.raises(ValueError, match="Integrity"):
+            log.verify_range(4, 7)
+
+    def test_checkpoint_resume_reads_file_once(self, tmp_path: Path, monkeypatch) -> None:
+        path = tmp_path / "events.jsonl"
+        self._write_log(path, 20, checkpoint=True)
+        log_opens: list[Path] = []
+        real_open = Path.open
+        monkeypatch.setattr(
+            Path, "open",
+            lambda self, *a, **kw: (self == path and log_opens.append(self))
+            or real_open(self, *a, **kw),
+        )
+        assert EventLog(storage_path=path, checkpoint=True).count == 20
+        assert len(log_opens) == 1
+
+    @pytest.mark.parametrize("reopen", [False, True])
+    def test_verify_range_seeks_near_start(
+        self, tmp_path: Path, monkeypatch, reopen: bool,
+    ) -> None:
+        import genesis.persistence.event_log as event_log_module
+        monkeypatch.setattr(event_log_module, "OFFSET_STRIDE", 4)
+        path = tmp_path / "events.jsonl"
+        log = self._write_log(path, 40)
+        if reopen:
+            log = EventLog(storage_path=path)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        # Same-length edits, so the remembered offsets stay aligned.
+        lines[1] = lines[1].replace('"i": 1', '"i": 7')
+        lines[33] = lines[33].replace('"i": 33', '"i": 34')
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        # The range after the tampered record 1 never reads it...
+        assert log.verify_range(29, 33) == 4
+        # ...and failures after a seek still name the right line.
+        with pytest.raises(ValueError, match="line 34"):
+            log.verify_range(30, 36)
+        with pytest.raises(ValueError, match="line 2"):
+            log.verify_range(0, 3)
+
+    def test_verify_range_in_memory(self) -> None:
+        log = EventLog()
+        for i in range(5):
+            log.append(EventRecord.create(f"E-{i}", EventKind.TRUST_UPDATED, "a", {}))
+        assert log.verify_range(1, 4) == 3
+        with pytest.raises(ValueError, match="Invalid range"):
+            log.verify_range(3, 9)
+
+
+class TestEventLogGroupCommit:
+    def _event(self, n: int) -> EventRecord:
+        return EventRecord.create(
+            f"E-{n:04d}", EventKind.TRUST_UPDATED, "alice", {"n": n},
+        )
+
+    def test_append_many_is_one_batch(self, tmp_path: Path) -> None:
+        log = EventLog(storage_path=tmp_path / "events.jsonl")
+        log.append_many([self._event(i) for i in range(3)])
+        stats = log.commit_stats
+        assert stats.batches == 1
+        assert stats.events == 3
+        assert stats.last_batch_size == 3
+        assert stats.mean_batch_size == 3.0
+        assert stats.last_commit_seconds >= 0.0
+
+        log2 = EventLog(storage_path=tmp_path / "events.jsonl")
+        assert log2.count == 3
+        assert log2.chain_head == log.chain_head
+
+    def test_file_handle_is_reused(self, tmp_path: Path) -> None:
+        log = EventLog(storage_path=tmp_path / "events.jsonl")
+        log.append(self._event(1))
+        handle = log._file
+        log.append(self._event(2))
+        assert log._file is handle
+        log.close()
+        log.append(self._event(3))
+        assert EventLog(storage_path=tmp_path / "events.jsonl").count == 3
+
+    def test_append_many_rejects_duplicates_atomically(self, tmp_path: Path) -> None:
+        log = EventLog(storage_path=tmp_path / "events.jsonl")
+        log.append(self._event(1))
+        with pytest.raises(ValueError):
+            log.append_many([self._event(2), self._event(1)])
+        assert log.count == 1
+        with pytest.raises(ValueError):
+            log.append_many([self._event(3), self._event(3)])
+        assert log.count == 1
+
+    def test_failed_commit_rolls_back_and_truncates(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        log = EventLog(storage_path=path)
+        log.append(self._event(1))
+        head = log.chain_head
+        size = path.stat().st_size
+
+        original = log._write_lines
+
+        def torn_write(lines: list[bytes]) -> None:
+            log._file.write(lines[0][:10])
+            log._file.flush()
+            raise OSError("disk full")
+
+        log._write_lines = torn_write
+        with pytest.raises(OSError):
+            log.append_many([self._event(2), self._event(3)])
+        assert log.count == 1
+        assert log.chain_head == head
+        assert path.stat().st_size == size
+        assert log.commit_stats.failed_batches == 1
+
+        log._write_lines = original
+        log.append(self._event(2))
+        reloaded = EventLog(storage_path=path)
+        assert [e.event_id for e in reloaded.events()] == ["E-0001", "E-0002"]
+
+    def test_concurrent_appends_share_commits(self, tmp_path: Path) -> None:
+        import threading
+
+        path = tmp_path / "events.jsonl"
+        log = EventLog(storage_path=path, commit_window_seconds=0.05)
+        barrier = threading.Barrier(8)
+        errors: list[Exception] = []
+
+        def worker(n: int) -> None:
+            barrier.wait()
+            try:
+                log.append(self._event(n))
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert log.commit_stats.events == 8
+        assert log.commit_stats.batches < 8
+        assert EventLog(storage_path=path).count == 8
+
+    def test_negative_window_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            EventLog(commit_window_seconds=-1)
+
+
 # =====================================================================
 # StateStore Tests
 # =====================================================================
@@ -480,3 +782,275 @@ class TestStateStoreEmpty:
         assert store.load_roster().count == 0
         assert len(store.load_missions()) == 0
         assert len(store.load_trust_records()) == 0
+
+
+class TestStateStoreDirtySections:
+    def _roster(self, trust: float = 0.5) -> ActorRoster:
+        roster = ActorRoster()
+        roster.register(RosterEntry(
+            actor_id="alice", actor_kind=ActorKind.HUMAN,
+            trust_score=trust, region="EU", organization="Org1",
+            model_family="human_reviewer", method_type="human_reviewer",
+        ))
+        return roster
+
+    def _count_writes(self, store: StateStore) -> list[list[str]]:
+        writes: list[list[str]] = []
+        original = store._write_sections
+
+        def counting(sections: list[str]) -> None:
+            writes.append(list(sections))
+            original(sections)
+
+        store._write_sections = counting
+        return writes
+
+    def test_unchanged_section_is_not_rewritten(self, tmp_path: Path) -> None:
+        store = StateStore(tmp_path / "state.json")
+        writes = self._count_writes(store)
+        store.save_roster(self._roster())
+        store.save_roster(self._roster())
+        assert writes == [["roster"]]
+
+    def test_batch_flushes_once_with_only_changed_sections(self, tmp_path: Path) -> None:
+        store = StateStore(tmp_path / "state.json")
+        store.save_roster(self._roster())
+        store.save_epoch_state("sha256:" + "a" * 64, 1)
+        writes = self._count_writes(store)
+
+        with store.batch():
+            store.save_roster(self._roster(trust=0.9))
+            store.save_epoch_state("sha256:" + "a" * 64, 1)
+            assert writes == []
+            assert store.dirty_sections == {"roster"}
+
+        assert writes == [["roster"]]
+        assert store.dirty_sections == frozenset()
+        reloaded = StateStore(tmp_path / "state.json")
+        assert reloaded.load_roster().get("alice").trust_score == 0.9
+        assert reloaded.load_epoch_state() == ("sha256:" + "a" * 64, 1)
+
+    def test_assume_changed_marks_dirty_without_encoding(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import genesis.persistence.state_store as state_store_module
+
+        store = StateStore(tmp_path / "state", layout="sectioned")
+        store.save_roster(self._roster())
+        encodes: list[object] = []
+        original = state_store_module._encode_section
+
+        def counting(value: object) -> str:
+            encodes.append(value)
+            return original(value)
+
+        monkeypatch.setattr(state_store_module, "_encode_section", counting)
+        writes = self._count_writes(store)
+        with store.batch(assume_changed=True):
+            store.save_roster(self._roster(trust=0.9))
+            assert store.dirty_sections == {"roster"}
+            assert encodes == []
+
+        assert writes == [["roster"]]
+        assert len(encodes) == 1
+        reloaded = StateStore(tmp_path / "state", layout="sectioned")
+        assert reloaded.load_roster().get("alice").trust_score == 0.9
+
+    def test_failed_batch_keeps_sections_dirty(self, tmp_path: Path) -> None:
+        store = StateStore(tmp_path / "state.json")
+        with pytest.raises(RuntimeError):
+            with store.batch():
+                store.save_roster(self._roster())
+                raise RuntimeError("mutation aborted")
+        assert not (tmp_path / "state.json").exists()
+        assert store.dirty_sections == {"roster"}
+        store.flush()
+        assert StateStore(tmp_path / "state.json").load_roster().count == 1
+
+    def test_sectioned_layout_writes_one_file_per_section(self, tmp_path: Path) -> None:
+        state_dir = tmp_path / "state"
+        store = StateStore(state_dir, layout="sectioned")
+        store.save_roster(self._roster())
+        store.save_epoch_state("sha256:" + "b" * 64, 3)
+        assert sorted(p.name for p in state_dir.iterdir()) == [
+            "epoch.json", "roster.json",
+        ]
+
+        roster_mtime = (state_dir / "roster.json").stat().st_mtime_ns
+        store.save_epoch_state("sha256:" + "c" * 64, 4)
+        assert (state_dir / "roster.json").stat().st_mtime_ns == roster_mtime
+
+        reloaded = StateStore(state_dir, layout="sectioned")
+        assert reloaded.load_roster().get("alice").trust_score == 0.5
+        assert reloaded.load_epoch_state() == ("sha256:" + "c" * 64, 4)
+
+    def test_flat_flush_keeps_previous_generation(self, tmp_path: Path) -> None:
+        store = StateStore(tmp_path / "state.json")
+        store.save_roster(self._roster(trust=0.5))
+        store.save_roster(self._roster(trust=0.9))
+        previous = StateStore(tmp_path / "state.json.bak")
+        assert previous.load_roster().get("alice").trust_score == 0.5
+
+    def test_unknown_layout_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            StateStore(tmp_path / "state.json", layout="mystery")
+
+
+class TestStateStoreCrashRecovery:
+    def _roster(self, *actor_ids: str) -> ActorRoster:
+        roster = ActorRoster()
+        for actor_id in actor_ids:
+            roster.register(RosterEntry(
+                actor_id=actor_id, actor_kind=ActorKind.HUMAN,
+                trust_score=0.5, region="EU", organization="Org1",
+                model_family="human_reviewer", method_type="human_reviewer",
+            ))
+        return roster
+
+    def test_clean_open_reports_nothing(self, tmp_path: Path) -> None:
+        store = StateStore(tmp_path / "state.json")
+        store.save_roster(self._roster("alice"))
+        report = StateStore(tmp_path / "state.json").recovery_report
+        assert report.actions == ()
+        assert report.restored_from_backup is False
+
+    def test_orphaned_temp_file_discarded(self, tmp_path: Path) -> None:
+        store = StateStore(tmp_path / "state.json")
+        store.save_roster(self._roster("alice"))
+        (tmp_path / "state.json.tmp").write_text('{"roster": [', encoding="utf-8")
+
+        store2 = StateStore(tmp_path / "state.json")
+        assert store2.load_roster().count == 1
+        assert not (tmp_path / "state.json.tmp").exists()
+        assert store2.recovery_report.actions
+
+    def test_truncated_state_restored_from_previous_generation(self, tmp_path: Path) -> None:
+        store = StateStore(tmp_path / "state.json")
+        store.save_roster(self._roster("alice"))
+        store.save_roster(self._roster("alice", "bob"))
+        # Simulate a torn write by a non-atomic writer
+        text = (tmp_path / "state.json").read_text(encoding="utf-8")
+        (tmp_path / "state.json").write_text(text[: len(text) // 2], encoding="utf-8")
+
+        store2 = StateStore(tmp_path / "state.json")
+        assert store2.recovery_report.restored_from_backup is True
+        assert store2.load_roster().count == 1
+        assert (tmp_path / "state.json.corrupt").exists()
+
+    def test_unrecoverable_state_fails_closed(self, tmp_path: Path) -> None:
+        (tmp_path / "state.json").write_text('{"roster": [', encoding="utf-8")
+        with pytest.raises(OSError):
+            StateStore(tmp_path / "state.json")
+
+    def test_sectioned_journal_replayed(self, tmp_path: Path) -> None:
+        state_dir = tmp_path / "state"
+        store = StateStore(state_dir, layout="sectioned")
+        store.save_roster(self._roster("alice"))
+        store.save_epoch_state("sha256:" + "a" * 64, 1)
+
+        # Crash after the journal committed but before sections applied
+        staged = StateStore(tmp_path / "staging", layout="sectioned")
+        staged.save_roster(self._roster("alice", "bob"))
+        staged.save_epoch_state("sha256:" + "b" * 64, 2)
+        journal = {
+            "roster": staged._encoded["roster"],
+            "epoch": staged._encoded["epoch"],
+        }
+        (state_dir / ".journal").write_text(json.dumps(journal), encoding="utf-8")
+        (state_dir / "epoch.json.tmp").write_text("{", encoding="utf-8")
+
+        store2 = StateStore(state_dir, layout="sectioned")
+        assert store2.load_roster().count == 2
+        assert store2.load_epoch_state() == ("sha256:" + "b" * 64, 2)
+        assert not (state_dir / ".journal").exists()
+        assert not (state_dir / "epoch.json.tmp").exists()
+
+    def test_service_flags_restored_state_as_degraded(self, tmp_path: Path) -> None:
+        from genesis.policy.resolver import PolicyResolver
+        from genesis.service import GenesisService
+
+        resolver = PolicyResolver.from_config_dir(
+            Path(__file__).resolve().parents[1] / "config"
+        )
+        store = StateStore(tmp_path / "state.json")
+        store.save_roster(self._roster("alice"))
+        store.save_roster(self._roster("alice", "bob"))
+        (tmp_path / "state.json").write_text("{", encoding="utf-8")
+
+        svc = GenesisService(resolver, state_store=StateStore(tmp_path / "state.json"))
+        status = svc.status()
+        assert status["persistence_degraded"] is True
+        assert status["persistence_recovery"]
+        assert svc.get_actor("alice") is not None
+
+
+class TestServicePersistSections:
+    def _service(self, tmp_path: Path):
+        from genesis.policy.resolver import PolicyResolver
+        from genesis.service import GenesisService
+
+        resolver = PolicyResolver.from_config_dir(
+            Path(__file__).resolve().parents[1] / "config"
+        )
+        store = StateStore(tmp_path / "state", layout="sectioned")
+        return GenesisService(resolver, state_store=store), store
+
+    def _staged(self, store: StateStore) -> list[str]:
+        staged: list[str] = []
+        original = store._put_section
+
+        def recording(section, value):
+            staged.append(section)
+            original(section, value)
+
+        store._put_section = recording
+        return staged
+
+    def test_declared_sections_are_the_only_ones_staged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from genesis.service import GenesisService
+
+        monkeypatch.setattr(GenesisService, "CHECK_DECLARED_SECTIONS", False)
+        svc, store = self._service(tmp_path)
+        svc._persist_state()
+        staged = self._staged(store)
+
+        assert svc.register_human("alice", "EU", "Org1").success
+        assert set(staged) == {"roster", "trust_records"}
+
+    def test_failed_flush_forces_full_restage(self, tmp_path: Path) -> None:
+        svc, store = self._service(tmp_path)
+        svc._persist_state()
+        original = store._write_sections
+
+        def failing(sections: list[str]) -> None:
+            raise OSError("disk full")
+
+        store._write_sections = failing
+        svc._roster.register(RosterEntry(
+            actor_id="alice", actor_kind=ActorKind.HUMAN,
+            trust_score=0.5, region="EU", organization="Org1",
+            model_family="human_reviewer", method_type="human_reviewer",
+        ))
+        with pytest.raises(OSError):
+            svc._persist_state(("roster",))
+        store._write_sections = original
+
+        staged = self._staged(store)
+        svc._persist_state(("roster",))
+        assert "missions" in staged and "machine_agency" in staged
+        assert store.dirty_sections == frozenset()
+        reloaded = StateStore(tmp_path / "state", layout="sectioned")
+        assert reloaded.load_roster().get("alice") is not None
+
+    def test_undeclared_change_is_rejected(self, tmp_path: Path) -> None:
+        svc, store = self._service(tmp_path)
+        svc._persist_state()
+        svc._roster.register(RosterEntry(
+            actor_id="alice", actor_kind=ActorKind.HUMAN,
+            trust_score=0.5, region="EU", organization="Org1",
+            model_family="human_reviewer", method_type="human_reviewer",
+        ))
+        with pytest.raises(AssertionError, match=r"\['roster'\]"):
+            svc._persist_state(("missions",))
@@ -1,5 +1,7 @@
 """Tests for the policy resolver — proves it loads and resolves all config correctly."""
 
+import copy
+
 import pytest
 from pathlib import Path
 
@@ -175,3 +177,54 @@ class TestCommitmentTiers:
         n, t = resolver.commitment_committee()
         assert t > n // 2
         assert t <= n
+
+
+class TestCompiledPolicy:
+    def test_matches_resolver_methods(self, resolver: PolicyResolver) -> None:
+        compiled = resolver.compiled()
+        assert compiled.trust.weights == resolver.trust_weights()
+        assert compiled.trust.half_life(True) == resolver.half_life_days(True)
+        assert compiled.trust.trust_floor(False) == resolver.trust_floor(False)
+        sm = resolver.skill_matching_config()
+        assert compiled.matching.min_relevance == sm["min_relevance_score"]
+
+    def test_snapshot_is_cached(self, resolver: PolicyResolver) -> None:
+        assert resolver.compiled() is resolver.compiled()
+        assert resolver.policy_version == 1
+
+    def test_recompile_bumps_version_and_picks_up_changes(
+        self, resolver: PolicyResolver,
+    ) -> None:
+        before = resolver.compiled()
+        resolver._params["fast_elevation"]["delta_fast"] = 0.05
+        after = resolver.recompile()
+        assert after.version == before.version + 1
+        assert after.trust.delta_fast == 0.05
+        assert before.trust.delta_fast != 0.05
+
+    def test_invalid_value_keeps_previous_snapshot(
+        self, resolver: PolicyResolver,
+    ) -> None:
+        before = resolver.compiled()
+        resolver._params["fast_elevation"]["delta_fast"] = -1
+        with pytest.raises(ValueError, match="delta_fast"):
+            resolver.recompile()
+        assert resolver.compiled() is before
+
+    def test_replace_params_is_all_or_nothing(
+        self, resolver: PolicyResolver,
+    ) -> None:
+        live = resolver._params
+        before = resolver.compiled()
+        staged = copy.deepcopy(live)
+        staged["fast_elevation"]["delta_fast"] = -1
+        with pytest.raises(ValueError, match="delta_fast"):
+            resolver.replace_params(staged)
+        assert resolver.delta_fast() != -1
+        assert resolver.compiled() is before
+
+        staged["fast_elevation"]["delta_fast"] = 0.05
+        after = resolver.replace_params(staged)
+        assert resolver._params is live
+        assert resolver.delta_fast() == 0.05
+        assert after.version == before.version + 1
@@ -238,6 +238,39 @@ class TestVerifierCooldown:
         assert len(violations) >= 1
         assert "concurrent" in violations[0].lower()
 
+    def test_history_stays_bounded_and_exact(self) -> None:
+        """A year of assignments keeps each history within its windows,
+        and the O(1) availability check agrees with the full checks."""
+        qv = QuorumVerifier(_safeguard_config(
+            verifier_cooldown_hours=12,
+            max_panels_per_verifier_per_month=4,
+            max_concurrent_panels_per_verifier=2,
+        ))
+        assigned = 0
+        for step in range(365 * 4):
+            now = NOW + timedelta(hours=6 * step)
+            for vid, _, _ in _eligible_facilitators():
+                expected = not (
+                    qv.check_verifier_cooldown(vid, now)
+                    or qv.check_verifier_workload(vid, now)
+                )
+                assert qv._is_available(vid, now) == expected
+            try:
+                qv.request_quorum_verification(
+                    actor_id=f"ACTOR-{step}",
+                    region="EU",
+                    available_verifiers=_eligible_facilitators(),
+                    now=now,
+                )
+                assigned += 1
+            except ValueError:
+                pass
+            for history in qv._verifier_history.values():
+                assert len(history) <= 4
+                assert list(history) == sorted(history)
+                assert history[0] >= history[-1] - timedelta(days=30)
+        assert assigned > 200  # ~5 verifiers x 4 per month
+
 
 # ===========================================================================
 # Blind Adjudication Tests
@@ -917,6 +950,14 @@ class TestPreSessionPreparation:
         phrases = {_generate_challenge_phrase() for _ in range(20)}
         assert len(phrases) >= 15  # extremely unlikely to have many collisions
 
+    def test_challenge_phrase_words_are_unique(self) -> None:
+        """Words within a phrase never repeat, even for long phrases."""
+        for _ in range(50):
+            words = _generate_challenge_phrase(word_count=64).split()
+            assert len(set(words)) == 64
+        with pytest.raises(ValueError):
+            _generate_challenge_phrase(word_count=len(EN_WORDS) + 1)
+
 
 # ===========================================================================
 # Nuke Appeal Tests (Phase D-5b)
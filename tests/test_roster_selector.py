@@ -113,6 +113,28 @@ class TestRosterRegistration:
         roster.remove("alice")
         assert roster.get("alice") is None
 
+    def test_entry_owned_by_another_roster_rejected(self) -> None:
+        first, second = ActorRoster(), ActorRoster()
+        entry = _entry("alice")
+        first.register(entry)
+        with pytest.raises(ValueError, match="another roster"):
+            second.register(entry)
+        first.remove("alice")
+        second.register(entry)
+        entry.status = ActorStatus.QUARANTINED
+        assert second.reviewer_count == 0
+
+    def test_copied_entry_does_not_refile_original(self) -> None:
+        import copy
+
+        roster = ActorRoster()
+        entry = _entry("alice")
+        roster.register(entry)
+        clone = copy.copy(entry)
+        clone.status = ActorStatus.QUARANTINED
+        assert roster.reviewer_count == 1
+        assert roster.available_reviewers()[0] is entry
+
 
 class TestRosterFiltering:
     def test_excludes_quarantined(self) -> None:
@@ -332,3 +354,118 @@ class TestMinTrustFilter:
         result = selector.select(_r0_mission(), seed="test", min_trust=0.5)
         assert result.success
         assert result.reviewers[0].id == "high"
+
+
+def _large_roster(n: int, seed: int = 5) -> ActorRoster:
+    import random
+    rng = random.Random(seed)
+    roster = ActorRoster()
+    for i in range(n):
+        roster.register(_entry(
+            f"a{i}",
+            trust=rng.random(),
+            region=rng.choice(["NA", "EU", "APAC", "LATAM", "AF"]),
+            org=f"Org{rng.randrange(40)}",
+            family=rng.choice(["claude", "gpt", "gemini", "llama"]),
+            method=rng.choice(["reasoning_model", "retrieval_augmented", "human_reviewer"]),
+            status=rng.choice([ActorStatus.ACTIVE] * 6 + [
+                ActorStatus.PROBATION, ActorStatus.PROVISIONAL, ActorStatus.QUARANTINED,
+            ]),
+        ))
+    return roster
+
+
+def _rebuilt(roster: ActorRoster) -> ActorRoster:
+    fresh = ActorRoster()
+    for entry in roster.all_actors():
+        fresh.register(RosterEntry(
+            actor_id=entry.actor_id, actor_kind=entry.actor_kind,
+            trust_score=entry.trust_score, region=entry.region,
+            organization=entry.organization, model_family=entry.model_family,
+            method_type=entry.method_type, status=entry.status,
+        ))
+    return fresh
+
+
+class TestReviewerBuckets:
+    def test_buckets_follow_field_changes(self) -> None:
+        roster = _large_roster(300)
+        for i, entry in enumerate(roster.all_actors()):
+            if i % 3 == 0:
+                entry.status = ActorStatus.QUARANTINED
+            elif i % 3 == 1:
+                entry.region = "EU"
+                entry.trust_score = 0.95
+        roster.remove("a1")
+        roster.register(_entry("a1", region="MARS"))
+
+        fresh = _rebuilt(roster)
+        assert [e.actor_id for e in roster.available_reviewers()] == [
+            e.actor_id for e in fresh.available_reviewers()
+        ]
+        for dim in ("model_family", "method_type", "region", "organization"):
+            assert roster.reviewer_values(dim) == fresh.reviewer_values(dim)
+            for value in roster.reviewer_values(dim):
+                assert [e.actor_id for e in roster.reviewer_bucket(dim, value)] == [
+                    e.actor_id for e in fresh.reviewer_bucket(dim, value)
+                ]
+        assert roster.reviewer_pool_size(0.5) == fresh.reviewer_pool_size(0.5)
+
+    def test_replaced_entry_is_detached(self) -> None:
+        roster = ActorRoster()
+        old = _entry("x")
+        roster.register(old)
+        roster.register(_entry("x", region="EU"))
+        old.status = ActorStatus.QUARANTINED
+        assert roster.reviewer_values("region") == ["EU"]
+        assert roster.reviewer_count == 1
+
+    def test_drifted_index_is_not_silently_repaired(self) -> None:
+        from genesis.review.roster import _discard
+
+        ordinals = [1, 3, 5]
+        with pytest.raises(ValueError):
+            _discard(ordinals, 4)
+        with pytest.raises(ValueError):
+            _discard(ordinals, 9)
+        assert ordinals == [1, 3, 5]
+        _discard(ordinals, 3)
+        assert ordinals == [1, 5]
+
+
+class TestBucketSelection:
+    def test_identical_to_rebuilt_roster(self, resolver: PolicyResolver) -> None:
+        """Live-maintained buckets select exactly what a freshly built
+        roster with the same contents selects, seed for seed."""
+        roster = _large_roster(2000)
+        for entry in roster.all_actors()[::7]:
+            entry.status = ActorStatus.SUSPENDED
+        fresh = _rebuilt(roster)
+        live_sel = ReviewerSelector(resolver, roster)
+        fresh_sel = ReviewerSelector(resolver, fresh)
+        for i in range(40):
+            mission = _r2_mission(worker_id=f"a{i}") if i % 2 else _r0_mission(f"a{i}")
+            a = live_sel.select(mission, seed=f"beacon:{i}", min_trust=0.2)
+            b = fresh_sel.select(mission, seed=f"beacon:{i}", min_trust=0.2)
+            assert a.success and a.reviewers == b.reviewers
+            ids = {r.id for r in a.reviewers}
+            assert mission.worker_id not in ids
+            for r in a.reviewers:
+                entry = roster.get(r.id)
+                assert entry.status in (ActorStatus.ACTIVE, ActorStatus.PROBATION)
+                assert entry.trust_score >= 0.2
+
+    def test_small_pool_matches_exhaustive_algorithm(self, resolver: PolicyResolver) -> None:
+        import random
+        roster = _large_roster(120)
+        selector = ReviewerSelector(resolver, roster)
+        policy = resolver.tier_policy(RiskTier.R2)
+        for i in range(20):
+            seed = f"s{i}"
+            result = selector.select(_r2_mission(worker_id="a0"), seed=seed)
+            rng = random.Random()
+            rng.seed(seed)
+            expected = selector._constrained_select(
+                roster.available_reviewers(exclude_ids={"a0"}), policy, rng,
+            )
+            assert [r.id for r in result.reviewers] == [e.actor_id for e in expected]
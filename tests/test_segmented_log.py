@@ -0,0 +1,255 @@
+"""Tests for the segmented event log — proves indexed, lazily loaded segments
+behave like the single-file EventLog while only verifying the tail on start."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from genesis.models.trust import ActorKind
+from genesis.persistence.event_log import EventKind, EventLog, EventRecord
+from genesis.persistence.segmented_log import SegmentedEventLog
+from genesis.policy.resolver import PolicyResolver
+from genesis.service import GenesisService
+
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
+BASE_TS = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _event(i: int, kind: EventKind = EventKind.MISSION_CREATED) -> EventRecord:
+    return EventRecord.create(
+        f"E-{i:04d}", kind, f"actor_{i % 3}", {"i": i},
+        BASE_TS + timedelta(minutes=i),
+    )
+
+
+def _fill(log: EventLog, start: int, stop: int) -> None:
+    for i in range(start, stop):
+        kind = EventKind.TRUST_UPDATED if i % 2 else EventKind.MISSION_CREATED
+        log.append(_event(i, kind))
+
+
+def _three_segments(path: Path) -> SegmentedEventLog:
+    log = SegmentedEventLog(path)
+    _fill(log, 0, 4)
+    log.roll_segment()
+    _fill(log, 4, 8)
+    log.roll_segment()
+    _fill(log, 8, 10)
+    return log
+
+
+class TestSegmentedStorage:
+    def test_roll_writes_segment_and_index(self, tmp_path: Path) -> None:
+        log = _three_segments(tmp_path)
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert names == [
+            "segment-000000.index.json", "segment-000000.jsonl",
+            "segment-000001.index.json", "segment-000001.jsonl",
+            "segment-000002.jsonl",
+        ]
+        assert log.segment_count == 3
+        assert log.count == 10
+        assert [i.count for i in log.segment_indexes()] == [4, 4]
+
+    def test_roll_on_empty_tail_is_noop(self, tmp_path: Path) -> None:
+        log = SegmentedEventLog(tmp_path)
+        log.roll_segment()
+        assert log.segment_count == 1
+
+    def test_reads_match_single_file_log(self, tmp_path: Path) -> None:
+        seg = _three_segments(tmp_path / "seg")
+        flat = EventLog()
+        _fill(flat, 0, 10)
+        assert [e.event_hash for e in seg.events()] == [e.event_hash for e in flat.events()]
+        assert seg.chain_head == flat.chain_head
+        for kind in (EventKind.TRUST_UPDATED, EventKind.MISSION_CREATED):
+            assert seg.event_hashes(kind) == flat.event_hashes(kind)
+            assert seg.recent_events(3, kind) == flat.recent_events(3, kind)
+        assert seg.recent_events(7) == flat.recent_events(7)
+        since = flat.events()[3].timestamp_utc
+        assert seg.events_since(since) == flat.events_since(since)
+        assert list(seg) == flat.events()
+
+    def test_actor_and_page_queries_span_segments(self, tmp_path: Path) -> None:
+        seg = _three_segments(tmp_path / "seg")
+        flat = EventLog()
+        _fill(flat, 0, 10)
+        since = flat.events()[2].timestamp_utc
+        for actor in ("actor_0", "actor_1"):
+            assert seg.events_for_actor(actor) == flat.events_for_actor(actor)
+            assert seg.events_for_actor(
+                actor, since=since, kind=EventKind.TRUST_UPDATED,
+            ) == flat.events_for_actor(actor, since=since, kind=EventKind.TRUST_UPDATED)
+        for page_size in (1, 3, 4, 20):
+            for kwargs in ({}, {"kind": EventKind.MISSION_CREATED}, {"actor_id": "actor_2"}):
+                assert [
+                    (p.events, p.next_cursor) for p in seg.iter_pages(page_size, **kwargs)
+                ] == [
+                    (p.events, p.next_cursor) for p in flat.iter_pages(page_size, **kwargs)
+                ]
+
+    def test_chain_continues_across_segments(self, tmp_path: Path) -> None:
+        log = _three_segments(tmp_path)
+        events = log.events()
+        for prev, event in zip(events, events[1:]):
+            assert event.previous_hash == prev.event_hash
+
+
+class TestSegmentedReopen:
+    def test_reopen_loads_only_tail(self, tmp_path: Path) -> None:
+        _three_segments(tmp_path).close()
+        log = SegmentedEventLog(tmp_path)
+        assert log.count == 10
+        assert len(log._events) == 2  # only the tail is decoded
+        assert log.get_event("E-0001").payload == {"i": 1}
+        assert log.last_event.event_id == "E-0009"
+        log.append(_event(10))
+        assert log.events()[-1].previous_hash == log.events()[-2].event_hash
+
+    def test_duplicate_across_segments_rejected(self, tmp_path: Path) -> None:
+        log = _three_segments(tmp_path)
+        with pytest.raises(ValueError, match="Duplicate"):
+            log.append(_event(1))
+
+    def test_index_records_max_timestamp(self, tmp_path: Path) -> None:
+        import json
+
+        _three_segments(tmp_path).close()
+        log = SegmentedEventLog(tmp_path)
+        for index in log.segment_indexes():
+            assert index.max_timestamp == max(index.timestamps)
+        # Indexes written before the field existed derive it on load.
+        path = tmp_path / "segment-000001.index.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        del data["max_timestamp"]
+        path.write_text(json.dumps(data), encoding="utf-8")
+        reopened = SegmentedEventLog(tmp_path)
+        assert reopened.segment_indexes()[1].max_timestamp == _event(7).timestamp_utc
+        since = _event(6).timestamp_utc
+        assert [e.event_id for e in reopened.events_since(since)] == [
+            "E-0006", "E-0007", "E-0008", "E-0009",
+        ]
+
+    def test_missing_index_is_rebuilt(self, tmp_path: Path) -> None:
+        _three_segments(tmp_path).close()
+        (tmp_path / "segment-000000.index.json").unlink()
+        log = SegmentedEventLog(tmp_path)
+        assert log.rebuilt_indexes == [0]
+        assert (tmp_path / "segment-000000.index.json").exists()
+        assert log.count == 10
+
+    def test_tampered_sealed_segment_detected_on_read(self, tmp_path: Path) -> None:
+        _three_segments(tmp_path).close()
+        path = tmp_path / "segment-000000.jsonl"
+        path.write_text(
+            path.read_text(encoding="utf-8").replace('"i": 1', '"i": 7'),
+            encoding="utf-8",
+        )
+        log = SegmentedEventLog(tmp_path)  # same size: startup trusts the index
+        with pytest.raises(ValueError, match="Integrity"):
+            log.get_event("E-0001")
+        with pytest.raises(ValueError):
+            log.verify()
+
+    def test_forged_record_with_recomputed_hash_refused(self, tmp_path: Path) -> None:
+        import json
+
+        from genesis.persistence.event_log import _content_hash
+
+        _three_segments(tmp_path).close()
+        path = tmp_path / "segment-000000.jsonl"
+        lines = path.read_bytes().splitlines(keepends=True)
+        record = json.loads(lines[1])
+        record["payload"]["i"] = 7  # same length
+        record["event_hash"] = _content_hash(
+            record["event_id"], record["event_kind"], record["timestamp_utc"],
+            record["actor_id"], record["payload"],
+        )
+        forged = (json.dumps(record, sort_keys=True, ensure_ascii=False) + "\n").encode()
+        assert len(forged) == len(lines[1])
+        lines[1] = forged
+        path.write_bytes(b"".join(lines))
+
+        log = SegmentedEventLog(tmp_path)
+        with pytest.raises(ValueError, match="does not match its index"):
+            log.get_event("E-0001")
+        with pytest.raises(ValueError, match="does not match its index"):
+            log.events(EventKind.TRUST_UPDATED)
+        assert log.get_event("E-0002").payload == {"i": 2}
+
+    def test_old_index_version_is_rebuilt(self, tmp_path: Path) -> None:
+        import json
+
+        _three_segments(tmp_path).close()
+        path = tmp_path / "segment-000001.index.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["version"] = 2
+        del data["event_hashes"]
+        path.write_text(json.dumps(data), encoding="utf-8")
+        log = SegmentedEventLog(tmp_path)
+        assert log.rebuilt_indexes == [1]
+        assert log.position_of("E-0009") == 9
+        assert log.position_of("E-0005") == 5
+
+    def test_parallel_verify_and_range(self, tmp_path: Path) -> None:
+        log = _three_segments(tmp_path)
+        log.verify(workers=2)
+        assert log.verify_range(3, 9) == 6
+        path = tmp_path / "segment-000001.jsonl"
+        path.write_text(
+            path.read_text(encoding="utf-8").replace('"i": 5', '"i": 8'),
+            encoding="utf-8",
+        )
+        assert log.verify_range(0, 4) == 4
+        with pytest.raises(ValueError):
+            log.verify_range(3, 9)
+        with pytest.raises(ValueError):
+            log.verify(workers=2)
+
+    def test_broken_cross_segment_link_rejected(self, tmp_path: Path) -> None:
+        _three_segments(tmp_path).close()
+        (tmp_path / "segment-000000.jsonl").unlink()
+        (tmp_path / "segment-000000.index.json").unlink()
+        with pytest.raises(ValueError, match="chain broken"):
+            SegmentedEventLog(tmp_path)
+
+    def test_max_segment_events_auto_rolls(self, tmp_path: Path) -> None:
+        log = SegmentedEventLog(tmp_path, max_segment_events=3)
+        _fill(log, 0, 7)
+        assert [i.count for i in log.segment_indexes()] == [3, 3]
+        assert log.count == 7
+
+
+class TestSegmentedMigration:
+    def test_from_jsonl_seals_legacy_file(self, tmp_path: Path) -> None:
+        legacy = EventLog(storage_path=tmp_path / "events.jsonl")
+        _fill(legacy, 0, 5)
+        legacy.close()
+
+        log = SegmentedEventLog.from_jsonl(tmp_path / "events.jsonl", tmp_path / "events")
+        assert log.count == 5
+        assert log.segment_count == 2
+        assert log.chain_head == legacy.chain_head
+        log.append(_event(5))
+
+        reopened = SegmentedEventLog.from_jsonl(tmp_path / "events.jsonl", tmp_path / "events")
+        assert reopened.count == 6
+
+
+class TestSegmentedServiceWiring:
+    def test_close_epoch_rolls_segment(self, tmp_path: Path) -> None:
+        resolver = PolicyResolver.from_config_dir(CONFIG_DIR)
+        log = SegmentedEventLog(tmp_path / "events")
+        service = GenesisService(resolver, event_log=log)
+        service.open_epoch("seg-epoch")
+        service.register_actor(
+            actor_id="alice", actor_kind=ActorKind.HUMAN,
+            region="EU", organization="OrgA",
+        )
+        before = log.count
+        result = service.close_epoch(beacon_round=1)
+        assert result.success
+        assert log.segment_count == 2
+        assert log.count == before
@@ -536,6 +536,150 @@ class TestProductionCallPaths:
         assert not result.success
         assert "APPROVED" in result.errors[0]
 
+    def test_settle_missions_matches_single_payments(
+        self, resolver: PolicyResolver,
+    ) -> None:
+        """A batch settles each mission exactly as one-at-a-time payment does."""
+        from genesis.compensation.ledger import OperationalLedger
+        from genesis.models.compensation import CompletedMission, ReserveFundState
+        from genesis.models.mission import DomainType, MissionClass, MissionState
+
+        now = datetime.now(timezone.utc)
+        ledger = OperationalLedger()
+        for i in range(55):
+            ledger.record_completed_mission(CompletedMission(
+                mission_id=f"hist-{i}",
+                reward_amount=Decimal("500.00"),
+                completed_utc=now - timedelta(days=30),
+                operational_costs=Decimal("10.00"),
+            ))
+        reserve = ReserveFundState(
+            balance=Decimal("10000"),
+            target=Decimal("10000"),
+            gap=Decimal("0"),
+            is_below_target=False,
+        )
+        rewards = [Decimal("500.00"), Decimal("12.34"), Decimal("1000.00")]
+
+        def build() -> GenesisService:
+            svc = GenesisService(resolver, event_log=EventLog())
+            svc.open_epoch("test-epoch")
+            _register_humans(svc)
+            svc._gcf_tracker.activate(now)
+            for i in range(len(rewards)):
+                svc.create_mission(
+                    mission_id=f"M-{i}",
+                    title="Settle",
+                    mission_class=MissionClass.DOCUMENTATION_UPDATE,
+                    domain_type=DomainType.OBJECTIVE,
+                    worker_id=f"human-{i}",
+                )
+                svc.get_mission(f"M-{i}").state = MissionState.APPROVED
+            return svc
+
+        single = build()
+        single_data = [
+            single.process_mission_payment(f"M-{i}", reward, ledger, reserve).data
+            for i, reward in enumerate(rewards)
+        ]
+        batched = build()
+        result = batched.settle_missions(
+            [(f"M-{i}", reward) for i, reward in enumerate(rewards)],
+            ledger, reserve, now=now,
+        )
+        assert result.success
+        assert result.data["settled"] == single_data
+        for item in result.data["settled"]:
+            assert (
+                Decimal(item["commission_amount"])
+                + Decimal(item["creator_allocation"])
+                + Decimal(item["worker_payout"])
+                + Decimal(item["gcf_contribution"])
+                == Decimal(item["mission_reward"])
+            )
+
+        def payloads(svc: GenesisService) -> list[dict]:
+            return [
+                {k: v for k, v in e.payload.items() if k != "event_hash"}
+                for e in svc._event_log.events()
+                if e.event_kind in (
+                    EventKind.CREATOR_ALLOCATION_DISBURSED,
+                    EventKind.GCF_CONTRIBUTION_RECORDED,
+                )
+            ]
+        assert payloads(batched) == payloads(single)
+        assert result.data["events_recorded"] == 2 * len(rewards)
+        assert (
+            batched._gcf_tracker.get_state().balance
+            == single._gcf_tracker.get_state().balance
+        )
+
+    def test_settle_missions_is_all_or_nothing(
+        self, service: GenesisService,
+    ) -> None:
+        """One invalid mission rejects the whole batch before anything is recorded."""
+        from genesis.compensation.ledger import OperationalLedger
+        from genesis.models.compensation import ReserveFundState
+        from genesis.models.mission import DomainType, MissionClass, MissionState
+
+        service.create_mission(
+            mission_id="M-OK",
+            title="Approved",
+            mission_class=MissionClass.DOCUMENTATION_UPDATE,
+            domain_type=DomainType.OBJECTIVE,
+        )
+        service.get_mission("M-OK").state = MissionState.APPROVED
+        before = len(service._event_log.events())
+
+        result = service.settle_missions(
+            [("M-OK", Decimal("500.00")), ("M-MISSING", Decimal("10.00")),
+             ("M-OK", Decimal("500.00"))],
+            OperationalLedger(),
+            ReserveFundState(
+                balance=Decimal("10000"),
+                target=Decimal("10000"),
+                gap=Decimal("0"),
+                is_below_target=False,
+            ),
+        )
+        assert not result.success
+        assert any("M-MISSING" in e for e in result.errors)
+        assert any("twice" in e for e in result.errors)
+        assert len(service._event_log.events()) == before
+
+    def test_settle_missions_without_event_log_needs_no_epoch(
+        self, resolver: PolicyResolver,
+    ) -> None:
+        """Like single payments, a batch only needs an epoch for its audit events."""
+        from genesis.compensation.ledger import OperationalLedger
+        from genesis.models.compensation import ReserveFundState
+        from genesis.models.mission import DomainType, MissionClass, MissionState
+
+        svc = GenesisService(resolver)
+        svc.open_epoch("setup")
+        _register_humans(svc)
+        svc.create_mission(
+            mission_id="M-0",
+            title="Settle",
+            mission_class=MissionClass.DOCUMENTATION_UPDATE,
+            domain_type=DomainType.OBJECTIVE,
+            worker_id="human-0",
+        )
+        svc.get_mission("M-0").state = MissionState.APPROVED
+        svc.close_epoch(beacon_round=1)
+
+        reserve = ReserveFundState(
+            balance=Decimal("10000"),
+            target=Decimal("10000"),
+            gap=Decimal("0"),
+            is_below_target=False,
+        )
+        result = svc.settle_missions(
+            [("M-0", Decimal("500.00"))], OperationalLedger(), reserve,
+        )
+        assert result.success, result.errors
+        assert result.data["settled_count"] == 1
+
     def test_periodic_first_light_check_delegates(
         self, service: GenesisService,
     ) -> None:
@@ -585,7 +729,7 @@ class TestPersistenceWarningSurfacing:
         service.set_founder("george")
         monkeypatch.setattr(
             service, "_safe_persist_post_audit",
-            lambda: "Persistence degraded: write failed",
+            lambda sections=None: "Persistence degraded: write failed",
         )
         result = service.record_founder_action()
         assert result.success
@@ -610,6 +754,7 @@ class TestCLIAdapterIntegration:
 
         exit_code = main([
             "--config", str(CONFIG_DIR),
+            "--data", str(tmp_path),
             "check-first-light",
             "--revenue", "100",
             "--costs", "1000",
@@ -625,6 +770,7 @@ class TestCLIAdapterIntegration:
 
         exit_code = main([
             "--config", str(CONFIG_DIR),
+            "--data", str(tmp_path),
             "process-payment",
             "--mission-id", "NONEXISTENT",
             "--reward", "500.00",
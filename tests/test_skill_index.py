@@ -0,0 +1,149 @@
+"""Tests for the inverted skill index — proves indexed worker matching
+returns exactly what the full roster scan returns, and that the service
+keeps the index current across skill and trust mutations."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from genesis.models.domain_trust import DomainTrustScore
+from genesis.models.skill import (
+    ActorSkillProfile,
+    SkillId,
+    SkillProficiency,
+    SkillRequirement,
+)
+from genesis.models.trust import ActorKind, TrustRecord
+from genesis.policy.resolver import PolicyResolver
+from genesis.review.roster import ActorRoster, ActorStatus, RosterEntry
+from genesis.service import GenesisService
+from genesis.skills.index import SkillIndex
+from genesis.skills.worker_matcher import WorkerMatcher
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
+
+DOMAINS = ["software_engineering", "data_science", "security"]
+SKILLS = ["python", "rust", "sql", "ml", "audit"]
+PYTHON = SkillId("software_engineering", "python")
+
+
+@pytest.fixture
+def resolver() -> PolicyResolver:
+    return PolicyResolver.from_config_dir(CONFIG_DIR)
+
+
+def _population(n: int, seed: int = 11):
+    rng = random.Random(seed)
+    roster = ActorRoster()
+    profiles: dict[str, ActorSkillProfile] = {}
+    records: dict[str, TrustRecord] = {}
+    for i in range(n):
+        aid = f"actor_{i}"
+        roster.register(RosterEntry(
+            actor_id=aid, actor_kind=ActorKind.HUMAN,
+            trust_score=rng.random(), region="eu", organization="org",
+            model_family="human_reviewer", method_type="human_reviewer",
+            status=ActorStatus.QUARANTINED if i % 13 == 0 else ActorStatus.ACTIVE,
+        ))
+        skills = {}
+        for _ in range(rng.randint(0, 3)):
+            sid = SkillId(rng.choice(DOMAINS), rng.choice(SKILLS))
+            skills[sid.canonical] = SkillProficiency(
+                skill_id=sid,
+                # Repeated values exercise the tie-breaking order.
+                proficiency_score=rng.choice([0.0, 0.5, 0.9, rng.random()]),
+                evidence_count=1,
+            )
+        if skills or i % 2:
+            profiles[aid] = ActorSkillProfile(actor_id=aid, skills=skills)
+        domain_scores = {
+            d: DomainTrustScore(domain=d, score=rng.choice([0.5, rng.random()]))
+            for d in DOMAINS if rng.random() < 0.25
+        }
+        records[aid] = TrustRecord(
+            actor_id=aid, actor_kind=ActorKind.HUMAN,
+            score=rng.choice([0.5, rng.random()]), domain_scores=domain_scores,
+        )
+    return roster, profiles, records
+
+
+def _requirements(rng: random.Random) -> list[SkillRequirement]:
+    return [
+        SkillRequirement(
+            skill_id=SkillId(rng.choice(DOMAINS), rng.choice(SKILLS)),
+            minimum_proficiency=rng.choice([0.0, 0.4, 0.8]),
+            required=rng.random() < 0.7,
+        )
+        for _ in range(rng.randint(1, 3))
+    ]
+
+
+class TestIndexedMatchingParity:
+    def test_matches_full_scan(self, resolver: PolicyResolver) -> None:
+        roster, profiles, records = _population(400)
+        index = SkillIndex.build(profiles, records)
+        scan = WorkerMatcher(resolver, roster, records, profiles)
+        indexed = WorkerMatcher(resolver, roster, records, profiles, skill_index=index)
+
+        rng = random.Random(3)
+        for _ in range(60):
+            reqs = _requirements(rng)
+            limit = rng.choice([1, 5, 10, 500])
+            min_trust = rng.choice([0.0, 0.3])
+            expected = scan.find_matches(reqs, min_trust=min_trust, limit=limit)
+            actual = indexed.find_matches(reqs, min_trust=min_trust, limit=limit)
+            assert actual == expected
+
+    def test_no_requirements_falls_back_to_scan(self, resolver: PolicyResolver) -> None:
+        roster, profiles, records = _population(50)
+        index = SkillIndex.build(profiles, records)
+        matcher = WorkerMatcher(resolver, roster, records, profiles, skill_index=index)
+        available = [a for a in roster.all_actors() if a.is_available()]
+        assert len(matcher.find_matches([], limit=1000)) == len(available)
+
+
+class TestSkillIndexMaintenance:
+    def test_reindex_replaces_postings(self) -> None:
+        index = SkillIndex()
+        profile = ActorSkillProfile(actor_id="a", skills={
+            PYTHON.canonical: SkillProficiency(
+                skill_id=PYTHON, proficiency_score=0.6, evidence_count=1,
+            ),
+        })
+        index.index_profile("a", profile)
+        assert index.holders(PYTHON) == {"a": 0.6}
+
+        profile.skills.clear()
+        index.index_profile("a", profile)
+        assert index.holders(PYTHON) == {}
+        assert index.skill_count == 0
+
+    def test_candidates_include_domain_trust_only(self) -> None:
+        index = SkillIndex()
+        index.index_trust("a", TrustRecord(
+            actor_id="a", actor_kind=ActorKind.HUMAN, score=0.5,
+            domain_scores={
+                "software_engineering": DomainTrustScore(
+                    domain="software_engineering", score=0.9,
+                ),
+            },
+        ))
+        assert index.candidates([SkillRequirement(skill_id=PYTHON)]) == {"a"}
+        index.remove_actor("a")
+        assert index.candidates([SkillRequirement(skill_id=PYTHON)]) == set()
+
+    def test_service_tracks_skill_updates(self, resolver: PolicyResolver) -> None:
+        service = GenesisService(resolver)
+        service.register_actor("w1", ActorKind.HUMAN, "eu", "acme", initial_trust=0.5)
+        service.register_actor("w2", ActorKind.HUMAN, "us", "beta", initial_trust=0.6)
+        reqs = [SkillRequirement(skill_id=PYTHON, minimum_proficiency=0.3)]
+
+        assert service.find_matching_workers(reqs).data["total_matches"] == 0
+
+        service.update_actor_skills("w2", [SkillProficiency(
+            skill_id=PYTHON, proficiency_score=0.8, evidence_count=5,
+        )])
+        ids = [m["actor_id"] for m in service.find_matching_workers(reqs).data["matches"]]
+        assert ids == ["w2"]
+        assert service._skill_index.holders(PYTHON) == {"w2": 0.8}
@@ -0,0 +1,237 @@
+"""Tests for the SQLite state store — proves row-level persistence behind the StateStore interface."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from genesis.models.mission import DomainType, MissionClass
+from genesis.models.trust import ActorKind, TrustRecord
+from genesis.persistence.event_log import EventLog
+from genesis.persistence.sqlite_store import SQLiteStateStore
+from genesis.persistence.state_store import StateStore, open_state_store
+from genesis.policy.resolver import PolicyResolver
+from genesis.review.roster import ActorRoster, RosterEntry
+from genesis.service import GenesisService
+
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
+
+
+def _records(n: int, score: float = 0.5) -> dict[str, TrustRecord]:
+    return {
+        f"actor_{i}": TrustRecord(
+            actor_id=f"actor_{i}", actor_kind=ActorKind.HUMAN, score=score,
+        )
+        for i in range(n)
+    }
+
+
+def _roster(*actor_ids: str) -> ActorRoster:
+    roster = ActorRoster()
+    for actor_id in actor_ids:
+        roster.register(RosterEntry(
+            actor_id=actor_id, actor_kind=ActorKind.HUMAN,
+            trust_score=0.5, region="EU", organization="Org1",
+            model_family="human_reviewer", method_type="human_reviewer",
+        ))
+    return roster
+
+
+def _row_count(db: Path, table: str) -> int:
+    conn = sqlite3.connect(str(db))
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestSQLiteRoundTrip:
+    def test_trust_records_round_trip(self, tmp_path: Path) -> None:
+        store = SQLiteStateStore(tmp_path / "state.db")
+        store.save_trust_records(_records(3))
+        store.close()
+
+        store2 = SQLiteStateStore(tmp_path / "state.db")
+        loaded = store2.load_trust_records()
+        assert list(loaded) == ["actor_0", "actor_1", "actor_2"]
+        assert loaded["actor_1"].score == 0.5
+        assert _row_count(tmp_path / "state.db", "trust_records") == 3
+
+    def test_roster_order_preserved(self, tmp_path: Path) -> None:
+        store = SQLiteStateStore(tmp_path / "state.db")
+        store.save_roster(_roster("zed", "amy", "kim"))
+        store2 = SQLiteStateStore(tmp_path / "state.db")
+        assert [a.actor_id for a in store2.load_roster().all_actors()] == [
+            "zed", "amy", "kim",
+        ]
+
+    def test_removed_entities_are_deleted(self, tmp_path: Path) -> None:
+        store = SQLiteStateStore(tmp_path / "state.db")
+        records = _records(3)
+        store.save_trust_records(records)
+        del records["actor_1"]
+        store.save_trust_records(records)
+        store2 = SQLiteStateStore(tmp_path / "state.db")
+        assert list(store2.load_trust_records()) == ["actor_0", "actor_2"]
+
+    def test_reordered_list_is_renumbered(self, tmp_path: Path) -> None:
+        store = SQLiteStateStore(tmp_path / "state.db")
+        store.save_roster(_roster("a", "b", "c"))
+        store.save_roster(_roster("c", "a", "b"))
+        store2 = SQLiteStateStore(tmp_path / "state.db")
+        assert [a.actor_id for a in store2.load_roster().all_actors()] == [
+            "c", "a", "b",
+        ]
+
+    def test_scalar_sections_round_trip(self, tmp_path: Path) -> None:
+        store = SQLiteStateStore(tmp_path / "state.db")
+        store.save_epoch_state("sha256:" + "e" * 64, 7)
+        store.save_gcf({"balance": "12.5"})
+        store2 = SQLiteStateStore(tmp_path / "state.db")
+        assert store2.load_epoch_state() == ("sha256:" + "e" * 64, 7)
+        assert store2.load_gcf() == {"balance": "12.5"}
+
+    def test_wal_mode(self, tmp_path: Path) -> None:
+        store = SQLiteStateStore(tmp_path / "state.db")
+        mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+
+class TestSQLiteRowLevelWrites:
+    def test_single_trust_update_upserts_one_row(self, tmp_path: Path) -> None:
+        store = SQLiteStateStore(tmp_path / "state.db")
+        records = _records(50)
+        store.save_trust_records(records)
+
+        statements: list[str] = []
+        store._conn.set_trace_callback(statements.append)
+        records["actor_7"].score = 0.9
+        store.save_trust_records(records)
+        store._conn.set_trace_callback(None)
+
+        upserts = [s for s in statements if s.startswith("INSERT INTO trust_records")]
+        assert len(upserts) == 1
+        assert SQLiteStateStore(tmp_path / "state.db").load_trust_records()[
+            "actor_7"
+        ].score == 0.9
+
+    def test_unchanged_save_touches_nothing(self, tmp_path: Path) -> None:
+        store = SQLiteStateStore(tmp_path / "state.db")
+        store.save_trust_records(_records(5))
+        statements: list[str] = []
+        store._conn.set_trace_callback(statements.append)
+        store.save_trust_records(_records(5))
+        store._conn.set_trace_callback(None)
+        assert statements == []
+
+    def test_sections_load_lazily(self, tmp_path: Path) -> None:
+        store = SQLiteStateStore(tmp_path / "state.db")
+        store.save_trust_records(_records(2))
+        store.save_roster(_roster("alice"))
+
+        store2 = SQLiteStateStore(tmp_path / "state.db")
+        assert store2._loaded == set()
+        store2.load_roster()
+        assert store2._loaded == {"roster"}
+
+
+class TestSQLiteImportExport:
+    def test_json_import_and_export(self, tmp_path: Path) -> None:
+        flat = StateStore(tmp_path / "state.json")
+        flat.save_roster(_roster("alice", "bob"))
+        flat.save_trust_records(_records(2))
+        flat.save_epoch_state("sha256:" + "a" * 64, 3)
+
+        store = SQLiteStateStore(tmp_path / "state.db")
+        store.import_json(tmp_path / "state.json")
+        assert store.load_roster().count == 2
+        assert _row_count(tmp_path / "state.db", "roster") == 2
+
+        store.export_json(tmp_path / "export.json")
+        exported = StateStore(tmp_path / "export.json")
+        assert exported.load_roster().count == 2
+        assert set(exported.load_trust_records()) == {"actor_0", "actor_1"}
+        assert exported.load_epoch_state() == ("sha256:" + "a" * 64, 3)
+
+
+class TestOpenStateStore:
+    def test_backend_selection(self, tmp_path: Path) -> None:
+        assert type(open_state_store(tmp_path)) is StateStore
+        assert isinstance(open_state_store(tmp_path, "sqlite"), SQLiteStateStore)
+        with pytest.raises(ValueError):
+            open_state_store(tmp_path, "postgresql")
+        with pytest.raises(ValueError):
+            open_state_store(tmp_path, "flatfile")
+
+    def test_resolver_default_backend(self) -> None:
+        resolver = PolicyResolver.from_config_dir(CONFIG_DIR)
+        assert resolver.persistence_backend() == "json_flat"
+        assert resolver.persistence_layout() == "sectioned"
+
+    def test_sectioned_layout_imports_flat_state(self, tmp_path: Path) -> None:
+        flat = open_state_store(tmp_path)
+        flat.save_epoch_state("sha256:" + "a" * 64, 2)
+
+        store = open_state_store(tmp_path, "json_flat", "sectioned")
+        assert (tmp_path / "state" / "epoch.json").exists()
+        assert store.load_epoch_state() == ("sha256:" + "a" * 64, 2)
+        # The imported file is renamed so it cannot go stale beside the store.
+        assert not (tmp_path / "state.json").exists()
+        assert (tmp_path / "state.json.migrated").exists()
+
+        reopened = open_state_store(tmp_path, "json_flat", "sectioned")
+        assert reopened.load_epoch_state() == ("sha256:" + "a" * 64, 2)
+
+    def test_sqlite_backend_imports_sectioned_state(self, tmp_path: Path) -> None:
+        sectioned = open_state_store(tmp_path, "json_flat", "sectioned")
+        sectioned.save_epoch_state("sha256:" + "c" * 64, 4)
+
+        store = open_state_store(tmp_path, "sqlite")
+        assert isinstance(store, SQLiteStateStore)
+        assert store.load_epoch_state() == ("sha256:" + "c" * 64, 4)
+        assert not (tmp_path / "state").exists()
+        assert (tmp_path / "state.migrated" / "epoch.json").exists()
+        store.close()
+
+        reopened = open_state_store(tmp_path, "sqlite")
+        assert reopened.load_epoch_state() == ("sha256:" + "c" * 64, 4)
+        reopened.close()
+
+    def test_sqlite_backend_imports_flat_state(self, tmp_path: Path) -> None:
+        open_state_store(tmp_path).save_epoch_state("sha256:" + "d" * 64, 5)
+
+        store = open_state_store(tmp_path, "sqlite")
+        assert store.load_epoch_state() == ("sha256:" + "d" * 64, 5)
+        assert (tmp_path / "state.json.migrated").exists()
+        store.close()
+
+
+class TestSQLiteServiceWiring:
+    def test_service_round_trip(self, tmp_path: Path) -> None:
+        resolver = PolicyResolver.from_config_dir(CONFIG_DIR)
+        svc1 = GenesisService(
+            resolver,
+            event_log=EventLog(storage_path=tmp_path / "events.jsonl"),
+            state_store=SQLiteStateStore(tmp_path / "state.db"),
+        )
+        svc1.open_epoch("sqlite-epoch")
+        svc1.register_actor(
+            actor_id="alice", actor_kind=ActorKind.HUMAN,
+            region="EU", organization="OrgA",
+        )
+        svc1.create_mission(
+            mission_id="M-SQL", title="SQLite persist test",
+            mission_class=MissionClass.DOCUMENTATION_UPDATE,
+            domain_type=DomainType.OBJECTIVE,
+        )
+        svc1.close_epoch(beacon_round=7)
+
+        svc2 = GenesisService(
+            resolver,
+            event_log=EventLog(storage_path=tmp_path / "events.jsonl"),
+            state_store=SQLiteStateStore(tmp_path / "state.db"),
+        )
+        assert svc2.get_actor("alice") is not None
+        assert svc2.get_mission("M-SQL") is not None
+        assert svc2.get_trust("alice") is not None
@@ -0,0 +1,157 @@
+"""Tests for materialised status counters — proves status() counts stay
+equal to a full scan through transitions, direct assignment and reloads."""
+
+from pathlib import Path
+
+import pytest
+
+from genesis.models.leave import LeaveCategory
+from genesis.models.market import ListingState
+from genesis.models.mission import (
+    DomainType,
+    Mission,
+    MissionClass,
+    MissionState,
+    RiskTier,
+)
+from genesis.models.tally import StateTally
+from genesis.models.trust import ActorKind
+from genesis.persistence.event_log import EventLog
+from genesis.persistence.state_store import StateStore
+from genesis.policy.resolver import PolicyResolver
+from genesis.review.roster import ActorStatus
+from genesis.service import GenesisService
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
+
+
+@pytest.fixture
+def resolver() -> PolicyResolver:
+    return PolicyResolver.from_config_dir(CONFIG_DIR)
+
+
+def _populate(svc: GenesisService) -> None:
+    svc.open_epoch()
+    for i, region in enumerate(["eu", "us", "apac", "latam"]):
+        svc.register_actor(
+            f"human-{i}", ActorKind.HUMAN, region, f"org-{i}", initial_trust=0.6,
+        )
+    svc.register_machine(
+        "bot-1", operator_id="human-0", region="eu", organization="org-0",
+        model_family="gpt", method_type="reasoning_model",
+    )
+    svc.quarantine_actor("bot-1")
+
+    for i in range(3):
+        svc.create_mission(
+            mission_id=f"M-{i}",
+            title=f"Mission {i}",
+            mission_class=MissionClass.DOCUMENTATION_UPDATE,
+            domain_type=DomainType.OBJECTIVE,
+        )
+    svc.submit_mission("M-0")
+
+    svc.create_listing("L-1", "Listing", "Build it", "human-0")
+    svc.create_listing("L-2", "Draft", "Later", "human-0")
+    svc.open_listing("L-1")
+    svc.start_accepting_bids("L-1")
+    svc.submit_bid("B-1", "L-1", "human-1")
+    svc.submit_bid("B-2", "L-1", "human-2")
+    svc.withdraw_bid("B-2", "L-1")
+
+    svc.request_leave("human-3", LeaveCategory.ILLNESS)
+
+
+class TestStateTally:
+    def test_counts_follow_assignment_and_membership(self) -> None:
+        missions = StateTally()
+        m = Mission(
+            mission_id="M", mission_title="T",
+            mission_class=MissionClass.DOCUMENTATION_UPDATE,
+            risk_tier=RiskTier.R0, domain_type=DomainType.OBJECTIVE,
+        )
+        missions["M"] = m
+        assert missions.count(MissionState.DRAFT) == 1
+        m.state = MissionState.SUBMITTED
+        assert missions.counts() == {MissionState.SUBMITTED: 1}
+        del missions["M"]
+        assert missions.counts() == {}
+        # A removed record no longer reports its changes.
+        m.state = MissionState.APPROVED
+        assert missions.counts() == {}
+
+    def test_record_held_by_another_tally_rejected(self) -> None:
+        first, second = StateTally(), StateTally()
+        m = Mission(
+            mission_id="M", mission_title="T",
+            mission_class=MissionClass.DOCUMENTATION_UPDATE,
+            risk_tier=RiskTier.R0, domain_type=DomainType.OBJECTIVE,
+        )
+        first["M"] = m
+        with pytest.raises(ValueError, match="another tally"):
+            second["M"] = m
+        assert second.counts() == {}
+        del first["M"]
+        second["M"] = m
+        m.state = MissionState.SUBMITTED
+        assert second.counts() == {MissionState.SUBMITTED: 1}
+        assert first.counts() == {}
+
+    def test_keys_stay_sorted_through_mutation(self) -> None:
+        missions = StateTally()
+        for mission_id in ["M-3", "M-1", "M-4", "M-2"]:
+            missions[mission_id] = Mission(
+                mission_id=mission_id, mission_title="T",
+                mission_class=MissionClass.DOCUMENTATION_UPDATE,
+                risk_tier=RiskTier.R0, domain_type=DomainType.OBJECTIVE,
+            )
+        missions["M-1"] = missions["M-1"]
+        del missions["M-3"]
+        missions.pop("M-9", None)
+        assert list(missions.keys_after()) == ["M-1", "M-2", "M-4"]
+        assert list(missions.keys_after("M-2")) == ["M-4"]
+        assert list(missions.keys_after("M-3")) == ["M-4"]
+        assert missions.count(MissionState.DRAFT) == 3
+        missions.clear()
+        assert list(missions.keys_after()) == []
+
+
+class TestStatusCounters:
+    def test_status_matches_full_scan(self, resolver: PolicyResolver) -> None:
+        svc = GenesisService(resolver, event_log=EventLog())
+        _populate(svc)
+        assert svc.verify_status_counters().success
+
+        status = svc.status()
+        assert status["actors"]["humans"] == 4
+        assert status["actors"]["active"] == 4
+        assert status["missions"]["by_state"] == {"draft": 2, "submitted": 1}
+        assert status["market"]["open_listings"] == 1
+        assert status["market"]["total_bids"] == 2
+        assert status["leave"]["pending_requests"] == 1
+
+    def test_direct_assignment_is_counted(self, resolver: PolicyResolver) -> None:
+        svc = GenesisService(resolver, event_log=EventLog())
+        _populate(svc)
+        svc.get_mission("M-1").state = MissionState.APPROVED
+        svc._listings["L-2"].state = ListingState.OPEN
+        svc._roster.get("human-1").status = ActorStatus.SUSPENDED
+        assert svc.verify_status_counters().success
+        assert svc.status()["actors"]["humans"] == 3
+        assert svc.status()["market"]["open_listings"] == 2
+
+    def test_rebuilds_from_state_store(
+        self, resolver: PolicyResolver, tmp_path: Path,
+    ) -> None:
+        svc = GenesisService(
+            resolver, event_log=EventLog(),
+            state_store=StateStore(tmp_path / "state.json"),
+        )
+        _populate(svc)
+        reloaded = GenesisService(
+            resolver, event_log=EventLog(),
+            state_store=StateStore(tmp_path / "state.json"),
+        )
+        assert reloaded.verify_status_counters().success
+        for section in ("actors", "missions", "market", "leave"):
+            assert reloaded.status()[section] == svc.status()[section]